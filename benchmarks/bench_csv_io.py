@@ -0,0 +1,64 @@
+# benchmarks/bench_csv_io.py
+"""
+Compara los motores de lectura CSV (CAPITAL_CSV_ENGINE) sobre los archivos de un directorio data/.
+
+Uso:
+    python benchmarks/bench_csv_io.py [--data-dir data] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ingestion.csv_processor import process_csv  # noqa: E402
+from src.utils import csv_io  # noqa: E402
+
+
+def _best_of(func, repeat: int) -> Tuple[float, float]:
+    """Mejor tiempo y mediana de `repeat` ejecuciones de `func`, en segundos."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de lectura CSV por motor")
+    parser.add_argument("--data-dir", type=Path, default=Path("data"))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data_dir = args.data_dir
+    base_path = data_dir / "dictionary" / "base.csv"
+    diccionario_path = data_dir / "dictionary" / "ruts_faltantes.csv"
+    cases = []
+    for path in sorted((data_dir / "original").glob("*.csv"))[-1:]:
+        cases.append((f"original {path.name} (process_csv)", lambda p=path: process_csv(
+            p, base_path=base_path, diccionario_path=diccionario_path
+        )))
+    for path in sorted((data_dir / "processed").glob("*.csv"))[-1:]:
+        cases.append((f"processed {path.name}", lambda p=path: csv_io.read_processed(p)))
+        cases.append((f"processed {path.name} [Rut, Saldo]", lambda p=path: csv_io.read_processed(p, ['Rut', 'Saldo'])))
+    if base_path.exists():
+        cases.append(("dictionary base.csv", lambda: csv_io.read_dictionary(base_path)))
+
+    engines = ["c", "pyarrow"] if csv_io.HAS_PYARROW else ["c"]
+    print(f"{'archivo':<45}" + "".join(f"{engine:>18}" for engine in engines))
+    for name, func in cases:
+        row = f"{name:<45}"
+        for engine in engines:
+            csv_io.CSV_ENGINE = engine
+            best, median = _best_of(func, args.repeat)
+            row += f"{best * 1000:>9.1f} / {median * 1000:>5.1f}ms"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
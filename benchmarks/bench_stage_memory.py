@@ -0,0 +1,72 @@
+# benchmarks/bench_stage_memory.py
+"""
+Mide la memoria asignada por las etapas de comparación, consolidación y reportes sobre una
+membresía sintética, y verifica que ninguna modifique los DataFrames que recibe.
+
+Con --partitions N la comparación y la consolidación se ejecutan por particiones en disco
+(modo fuera de memoria, ver src/consolidation/partitioned.py).
+
+Uso:
+    python benchmarks/bench_stage_memory.py [--members 200000] [--partitions 8]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.comparison.diff_generator import generate_diffs  # noqa: E402
+from src.consolidation.monthly_builder import build_monthly_file  # noqa: E402
+from src.consolidation.partitioned import build_monthly_file_partitioned, generate_diffs_partitioned  # noqa: E402
+from src.reporting.word_report import _calculate_tramo_statistics  # noqa: E402
+from src.utils.profiling import AllocationTracker  # noqa: E402
+
+
+def _members(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    ids = np.arange(n)
+    creditos = rng.integers(10_000, 500_000, n)
+    debitos = rng.integers(0, 5_000, n)
+    return pd.DataFrame({
+        "rut": [f"{i}-{i % 10}" for i in ids],
+        "nombre": [f"SOCIO {i}" for i in ids],
+        "debitos": debitos,
+        "creditos": creditos,
+        "saldo": creditos - debitos,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria por etapa (tracemalloc)")
+    parser.add_argument("--members", type=int, default=200_000)
+    parser.add_argument("--partitions", type=int, default=1)
+    args = parser.parse_args()
+
+    current = _members(args.members, seed=1)
+    previous = _members(args.members, seed=2)
+    previous_good = previous.rename(columns={
+        "rut": "Rut", "nombre": "Nombre", "debitos": "Debito", "creditos": "Credito", "saldo": "Saldo"
+    })
+    previous_good["Cuotas"] = previous_good["Saldo"] // 1000
+
+    tracker = AllocationTracker()
+    if args.partitions > 1:
+        diffs = tracker.run("diffs", generate_diffs_partitioned, current, previous, None, args.partitions)
+        good = tracker.run("consolidate", build_monthly_file_partitioned, diffs, previous_good, args.partitions)
+    else:
+        diffs = tracker.run("diffs", generate_diffs, current, previous)
+        good = tracker.run("consolidate", build_monthly_file, diffs, previous_good)
+    tracker.run("tramos", _calculate_tramo_statistics, good)
+
+    print(f"pandas {pd.__version__}, {args.members} socios, {args.partitions} particiones")
+    print(tracker.summary().to_string(index=False))
+    if any(stage.mutated_inputs for stage in tracker.stages):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,89 +1,91 @@
 from pathlib import Path
-import pandas as pd
 import argparse
+import time
 from datetime import datetime, timedelta
 
-from src.ingestion.xls_converter import convert_xls_to_csv
-from src.ingestion.csv_processor import process_csv
-from src.comparison.diff_generator import generate_diffs
-from src.consolidation.monthly_builder import build_monthly_file
-from src.reporting.excel_report import generate_excel_report
-from src.reporting.word_report import generate_word_report
+from src.ingestion.preflight import run_preflight
+from src.consolidation.audit import audit_range
+from src.storage.history_store import load_processed_history, query_member_history
+from src.orchestration.pipeline import Pipeline, PeriodContext
+from src.orchestration.restatement import restate_from
+from src.reporting.member_statements import generate_member_statements
+from src.reporting.perf_report import (
+    PERF_BASELINE_RUNS,
+    PERF_THRESHOLD,
+    check_run,
+    generate_perf_report,
+)
+from src.reporting.trend_report import generate_annual_report, generate_trend_report
+from src.orchestration.watcher import RawFolderWatcher, DEBOUNCE_SECONDS, POLL_INTERVAL
+from src.service.http_service import serve, SERVICE_HOST, SERVICE_PORT, SERVICE_WORKERS
+from src.storage.perf_history import record_run
+from src.utils.artifacts import artifact_exists, resolve_artifact
 from src.utils.paths import (
-    get_raw_xls_path,
     get_original_csv_path,
-    get_diff_csv_path,
-    get_processed_csv_path,
-    get_report_paths,
     get_base_path,
     get_dictionary_path,
+    get_history_db_path,
+    get_audit_paths,
 )
 from src.utils.dates import get_previous_period
 from src.utils.logging import setup_logger
 from src.utils.exceptions import PipelineError
+from src.utils.profiling import peak_rss_mb
 
 logger = setup_logger(__name__)
 
 
-def run_month(year: int, month: int):
+def record_performance(ctx: PeriodContext, pipeline: Pipeline, started: datetime, seconds: float, status: str):
+    """
+    Registra los tiempos de la ejecución en data/perf_history.sqlite y advierte si alguna etapa
+    quedó más lenta que su línea base (ver `perf-report`). Un error aquí no afecta al proceso.
+    """
     try:
-        logger.info(f"Procesando período {year}-{month:02d}")
-
-        prev_year, prev_month = get_previous_period(year, month)
-
-        # 1. Conversión XLS → CSV
-        raw_xls = get_raw_xls_path(year, month)
-        original_csv = get_original_csv_path(year, month)
-        logger.info(f"Convirtiendo {raw_xls.parent.name + '/' + raw_xls.name} a {original_csv.parent.name + '/' + original_csv.name}")
-
-        convert_xls_to_csv(raw_xls, original_csv)
-
-        # 2. Procesamiento de datos CSV
-        base_path = get_base_path()
-        diccionario_path = get_dictionary_path()
-        
-        logger.info(f"Procesando CSV del mes actual: {original_csv.name}")
-        df_current = process_csv(
-            original_csv,
-            base_path=base_path,
-            diccionario_path=diccionario_path
-        )
-        
-        previous_csv = get_original_csv_path(prev_year, prev_month)
-        logger.info(f"Procesando CSV del mes anterior: {previous_csv.name}")
-        df_previous = process_csv(
-            previous_csv,
-            base_path=base_path,
-            diccionario_path=diccionario_path
-        )
-
-        # 3. Generación de diferencias
-        df_diffs = generate_diffs(df_current, df_previous)
-        diffs_path = get_diff_csv_path(year, month)
-        df_diffs.to_csv(diffs_path, index=False)
-
-        # 4. Consolidación mensual
-        df_previous_good = pd.read_csv(
-            get_processed_csv_path(prev_year, prev_month)
+        run_id = record_run(
+            ctx.year,
+            ctx.month,
+            pipeline.timings,
+            seconds,
+            status=status,
+            complete=set(pipeline.build_scheduler().stages) <= set(pipeline.timings),
+            peak_mb=peak_rss_mb(),
+            members=len(ctx.frames.good) if ctx.frames.good is not None else None,
+            input_bytes=sum(resolve_artifact(path).stat().st_size for path in ctx.input_paths if artifact_exists(path)),
+            started=started,
         )
+        for row in check_run(run_id).itertuples(index=False):
+            logger.warning(
+                f"Etapa {row.Etapa} más lenta de lo habitual: {row.Segundos:.1f} s "
+                f"(línea base {row.Base:.1f} s, {row.Variacion:+.0%})"
+            )
+    except Exception as e:
+        logger.warning(f"No se pudo registrar el rendimiento de la ejecución: {e}")
 
-        df_good = build_monthly_file(df_diffs, df_previous_good)
-        processed_path = get_processed_csv_path(year, month)
-        df_good.to_csv(processed_path, index=False)
 
-        # 5. Reportes
-        excel_path, word_path = get_report_paths(year, month)
+def run_month(year: int, month: int, dry_run: bool = False, stages=None, from_stage=None, resume: bool = True):
+    ctx = PeriodContext(year, month, dry_run=dry_run, stages=stages, from_stage=from_stage, resume=resume)
+    pipeline = Pipeline(ctx)
+    started = datetime.now()
+    start = time.perf_counter()
+    status = "error"
+    try:
+        logger.info(f"Procesando período {year}-{month:02d}" + (" (dry-run)" if dry_run else ""))
 
-        generate_excel_report(df_good, excel_path)
-        generate_word_report(df_good, word_path)
+        timings = pipeline.run()
+        status = "ok"
 
         logger.info("Proceso finalizado correctamente")
+        return timings
     except PipelineError as e:
         logger.error(f"Fallo en el pipeline: {e}")
         raise
     except Exception as e:
         logger.exception("Error inesperado en el pipeline")
         raise
+    finally:
+        # Un dry-run no escribe nada, tampoco en el historial de rendimiento
+        if not dry_run:
+            record_performance(ctx, pipeline, started, time.perf_counter() - start, status)
 
 
 
@@ -96,6 +98,118 @@ def get_last_month():
     return last_day_previous.year, last_day_previous.month
 
 
+def run_query(rut: str, months: int, rebuild: bool = False):
+    """Muestra el historial mensual de un socio desde el historial local."""
+    if rebuild or not get_history_db_path().exists():
+        load_processed_history()
+
+    history = query_member_history(rut, months=months)
+    if history.empty:
+        print(f"No hay registros para el Rut {rut}")
+        return
+    print(history.to_string(index=False))
+
+
+def run_audit(start, end, max_workers=None) -> bool:
+    """
+    Audita la cadena de archivos Bueno de un rango y guarda el detalle en data/audit.
+
+    Returns:
+        bool: True si no se encontraron diferencias
+    """
+    result = audit_range(start, end, max_workers=max_workers)
+
+    members_path, summary_path = get_audit_paths(*start, *end)
+    members_path.parent.mkdir(parents=True, exist_ok=True)
+    result.members.to_csv(members_path, index=False)
+    result.summary.to_csv(summary_path, index=False)
+
+    print(result.summary.to_string(index=False))
+    logger.info(f"Detalle de auditoría guardado en {members_path} y {summary_path}")
+    return not result.has_drift
+
+
+def run_check(year: int, month: int):
+    """Valida los originales de un período (y del anterior) sin procesarlos."""
+    prev_year, prev_month = get_previous_period(year, month)
+    run_preflight(
+        [get_original_csv_path(year, month), get_original_csv_path(prev_year, prev_month)],
+        base_path=get_base_path(),
+        diccionario_path=get_dictionary_path(),
+    )
+    print(f"Período {year}-{month:02d}: validación previa correcta")
+
+
+def run_restate(year: int, month: int):
+    """Re-expresa un mes re-emitido y propaga la corrección a los meses posteriores."""
+    result = restate_from(year, month)
+    for key, count in result.changed.items():
+        print(f"Período {key}: {count} socios modificados")
+    if result.untouched:
+        print(f"Sin cambios: {', '.join(str(key) for key in result.untouched)}")
+
+
+def run_statements(year: int, month: int, max_workers=None):
+    """Genera las cartolas por socio del período en un zip."""
+    output_path = generate_member_statements(year, month, max_workers=max_workers)
+    print(f"Cartolas de {year}-{month:02d} guardadas en {output_path}")
+
+
+def run_trend(start, end):
+    """Genera el reporte de tendencia mensual de un rango desde el resumen del historial."""
+    if not get_history_db_path().exists():
+        load_processed_history()
+    output_path = generate_trend_report(*start, *end)
+    print(f"Reporte de tendencia guardado en {output_path}")
+
+
+def run_annual(year: int):
+    """Genera el reporte anual (cierre del año contra el del año anterior) desde el resumen del historial."""
+    if not get_history_db_path().exists():
+        load_processed_history()
+    output_path = generate_annual_report(year)
+    print(f"Reporte anual guardado en {output_path}")
+
+
+def run_perf_report(last: int, window: int, threshold: float) -> bool:
+    """
+    Muestra la tendencia de tiempos por etapa de las últimas ejecuciones y las regresiones.
+
+    Returns:
+        bool: True si la ejecución más reciente no tiene regresiones
+    """
+    report = generate_perf_report(last=last, window=window, threshold=threshold)
+    print("Ejecuciones:")
+    print(report.runs.to_string(index=False))
+    print("\nSegundos por etapa:")
+    print(report.trend.to_string(na_rep="-"))
+    print(f"\nRegresiones (más de {threshold:.0%} sobre la mediana de las {window} ejecuciones correctas anteriores):")
+    if report.regressions.empty:
+        print("Sin regresiones")
+    else:
+        print(report.regressions.to_string(index=False))
+    return not report.latest_regressed
+
+
+def parse_period(text: str):
+    """Convierte un período en formato YYYY-MM al par (año, mes)."""
+    try:
+        year, month = (int(part) for part in text.split("-"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Período inválido: {text}. Use el formato YYYY-MM")
+    if not (1 <= month <= 12):
+        raise argparse.ArgumentTypeError(f"El mes debe estar entre 1 y 12. Se recibió: {month}")
+    return year, month
+
+
+def parse_stages(text: str):
+    """Convierte una lista de etapas separadas por comas en una tupla de nombres."""
+    stages = tuple(name.strip() for name in text.split(",") if name.strip())
+    if not stages:
+        raise argparse.ArgumentTypeError("Debe indicar al menos una etapa")
+    return stages
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Procesa los datos de capital pagado para un período mensual específico."
@@ -115,9 +229,209 @@ if __name__ == "__main__":
         action="store_true",
         help="Ejecutar automáticamente para el mes anterior sin requerir argumentos.",
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Procesa el período en memoria sin escribir en data/ ni reports/.",
+    )
+    stage_group = parser.add_mutually_exclusive_group()
+    stage_group.add_argument(
+        "--stages",
+        type=parse_stages,
+        help="Ejecuta solo estas etapas, separadas por comas (p. ej. word_report,excel_report). "
+             "Sus entradas se leen de los checkpoints o de los artefactos existentes.",
+    )
+    stage_group.add_argument(
+        "--from-stage",
+        help="Ejecuta esta etapa y las que dependen de ella (p. ej. consolidate).",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="No retomar una ejecución fallida desde sus checkpoints: procesa el período completo.",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+
+    query_parser = subparsers.add_parser(
+        "query",
+        help="Consulta el historial mensual (Debito/Credito/Saldo/Cuotas) de un socio.",
+    )
+    query_parser.add_argument("--rut", required=True, help="Rut del socio a consultar.")
+    query_parser.add_argument(
+        "--months",
+        type=int,
+        default=24,
+        help="Cantidad de períodos más recientes a mostrar (por defecto 24).",
+    )
+    query_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recarga el historial completo desde data/processed antes de consultar.",
+    )
+
+    audit_parser = subparsers.add_parser(
+        "audit",
+        help="Verifica la cadena de archivos Bueno de un rango contra los originales.",
+    )
+    audit_parser.add_argument("--from", dest="start", type=parse_period, required=True, help="Período inicial (YYYY-MM).")
+    audit_parser.add_argument("--to", dest="end", type=parse_period, required=True, help="Período final (YYYY-MM).")
+    audit_parser.add_argument("--workers", type=int, default=None, help="Cantidad de procesos trabajadores.")
+
+    check_parser = subparsers.add_parser(
+        "check",
+        help="Valida los CSV originales de un período y del anterior antes de procesarlos.",
+    )
+    check_parser.add_argument("--period", type=parse_period, required=True, help="Período a validar (YYYY-MM).")
+
+    restate_parser = subparsers.add_parser(
+        "restate",
+        help="Reprocesa un mes con su XLS re-emitido y propaga la corrección a los meses posteriores.",
+    )
+    restate_parser.add_argument("--from", dest="start", type=parse_period, required=True, help="Período corregido (YYYY-MM).")
+
+    statements_parser = subparsers.add_parser(
+        "statements",
+        help="Genera la cartola de capital pagado de cada socio del período (zip de documentos Word).",
+    )
+    statements_parser.add_argument("--period", type=parse_period, required=True, help="Período de cierre (YYYY-MM).")
+    statements_parser.add_argument("--workers", type=int, default=None, help="Cantidad de procesos trabajadores.")
+
+    trend_parser = subparsers.add_parser(
+        "trend",
+        help="Genera el reporte de tendencia mensual (por tramo, categoría y tipo) de un rango.",
+    )
+    trend_parser.add_argument("--from", dest="start", type=parse_period, required=True, help="Período inicial (YYYY-MM).")
+    trend_parser.add_argument("--to", dest="end", type=parse_period, required=True, help="Período final (YYYY-MM).")
+
+    annual_parser = subparsers.add_parser(
+        "annual",
+        help="Genera el reporte anual: cierre del año comparado con el cierre del año anterior.",
+    )
+    annual_parser.add_argument("--year", type=int, required=True, help="Año a reportar (YYYY).")
+
+    perf_parser = subparsers.add_parser(
+        "perf-report",
+        help="Muestra los tiempos por etapa de las últimas ejecuciones y marca las regresiones.",
+    )
+    perf_parser.add_argument("--last", type=int, default=10, help="Ejecuciones a mostrar (por defecto 10).")
+    perf_parser.add_argument(
+        "--window",
+        type=int,
+        default=PERF_BASELINE_RUNS,
+        help=f"Ejecuciones anteriores de la línea base de cada etapa (por defecto {PERF_BASELINE_RUNS}).",
+    )
+    perf_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=PERF_THRESHOLD,
+        help=f"Aumento relativo sobre la línea base que se marca como regresión (por defecto {PERF_THRESHOLD:g}).",
+    )
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Vigila data/raw y procesa cada YYYYMM.xls nuevo o modificado.",
+    )
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=POLL_INTERVAL,
+        help=f"Segundos entre revisiones de data/raw (por defecto {POLL_INTERVAL:g}).",
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEBOUNCE_SECONDS,
+        help=f"Segundos sin cambios antes de procesar un archivo (por defecto {DEBOUNCE_SECONDS:g}).",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Levanta un servicio HTTP local para procesar períodos y descargar reportes.",
+    )
+    serve_parser.add_argument("--host", default=SERVICE_HOST, help=f"Dirección de escucha (por defecto {SERVICE_HOST}).")
+    serve_parser.add_argument("--port", type=int, default=SERVICE_PORT, help=f"Puerto (por defecto {SERVICE_PORT}).")
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=SERVICE_WORKERS,
+        help=f"Procesos trabajadores (por defecto {SERVICE_WORKERS}).",
+    )
 
     args = parser.parse_args()
 
+    if args.command == "query":
+        try:
+            run_query(args.rut, args.months, rebuild=args.rebuild)
+        except Exception as e:
+            logger.error(f"Error durante la consulta: {e}")
+            exit(1)
+        exit(0)
+
+    if args.command == "audit":
+        try:
+            ok = run_audit(args.start, args.end, max_workers=args.workers)
+        except Exception as e:
+            logger.error(f"Error durante la auditoría: {e}")
+            exit(1)
+        exit(0 if ok else 1)
+
+    if args.command == "check":
+        try:
+            run_check(*args.period)
+        except Exception as e:
+            logger.error(f"Error durante la validación previa: {e}")
+            exit(1)
+        exit(0)
+
+    if args.command == "restate":
+        try:
+            run_restate(*args.start)
+        except Exception as e:
+            logger.error(f"Error durante la re-expresión: {e}")
+            exit(1)
+        exit(0)
+
+    if args.command == "statements":
+        try:
+            run_statements(*args.period, max_workers=args.workers)
+        except Exception as e:
+            logger.error(f"Error al generar las cartolas: {e}")
+            exit(1)
+        exit(0)
+
+    if args.command == "trend":
+        try:
+            run_trend(args.start, args.end)
+        except Exception as e:
+            logger.error(f"Error al generar el reporte de tendencia: {e}")
+            exit(1)
+        exit(0)
+
+    if args.command == "annual":
+        try:
+            run_annual(args.year)
+        except Exception as e:
+            logger.error(f"Error al generar el reporte anual: {e}")
+            exit(1)
+        exit(0)
+
+    if args.command == "perf-report":
+        try:
+            ok = run_perf_report(args.last, args.window, args.threshold)
+        except Exception as e:
+            logger.error(f"Error al generar el reporte de rendimiento: {e}")
+            exit(1)
+        exit(0 if ok else 1)
+
+    if args.command == "watch":
+        RawFolderWatcher(run_month, poll_interval=args.interval, debounce=args.debounce).run()
+        exit(0)
+
+    if args.command == "serve":
+        serve(run_month, host=args.host, port=args.port, max_workers=args.workers)
+        exit(0)
+
     # Si se usa --auto o no se proporcionan argumentos, usar el mes anterior
     if args.auto or (args.year is None and args.month is None):
         year, month = get_last_month()
@@ -139,7 +453,14 @@ if __name__ == "__main__":
         parser.error(f"El año debe estar entre 2000 y {current_year + 1}. Se recibió: {year}")
 
     try:
-        run_month(year=year, month=month)
+        run_month(
+            year=year,
+            month=month,
+            dry_run=args.dry_run,
+            stages=args.stages,
+            from_stage=args.from_stage,
+            resume=not args.no_resume,
+        )
     except Exception as e:
         logger.error(f"Error durante la ejecución: {e}")
         exit(1)
\ No newline at end of file
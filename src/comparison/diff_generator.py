@@ -1,22 +1,139 @@
 # src/comparison/diff_generator.py
 
 import pandas as pd
+from typing import Optional
+from src.utils.contracts import PARSED
 from src.utils.exceptions import DiffGenerationError
 from src.utils.logging import setup_logger
+from src.utils.names import canonicalize_names
 
 logger = setup_logger(__name__)
 
 
-def generate_diffs(current: pd.DataFrame, previous: pd.DataFrame) -> pd.DataFrame:
+def _numeric_members(df: pd.DataFrame, numeric_columns) -> pd.DataFrame:
+    """
+    Retorna rut, nombre, su forma canónica (`clave`, la del cruce entre meses) y los montos
+    convertidos a número, sin modificar `df`.
+    """
+    columns = {'rut': df['rut'], 'nombre': df['nombre'], 'clave': canonicalize_names(df['nombre'])}
+    for col in numeric_columns:
+        columns[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+    return pd.DataFrame(columns)
+
+
+def diff_members(
+    current: pd.DataFrame,
+    previous: pd.DataFrame,
+    renames: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
+    """
+    Cálculo de `generate_diffs`, sin registro ni manejo de errores (se usa también por partición,
+    ver src/consolidation/partitioned.py).
+
+    Raises:
+        DiffGenerationError: Si a algún DataFrame le faltan columnas requeridas
+    """
+    # Validar que los DataFrames tengan las columnas necesarias
+    for df_name, df in [('current', current), ('previous', previous)]:
+        PARSED.require(df, error=DiffGenerationError, source=f"El DataFrame {df_name}")
+
+    # Convertir columnas numéricas a float, manejando valores no numéricos. Se arma un
+    # DataFrame nuevo solo con las columnas usadas: los DataFrames recibidos no se modifican
+    numeric_columns = ['debitos', 'creditos', 'saldo']
+    current = _numeric_members(current, numeric_columns)
+    previous = _numeric_members(previous, numeric_columns)
+
+    # Agrupar por rut y nombre canónico, sumando los valores numéricos (se conserva el primer
+    # nombre original). Esto maneja casos donde un socio puede tener múltiples registros
+    logger.debug("Agrupando datos del mes actual por rut/nombre")
+    current_grouped = current.groupby(['rut', 'clave']).agg({
+        'nombre': 'first',
+        'debitos': 'sum',
+        'creditos': 'sum',
+        'saldo': 'sum'
+    }).reset_index()
+
+    logger.debug("Agrupando datos del mes anterior por rut/nombre")
+    previous_grouped = previous.groupby(['rut', 'clave']).agg({
+        'nombre': 'first',
+        'debitos': 'sum',
+        'creditos': 'sum',
+        'saldo': 'sum'
+    }).reset_index()
+
+    # Unificar los socios renombrados bajo el nombre del mes actual
+    if renames is not None and not renames.empty:
+        applied = renames[renames['aplicado'].astype(bool)]
+        previous_keys = canonicalize_names(applied['nombre_anterior'])
+        rename_map = dict(zip(previous_keys, canonicalize_names(applied['nombre_actual'])))
+        if rename_map:
+            logger.debug(f"Aplicando {len(rename_map)} cambios de nombre al mes anterior")
+            renamed = previous_grouped['clave'].isin(rename_map.keys())
+            previous_grouped.loc[renamed, 'nombre'] = previous_grouped.loc[renamed, 'clave'].map(
+                dict(zip(previous_keys, applied['nombre_actual']))
+            )
+            previous_grouped['clave'] = previous_grouped['clave'].replace(rename_map)
+
+    # Hacer merge por rut y nombre usando outer join para incluir todos los registros
+    # Esto permite detectar socios nuevos o que ya no están
+    logger.debug("Realizando merge entre meses actual y anterior")
+    merged = pd.merge(
+        current_grouped,
+        previous_grouped,
+        on='clave',
+        how='outer',
+        suffixes=('_current', '_previous')
+    )
+
+    # Rellenar valores NaN con 0 para el cálculo de diferencias
+    for col in numeric_columns:
+        merged[f'{col}_current'] = merged[f'{col}_current'].fillna(0)
+        merged[f'{col}_previous'] = merged[f'{col}_previous'].fillna(0)
+
+    # Calcular diferencias (mes actual - mes anterior)
+    merged['diff_debito'] = merged['debitos_current'] - merged['debitos_previous']
+    merged['diff_credito'] = merged['creditos_current'] - merged['creditos_previous']
+    merged['diff_saldo'] = merged['saldo_current'] - merged['saldo_previous']
+
+    merged['rut'] = merged['rut_current'].fillna(merged['rut_previous'])
+    # El nombre que se muestra es el del mes actual (el anterior solo para las bajas)
+    merged['nombre'] = merged['nombre_current'].fillna(merged['nombre_previous'])
+
+    # Seleccionar y renombrar columnas según el formato requerido
+    diffs = merged[[
+        'nombre',
+        'rut',
+        'diff_debito',
+        'diff_credito',
+        'diff_saldo'
+    ]]
+
+    # Renombrar columnas para que empiecen con mayúscula
+    diffs.columns = ['Nombre', 'Rut', 'diff_debito', 'diff_credito', 'diff_saldo']
+
+    # Ordenar por nombre para consistencia
+    diffs = diffs.sort_values('Nombre').reset_index(drop=True)
+    return diffs
+
+
+def generate_diffs(
+    current: pd.DataFrame,
+    previous: pd.DataFrame,
+    renames: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
     """
     Genera un DataFrame con las diferencias entre el mes actual y el mes anterior.
     
     Agrupa los datos por rut/nombre, suma los valores de debitos, creditos y saldo,
-    y calcula las diferencias entre ambos períodos.
+    y calcula las diferencias entre ambos períodos. No modifica `current`, `previous` ni
+    `renames`: el llamador puede reutilizarlos (por ejemplo, para escribirlos en segundo plano).
     
     Args:
         current: DataFrame del mes actual con columnas: rut, nombre, debitos, creditos, saldo
         previous: DataFrame del mes anterior con las mismas columnas
+        renames: DataFrame opcional de cambios de nombre (ver match_renamed_members). Los pares
+                 marcados como aplicados se unen bajo el nombre actual, para que un socio
+                 renombrado no aparezca como una baja más un alta
     
     Returns:
         pd.DataFrame: DataFrame con columnas: Nombre, Rut, diff_debito, diff_credito, diff_saldo
@@ -27,75 +144,7 @@ def generate_diffs(current: pd.DataFrame, previous: pd.DataFrame) -> pd.DataFram
     logger.info("Generando diferencias intermensuales")
 
     try:
-        # Validar que los DataFrames tengan las columnas necesarias
-        required_columns = ['rut', 'nombre', 'debitos', 'creditos', 'saldo']
-        for df_name, df in [('current', current), ('previous', previous)]:
-            missing_cols = [col for col in required_columns if col not in df.columns]
-            if missing_cols:
-                raise DiffGenerationError(
-                    f"El DataFrame {df_name} no tiene las columnas requeridas: {missing_cols}"
-                )
-        
-        # Convertir columnas numéricas a float, manejando valores no numéricos
-        numeric_columns = ['debitos', 'creditos', 'saldo']
-        for col in numeric_columns:
-            current[col] = pd.to_numeric(current[col], errors='coerce').fillna(0)
-            previous[col] = pd.to_numeric(previous[col], errors='coerce').fillna(0)
-        
-        # Agrupar por rut y nombre, sumando los valores numéricos
-        # Esto maneja casos donde un socio puede tener múltiples registros
-        logger.debug("Agrupando datos del mes actual por rut/nombre")
-        current_grouped = current.groupby(['rut', 'nombre']).agg({
-            'debitos': 'sum',
-            'creditos': 'sum',
-            'saldo': 'sum'
-        }).reset_index()
-        
-        logger.debug("Agrupando datos del mes anterior por rut/nombre")
-        previous_grouped = previous.groupby(['rut', 'nombre']).agg({
-            'debitos': 'sum',
-            'creditos': 'sum',
-            'saldo': 'sum'
-        }).reset_index()
-        
-        # Hacer merge por rut y nombre usando outer join para incluir todos los registros
-        # Esto permite detectar socios nuevos o que ya no están
-        logger.debug("Realizando merge entre meses actual y anterior")
-        merged = pd.merge(
-            current_grouped,
-            previous_grouped,
-            on='nombre',
-            how='outer',
-            suffixes=('_current', '_previous')
-        )
-        
-        # Rellenar valores NaN con 0 para el cálculo de diferencias
-        for col in numeric_columns:
-            merged[f'{col}_current'] = merged[f'{col}_current'].fillna(0)
-            merged[f'{col}_previous'] = merged[f'{col}_previous'].fillna(0)
-        
-        # Calcular diferencias (mes actual - mes anterior)
-        merged['diff_debito'] = merged['debitos_current'] - merged['debitos_previous']
-        merged['diff_credito'] = merged['creditos_current'] - merged['creditos_previous']
-        merged['diff_saldo'] = merged['saldo_current'] - merged['saldo_previous']
-
-        merged['rut'] = merged['rut_current'].fillna(merged['rut_previous'])
-        
-        # Seleccionar y renombrar columnas según el formato requerido
-        diffs = merged[[
-            'nombre',
-            'rut',
-            'diff_debito',
-            'diff_credito',
-            'diff_saldo'
-        ]].copy()
-        
-        # Renombrar columnas para que empiecen con mayúscula
-        diffs.columns = ['Nombre', 'Rut', 'diff_debito', 'diff_credito', 'diff_saldo']
-        
-        # Ordenar por nombre para consistencia
-        diffs = diffs.sort_values('Nombre').reset_index(drop=True)
-        
+        diffs = diff_members(current, previous, renames=renames)
     except DiffGenerationError:
         raise
     except Exception as e:
@@ -0,0 +1,235 @@
+# src/comparison/name_matching.py
+
+import pandas as pd
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+from src.utils.contracts import PARSED
+from src.utils.exceptions import DiffGenerationError
+from src.utils.logging import setup_logger
+from src.utils.names import get_canonicalizer
+
+logger = setup_logger(__name__)
+
+# Similitud mínima para considerar que dos nombres corresponden al mismo socio
+SIMILARITY_THRESHOLD = 0.85
+
+# Tamaño de los n-gramas usados como claves de bloqueo
+NGRAM_SIZE = 3
+
+# Cantidad de candidatos (los que más n-gramas comparten) que se comparan en detalle
+MAX_CANDIDATES = 5
+
+# Cantidad máxima de entradas del índice que se revisan por consulta
+MAX_POSTINGS_PER_QUERY = 1000
+
+RENAME_COLUMNS = [
+    'nombre_anterior', 'nombre_actual', 'rut_anterior', 'rut_actual', 'similitud', 'criterio', 'aplicado'
+]
+
+
+def normalize_name(name) -> str:
+    """
+    Normaliza un nombre para compararlo: su forma canónica (ver src/utils/names.py), tomada de la
+    tabla compartida con la ingesta.
+    """
+    return get_canonicalizer().canonical(name)
+
+
+def normalize_rut_key(rut) -> str:
+    """Clave de bloqueo por Rut: mayúsculas, sin puntos ni espacios."""
+    if rut is None or (isinstance(rut, float) and pd.isna(rut)):
+        return ""
+    return str(rut).upper().replace(".", "").replace(" ", "")
+
+
+def _ngrams(text: str, n: int = NGRAM_SIZE) -> set:
+    padded = f" {text} "
+    return {padded[i:i + n] for i in range(max(len(padded) - n + 1, 1))}
+
+
+def _dice(a: set, b: set) -> float:
+    if not a and not b:
+        return 1.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def similarity(a: str, b: str) -> float:
+    """Similitud (coeficiente de Dice sobre n-gramas) entre dos nombres ya normalizados (0 a 1)."""
+    return _dice(_ngrams(a), _ngrams(b))
+
+
+class NameMatchIndex:
+    """
+    Índice invertido de n-gramas para buscar nombres parecidos sin comparar todos contra todos.
+
+    Cada consulta recorre primero las listas de los n-gramas más raros del nombre buscado, hasta
+    un presupuesto fijo de entradas, y solo compara en detalle los pocos nombres que comparten
+    más n-gramas con él. Como el trabajo por consulta está acotado, el costo total crece de
+    forma casi lineal con la cantidad de nombres.
+    """
+
+    def __init__(self, names: List[str], ngram_size: int = NGRAM_SIZE):
+        self.ngram_size = ngram_size
+        self.names = [normalize_name(name) for name in names]
+        self.grams = [_ngrams(name, ngram_size) for name in self.names]
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for idx, grams in enumerate(self.grams):
+            for gram in grams:
+                postings[gram].append(idx)
+        self.postings = dict(postings)
+
+    def query(self, name: str, max_candidates: int = MAX_CANDIDATES) -> List[Tuple[int, float]]:
+        """
+        Busca los nombres del índice más parecidos a `name`.
+
+        Returns:
+            List[Tuple[int, float]]: Pares (posición en el índice, similitud), de mayor a menor similitud
+        """
+        grams = _ngrams(normalize_name(name), self.ngram_size)
+        lists = sorted((self.postings[gram] for gram in grams if gram in self.postings), key=len)
+
+        shared = Counter()
+        scanned = 0
+        for ids in lists:
+            if scanned and scanned + len(ids) > MAX_POSTINGS_PER_QUERY:
+                break
+            shared.update(ids)
+            scanned += len(ids)
+
+        scored = [(idx, _dice(grams, self.grams[idx])) for idx, _ in shared.most_common(max_candidates)]
+        return sorted(scored, key=lambda item: item[1], reverse=True)
+
+
+def find_renames(
+    removed: pd.DataFrame,
+    added: pd.DataFrame,
+    threshold: float = SIMILARITY_THRESHOLD,
+) -> pd.DataFrame:
+    """
+    Empareja socios que desaparecen de un mes con socios que aparecen en el siguiente.
+
+    Primero se bloquea por Rut: un mismo Rut en ambos lados es el mismo socio aunque el nombre
+    haya cambiado. Luego se emparejan los nombres que coinciden una vez normalizados (tildes,
+    mayúsculas y espacios). Los restantes se buscan en un índice de n-gramas y se emparejan uno
+    a uno si su similitud supera el umbral.
+
+    Args:
+        removed: DataFrame con columnas nombre y rut de los socios que ya no están
+        added: DataFrame con columnas nombre y rut de los socios nuevos
+        threshold: Similitud mínima para emparejar por nombre
+
+    Returns:
+        pd.DataFrame: Pares con columnas: nombre_anterior, nombre_actual, rut_anterior, rut_actual,
+                     similitud, criterio ("rut" o "nombre") y aplicado. Solo los pares con el mismo
+                     Rut se marcan como aplicados; el resto queda para revisión manual.
+    """
+    pairs = []
+    removed_names = removed['nombre'].tolist()
+    removed_ruts = removed['rut'].tolist()
+    added_names = added['nombre'].tolist()
+    added_ruts = added['rut'].tolist()
+    used_removed: set = set()
+    used_added: set = set()
+
+    # 1. Bloqueo por Rut
+    removed_by_rut: Dict[str, List[int]] = defaultdict(list)
+    for idx, rut in enumerate(removed_ruts):
+        key = normalize_rut_key(rut)
+        if key:
+            removed_by_rut[key].append(idx)
+
+    for a_idx, rut in enumerate(added_ruts):
+        candidates = [r for r in removed_by_rut.get(normalize_rut_key(rut), []) if r not in used_removed]
+        if not candidates:
+            continue
+        new_name = normalize_name(added_names[a_idx])
+        scored_candidates = [(similarity(new_name, normalize_name(removed_names[r])), r) for r in candidates]
+        score, r_idx = max(scored_candidates)
+        used_removed.add(r_idx)
+        used_added.add(a_idx)
+        pairs.append((r_idx, a_idx, score, 'rut'))
+
+    # 2. Nombres iguales una vez normalizados
+    removed_by_name: Dict[str, List[int]] = defaultdict(list)
+    for idx, name in enumerate(removed_names):
+        if idx not in used_removed:
+            removed_by_name[normalize_name(name)].append(idx)
+
+    for a_idx, name in enumerate(added_names):
+        if a_idx in used_added:
+            continue
+        candidates = removed_by_name.get(normalize_name(name))
+        if candidates:
+            r_idx = candidates.pop(0)
+            used_removed.add(r_idx)
+            used_added.add(a_idx)
+            pairs.append((r_idx, a_idx, 1.0, 'nombre'))
+
+    # 3. Bloqueo por n-gramas para los que no coincidieron por Rut ni por nombre normalizado
+    remaining_removed = [idx for idx in range(len(removed_names)) if idx not in used_removed]
+    if remaining_removed:
+        index = NameMatchIndex([removed_names[idx] for idx in remaining_removed])
+        scored = []
+        for a_idx, name in enumerate(added_names):
+            if a_idx in used_added:
+                continue
+            for pos, score in index.query(name):
+                if score >= threshold:
+                    scored.append((score, remaining_removed[pos], a_idx))
+
+        for score, r_idx, a_idx in sorted(scored, reverse=True):
+            if r_idx in used_removed or a_idx in used_added:
+                continue
+            used_removed.add(r_idx)
+            used_added.add(a_idx)
+            pairs.append((r_idx, a_idx, score, 'nombre'))
+
+    renames = pd.DataFrame([
+        {
+            'nombre_anterior': removed_names[r_idx],
+            'nombre_actual': added_names[a_idx],
+            'rut_anterior': removed_ruts[r_idx],
+            'rut_actual': added_ruts[a_idx],
+            'similitud': round(score, 4),
+            'criterio': criterio,
+            'aplicado': criterio == 'rut',
+        }
+        for r_idx, a_idx, score, criterio in pairs
+    ], columns=RENAME_COLUMNS)
+    return renames
+
+
+def match_renamed_members(
+    current: pd.DataFrame,
+    previous: pd.DataFrame,
+    threshold: float = SIMILARITY_THRESHOLD,
+) -> pd.DataFrame:
+    """
+    Detecta socios cuyo nombre cambió entre el mes anterior y el actual.
+
+    Args:
+        current: DataFrame procesado del mes actual con columnas: rut, nombre
+        previous: DataFrame procesado del mes anterior con columnas: rut, nombre
+        threshold: Similitud mínima para emparejar por nombre
+
+    Returns:
+        pd.DataFrame: Pares de nombres (ver find_renames)
+
+    Raises:
+        DiffGenerationError: Si los DataFrames no tienen las columnas requeridas
+    """
+    for df_name, df in [('current', current), ('previous', previous)]:
+        PARSED.require(df, columns=['rut', 'nombre'], error=DiffGenerationError, source=f"El DataFrame {df_name}")
+
+    current_names = set(current['nombre'])
+    previous_names = set(previous['nombre'])
+    removed = previous.loc[~previous['nombre'].isin(current_names), ['nombre', 'rut']].drop_duplicates('nombre')
+    added = current.loc[~current['nombre'].isin(previous_names), ['nombre', 'rut']].drop_duplicates('nombre')
+
+    renames = find_renames(removed, added, threshold=threshold)
+    if not renames.empty:
+        logger.info(
+            f"Posibles cambios de nombre: {len(renames)} "
+            f"({int(renames['aplicado'].sum())} con el mismo Rut)"
+        )
+    return renames
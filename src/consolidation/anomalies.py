@@ -0,0 +1,259 @@
+# src/consolidation/anomalies.py
+
+import os
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+from src.utils.artifacts import artifact_exists
+from src.utils.csv_io import read_processed
+from src.utils.dates import get_next_period, get_previous_period
+from src.utils.exceptions import ConsolidationError
+from src.utils.logging import setup_logger
+from src.utils.paths import get_anomalies_csv_path, get_processed_csv_path
+
+logger = setup_logger(__name__)
+
+# Umbrales por defecto de la detección de movimientos anómalos (ver AnomalyThresholds)
+ANOMALY_WINDOW = int(os.getenv("CAPITAL_ANOMALY_WINDOW", "12"))
+ANOMALY_MIN_MONTHS = int(os.getenv("CAPITAL_ANOMALY_MIN_MONTHS", "3"))
+ANOMALY_ZSCORE = float(os.getenv("CAPITAL_ANOMALY_ZSCORE", "4"))
+ANOMALY_RATIO = float(os.getenv("CAPITAL_ANOMALY_RATIO", "10"))
+ANOMALY_MIN_AMOUNT = int(os.getenv("CAPITAL_ANOMALY_MIN_AMOUNT", "100000"))
+ANOMALY_NEGATIVE_LIMIT = int(os.getenv("CAPITAL_ANOMALY_NEGATIVE_LIMIT", "1000000"))
+
+ANOMALY_COLUMNS = [
+    'Periodo', 'Rut', 'Nombre', 'Saldo_anterior', 'Saldo', 'Diferencia',
+    'Media_diferencias', 'Desviacion_diferencias', 'Meses_historial', 'Puntaje_z', 'Motivo',
+]
+
+
+@dataclass(frozen=True)
+class AnomalyThresholds:
+    """
+    Umbrales para marcar un movimiento mensual de saldo como anómalo.
+
+    - `window`: meses anteriores con que se calculan la media y la desviación de las diferencias
+    - `min_months`: meses con diferencia necesarios en la ventana para evaluar la variación
+    - `zscore`: desviaciones respecto de la media a partir de las que la variación es atípica
+    - `ratio`: factor de cambio del saldo (en cualquier sentido) que se considera un salto
+    - `min_amount`: monto mínimo del movimiento para marcar una variación atípica o un salto
+    - `negative_limit`: diferencia negativa que se marca siempre, sin importar el historial
+    """
+    window: int = ANOMALY_WINDOW
+    min_months: int = ANOMALY_MIN_MONTHS
+    zscore: float = ANOMALY_ZSCORE
+    ratio: float = ANOMALY_RATIO
+    min_amount: int = ANOMALY_MIN_AMOUNT
+    negative_limit: int = ANOMALY_NEGATIVE_LIMIT
+
+
+def _period_axis(periods: Iterable[int]) -> List[int]:
+    """Períodos consecutivos (YYYYMM) entre el menor y el mayor, sin huecos."""
+    periods = sorted(set(periods))
+    axis = [periods[0]]
+    while axis[-1] < periods[-1]:
+        year, month = get_next_period(axis[-1] // 100, axis[-1] % 100)
+        axis.append(year * 100 + month)
+    return axis
+
+
+def _rolling(values: np.ndarray, valid: np.ndarray, window: int) -> np.ndarray:
+    """
+    Suma de cada columna con las `window` columnas anteriores (sin incluirla), por fila.
+
+    Se calcula con sumas acumuladas sobre todo el arreglo: el costo no depende de la ventana.
+    """
+    cumulative = np.zeros((values.shape[0], values.shape[1] + 1))
+    np.cumsum(np.where(valid, values, 0.0), axis=1, out=cumulative[:, 1:])
+    end = np.arange(values.shape[1])
+    start = np.maximum(end - window, 0)
+    return cumulative[:, end] - cumulative[:, start]
+
+
+def detect_anomalies(
+    panel: pd.DataFrame,
+    periods: Optional[Iterable[int]] = None,
+    thresholds: Optional[AnomalyThresholds] = None,
+) -> pd.DataFrame:
+    """
+    Marca los movimientos de saldo anómalos de cada socio respecto de su propio historial.
+
+    El panel se lleva a una matriz socio × período (un socio ausente en un período registrado
+    tiene saldo cero, igual que en el archivo Bueno; un período sin datos queda fuera del
+    cálculo, igual que los meses anteriores al ingreso del socio). La diferencia de cada mes
+    se compara con la media y la desviación de las diferencias del socio en los `window` meses
+    anteriores, calculadas para todos los socios y períodos a la vez con sumas acumuladas.
+    Reglas:
+
+    - variacion_atipica: la diferencia se aleja de la media más de `zscore` desviaciones y al
+      menos `min_amount` (con `min_months` meses de historial en la ventana)
+    - salto_de_magnitud: el saldo se multiplica o divide por `ratio` o más, en al menos
+      `min_amount`
+    - diferencia_negativa: la diferencia es de `negative_limit` o más, hacia abajo
+
+    Args:
+        panel: Saldos por período con columnas: Periodo (YYYYMM), Rut, Saldo y opcionalmente
+               Nombre
+        periods: Períodos a evaluar (por defecto el último del panel)
+        thresholds: Umbrales (por defecto los de las variables de entorno CAPITAL_ANOMALY_*)
+
+    Returns:
+        pd.DataFrame: Un registro por socio y período marcado, con columnas: Periodo, Rut, Nombre,
+                     Saldo_anterior, Saldo, Diferencia, Media_diferencias,
+                     Desviacion_diferencias, Meses_historial, Puntaje_z y Motivo (reglas
+                     separadas por coma), ordenado por período y Rut
+    """
+    thresholds = thresholds or AnomalyThresholds()
+    if panel.empty:
+        return pd.DataFrame(columns=ANOMALY_COLUMNS)
+
+    # Los RUTs y los períodos se factorizan una vez y solo se normalizan los valores distintos
+    period_codes, registered = pd.factorize(panel['Periodo'])
+    axis = _period_axis(registered)
+    periods = [axis[-1]] if periods is None else sorted(set(periods) & set(axis))
+    registered = np.searchsorted(axis, registered)
+    columns = registered[period_codes]
+    raw_codes, raw_ruts = pd.factorize(panel['Rut'].astype(str))
+    rut_codes, uniques = pd.factorize(pd.Series(raw_ruts).str.upper().str.strip())
+    codes = rut_codes[raw_codes]
+
+    # Saldos: cero para los socios ausentes en un período registrado, NaN en los períodos sin datos
+    saldo = np.full((len(uniques), len(axis)), np.nan)
+    saldo[:, registered] = 0.0
+    saldo[codes, columns] = pd.to_numeric(panel['Saldo'], errors='coerce').fillna(0).to_numpy(dtype=float)
+
+    # Diferencia de cada período respecto del anterior (la columna 0 no tiene anterior)
+    previous = np.concatenate([np.full((len(uniques), 1), np.nan), saldo[:, :-1]], axis=1)
+    # Los meses en que el socio no tenía saldo ni antes ni después no cuentan como historial
+    diff = saldo - previous
+    valid = ~np.isnan(diff) & ((saldo != 0) | (previous != 0))
+
+    # Media y desviación (muestral) de las diferencias de los meses anteriores de la ventana
+    months = _rolling(np.ones_like(diff), valid, thresholds.window)
+    total = _rolling(diff, valid, thresholds.window)
+    squares = _rolling(diff * diff, valid, thresholds.window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / months
+        std = np.sqrt(np.maximum(squares - months * mean * mean, 0.0) / (months - 1))
+
+    selected = np.searchsorted(axis, periods)
+    diff, previous, saldo = diff[:, selected], previous[:, selected], saldo[:, selected]
+    months, mean, std = months[:, selected], mean[:, selected], std[:, selected]
+
+    deviation = np.abs(diff - mean)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        zscore = np.where(std > 0, (diff - mean) / std, np.sign(diff - mean) * np.inf)
+        ratio = np.abs(saldo) / np.abs(previous)
+    atypical = (
+        (months >= thresholds.min_months)
+        & (deviation >= thresholds.min_amount)
+        & (deviation > thresholds.zscore * std)
+    )
+    jump = (
+        (previous != 0) & (saldo != 0)
+        & ((ratio >= thresholds.ratio) | (ratio <= 1 / thresholds.ratio))
+        & (np.abs(diff) >= thresholds.min_amount)
+    )
+    negative = diff <= -thresholds.negative_limit
+
+    flagged = atypical | jump | negative
+    member, period = np.nonzero(flagged)
+    anomalies = pd.DataFrame({
+        'Periodo': np.asarray(periods)[period],
+        'Rut': uniques[member],
+        'Saldo_anterior': previous[member, period],
+        'Saldo': saldo[member, period],
+        'Diferencia': diff[member, period],
+        'Media_diferencias': mean[member, period].round(2),
+        'Desviacion_diferencias': std[member, period].round(2),
+        'Meses_historial': months[member, period].astype('int64'),
+        'Puntaje_z': np.where(
+            months[member, period] >= thresholds.min_months, zscore[member, period], np.nan
+        ).round(2),
+    })
+    for col in ('Saldo_anterior', 'Saldo', 'Diferencia'):
+        anomalies[col] = anomalies[col].astype('int64')
+
+    motive = pd.Series('', index=anomalies.index)
+    for rule, mask in (('variacion_atipica', atypical), ('salto_de_magnitud', jump), ('diferencia_negativa', negative)):
+        motive += np.where(mask[member, period], f'{rule}, ', '')
+    anomalies['Motivo'] = motive.str.rstrip(', ')
+
+    if 'Nombre' in panel.columns:
+        # Nombre: el primero registrado en el panel para cada socio marcado
+        rows = np.flatnonzero(np.isin(codes, member))
+        names = panel['Nombre'].take(rows).set_axis(uniques[codes[rows]]).dropna()
+        anomalies['Nombre'] = anomalies['Rut'].map(names[~names.index.duplicated(keep='first')])
+    else:
+        anomalies['Nombre'] = None
+
+    return anomalies[ANOMALY_COLUMNS].sort_values(['Periodo', 'Rut'], kind='stable').reset_index(drop=True)
+
+
+def load_balance_panel(
+    year: int,
+    month: int,
+    good: pd.DataFrame,
+    previous_good: pd.DataFrame,
+    window: int = ANOMALY_WINDOW,
+) -> pd.DataFrame:
+    """
+    Arma el panel de saldos para evaluar un período: el archivo Bueno del período y el del mes
+    anterior (en memoria) y los archivos Bueno de data/processed de los meses previos que cubren
+    la ventana (solo Rut y Saldo). Los meses sin archivo Bueno quedan fuera del cálculo.
+
+    Los saldos se leen de los archivos Bueno y no del historial SQLite: leer un año de socios
+    desde SQLite toma varias veces lo que toma leer las dos columnas de los CSV.
+    """
+    prev_year, prev_month = get_previous_period(year, month)
+    frames = [
+        good[['Rut', 'Saldo', 'Nombre']].assign(Periodo=year * 100 + month),
+        previous_good[['Rut', 'Saldo', 'Nombre']].assign(Periodo=prev_year * 100 + prev_month),
+    ]
+    y, m = prev_year, prev_month
+    for _ in range(window):
+        y, m = get_previous_period(y, m)
+        path = get_processed_csv_path(y, m)
+        if artifact_exists(path):
+            frames.append(read_processed(path, columns=['Rut', 'Saldo']).assign(Periodo=y * 100 + m))
+    return pd.concat(frames, ignore_index=True)
+
+
+def generate_anomalies(
+    year: int,
+    month: int,
+    good: pd.DataFrame,
+    previous_good: pd.DataFrame,
+    thresholds: Optional[AnomalyThresholds] = None,
+) -> pd.DataFrame:
+    """
+    Detecta los movimientos anómalos del período contra el historial de cada socio.
+
+    Args:
+        year: Año del período
+        month: Mes del período
+        good: Archivo Bueno del período
+        previous_good: Archivo Bueno del mes anterior
+        thresholds: Umbrales opcionales (ver AnomalyThresholds)
+
+    Returns:
+        pd.DataFrame: Movimientos anómalos del período (ver detect_anomalies)
+
+    Raises:
+        ConsolidationError: Si falla la lectura de los archivos Bueno anteriores o la detección
+    """
+    thresholds = thresholds or AnomalyThresholds()
+    logger.info(f"Buscando movimientos anómalos del período {year}-{month:02d}")
+    try:
+        panel = load_balance_panel(year, month, good, previous_good, window=thresholds.window)
+        anomalies = detect_anomalies(panel, periods=[year * 100 + month], thresholds=thresholds)
+    except Exception as e:
+        logger.exception("Error detectando movimientos anómalos")
+        raise ConsolidationError("No se pudieron detectar los movimientos anómalos") from e
+
+    if anomalies.empty:
+        logger.info("Sin movimientos anómalos")
+    else:
+        logger.warning(f"Movimientos anómalos: {len(anomalies)} socios, ver {get_anomalies_csv_path(year, month)}")
+    return anomalies
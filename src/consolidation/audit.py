@@ -0,0 +1,248 @@
+# src/consolidation/audit.py
+
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from src.ingestion.csv_processor import process_csv
+from src.comparison.diff_generator import generate_diffs
+from src.consolidation.monthly_builder import build_monthly_file
+from src.utils.artifacts import artifact_exists
+from src.utils.csv_io import read_diffs, read_processed
+from src.utils.dates import get_previous_period
+from src.utils.exceptions import ConsolidationError
+from src.utils.logging import setup_logger
+from src.utils.shared_frames import SharedFrame, SharedFrameStore, share_frame
+from src.utils.paths import (
+    get_base_path,
+    get_dictionary_path,
+    get_diff_csv_path,
+    get_original_csv_path,
+    get_processed_csv_path,
+)
+
+logger = setup_logger(__name__)
+
+# Diferencias menores a esta tolerancia se consideran iguales
+TOLERANCE = 0.5
+
+NUMERIC_COLUMNS = ['Debito', 'Credito', 'Saldo', 'Cuotas']
+
+DRIFT_COLUMNS = ['Periodo', 'Rut', 'Nombre', 'Tipo'] + [f'{col}_diff' for col in NUMERIC_COLUMNS]
+
+SUMMARY_COLUMNS = [
+    'Periodo', 'Estado', 'socios_esperados', 'socios_almacenados', 'socios_con_diferencias',
+    'saldo_esperado', 'saldo_almacenado', 'diff_saldo_esperado', 'diff_saldo_almacenado', 'Detalle',
+]
+
+
+@dataclass
+class AuditResult:
+    """Resultado de una auditoría: diferencias por socio y resumen por mes."""
+    members: pd.DataFrame
+    summary: pd.DataFrame
+
+    @property
+    def has_drift(self) -> bool:
+        return bool((self.summary['Estado'] != 'OK').any())
+
+
+def _periods(start: Tuple[int, int], end: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """Lista los períodos entre start y end, ambos incluidos."""
+    periods = []
+    year, month = end
+    while (year, month) >= start:
+        periods.append((year, month))
+        year, month = get_previous_period(year, month)
+    return periods[::-1]
+
+
+def _parse_original(year: int, month: int) -> Tuple[Tuple[int, int], Optional[SharedFrame], Optional[str]]:
+    """
+    Procesa el CSV original de un período (se ejecuta en un proceso trabajador).
+
+    El resultado se publica en memoria compartida: al proceso principal solo vuelve la referencia.
+    """
+    try:
+        df = process_csv(
+            get_original_csv_path(year, month),
+            base_path=get_base_path(),
+            diccionario_path=get_dictionary_path(),
+        )
+        return (year, month), share_frame(df), None
+    except Exception as e:
+        return (year, month), None, str(e)
+
+
+def _summary_row(periodo: int, estado: str, detalle: str = '', **values) -> Dict:
+    row = {col: None for col in SUMMARY_COLUMNS}
+    row.update(values, Periodo=periodo, Estado=estado, Detalle=detalle)
+    return row
+
+
+def compare_good_files(periodo: int, expected: pd.DataFrame, stored: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compara el archivo Bueno esperado con el almacenado, socio por socio.
+
+    Args:
+        periodo: Clave YYYYMM del período
+        expected: Archivo Bueno re-derivado desde los originales
+        stored: Archivo Bueno almacenado en data/processed
+
+    Returns:
+        pd.DataFrame: Diferencias por socio con columnas: Periodo, Rut, Nombre, Tipo,
+                     Debito_diff, Credito_diff, Saldo_diff, Cuotas_diff. Tipo es "faltante"
+                     (esperado y no almacenado), "sobrante" (almacenado y no esperado) o
+                     "diferencia" (valores distintos)
+    """
+    def prepare(df: pd.DataFrame) -> pd.DataFrame:
+        df = df[['Rut', 'Nombre'] + NUMERIC_COLUMNS].copy()
+        df['Rut'] = df['Rut'].astype(str).str.upper().str.strip()
+        df[NUMERIC_COLUMNS] = df[NUMERIC_COLUMNS].apply(pd.to_numeric, errors='coerce').fillna(0)
+        return df.drop_duplicates(subset=['Rut'], keep='first')
+
+    merged = pd.merge(
+        prepare(expected), prepare(stored), on='Rut', how='outer',
+        suffixes=('_esperado', '_almacenado'), indicator=True,
+    )
+    for col in NUMERIC_COLUMNS:
+        merged[f'{col}_diff'] = merged[f'{col}_almacenado'].fillna(0) - merged[f'{col}_esperado'].fillna(0)
+
+    differs = (merged[[f'{col}_diff' for col in NUMERIC_COLUMNS]].abs() > TOLERANCE).any(axis=1)
+    merged['Tipo'] = merged['_merge'].map({
+        'left_only': 'faltante', 'right_only': 'sobrante', 'both': 'diferencia'
+    }).astype(str)
+    merged['Nombre'] = merged['Nombre_almacenado'].fillna(merged['Nombre_esperado'])
+    merged['Periodo'] = periodo
+
+    drift = merged[(merged['_merge'] != 'both') | differs]
+    return drift[DRIFT_COLUMNS].reset_index(drop=True)
+
+
+def _audit_month(
+    year: int,
+    month: int,
+    current_ref: SharedFrame,
+    previous_ref: SharedFrame,
+) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Audita un período contra sus vecinos almacenados (se ejecuta en un proceso trabajador).
+
+    Los originales procesados se leen directamente de la memoria compartida, sin copiarlos.
+    """
+    periodo = year * 100 + month
+    current = current_ref.attach()
+    previous = previous_ref.attach()
+    prev_year, prev_month = get_previous_period(year, month)
+    previous_good_path = get_processed_csv_path(prev_year, prev_month)
+    good_path = get_processed_csv_path(year, month)
+
+    for path in (previous_good_path, good_path):
+        if not artifact_exists(path):
+            return pd.DataFrame(columns=DRIFT_COLUMNS), _summary_row(
+                periodo, 'ERROR', f"Archivo consolidado no encontrado: {path}"
+            )
+
+    try:
+        diffs = generate_diffs(current, previous)
+        expected = build_monthly_file(diffs, read_processed(previous_good_path))
+        stored = read_processed(good_path)
+        drift = compare_good_files(periodo, expected, stored)
+
+        diff_saldo_almacenado = None
+        diff_path = get_diff_csv_path(year, month)
+        if artifact_exists(diff_path):
+            diff_saldo_almacenado = float(read_diffs(diff_path, columns=['diff_saldo'])['diff_saldo'].sum())
+        diff_saldo_esperado = float(diffs['diff_saldo'].sum())
+
+        estado = 'OK'
+        if not drift.empty or (
+            diff_saldo_almacenado is not None and abs(diff_saldo_almacenado - diff_saldo_esperado) > TOLERANCE
+        ):
+            estado = 'DRIFT'
+
+        summary = _summary_row(
+            periodo,
+            estado,
+            socios_esperados=len(expected),
+            socios_almacenados=len(stored),
+            socios_con_diferencias=len(drift),
+            saldo_esperado=float(expected['Saldo'].sum()),
+            saldo_almacenado=float(pd.to_numeric(stored['Saldo'], errors='coerce').sum()),
+            diff_saldo_esperado=diff_saldo_esperado,
+            diff_saldo_almacenado=diff_saldo_almacenado,
+        )
+        return drift, summary
+    except Exception as e:
+        return pd.DataFrame(columns=DRIFT_COLUMNS), _summary_row(periodo, 'ERROR', str(e))
+
+
+def audit_range(
+    start: Tuple[int, int],
+    end: Tuple[int, int],
+    max_workers: Optional[int] = None,
+) -> AuditResult:
+    """
+    Audita la cadena de archivos Bueno de un rango de períodos contra los originales.
+
+    Para cada período N se re-deriva el archivo Bueno esperado como la consolidación de las
+    diferencias entre los originales de N y N-1 sobre el Bueno almacenado de N-1, y se compara
+    con el Bueno almacenado de N. Así cada eslabón de la cadena se verifica de forma independiente:
+    primero se procesan todos los originales en paralelo (cada uno una sola vez) y luego se
+    auditan todos los meses en paralelo, sin reproducir el pipeline mes a mes. Cada original
+    procesado viaja entre procesos como referencia a memoria compartida, no como pickle.
+
+    Args:
+        start: Período inicial (año, mes)
+        end: Período final (año, mes), incluido
+        max_workers: Cantidad máxima de procesos trabajadores
+
+    Returns:
+        AuditResult: Diferencias por socio y resumen por mes
+
+    Raises:
+        ConsolidationError: Si el rango de períodos es inválido
+    """
+    if start > end:
+        raise ConsolidationError(f"Rango de auditoría inválido: {start} > {end}")
+
+    periods = _periods(start, end)
+    to_parse = [get_previous_period(*start)] + periods
+    logger.info(f"Auditando {len(periods)} períodos entre {start[0]}-{start[1]:02d} y {end[0]}-{end[1]:02d}")
+
+    parsed: Dict[Tuple[int, int], SharedFrame] = {}
+    parse_errors: Dict[Tuple[int, int], str] = {}
+    drifts: List[pd.DataFrame] = []
+    summaries: List[Dict] = []
+
+    # Los originales procesados se comparten entre procesos en memoria compartida, que se libera
+    # al terminar (el store se crea antes que los procesos trabajadores, ver SharedFrameStore)
+    with SharedFrameStore() as store, ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for period, frame, error in pool.map(_parse_original, *zip(*to_parse)):
+            if error is None:
+                parsed[period] = store.adopt(frame)
+            else:
+                parse_errors[period] = error
+
+        futures = []
+        for year, month in periods:
+            previous = get_previous_period(year, month)
+            errors = [f"{p[0]}{p[1]:02d}: {parse_errors[p]}" for p in (previous, (year, month)) if p in parse_errors]
+            if errors:
+                summaries.append(_summary_row(year * 100 + month, 'ERROR', "; ".join(errors)))
+                continue
+            futures.append(pool.submit(_audit_month, year, month, parsed[(year, month)], parsed[previous]))
+
+        for future in futures:
+            drift, summary = future.result()
+            drifts.append(drift)
+            summaries.append(summary)
+
+    members = pd.concat(drifts, ignore_index=True) if drifts else pd.DataFrame(columns=DRIFT_COLUMNS)
+    summary = pd.DataFrame(summaries, columns=SUMMARY_COLUMNS).sort_values('Periodo').reset_index(drop=True)
+
+    for _, row in summary[summary['Estado'] != 'OK'].iterrows():
+        logger.warning(f"Auditoría {row['Periodo']}: {row['Estado']} {row['Detalle'] or ''}".rstrip())
+    logger.info(f"Auditoría finalizada: {int((summary['Estado'] == 'OK').sum())}/{len(summary)} períodos sin diferencias")
+
+    return AuditResult(members=members, summary=summary)
@@ -0,0 +1,249 @@
+# src/consolidation/ledger.py
+
+import os
+import pandas as pd
+from datetime import date
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+from src.consolidation.monthly_builder import build_monthly_file
+from src.utils.artifacts import append_atomic, list_artifacts, remove_artifact, write_csv
+from src.utils.contracts import DIFFS
+from src.utils.csv_io import read_csv, read_processed
+from src.utils.exceptions import ConsolidationError
+from src.utils.logging import setup_logger
+from src.utils.dates import get_previous_period
+from src.utils.paths import get_ledger_path, get_snapshot_dir
+
+logger = setup_logger(__name__)
+
+# Cantidad de períodos registrados en el ledger entre dos snapshots consecutivos
+SNAPSHOT_INTERVAL = int(os.getenv("LEDGER_SNAPSHOT_INTERVAL", "12"))
+
+LEDGER_COLUMNS = ['Periodo', 'Revision', 'Nombre', 'Rut', 'diff_debito', 'diff_credito', 'diff_saldo']
+DIFF_COLUMNS = ['Nombre', 'Rut', 'diff_debito', 'diff_credito', 'diff_saldo']
+SNAPSHOT_COLUMNS = ['Rut', 'Debito', 'Credito', 'Saldo', 'Cuotas', 'Nombre']
+
+
+def period_key(year: int, month: int) -> int:
+    """Convierte un período (año, mes) a su clave entera YYYYMM."""
+    return year * 100 + month
+
+
+def key_to_period(key: int) -> Tuple[int, int]:
+    """Convierte una clave YYYYMM al par (año, mes)."""
+    return key // 100, key % 100
+
+
+def _normalize_rut(ruts: pd.Series) -> pd.Series:
+    """Normaliza el Rut igual que la consolidación: mayúsculas y sin espacios."""
+    return ruts.astype(str).str.upper().str.strip()
+
+
+def _snapshot_dir(snapshot_dir: Optional[Path]) -> Path:
+    return snapshot_dir if snapshot_dir is not None else get_snapshot_dir()
+
+
+def list_snapshots(snapshot_dir: Optional[Path] = None) -> List[int]:
+    """
+    Lista las claves YYYYMM de los snapshots disponibles, ordenadas de forma ascendente.
+    """
+    return sorted(int(p.stem) for p in list_artifacts(_snapshot_dir(snapshot_dir)) if p.stem.isdigit())
+
+
+def read_ledger(ledger_path: Optional[Path] = None, keep_revisions: bool = False) -> pd.DataFrame:
+    """
+    Lee el ledger de diferencias.
+
+    Por defecto solo se conserva la última revisión registrada de cada período, de modo que
+    un período reescrito (por ejemplo, en una re-emisión contable) reemplaza lógicamente a las
+    revisiones anteriores sin borrarlas del archivo.
+
+    Args:
+        ledger_path: Ruta opcional al ledger (por defecto data/ledger/deltas.csv)
+        keep_revisions: Si es True, devuelve todas las revisiones registradas
+
+    Returns:
+        pd.DataFrame: DataFrame con columnas: Periodo, Revision, Nombre, Rut, diff_debito,
+                     diff_credito, diff_saldo
+    """
+    ledger_path = ledger_path or get_ledger_path()
+    if not ledger_path.exists():
+        return pd.DataFrame(columns=LEDGER_COLUMNS)
+
+    ledger = read_csv(ledger_path, columns=LEDGER_COLUMNS, dtype={'Rut': str, 'Nombre': str})
+    if keep_revisions or ledger.empty:
+        return ledger
+
+    latest = ledger.groupby('Periodo')['Revision'].transform('max')
+    return ledger[ledger['Revision'] == latest].reset_index(drop=True)
+
+
+def _write_snapshot(df: pd.DataFrame, key: int, snapshot_dir: Optional[Path]) -> None:
+    path = _snapshot_dir(snapshot_dir) / f"{key}.csv"
+    write_csv(df[SNAPSHOT_COLUMNS], path, index=False)
+    logger.info(f"Snapshot del ledger escrito: {path.name}")
+
+
+def append_period(
+    year: int,
+    month: int,
+    diffs: pd.DataFrame,
+    previous_good: pd.DataFrame,
+    good: pd.DataFrame,
+    ledger_path: Optional[Path] = None,
+    snapshot_dir: Optional[Path] = None,
+    snapshot_interval: int = SNAPSHOT_INTERVAL,
+) -> int:
+    """
+    Registra las diferencias de un período en el ledger append-only.
+
+    Si todavía no existe un snapshot anterior al período, el archivo bueno del mes anterior
+    se guarda como snapshot inicial. Cada `snapshot_interval` períodos registrados se guarda
+    además el archivo bueno del período como nuevo checkpoint completo. Si el período ya estaba
+    registrado, se agrega una nueva revisión y se descartan los snapshots posteriores, que
+    quedaron desactualizados.
+
+    Args:
+        year: Año del período
+        month: Mes del período
+        diffs: DataFrame de diferencias del período (Nombre, Rut, diff_debito, diff_credito, diff_saldo)
+        previous_good: Archivo bueno del mes anterior
+        good: Archivo bueno del período
+        ledger_path: Ruta opcional al ledger
+        snapshot_dir: Directorio opcional de snapshots
+        snapshot_interval: Cantidad de períodos entre snapshots
+
+    Returns:
+        int: Número de revisión registrado para el período
+
+    Raises:
+        ConsolidationError: Si las diferencias no tienen las columnas requeridas
+    """
+    ledger_path = ledger_path or get_ledger_path()
+    key = period_key(year, month)
+
+    DIFFS.require(diffs, error=ConsolidationError, source="El DataFrame de diferencias")
+
+    history = read_ledger(ledger_path, keep_revisions=True)
+    previous_revisions = history.loc[history['Periodo'] == key, 'Revision']
+    revision = int(previous_revisions.max()) + 1 if not previous_revisions.empty else 0
+
+    snapshots = list_snapshots(snapshot_dir)
+    if revision > 0:
+        for stale in [s for s in snapshots if s >= key]:
+            remove_artifact(_snapshot_dir(snapshot_dir) / f"{stale}.csv")
+            logger.info(f"Snapshot {stale} descartado por revisión del período {key}")
+        snapshots = [s for s in snapshots if s < key]
+
+    if not snapshots:
+        prev_key = period_key(*get_previous_period(year, month))
+        _write_snapshot(previous_good, prev_key, snapshot_dir)
+        snapshots = [prev_key]
+
+    entries = diffs[DIFF_COLUMNS].copy()
+    entries.insert(0, 'Revision', revision)
+    entries.insert(0, 'Periodo', key)
+
+    # Se agrega sobre una copia que reemplaza al ledger: un corte a mitad de la escritura no deja
+    # una fila incompleta que impida leerlo
+    ledger_path.parent.mkdir(parents=True, exist_ok=True)
+    append_atomic(ledger_path, entries.to_csv(header=not ledger_path.exists(), index=False).encode("utf-8"))
+    logger.info(f"Ledger: período {key} registrado (revisión {revision}, {len(entries)} movimientos)")
+
+    registered = set(history['Periodo']) | {key}
+    periods_since_snapshot = len([p for p in registered if snapshots[-1] < p <= key])
+    if periods_since_snapshot >= snapshot_interval or revision > 0:
+        _write_snapshot(good, key, snapshot_dir)
+
+    return revision
+
+
+def _expected_periods(start_key: int, end_key: int) -> List[int]:
+    """Claves de los períodos en el intervalo (start_key, end_key]."""
+    periods = []
+    year, month = key_to_period(end_key)
+    while period_key(year, month) > start_key:
+        periods.append(period_key(year, month))
+        year, month = get_previous_period(year, month)
+    return sorted(periods)
+
+
+def reconstruct_period(
+    year: int,
+    month: int,
+    ruts: Optional[Iterable[str]] = None,
+    ledger_path: Optional[Path] = None,
+    snapshot_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    Reconstruye el archivo Bueno de un período a partir del snapshot más cercano y las
+    diferencias registradas desde entonces.
+
+    Si se indican RUTs, el snapshot y las diferencias se filtran antes de reaplicar los
+    períodos: la consolidación agrupa por Rut, por lo que cada socio se reconstruye de forma
+    independiente.
+
+    Args:
+        year: Año del período
+        month: Mes del período
+        ruts: RUTs opcionales a reconstruir
+        ledger_path: Ruta opcional al ledger
+        snapshot_dir: Directorio opcional de snapshots
+
+    Returns:
+        pd.DataFrame: DataFrame con columnas: Rut, Debito, Credito, Saldo, Cuotas, Nombre
+
+    Raises:
+        ConsolidationError: Si no hay un snapshot anterior o faltan períodos en el ledger
+    """
+    key = period_key(year, month)
+    snapshots = [s for s in list_snapshots(snapshot_dir) if s <= key]
+    if not snapshots:
+        raise ConsolidationError(f"No existe un snapshot del ledger anterior o igual a {key}")
+
+    base_key = snapshots[-1]
+    state = read_processed(_snapshot_dir(snapshot_dir) / f"{base_key}.csv")
+
+    ledger = read_ledger(ledger_path)
+    pending = ledger[(ledger['Periodo'] > base_key) & (ledger['Periodo'] <= key)]
+
+    missing_periods = sorted(set(_expected_periods(base_key, key)) - set(pending['Periodo']))
+    if missing_periods:
+        raise ConsolidationError(f"El ledger no tiene registrados los períodos: {missing_periods}")
+
+    if ruts is not None:
+        wanted = set(_normalize_rut(pd.Series(list(ruts), dtype=str)))
+        state = state[_normalize_rut(state['Rut']).isin(wanted)]
+        pending = pending[_normalize_rut(pending['Rut']).isin(wanted)]
+
+    logger.debug(f"Reconstruyendo {key} desde snapshot {base_key} con {pending['Periodo'].nunique()} períodos")
+    for _, period_diffs in pending.groupby('Periodo', sort=True):
+        state = build_monthly_file(period_diffs[DIFF_COLUMNS], state)
+
+    if state.empty:
+        return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+    return state[SNAPSHOT_COLUMNS].reset_index(drop=True)
+
+
+def get_member_balances(
+    at: date,
+    ruts: Optional[Iterable[str]] = None,
+    ledger_path: Optional[Path] = None,
+    snapshot_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    Consulta los saldos de los socios vigentes en una fecha.
+
+    La granularidad es mensual: se entrega el estado del archivo Bueno del período que
+    contiene la fecha.
+
+    Args:
+        at: Fecha a consultar
+        ruts: RUTs opcionales a consultar (por defecto todos los socios)
+        ledger_path: Ruta opcional al ledger
+        snapshot_dir: Directorio opcional de snapshots
+
+    Returns:
+        pd.DataFrame: DataFrame con columnas: Rut, Debito, Credito, Saldo, Cuotas, Nombre
+    """
+    return reconstruct_period(at.year, at.month, ruts=ruts, ledger_path=ledger_path, snapshot_dir=snapshot_dir)
@@ -0,0 +1,280 @@
+# src/consolidation/partitioned.py
+
+import math
+import os
+import pickle
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Iterator, List, Optional
+from src.comparison.diff_generator import diff_members
+from src.consolidation.monthly_builder import merge_monthly
+from src.utils.exceptions import ConsolidationError, DiffGenerationError
+from src.utils.logging import setup_logger
+from src.utils.names import canonicalize_names
+from src.utils.paths import get_spill_dir
+
+logger = setup_logger(__name__)
+
+# Presupuesto de memoria (MB) para el trabajo de comparación y consolidación. Si la estimación
+# lo supera, ambas etapas se ejecutan por particiones en disco (0 = sin límite: siempre en memoria)
+MEMORY_BUDGET_MB = int(os.getenv("CAPITAL_MEMORY_BUDGET_MB", "0"))
+
+# Cantidad fija de particiones (0 = según el presupuesto de memoria)
+PARTITIONS = int(os.getenv("CAPITAL_PARTITIONS", "0"))
+
+# Memoria de trabajo de generate_diffs y build_monthly_file por byte de entrada (medido con
+# benchmarks/bench_stage_memory.py: pico de ~2 a 2,4 veces el tamaño de las entradas)
+WORKING_SET_FACTOR = 2.5
+
+MAX_PARTITIONS = 256
+
+# Filas por bloque al repartir las entradas y al mezclar los resultados ordenados
+CHUNK_ROWS = 50_000
+
+
+def plan_partitions(*frames: pd.DataFrame, budget_mb: Optional[int] = None, partitions: Optional[int] = None) -> int:
+    """
+    Decide en cuántas particiones procesar las entradas de una etapa.
+
+    Args:
+        frames: Entradas de la etapa
+        budget_mb: Presupuesto de memoria en MB (por defecto CAPITAL_MEMORY_BUDGET_MB)
+        partitions: Cantidad fija de particiones (por defecto CAPITAL_PARTITIONS)
+
+    Returns:
+        int: 1 para procesar en memoria; más de 1 para procesar por particiones en disco
+    """
+    partitions = PARTITIONS if partitions is None else partitions
+    if partitions > 0:
+        return min(partitions, MAX_PARTITIONS)
+    budget_mb = MEMORY_BUDGET_MB if budget_mb is None else budget_mb
+    if budget_mb <= 0:
+        return 1
+    input_mb = sum(df.memory_usage(index=False, deep=True).sum() for df in frames) / 1e6
+    needed = math.ceil(input_mb * WORKING_SET_FACTOR / budget_mb)
+    return min(max(needed, 1), MAX_PARTITIONS)
+
+
+def partition_of(keys: pd.Series, partitions: int) -> np.ndarray:
+    """Partición de cada fila según el hash de su clave (la misma clave cae siempre en la misma)."""
+    return (pd.util.hash_array(keys.to_numpy(dtype=object)) % np.uint64(partitions)).astype(np.int64)
+
+
+def _rut_keys(df: pd.DataFrame) -> pd.Series:
+    """Rut normalizado igual que la consolidación: mayúsculas y sin espacios."""
+    return df['Rut'].astype(str).str.upper().str.strip()
+
+
+def _slices(df: pd.DataFrame, rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(df), rows):
+        yield df.iloc[start:start + rows]
+
+
+class PartitionSpill:
+    """
+    Archivos de partición en disco de un conjunto de filas.
+
+    Las filas se agregan por bloques con `write` y cada partición se lee completa con `read` o
+    bloque a bloque con `pieces`. Dentro de cada partición se conserva el orden en que llegaron
+    las filas.
+    """
+
+    def __init__(self, directory: Path, name: str, partitions: int, template: pd.DataFrame):
+        self.paths = [directory / f"{name}_{p:03d}.pkl" for p in range(partitions)]
+        self.template = template.iloc[:0]
+        self._files = [None] * partitions
+
+    def _file(self, p: int):
+        if self._files[p] is None:
+            self._files[p] = open(self.paths[p], "ab")
+        return self._files[p]
+
+    def write(self, df: pd.DataFrame, keys: np.ndarray) -> None:
+        """Reparte las filas de `df` según la partición de cada una (ver `partition_of`)."""
+        if df.empty:
+            return
+        order = np.argsort(keys, kind="stable")
+        bounds = np.searchsorted(keys[order], np.arange(len(self.paths) + 1))
+        sorted_df = df.take(order)
+        for p in range(len(self.paths)):
+            if bounds[p] < bounds[p + 1]:
+                self.write_partition(p, sorted_df.iloc[bounds[p]:bounds[p + 1]])
+
+    def write_partition(self, p: int, df: pd.DataFrame) -> None:
+        for piece in _slices(df):
+            pickle.dump(piece, self._file(p), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def close(self) -> None:
+        for i, f in enumerate(self._files):
+            if f is not None:
+                f.close()
+                self._files[i] = None
+
+    def pieces(self, p: int) -> Iterator[pd.DataFrame]:
+        self.close()
+        if not self.paths[p].exists():
+            return
+        with open(self.paths[p], "rb") as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    return
+
+    def read(self, p: int) -> pd.DataFrame:
+        pieces = list(self.pieces(p))
+        if not pieces:
+            return self.template
+        return pd.concat(pieces, ignore_index=True)
+
+
+def _merge_sorted(spill: PartitionSpill, key: str) -> Iterator[pd.DataFrame]:
+    """
+    Mezcla las particiones (cada una ordenada por `key`) en bloques ordenados globalmente.
+
+    En cada vuelta se emiten, de todas las particiones, las filas con clave menor o igual a la
+    menor de las últimas claves de los bloques cargados: ninguna fila pendiente puede quedar
+    antes. Las claves iguales están siempre en la misma partición, así que su orden se conserva.
+    """
+    readers = {p: spill.pieces(p) for p in range(len(spill.paths))}
+    heads = {}
+    for p, reader in readers.items():
+        piece = next(reader, None)
+        if piece is not None:
+            heads[p] = piece
+
+    while heads:
+        bound = min(piece[key].iloc[-1] for piece in heads.values())
+        batch = []
+        for p in sorted(heads):
+            piece = heads[p]
+            cut = int(np.searchsorted(piece[key].to_numpy(dtype=object), bound, side="right"))
+            batch.append(piece.iloc[:cut])
+            if cut < len(piece):
+                heads[p] = piece.iloc[cut:]
+                continue
+            following = next(readers[p], None)
+            if following is None:
+                del heads[p]
+            else:
+                heads[p] = following
+        batch = pd.concat(batch, ignore_index=True)
+        order = np.argsort(batch[key].to_numpy(dtype=object), kind="stable")
+        yield batch.take(order).reset_index(drop=True)
+
+
+def _spill_dir(spill_dir: Optional[Path]) -> tempfile.TemporaryDirectory:
+    directory = spill_dir or get_spill_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    return tempfile.TemporaryDirectory(prefix="particiones_", dir=directory)
+
+
+def _concat(chunks: List[pd.DataFrame], empty: pd.DataFrame) -> pd.DataFrame:
+    return pd.concat(chunks, ignore_index=True) if chunks else empty
+
+
+def generate_diffs_partitioned(
+    current: pd.DataFrame,
+    previous: pd.DataFrame,
+    renames: Optional[pd.DataFrame] = None,
+    partitions: int = 2,
+    spill_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    Igual que `generate_diffs`, pero comparando una partición a la vez.
+
+    Ambos meses se reparten en disco según el hash del nombre canónico (la clave del cruce entre
+    meses; en el mes anterior, el nombre ya renombrado, para que un socio renombrado quede en la
+    misma partición que su nombre actual). Cada partición se compara por separado y los
+    resultados, ordenados por nombre, se mezclan en orden. La memoria de trabajo es la de una
+    partición.
+
+    Raises:
+        DiffGenerationError: Si falta alguna columna o falla la comparación de una partición
+    """
+    logger.info(f"Generando diferencias intermensuales en {partitions} particiones")
+
+    rename_map = {}
+    if renames is not None and not renames.empty:
+        applied = renames[renames['aplicado'].astype(bool)]
+        rename_map = dict(zip(
+            canonicalize_names(applied['nombre_anterior']), canonicalize_names(applied['nombre_actual'])
+        ))
+
+    try:
+        with _spill_dir(spill_dir) as directory:
+            directory = Path(directory)
+            current_spill = PartitionSpill(directory, "actual", partitions, current)
+            previous_spill = PartitionSpill(directory, "anterior", partitions, previous)
+            for chunk in _slices(current):
+                current_spill.write(chunk, partition_of(canonicalize_names(chunk['nombre']), partitions))
+            for chunk in _slices(previous):
+                names = canonicalize_names(chunk['nombre'])
+                names = names.replace(rename_map) if rename_map else names
+                previous_spill.write(chunk, partition_of(names, partitions))
+
+            result_spill = PartitionSpill(directory, "diferencias", partitions, pd.DataFrame())
+            for p in range(partitions):
+                result_spill.write_partition(
+                    p, diff_members(current_spill.read(p), previous_spill.read(p), renames=renames)
+                )
+            diffs = _concat(
+                list(_merge_sorted(result_spill, 'Nombre')),
+                diff_members(current.iloc[:0], previous.iloc[:0]),
+            )
+    except DiffGenerationError:
+        raise
+    except Exception as e:
+        logger.exception("Error generando diferencias por particiones")
+        raise DiffGenerationError("No se pudieron generar las diferencias") from e
+
+    logger.info(f"Diferencias generadas: {len(diffs)} filas")
+    return diffs
+
+
+def build_monthly_file_partitioned(
+    diffs: pd.DataFrame,
+    previous_good: pd.DataFrame,
+    partitions: int = 2,
+    spill_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    Igual que `build_monthly_file`, pero consolidando una partición a la vez.
+
+    Las diferencias y el archivo Bueno anterior se reparten en disco según el hash del Rut
+    normalizado (la consolidación es independiente por Rut). En cada partición las filas
+    conservan su orden original, así que el nombre elegido para cada Rut es el mismo que en
+    memoria. Los resultados, ordenados por Rut, se mezclan en orden.
+
+    Raises:
+        ConsolidationError: Si falta alguna columna o falla la consolidación de una partición
+    """
+    logger.info(f"Construyendo archivo Bueno del mes en {partitions} particiones")
+
+    try:
+        with _spill_dir(spill_dir) as directory:
+            directory = Path(directory)
+            diff_spill = PartitionSpill(directory, "diferencias", partitions, diffs)
+            previous_spill = PartitionSpill(directory, "bueno_anterior", partitions, previous_good)
+            for chunk in _slices(diffs):
+                diff_spill.write(chunk, partition_of(_rut_keys(chunk), partitions))
+            for chunk in _slices(previous_good):
+                previous_spill.write(chunk, partition_of(_rut_keys(chunk), partitions))
+
+            result_spill = PartitionSpill(directory, "bueno", partitions, pd.DataFrame())
+            for p in range(partitions):
+                result_spill.write_partition(p, merge_monthly(diff_spill.read(p), previous_spill.read(p)))
+            result = _concat(
+                list(_merge_sorted(result_spill, 'Rut')),
+                merge_monthly(diffs.iloc[:0], previous_good.iloc[:0]),
+            )
+    except ConsolidationError:
+        raise
+    except Exception as e:
+        logger.exception("Error en consolidación mensual por particiones")
+        raise ConsolidationError("Fallo al construir archivo mensual") from e
+
+    logger.info(f"Archivo mensual generado: {len(result)} registros")
+    return result
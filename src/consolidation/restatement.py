@@ -0,0 +1,88 @@
+# src/consolidation/restatement.py
+
+import pandas as pd
+from typing import Optional, Set, Tuple
+from src.consolidation.monthly_builder import build_monthly_file
+from src.utils.contracts import GOOD
+from src.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+GOOD_COLUMNS = ['Rut', 'Debito', 'Credito', 'Saldo', 'Cuotas', 'Nombre']
+COMPARED_COLUMNS = ['Debito', 'Credito', 'Saldo', 'Cuotas', 'Nombre']
+
+
+def _keys(df: pd.DataFrame) -> pd.Series:
+    """Rut normalizado igual que la consolidación: mayúsculas y sin espacios."""
+    return df['Rut'].astype(str).str.upper().str.strip()
+
+
+def changed_ruts(old: Optional[pd.DataFrame], new: pd.DataFrame) -> Set[str]:
+    """
+    Compara dos versiones del archivo Bueno de un mismo período.
+
+    Args:
+        old: Versión anterior (None si no existía)
+        new: Versión nueva
+
+    Returns:
+        Set[str]: RUTs normalizados que aparecen, desaparecen o cambian algún valor
+    """
+    if old is None:
+        return set(_keys(new))
+
+    def prepare(df: pd.DataFrame) -> pd.DataFrame:
+        df = df[COMPARED_COLUMNS].set_axis(_keys(df), axis=0)
+        return df[~df.index.duplicated(keep='first')]
+
+    before, after = prepare(old), prepare(new)
+    merged = before.join(after, how='outer', lsuffix='_old', rsuffix='_new')
+
+    differs = pd.Series(False, index=merged.index)
+    for col in COMPARED_COLUMNS:
+        a, b = merged[f'{col}_old'], merged[f'{col}_new']
+        if col != 'Nombre':
+            a, b = pd.to_numeric(a, errors='coerce'), pd.to_numeric(b, errors='coerce')
+        differs |= ~((a == b) | (a.isna() & b.isna()))
+    return set(merged.index[differs])
+
+
+def propagate_changes(
+    diffs: pd.DataFrame,
+    previous_good: pd.DataFrame,
+    good: pd.DataFrame,
+    ruts: Set[str],
+) -> Tuple[pd.DataFrame, Set[str]]:
+    """
+    Actualiza el archivo Bueno de un período tras un cambio en el Bueno del mes anterior.
+
+    La consolidación es independiente por Rut (cada fila del Bueno depende solo de las filas del
+    mismo Rut en el Bueno anterior y en las diferencias), por lo que basta con reconstruir los
+    RUTs que cambiaron en el mes anterior y conservar el resto del archivo tal como estaba. El
+    resultado es igual al de reconstruir el mes completo con `build_monthly_file`.
+
+    Args:
+        diffs: Diferencias del período (sin cambios: sus originales no se re-emitieron)
+        previous_good: Archivo Bueno corregido del mes anterior
+        good: Archivo Bueno almacenado del período
+        ruts: RUTs normalizados que cambiaron en el mes anterior
+
+    Returns:
+        Tuple[pd.DataFrame, Set[str]]: Archivo Bueno actualizado y RUTs que cambiaron en él
+
+    Raises:
+        ConsolidationError: Si el archivo Bueno no tiene las columnas requeridas
+    """
+    GOOD.require(good, source="El archivo Bueno")
+
+    in_ruts = _keys(good).isin(ruts)
+    rebuilt = build_monthly_file(diffs[_keys(diffs).isin(ruts)], previous_good[_keys(previous_good).isin(ruts)])
+    changed = changed_ruts(good[in_ruts], rebuilt)
+    if not changed:
+        return good, changed
+
+    result = pd.concat([good.loc[~in_ruts, GOOD_COLUMNS], rebuilt], ignore_index=True)
+    result['Cuotas'] = result['Cuotas'].astype('int64')
+    result = result.sort_values('Rut', kind='mergesort').reset_index(drop=True)
+    logger.info(f"Re-expresión: {len(changed)} socios modificados de {len(result)}")
+    return result, changed
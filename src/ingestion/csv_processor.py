@@ -4,8 +4,12 @@ import math
 import pandas as pd
 from pathlib import Path
 from typing import Optional
+from src.ingestion.csv_scanner import read_member_rows
+from src.ingestion.reference_index import get_reference_index
+from src.utils.artifacts import artifact_exists
 from src.utils.exceptions import IngestionError
 from src.utils.logging import setup_logger
+from src.utils.names import canonicalize_names
 
 logger = setup_logger(__name__)
 
@@ -98,20 +102,14 @@ def process_csv(
     """
     logger.info(f"Procesando archivo CSV: {csv_path.name}")
     
-    if not csv_path.exists():
+    if not artifact_exists(csv_path):
         raise IngestionError(f"Archivo CSV no encontrado: {csv_path}")
     
     try:
-        # Leer CSV empezando desde la fila 12 (header=12)
-        df = pd.read_csv(csv_path, delimiter=delimiter, header=12)
-        logger.debug(f"CSV leído con {len(df)} filas")
-        
-        # Eliminar la última fila
-        df = df.iloc[:-1]
-        
-        # Filtrar filas que no contengan "/" en la columna "Vencto."
-        clean_df = df[~df["Vencto."].str.contains("/").fillna(False)].reset_index(drop=True)
-        logger.debug(f"Después de filtrar: {len(clean_df)} filas")
+        # Leer solo las filas de socios: el escáner ubica el encabezado (fila 12), descarta la
+        # última fila (totales) y las filas con "/" en la columna "Vencto." antes de parsearlas
+        clean_df = read_member_rows(csv_path, delimiter=delimiter)
+        logger.debug(f"Filas de socios leídas: {len(clean_df)}")
         
         # Crear "join_key" para juntar ambas filas por socio más adelante
         clean_df["join_key"] = pd.Series(clean_df.index).apply(lambda x: math.floor(x/2))
@@ -136,17 +134,10 @@ def process_csv(
         df_final = df_principal.join(df_secundario)
         df_final = df_final.reset_index(drop=True)
         
-        # Cargar archivos de referencia si están disponibles
-        base = None
-        diccionario = None
-        
-        if base_path and base_path.exists():
-            logger.debug(f"Cargando archivo base: {base_path}")
-            base = pd.read_csv(base_path, index_col="Unnamed: 0")
-        
-        if diccionario_path and diccionario_path.exists():
-            logger.debug(f"Cargando diccionario: {diccionario_path}")
-            diccionario = pd.read_csv(diccionario_path)
+        # Cargar archivos de referencia si están disponibles (se reutilizan mientras no cambien)
+        reference = get_reference_index(base_path, diccionario_path)
+        base = reference.base
+        diccionario = reference.diccionario
         
         # Aplicar regularización de nombres (siempre se aplica, independientemente de los archivos de referencia)
         logger.debug("Aplicando regularización de nombres")
@@ -187,7 +178,9 @@ def process_csv(
             logger.info(f"Se eliminaron {filas_eliminadas} filas con categoría vacía o nula. "
                        f"Filas antes: {filas_antes_filtro}, filas después: {filas_despues_filtro}")
         
-        # Agrupar filas duplicadas por nombre, sumando valores numéricos y manteniendo el primer rut
+        # Agrupar filas duplicadas por nombre, sumando valores numéricos y manteniendo el primer rut.
+        # Se agrupa por la forma canónica del nombre (sin tildes, en mayúsculas y con espacios
+        # simples), la misma con que generate_diffs cruza los meses; se conserva el nombre original
         logger.debug("Agrupando filas duplicadas por nombre")
         filas_antes = len(df_final)
         
@@ -201,10 +194,11 @@ def process_csv(
             'creditos': 'sum',  # Sumar creditos
             'saldo': 'sum',  # Sumar saldo
             'categoria': 'first',  # Mantener la primera categoria
-            'nombre': 'first'  # Mantener el nombre (debe ser igual en todas las filas del grupo)
+            'nombre': 'first'  # Mantener el primer nombre tal como viene en el original
         }
         
-        df_final = df_final.groupby('nombre', as_index=False).agg(agg_dict)
+        df_final = df_final.groupby(canonicalize_names(df_final["nombre"]).rename("clave")).agg(agg_dict)
+        df_final = df_final.reset_index(drop=True)
         filas_despues = len(df_final)
         
         if filas_antes != filas_despues:
@@ -0,0 +1,227 @@
+# src/ingestion/csv_scanner.py
+
+import csv
+import io
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+from src.utils.artifacts import artifact_buffer
+from src.utils.csv_io import get_engine
+from src.utils.exceptions import IngestionError
+from src.utils.logging import setup_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow es opcional: sin él se usa el lector de pandas
+    pa = None
+
+logger = setup_logger(__name__)
+
+# Fila (sin contar líneas vacías) donde está el encabezado en el CSV convertido desde XLS
+HEADER_ROW = 12
+
+# Columnas del CSV convertido que usa el procesamiento de socios
+MEMBER_COLUMNS = ["TP", "Vencto.", "Detalle", "TP.1", "Unnamed: 8", "Créditos", "Saldo", "Unnamed: 11"]
+
+
+@dataclass
+class CsvLayout:
+    """
+    Ubicación (en bytes) de las regiones del CSV convertido.
+
+    El archivo tiene un preámbulo de HEADER_ROW líneas, una línea de encabezado, la región de
+    datos y una línea final de totales (trailer).
+    """
+    header_start: int
+    data_start: int
+    trailer_start: int
+    end: int
+    columns: List[str]
+
+
+def _mangle_columns(names: List[str]) -> List[str]:
+    """Nombra las columnas igual que pandas: vacías como "Unnamed: i" y repetidas como "X.1"."""
+    mangled = []
+    seen = {}
+    for i, name in enumerate(names):
+        name = name if name != "" else f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        mangled.append(name)
+    return mangled
+
+
+def _is_blank(buffer, start: int, stop: int) -> bool:
+    return buffer[start:stop].strip(b"\r\n") == b""
+
+
+def scan_layout(buffer, delimiter: str = ",", header_row: int = HEADER_ROW) -> CsvLayout:
+    """
+    Ubica el encabezado, la región de datos y el trailer con una pasada a nivel de bytes.
+
+    Las líneas vacías no se cuentan, igual que en pandas. Se asume que ningún campo contiene
+    saltos de línea entre comillas, como ocurre en los CSV generados desde el XLS contable.
+
+    Args:
+        buffer: Contenido del archivo (bytes o mmap)
+        delimiter: Delimitador del CSV
+        header_row: Cantidad de líneas no vacías antes del encabezado
+
+    Returns:
+        CsvLayout: Offsets de cada región y nombres de columna (al estilo de pandas)
+
+    Raises:
+        IngestionError: Si el archivo no tiene encabezado o no tiene filas de datos
+    """
+    size = len(buffer)
+    pos = 0
+    found = 0
+    header_start = None
+    while pos < size:
+        newline = buffer.find(b"\n", pos)
+        line_end = size if newline == -1 else newline
+        if not _is_blank(buffer, pos, line_end):
+            if found == header_row:
+                header_start = pos
+                break
+            found += 1
+        pos = line_end + 1
+
+    if header_start is None:
+        raise IngestionError(f"El CSV tiene menos de {header_row + 1} líneas: no se encontró el encabezado")
+
+    header_end = buffer.find(b"\n", header_start)
+    if header_end == -1:
+        raise IngestionError("El CSV no tiene filas de datos después del encabezado")
+    header_line = bytes(buffer[header_start:header_end]).decode("utf-8").rstrip("\r")
+    columns = _mangle_columns(next(csv.reader([header_line], delimiter=delimiter)))
+
+    end = size
+    while end > header_end and buffer[end - 1:end] in (b"\n", b"\r", b" "):
+        end -= 1
+    trailer_start = buffer.rfind(b"\n", header_end, end) + 1
+    if trailer_start <= header_end:
+        raise IngestionError("El CSV no tiene filas de datos después del encabezado")
+
+    return CsvLayout(
+        header_start=header_start,
+        data_start=header_end + 1,
+        trailer_start=trailer_start,
+        end=end,
+        columns=columns,
+    )
+
+
+def _read_region_arrow(region, layout: CsvLayout, columns: List[str], delimiter: str) -> pd.DataFrame:
+    table = pa_csv.read_csv(
+        pa.BufferReader(pa.py_buffer(region)),
+        read_options=pa_csv.ReadOptions(column_names=layout.columns, use_threads=True),
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=columns,
+            column_types={col: pa.string() for col in columns},
+            strings_can_be_null=True,
+        ),
+    )
+    # Descartar las filas de movimientos (con "/" en Vencto.) antes de crear objetos Python
+    vencto = table.column("Vencto.")
+    keep = pc.invert(pc.fill_null(pc.match_substring(vencto, "/"), False))
+    df = table.filter(keep).to_pandas()
+    return df.where(df.notna(), np.nan)
+
+
+def _read_region_pandas(region, layout: CsvLayout, columns: List[str], delimiter: str) -> pd.DataFrame:
+    df = pd.read_csv(
+        io.BytesIO(region),
+        delimiter=delimiter,
+        header=None,
+        names=layout.columns,
+        usecols=columns,
+        dtype=str,
+    )
+    return df[~df["Vencto."].str.contains("/").fillna(False)]
+
+
+def read_member_rows(
+    csv_path: Path,
+    delimiter: str = ",",
+    columns: Optional[List[str]] = None,
+    header_row: int = HEADER_ROW,
+) -> pd.DataFrame:
+    """
+    Lee solo las filas de socios del CSV convertido.
+
+    El archivo se mapea en memoria (o se descomprime, si es un artefacto comprimido), se ubica la región de datos con `scan_layout` y solo ese
+    rango de bytes se entrega al lector CSV (multihilo con pyarrow, según CAPITAL_CSV_ENGINE). Las filas
+    de movimientos, que tienen "/" en la columna Vencto., y el trailer se descartan sin
+    convertirse a objetos Python. Todas las columnas se leen como texto.
+
+    Args:
+        csv_path: Ruta al CSV convertido desde XLS
+        delimiter: Delimitador del CSV
+        columns: Columnas a leer (por defecto MEMBER_COLUMNS)
+        header_row: Cantidad de líneas no vacías antes del encabezado
+
+    Returns:
+        pd.DataFrame: Filas de socios (fila principal y fila de totales alternadas), con índice desde 0
+
+    Raises:
+        IngestionError: Si el archivo no tiene el formato esperado
+    """
+    columns = columns or MEMBER_COLUMNS
+
+    with artifact_buffer(csv_path) as mm:
+        layout = scan_layout(mm, delimiter=delimiter, header_row=header_row)
+        missing_cols = [col for col in columns if col not in layout.columns]
+        if missing_cols:
+            raise IngestionError(f"El CSV no tiene el formato esperado. Columnas faltantes: {missing_cols}")
+
+        logger.debug(
+            f"Región de datos de {csv_path.name}: bytes {layout.data_start}-{layout.trailer_start} "
+            f"de {len(mm)}"
+        )
+        region = memoryview(mm)[layout.data_start:layout.trailer_start]
+        try:
+            df = None
+            if pa is not None and get_engine() == "pyarrow":
+                try:
+                    df = _read_region_arrow(region, layout, columns, delimiter)
+                except pa.ArrowInvalid as e:
+                    # Filas con una cantidad irregular de campos: pandas las tolera
+                    logger.debug(f"Lector pyarrow no pudo leer {csv_path.name} ({e}); usando pandas")
+            if df is None:
+                df = _read_region_pandas(region, layout, columns, delimiter)
+        finally:
+            region.release()
+
+    return df.reset_index(drop=True)
+
+
+def read_trailer(csv_path: Path, delimiter: str = ",", header_row: int = HEADER_ROW) -> Dict[str, str]:
+    """
+    Lee solo la línea final de totales (trailer) del CSV convertido.
+
+    Args:
+        csv_path: Ruta al CSV convertido desde XLS
+        delimiter: Delimitador del CSV
+        header_row: Cantidad de líneas no vacías antes del encabezado
+
+    Returns:
+        Dict[str, str]: Valor de cada columna del trailer (al estilo de pandas), vacías omitidas
+
+    Raises:
+        IngestionError: Si el archivo no tiene el formato esperado
+    """
+    with artifact_buffer(csv_path) as mm:
+        layout = scan_layout(mm, delimiter=delimiter, header_row=header_row)
+        line = bytes(mm[layout.trailer_start:layout.end]).decode("utf-8").rstrip("\r")
+
+    values = next(csv.reader([line], delimiter=delimiter), [])
+    return {col: value for col, value in zip(layout.columns, values) if value != ""}
@@ -0,0 +1,171 @@
+# src/ingestion/preflight.py
+
+import time
+import pandas as pd
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+from src.ingestion.csv_scanner import read_member_rows, read_trailer
+from src.ingestion.reference_index import ReferenceIndex, get_reference_index
+from src.utils.artifacts import artifact_exists
+from src.utils.exceptions import IngestionError, StorageError
+from src.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+# Columnas del CSV convertido que necesita la validación previa (sin Detalle ni categoría)
+PREFLIGHT_COLUMNS = ["TP", "Vencto.", "TP.1", "Unnamed: 8", "Créditos", "Saldo"]
+
+# Columnas de montos de las líneas "Total" de cada socio y de la línea "TOTAL" final
+AMOUNT_COLUMNS = {"debitos": "Unnamed: 8", "creditos": "Créditos", "saldo": "Saldo"}
+
+# Cantidad máxima de ejemplos listados por cada problema
+MAX_EXAMPLES = 10
+
+
+@dataclass
+class PreflightReport:
+    """Resultado de la validación previa de un CSV original."""
+    csv_path: Path
+    members: int = 0
+    problems: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+
+def _examples(values: Sequence) -> str:
+    shown = ", ".join(map(str, values[:MAX_EXAMPLES]))
+    return shown + (f" y {len(values) - MAX_EXAMPLES} más" if len(values) > MAX_EXAMPLES else "")
+
+
+def _to_number(values: pd.Series) -> pd.Series:
+    """Convierte montos con separadores ("1.234.567") a número; los inválidos quedan como NaN."""
+    text = values.fillna("0").str.replace(".", "", regex=False).str.replace(",", "", regex=False)
+    return pd.to_numeric(text, errors="coerce")
+
+
+def preflight_original(
+    csv_path: Path,
+    reference: ReferenceIndex,
+    delimiter: str = ",",
+) -> PreflightReport:
+    """
+    Valida un CSV original sin procesarlo completo.
+
+    Lee solo las columnas de Rut, nombre y montos de las filas de socios y la línea final de
+    totales, y revisa que:
+    - cada socio tenga su fila principal (Rut) seguida de su línea "Total",
+    - los socios sin nombre en el archivo estén en la base o en el diccionario de referencia,
+    - los montos sean numéricos y su suma coincida con la línea "TOTAL" del archivo.
+
+    Args:
+        csv_path: Ruta al CSV convertido desde XLS
+        reference: Índice de RUTs de referencia
+        delimiter: Delimitador del CSV
+
+    Returns:
+        PreflightReport: Cantidad de socios y lista de problemas encontrados
+    """
+    report = PreflightReport(csv_path=csv_path)
+    if not artifact_exists(csv_path):
+        report.problems.append(f"Archivo CSV no encontrado: {csv_path}")
+        return report
+
+    try:
+        rows = read_member_rows(csv_path, delimiter=delimiter, columns=PREFLIGHT_COLUMNS)
+        trailer = read_trailer(csv_path, delimiter=delimiter)
+    except (IngestionError, StorageError) as e:
+        report.problems.append(str(e))
+        return report
+
+    principal = rows.iloc[::2].reset_index(drop=True)
+    totals = rows.iloc[1::2].reset_index(drop=True)
+    report.members = len(principal)
+
+    # 1. Estructura: fila principal con Rut seguida de su línea "Total"
+    if len(principal) != len(totals):
+        report.problems.append(
+            f"El socio {principal['TP'].iloc[-1]} (último del archivo) no tiene línea \"Total\""
+        )
+        principal = principal.iloc[:len(totals)]
+    misaligned = principal['TP'].isna() | (totals['Vencto.'].str.strip().str.upper() != "TOTAL")
+    if misaligned.any():
+        positions = (principal.index[misaligned] * 2).tolist()
+        report.problems.append(
+            f"{int(misaligned.sum())} socios sin el par fila principal/línea \"Total\" esperado "
+            f"(filas de socios: {_examples(positions)})"
+        )
+
+    # 2. Socios sin nombre en el archivo que tampoco están en la referencia
+    without_name = principal['Vencto.'].isna() & totals['TP.1'].isna()
+    missing = reference.missing(principal.loc[without_name, 'TP'].dropna())
+    if missing:
+        report.problems.append(
+            f"{len(missing)} RUTs sin nombre en el archivo ni en el diccionario de referencia: {_examples(missing)}"
+        )
+
+    # 3. Montos numéricos y cuadratura con la línea "TOTAL"
+    if trailer.get("Vencto.", "").strip().upper() != "TOTAL":
+        report.problems.append("El archivo no tiene la línea final \"TOTAL\"")
+        return report
+
+    for name, column in AMOUNT_COLUMNS.items():
+        amounts = _to_number(totals[column])
+        invalid = amounts.isna()
+        if invalid.any():
+            report.problems.append(
+                f"{int(invalid.sum())} montos no numéricos en {column} "
+                f"(RUTs: {_examples(principal.loc[invalid, 'TP'].tolist())})"
+            )
+            continue
+        expected = _to_number(pd.Series([trailer.get(column, "0")])).iloc[0]
+        if pd.isna(expected):
+            report.problems.append(f"Monto no numérico en {column} de la línea \"TOTAL\": {trailer.get(column)}")
+        elif int(amounts.sum()) != int(expected):
+            report.problems.append(
+                f"La suma de {name} de los socios ({int(amounts.sum())}) no coincide con la línea "
+                f"\"TOTAL\" ({int(expected)})"
+            )
+
+    return report
+
+
+def run_preflight(
+    csv_paths: Sequence[Path],
+    base_path: Optional[Path] = None,
+    diccionario_path: Optional[Path] = None,
+    reference: Optional[ReferenceIndex] = None,
+) -> List[PreflightReport]:
+    """
+    Valida los CSV originales de un período antes de procesarlos.
+
+    Args:
+        csv_paths: CSV originales a validar (típicamente el mes actual y el anterior)
+        base_path: Ruta opcional al archivo base de referencia
+        diccionario_path: Ruta opcional al diccionario de referencia
+        reference: Índice ya construido (si se entrega, no se leen base ni diccionario)
+
+    Returns:
+        List[PreflightReport]: Un reporte por archivo, todos sin problemas
+
+    Raises:
+        IngestionError: Con todos los problemas de todos los archivos, si hay alguno
+    """
+    start = time.perf_counter()
+    reference = reference if reference is not None else get_reference_index(base_path, diccionario_path)
+    reports = [preflight_original(path, reference) for path in csv_paths]
+    elapsed = time.perf_counter() - start
+
+    problems = [f"{report.csv_path.name}: {problem}" for report in reports for problem in report.problems]
+    if problems:
+        error_msg = f"La validación previa encontró {len(problems)} problemas:\n- " + "\n- ".join(problems)
+        logger.error(error_msg)
+        raise IngestionError(error_msg)
+
+    logger.info(
+        f"Validación previa correcta en {elapsed * 1000:.0f} ms: "
+        + ", ".join(f"{report.csv_path.name} ({report.members} socios)" for report in reports)
+    )
+    return reports
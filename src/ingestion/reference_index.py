@@ -0,0 +1,114 @@
+# src/ingestion/reference_index.py
+
+import threading
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.utils.csv_io import read_dictionary
+from src.utils.logging import setup_logger
+from src.utils.paths import get_base_path, get_dictionary_path
+
+logger = setup_logger(__name__)
+
+
+class ReferenceIndex:
+    """
+    Índice Rut → Nombre construido desde los archivos de referencia (base y diccionario).
+
+    Sigue el mismo orden de búsqueda que `regularizar_nombre`: primero la base y luego el
+    diccionario, quedándose con la primera aparición de cada Rut (comparado sin espacios).
+    También conserva los DataFrames leídos, que usa `process_csv`.
+    """
+
+    def __init__(
+        self,
+        names: Dict[str, str],
+        base: Optional[pd.DataFrame] = None,
+        diccionario: Optional[pd.DataFrame] = None,
+    ):
+        self.names = names
+        self.base = base
+        self.diccionario = diccionario
+
+    @classmethod
+    def load(cls, base_path: Optional[Path] = None, diccionario_path: Optional[Path] = None) -> "ReferenceIndex":
+        frames = []
+        for path in (base_path, diccionario_path):
+            if path is not None and path.exists():
+                logger.debug(f"Cargando archivo de referencia: {path}")
+                frames.append(read_dictionary(path))
+            else:
+                frames.append(None)
+
+        names: Dict[str, str] = {}
+        for df in frames:
+            if df is None:
+                continue
+            df = df.dropna(subset=['Rut'])
+            for rut, nombre in zip(df['Rut'].str.strip(), df['Nombre']):
+                names.setdefault(rut, nombre)
+        logger.debug(f"Índice de referencia con {len(names)} RUTs")
+        return cls(names, base=frames[0], diccionario=frames[1])
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, rut) -> bool:
+        return str(rut).strip() in self.names
+
+    def lookup(self, rut) -> Optional[str]:
+        """Retorna el nombre de referencia del Rut, o None si no está registrado."""
+        return self.names.get(str(rut).strip())
+
+    def missing(self, ruts: Iterable) -> List[str]:
+        """Lista (sin repetir, en orden) los RUTs que no están en el índice."""
+        seen = set()
+        result = []
+        for rut in ruts:
+            key = str(rut).strip()
+            if key not in self.names and key not in seen:
+                seen.add(key)
+                result.append(key)
+        return result
+
+
+_cache: Dict[Tuple, ReferenceIndex] = {}
+_cache_lock = threading.Lock()
+
+
+def _signature(path: Optional[Path]) -> Tuple:
+    if path is None or not path.exists():
+        return (str(path), None, None)
+    stat = path.stat()
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def get_reference_index(
+    base_path: Optional[Path] = None,
+    diccionario_path: Optional[Path] = None,
+) -> ReferenceIndex:
+    """
+    Retorna el índice de referencia, reutilizando el ya cargado si los archivos no cambiaron.
+
+    En un proceso de larga duración (modo watch o servicio HTTP) la base y el diccionario se
+    leen una sola vez y se vuelven a leer solo cuando cambia su fecha de modificación o tamaño.
+    """
+    key = (_signature(base_path), _signature(diccionario_path))
+    with _cache_lock:
+        index = _cache.get(key)
+        if index is None:
+            index = ReferenceIndex.load(base_path, diccionario_path)
+            _cache.clear()
+            _cache[key] = index
+    return index
+
+
+def warm_reference_index():
+    """
+    Carga el índice de referencia de data/dictionary.
+
+    Se usa como inicializador de los procesos trabajadores de larga duración, para que la
+    primera ejecución no pague la lectura de la base y el diccionario.
+    """
+    index = get_reference_index(get_base_path(), get_dictionary_path())
+    logger.info(f"Proceso trabajador listo (índice de referencia con {len(index)} RUTs)")
@@ -5,6 +5,7 @@ import time
 import base64
 import requests
 from pathlib import Path
+from src.utils.artifacts import artifact_exists, write_bytes
 from src.utils.exceptions import IngestionError
 from src.utils.logging import setup_logger
 
@@ -82,9 +83,8 @@ def convert_xls_to_csv(input_xls: Path, output_csv: Path) -> None:
 
         csv_bytes = base64.b64decode(dl_resp.json()["data"]["content"])
 
-        # 5) Guardar archivo CSV
-        with open(output_csv, "wb") as f:
-            f.write(csv_bytes)
+        # 5) Guardar archivo CSV (escritura atómica, con compresión opcional)
+        write_bytes(output_csv, csv_bytes)
 
         logger.debug("Llamada a API exitosa")
 
@@ -95,7 +95,7 @@ def convert_xls_to_csv(input_xls: Path, output_csv: Path) -> None:
         logger.exception("Error durante la conversión XLS → CSV")
         raise IngestionError("Fallo en conversión XLS → CSV") from e
 
-    if not output_csv.exists():
+    if not artifact_exists(output_csv):
         raise IngestionError("La conversión no generó el archivo CSV")
 
     logger.info("Conversión finalizada correctamente")
@@ -0,0 +1,112 @@
+# src/orchestration/checkpoints.py
+
+import json
+import pickle
+import shutil
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+from src.utils.artifacts import resolve_artifact, write_atomic
+from src.utils.logging import setup_logger
+from src.utils.paths import get_checkpoint_dir
+
+logger = setup_logger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+STATE_FILE = "estado.json"
+
+
+def input_fingerprint(paths: Iterable[Path]) -> List:
+    """
+    Huella de las entradas de un período: ruta, fecha de modificación y tamaño de cada archivo.
+
+    Si alguna entrada cambia (por ejemplo, un XLS re-emitido), los checkpoints dejan de valer.
+    """
+    fingerprint = []
+    for path in paths:
+        stored = resolve_artifact(path)
+        if stored.exists():
+            stat = stored.stat()
+            fingerprint.append([str(path), stat.st_mtime_ns, stat.st_size])
+        else:
+            fingerprint.append([str(path), None, None])
+    return fingerprint
+
+
+class CheckpointStore:
+    """
+    Checkpoints de las etapas de una ejecución fallida de un período, en data/checkpoints/YYYYMM.
+
+    El resultado de cada etapa terminada se guarda en `<etapa>.pkl` (las etapas sin resultado
+    solo se registran) y `estado.json` lista las etapas terminadas, la etapa que falló y la
+    huella de las entradas del período. Una ejecución posterior con las mismas entradas retoma
+    desde las etapas pendientes leyendo sus entradas de los checkpoints.
+    """
+
+    def __init__(self, year: int, month: int, fingerprint: List, directory: Optional[Path] = None):
+        self.directory = directory or get_checkpoint_dir(year, month)
+        self.fingerprint = fingerprint
+        self.completed: List[str] = []
+        self.failed: Optional[str] = None
+        self._load_state()
+
+    @property
+    def state_path(self) -> Path:
+        return self.directory / STATE_FILE
+
+    @property
+    def exists(self) -> bool:
+        return self.state_path.exists()
+
+    def _load_state(self):
+        if not self.exists:
+            return
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"No se pudo leer el estado de checkpoints {self.state_path}: {e}")
+            self.clear()
+            return
+        if state.get("version") != CHECKPOINT_VERSION or state.get("huella") != self.fingerprint:
+            logger.info(f"Checkpoints de {self.directory.name} descartados: cambiaron las entradas del período")
+            self.clear()
+            return
+        self.completed = list(state.get("etapas", []))
+        self.failed = state.get("fallida")
+
+    def path(self, stage: str) -> Path:
+        return self.directory / f"{stage}.pkl"
+
+    def has(self, stage: str) -> bool:
+        return stage in self.completed
+
+    def load(self, stage: str) -> Any:
+        """Resultado guardado de una etapa terminada (None si la etapa no tiene resultado)."""
+        path = self.path(stage)
+        if not path.exists():
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def save(self, stage: str, result: Any):
+        """Guarda el resultado de una etapa (no actualiza el estado: ver `write_state`)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.path(stage), pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def write_state(self, completed: Iterable[str], failed: Optional[str]):
+        self.completed = sorted(set(completed))
+        self.failed = failed
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "huella": self.fingerprint,
+            "etapas": self.completed,
+            "fallida": failed,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.state_path, json.dumps(state, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    def clear(self):
+        self.completed = []
+        self.failed = None
+        if self.directory.exists():
+            shutil.rmtree(self.directory, ignore_errors=True)
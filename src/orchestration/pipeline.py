@@ -0,0 +1,591 @@
+# src/orchestration/pipeline.py
+
+import contextlib
+import queue
+import tempfile
+import threading
+import time
+import pandas as pd
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from src.ingestion.xls_converter import convert_xls_to_csv
+from src.ingestion.csv_processor import process_csv
+from src.ingestion.preflight import run_preflight
+from src.comparison.diff_generator import generate_diffs
+from src.comparison.name_matching import match_renamed_members
+from src.consolidation.monthly_builder import build_monthly_file
+from src.consolidation.partitioned import (
+    CHUNK_ROWS,
+    build_monthly_file_partitioned,
+    generate_diffs_partitioned,
+    plan_partitions,
+)
+from src.consolidation.anomalies import generate_anomalies
+from src.consolidation.ledger import append_period
+from src.storage.history_store import upsert_period
+from src.reporting.sinks import ReportSink, get_report_sinks
+from src.orchestration.checkpoints import CheckpointStore, input_fingerprint
+from src.orchestration.scheduler import StageScheduler
+from src.utils.artifacts import artifact_exists, write_csv, write_csv_chunks
+from src.utils.contracts import ANOMALIES, DIFFS, GOOD, PARSED, RENAMES, VALIDATION_MODE, Contract
+from src.utils.csv_io import read_csv, read_diffs, read_processed
+from src.utils.dates import get_previous_period
+from src.utils.exceptions import PipelineError
+from src.utils.logging import setup_logger
+from src.utils.names import save_name_cache
+from src.utils.paths import (
+    get_anomalies_csv_path,
+    get_base_path,
+    get_diff_csv_path,
+    get_dictionary_path,
+    get_history_db_path,
+    get_original_csv_path,
+    get_processed_csv_path,
+    get_raw_xls_path,
+    get_renames_csv_path,
+    get_report_paths,
+)
+
+logger = setup_logger(__name__)
+
+
+def _copy_on_write():
+    """
+    Activa copy-on-write mientras corre el pipeline. Las etapas no modifican los DataFrames que
+    reciben (ver generate_diffs y build_monthly_file), así que las selecciones de columnas
+    comparten memoria en lugar de copiarse. Es el comportamiento por defecto desde pandas 3; en
+    pandas 2 se activa solo dentro de `Pipeline.run`, sin cambiar la opción para el resto del proceso.
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        return pd.option_context("mode.copy_on_write", True)
+    return contextlib.nullcontext()
+
+
+class ArtifactWriter:
+    """
+    Escribe artefactos en un hilo de fondo, fuera de la ruta crítica del pipeline.
+
+    Las etapas encolan la escritura y siguen trabajando con el DataFrame en memoria. `close`
+    espera a que terminen todas las escrituras y relanza el primer error. En modo dry-run no
+    se escribe nada: solo se registra qué se habría escrito.
+    """
+
+    def __init__(self, dry_run: bool = False):
+        self.dry_run = dry_run
+        self.written: List[Path] = []
+        self.skipped: List[Path] = []
+        self.errors: List[Tuple[Path, BaseException]] = []
+        self._queue: "queue.Queue[Optional[Tuple[Path, Callable[[], object]]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        if not dry_run:
+            self._thread = threading.Thread(target=self._run, name="escritor", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, write = item
+            try:
+                write()
+                self.written.append(path)
+                logger.debug(f"Artefacto guardado: {path}")
+            except BaseException as e:
+                logger.error(f"No se pudo guardar {path}: {e}")
+                self.errors.append((path, e))
+
+    def submit(self, path: Path, write: Callable[[], object]):
+        """Encola la escritura de `path` (en dry-run solo la registra)."""
+        if self.dry_run:
+            self.skipped.append(path)
+            return
+        self._queue.put((path, write))
+
+    def submit_csv(self, df: pd.DataFrame, path: Path, chunk_rows: Optional[int] = None):
+        """
+        Encola un DataFrame para guardarlo como artefacto CSV (ver src/utils/artifacts.py).
+
+        Con `chunk_rows` el CSV se escribe por bloques de filas, sin armar el texto completo en
+        memoria.
+        """
+        if chunk_rows:
+            self.submit(path, lambda: write_csv_chunks(
+                (df.iloc[i:i + chunk_rows] for i in range(0, len(df), chunk_rows)), path, index=False
+            ))
+        else:
+            self.submit(path, lambda: write_csv(df, path, index=False))
+
+    def close(self):
+        """
+        Espera a que terminen las escrituras encoladas.
+
+        Raises:
+            PipelineError: Si alguna escritura falló (se relanza la primera)
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self.errors:
+            path, error = self.errors[0]
+            if isinstance(error, PipelineError):
+                raise error
+            raise PipelineError(f"No se pudo guardar {path}: {error}") from error
+
+
+@dataclass
+class PeriodFrames:
+    """DataFrames producidos por el pipeline de un período, disponibles en memoria."""
+    current: Optional[pd.DataFrame] = None
+    previous: Optional[pd.DataFrame] = None
+    renames: Optional[pd.DataFrame] = None
+    diffs: Optional[pd.DataFrame] = None
+    previous_good: Optional[pd.DataFrame] = None
+    good: Optional[pd.DataFrame] = None
+    anomalies: Optional[pd.DataFrame] = None
+
+
+# Atributo de PeriodFrames donde queda el resultado de cada etapa
+STAGE_FRAMES = {
+    "parse_current": "current",
+    "parse_previous": "previous",
+    "renames": "renames",
+    "diffs": "diffs",
+    "load_previous_good": "previous_good",
+    "consolidate": "good",
+    "anomalies": "anomalies",
+}
+
+# Contrato que cumple el resultado de cada etapa (ver src/utils/contracts.py)
+STAGE_CONTRACTS: Dict[str, Contract] = {
+    "parse_current": PARSED,
+    "parse_previous": PARSED,
+    "renames": RENAMES,
+    "diffs": DIFFS,
+    "load_previous_good": GOOD,
+    "consolidate": GOOD,
+    "anomalies": ANOMALIES,
+}
+
+# Marca de una etapa cuyo resultado no está disponible sin ejecutarla
+_MISSING = object()
+
+
+@dataclass
+class PeriodContext:
+    """
+    Período a procesar, con las rutas de sus artefactos y los DataFrames producidos.
+
+    Con `convert=False` no se vuelve a convertir el XLS: se usa el CSV original ya existente.
+    `partitions` fija en cuántas particiones se comparan y consolidan los meses; por defecto se
+    decide según el presupuesto de memoria (ver src/consolidation/partitioned.py).
+
+    `stages` ejecuta solo las etapas indicadas y `from_stage`, la etapa indicada y las que
+    dependen de ella; las entradas de las demás se leen de los checkpoints o de los artefactos
+    existentes. Con `resume` (por defecto) una ejecución que falló se retoma desde sus etapas
+    pendientes (ver `Pipeline.plan`).
+    """
+    year: int
+    month: int
+    dry_run: bool = False
+    convert: bool = True
+    partitions: Optional[int] = None
+    stages: Optional[Tuple[str, ...]] = None
+    from_stage: Optional[str] = None
+    resume: bool = True
+    frames: PeriodFrames = field(default_factory=PeriodFrames)
+
+    @property
+    def previous_period(self) -> Tuple[int, int]:
+        return get_previous_period(self.year, self.month)
+
+    @property
+    def label(self) -> str:
+        return f"{self.year}-{self.month:02d}"
+
+    @property
+    def raw_xls(self) -> Path:
+        return get_raw_xls_path(self.year, self.month)
+
+    @property
+    def original_csv(self) -> Path:
+        return get_original_csv_path(self.year, self.month)
+
+    @property
+    def previous_csv(self) -> Path:
+        return get_original_csv_path(*self.previous_period)
+
+    @property
+    def base_path(self) -> Path:
+        return get_base_path()
+
+    @property
+    def diccionario_path(self) -> Path:
+        return get_dictionary_path()
+
+    @property
+    def diff_csv(self) -> Path:
+        return get_diff_csv_path(self.year, self.month)
+
+    @property
+    def renames_csv(self) -> Path:
+        return get_renames_csv_path(self.year, self.month)
+
+    @property
+    def anomalies_csv(self) -> Path:
+        return get_anomalies_csv_path(self.year, self.month)
+
+    @property
+    def processed_csv(self) -> Path:
+        return get_processed_csv_path(self.year, self.month)
+
+    @property
+    def previous_processed_csv(self) -> Path:
+        return get_processed_csv_path(*self.previous_period)
+
+    @property
+    def report_paths(self) -> Tuple[Path, Path]:
+        return get_report_paths(self.year, self.month)
+
+    @property
+    def input_paths(self) -> List[Path]:
+        """Entradas del período: si cambian, los checkpoints de una ejecución fallida no valen."""
+        paths = [self.raw_xls] if self.convert else [self.original_csv]
+        return paths + [self.previous_csv, self.previous_processed_csv, self.base_path, self.diccionario_path]
+
+
+class Pipeline:
+    """
+    Pipeline mensual: conversión, validación previa, procesamiento, diferencias, consolidación,
+    movimientos anómalos, ledger, historial y reportes (una etapa por salida de reportes, en
+    paralelo).
+
+    Las etapas se ejecutan con `StageScheduler` y se pasan los DataFrames en memoria (quedan
+    también en `ctx.frames`). Los CSV de diferencias, renombres, anomalías y el archivo Bueno se
+    guardan en un hilo de fondo que se espera al final de la ejecución, así que ninguna etapa
+    espera al disco para continuar. Con `dry_run` se produce todo en memoria y no se escribe nada en
+    data/ ni reports/: si el CSV original aún no existe, se convierte a un directorio temporal.
+
+    El resultado de cada etapa se guarda además como checkpoint en data/checkpoints/YYYYMM. Si
+    la ejecución termina bien se borran; si falla, se conservan y la siguiente ejecución del
+    período la retoma (ver `plan`).
+    """
+
+    def __init__(self, ctx: PeriodContext):
+        self.ctx = ctx
+        self.writer = ArtifactWriter(dry_run=ctx.dry_run)
+        self.timings: Dict[str, float] = {}
+        self._tmp_dir: Optional[tempfile.TemporaryDirectory] = None
+        self.original_csv = ctx.original_csv
+        self.checkpoints: Optional[CheckpointStore] = None
+        self._finished: List[str] = []
+
+    # 1. Conversión XLS → CSV
+    def convert(self):
+        if not self.ctx.convert:
+            logger.info(f"Se usa el CSV original existente {self.original_csv.name}")
+            return
+        if self.ctx.dry_run:
+            if artifact_exists(self.original_csv):
+                logger.info(f"Dry-run: se usa el CSV original existente {self.original_csv.name}")
+                return
+            self._tmp_dir = tempfile.TemporaryDirectory(prefix="capital_pagado_")
+            self.original_csv = Path(self._tmp_dir.name) / self.ctx.original_csv.name
+        raw_xls = self.ctx.raw_xls
+        logger.info(f"Convirtiendo {raw_xls.parent.name + '/' + raw_xls.name} a {self.original_csv.parent.name + '/' + self.original_csv.name}")
+        convert_xls_to_csv(raw_xls, self.original_csv)
+
+    # 2. Validación previa de ambos originales (RUTs sin nombre, cuadratura con la línea TOTAL)
+    def preflight(self, convert):
+        run_preflight(
+            [self.original_csv, self.ctx.previous_csv],
+            base_path=self.ctx.base_path,
+            diccionario_path=self.ctx.diccionario_path,
+        )
+
+    # 3. Procesamiento de datos CSV (mes actual y mes anterior son independientes)
+    def parse_current(self, preflight):
+        logger.info(f"Procesando CSV del mes actual: {self.original_csv.name}")
+        self.ctx.frames.current = self._validated("parse_current", process_csv(
+            self.original_csv, base_path=self.ctx.base_path, diccionario_path=self.ctx.diccionario_path
+        ))
+        return self.ctx.frames.current
+
+    def parse_previous(self, preflight):
+        logger.info(f"Procesando CSV del mes anterior: {self.ctx.previous_csv.name}")
+        self.ctx.frames.previous = self._validated("parse_previous", process_csv(
+            self.ctx.previous_csv, base_path=self.ctx.base_path, diccionario_path=self.ctx.diccionario_path
+        ))
+        return self.ctx.frames.previous
+
+    # 4. Generación de diferencias
+    def renames(self, parse_current, parse_previous):
+        self.ctx.frames.renames = self._validated("renames", match_renamed_members(parse_current, parse_previous))
+        self.writer.submit_csv(self.ctx.frames.renames, self.ctx.renames_csv)
+        return self.ctx.frames.renames
+
+    def diffs(self, parse_current, parse_previous, renames):
+        partitions = plan_partitions(parse_current, parse_previous, partitions=self.ctx.partitions)
+        if partitions > 1:
+            self.ctx.frames.diffs = generate_diffs_partitioned(
+                parse_current, parse_previous, renames=renames, partitions=partitions, spill_dir=self._spill_dir()
+            )
+        else:
+            self.ctx.frames.diffs = generate_diffs(parse_current, parse_previous, renames=renames)
+        self._validated("diffs", self.ctx.frames.diffs)
+        self.writer.submit_csv(self.ctx.frames.diffs, self.ctx.diff_csv, chunk_rows=CHUNK_ROWS if partitions > 1 else None)
+        return self.ctx.frames.diffs
+
+    # 5. Consolidación mensual
+    def load_previous_good(self):
+        # Es el archivo Bueno que validó la ejecución del mes anterior
+        self.ctx.frames.previous_good = self._validated(
+            "load_previous_good", read_processed(self.ctx.previous_processed_csv), trusted=True
+        )
+        return self.ctx.frames.previous_good
+
+    def consolidate(self, diffs, load_previous_good):
+        partitions = plan_partitions(diffs, load_previous_good, partitions=self.ctx.partitions)
+        if partitions > 1:
+            self.ctx.frames.good = build_monthly_file_partitioned(
+                diffs, load_previous_good, partitions=partitions, spill_dir=self._spill_dir()
+            )
+        else:
+            self.ctx.frames.good = build_monthly_file(diffs, load_previous_good)
+        self._validated("consolidate", self.ctx.frames.good)
+        self.writer.submit_csv(self.ctx.frames.good, self.ctx.processed_csv, chunk_rows=CHUNK_ROWS if partitions > 1 else None)
+        return self.ctx.frames.good
+
+    def _spill_dir(self) -> Optional[Path]:
+        # En dry-run las particiones van al directorio temporal del sistema, no a data/spill
+        return Path(tempfile.gettempdir()) if self.ctx.dry_run else None
+
+    # Movimientos de saldo anómalos respecto del historial de cada socio (junto a las diferencias)
+    def anomalies(self, load_previous_good, consolidate):
+        self.ctx.frames.anomalies = self._validated(
+            "anomalies", generate_anomalies(self.ctx.year, self.ctx.month, consolidate, load_previous_good)
+        )
+        self.writer.submit_csv(self.ctx.frames.anomalies, self.ctx.anomalies_csv)
+        return self.ctx.frames.anomalies
+
+    # Registro en el ledger de diferencias (con snapshots periódicos)
+    def ledger(self, diffs, load_previous_good, consolidate):
+        append_period(self.ctx.year, self.ctx.month, diffs, load_previous_good, consolidate)
+
+    # Actualización del historial consultable por socio (y de su resumen por tramo, categoría y tipo)
+    def history(self, parse_current, consolidate):
+        upsert_period(self.ctx.year, self.ctx.month, consolidate, classification=parse_current)
+
+    # 6. Reportes: una etapa por cada salida habilitada (ver src/reporting/sinks.py)
+    def report_stage(self, sink: ReportSink) -> Callable[..., None]:
+        def run(consolidate, **deps):
+            sink.generate(consolidate, self.ctx.year, self.ctx.month)
+        return run
+
+    def _validated(self, name: str, df: pd.DataFrame, trusted: bool = False) -> pd.DataFrame:
+        """
+        Valida el resultado de una etapa contra su contrato antes de pasarlo a las siguientes
+        (y antes de escribirlo). `trusted` indica que ya se validó en otra ejecución.
+
+        Raises:
+            PipelineError: Con todas las infracciones del contrato (ver `Contract.enforce`)
+        """
+        return STAGE_CONTRACTS[name].enforce(df, source=f"El resultado de {name} ({self.ctx.label})", trusted=trusted)
+
+    def build_scheduler(self) -> StageScheduler:
+        scheduler = StageScheduler()
+        scheduler.add("convert", self.convert)
+        scheduler.add("preflight", self.preflight, deps=("convert",))
+        scheduler.add("parse_current", self.parse_current, deps=("preflight",))
+        scheduler.add("parse_previous", self.parse_previous, deps=("preflight",))
+        scheduler.add("renames", self.renames, deps=("parse_current", "parse_previous"))
+        scheduler.add("diffs", self.diffs, deps=("parse_current", "parse_previous", "renames"))
+        scheduler.add("load_previous_good", self.load_previous_good)
+        scheduler.add("consolidate", self.consolidate, deps=("diffs", "load_previous_good"))
+        scheduler.add("anomalies", self.anomalies, deps=("load_previous_good", "consolidate"))
+        if not self.ctx.dry_run:
+            scheduler.add("ledger", self.ledger, deps=("diffs", "load_previous_good", "consolidate"))
+            scheduler.add("history", self.history, deps=("parse_current", "consolidate"))
+            for sink in get_report_sinks():
+                scheduler.add(sink.stage, self.report_stage(sink), deps=sink.deps)
+        return scheduler
+
+    def _artifact_result(self, name: str) -> Any:
+        """Resultado de una etapa no ejecutada, leído de los artefactos que ya produjo."""
+        if name == "convert":
+            return None if artifact_exists(self.original_csv) else _MISSING
+        if name == "preflight":
+            return None
+        if name == "history":
+            return None if get_history_db_path().exists() else _MISSING
+        # Los artefactos los validó la ejecución que los escribió: en modo "fast" se revisa una muestra
+        if name == "renames" and artifact_exists(self.ctx.renames_csv):
+            return self._validated("renames", read_csv(
+                self.ctx.renames_csv,
+                dtype={'nombre_anterior': str, 'nombre_actual': str, 'rut_anterior': str, 'rut_actual': str},
+            ), trusted=True)
+        if name == "diffs" and artifact_exists(self.ctx.diff_csv):
+            return self._validated("diffs", read_diffs(self.ctx.diff_csv), trusted=True)
+        if name == "consolidate" and artifact_exists(self.ctx.processed_csv):
+            return self._validated("consolidate", read_processed(self.ctx.processed_csv), trusted=True)
+        return _MISSING
+
+    def _saved_result(self, name: str) -> Any:
+        if self.checkpoints is not None and self.checkpoints.has(name):
+            result = self.checkpoints.load(name)
+            # Un checkpoint es el resultado ya validado de la etapa; solo se revisa en modo "full"
+            if VALIDATION_MODE == "full" and name in STAGE_CONTRACTS:
+                self._validated(name, result)
+            return result
+        return self._artifact_result(name)
+
+    def plan(self, scheduler: StageScheduler) -> Tuple[Set[str], Dict[str, Any]]:
+        """
+        Decide qué etapas ejecutar y de dónde leer las entradas de las demás.
+
+        - Con `ctx.stages` se ejecutan esas etapas; con `ctx.from_stage`, esa etapa y las que
+          dependen de ella.
+        - Si no, y hay checkpoints de una ejecución fallida con las mismas entradas, se ejecutan
+          solo las etapas que no terminaron.
+        - Si no, se ejecutan todas.
+
+        El resultado de una dependencia que no se ejecuta se lee de su checkpoint o de los
+        artefactos que ya produjo (el CSV original, las diferencias, el archivo Bueno). Si no
+        está disponible, esa dependencia también se ejecuta.
+
+        Returns:
+            Tuple[Set[str], Dict[str, Any]]: Etapas a ejecutar y resultados de las dependencias leídas
+
+        Raises:
+            PipelineError: Si se pide una etapa desconocida
+        """
+        names = list(scheduler.stages)
+        for name in (*(self.ctx.stages or ()), *([self.ctx.from_stage] if self.ctx.from_stage else [])):
+            if name not in scheduler.stages:
+                raise PipelineError(f"Etapa desconocida '{name}'. Etapas disponibles: {', '.join(names)}")
+
+        if self.ctx.stages:
+            selected = set(self.ctx.stages)
+        elif self.ctx.from_stage:
+            selected = {self.ctx.from_stage}
+            for name in names:
+                if any(dep in selected for dep in scheduler.stages[name].deps):
+                    selected.add(name)
+        elif self.checkpoints is not None and self.checkpoints.completed:
+            selected = set(names) - set(self.checkpoints.completed)
+            logger.info(
+                f"Reanudando {self.ctx.label} desde la etapa {self.checkpoints.failed or 'pendiente'}: "
+                f"{len(names) - len(selected)} etapas terminadas se leen de {self.checkpoints.directory}"
+            )
+        else:
+            return set(names), {}
+
+        preloaded: Dict[str, Any] = {}
+        queue = [name for name in names if name in selected]
+        while queue:
+            for dep in scheduler.stages[queue.pop()].deps:
+                if dep in selected or dep in preloaded:
+                    continue
+                result = self._saved_result(dep)
+                if result is _MISSING:
+                    selected.add(dep)
+                    queue.append(dep)
+                else:
+                    preloaded[dep] = result
+                    if dep in STAGE_FRAMES:
+                        setattr(self.ctx.frames, STAGE_FRAMES[dep], result)
+
+        logger.info(f"Etapas a ejecutar: {', '.join(name for name in names if name in selected)}")
+        return selected, preloaded
+
+    def _checkpoint(self, name: str, result: Any):
+        # Se llama desde el planificador al terminar cada etapa; se guarda en el hilo de escritura
+        self._finished.append(name)
+        if result is not None:
+            checkpoints = self.checkpoints
+            self.writer.submit(checkpoints.path(name), lambda: checkpoints.save(name, result))
+
+    def _finish_checkpoints(self, scheduler: StageScheduler, had_state: bool):
+        """Borra los checkpoints si el período quedó completo; si no, registra las etapas terminadas."""
+        checkpoints = self.checkpoints
+        if scheduler.failed is None and not had_state:
+            checkpoints.clear()
+            return
+        saved = set(self.writer.written)
+        # Una etapa cuyo artefacto no se pudo guardar se vuelve a ejecutar
+        unsaved = {path for path, _ in self.writer.errors}
+        artifacts = {
+            "renames": self.ctx.renames_csv,
+            "diffs": self.ctx.diff_csv,
+            "consolidate": self.ctx.processed_csv,
+            "anomalies": self.ctx.anomalies_csv,
+        }
+        completed = set(checkpoints.completed) | {
+            name for name in self._finished
+            if (checkpoints.path(name) in saved or scheduler.results.get(name) is None)
+            and artifacts.get(name) not in unsaved
+        }
+        if completed >= set(scheduler.stages):
+            checkpoints.clear()
+            return
+        failed = scheduler.failed or (checkpoints.failed if checkpoints.failed not in completed else None)
+        checkpoints.write_state(completed, failed)
+        if failed is not None:
+            logger.info(f"Checkpoints guardados en {checkpoints.directory}: la próxima ejecución retoma desde {failed}")
+
+    def run(self) -> Dict[str, float]:
+        """
+        Ejecuta el pipeline del período (solo las etapas que indica `plan`).
+
+        Returns:
+            Dict[str, float]: Tiempo de cada etapa ejecutada (y de la espera final de escrituras), en segundos
+
+        Raises:
+            PipelineError: Si falla una etapa o alguna escritura de artefactos
+        """
+        scheduler = self.build_scheduler()
+        had_state = False
+        if not self.ctx.dry_run:
+            self.checkpoints = CheckpointStore(self.ctx.year, self.ctx.month, input_fingerprint(self.ctx.input_paths))
+            if not self.ctx.resume:
+                self.checkpoints.clear()
+            had_state = self.checkpoints.exists
+        with _copy_on_write():
+            try:
+                selected, preloaded = self.plan(scheduler)
+                scheduler.run(
+                    results=preloaded,
+                    only=selected,
+                    on_complete=self._checkpoint if self.checkpoints is not None else None,
+                )
+            finally:
+                self.timings = dict(scheduler.timings)
+                try:
+                    start = time.perf_counter()
+                    self.writer.close()
+                    self.timings["write_artifacts"] = time.perf_counter() - start
+                finally:
+                    if self._tmp_dir is not None:
+                        self._tmp_dir.cleanup()
+                    if self.checkpoints is not None:
+                        self._finish_checkpoints(scheduler, had_state)
+
+        if self.ctx.dry_run:
+            frames = self.ctx.frames
+            produced = [
+                f"{len(df)} {label}" for df, label in (
+                    (frames.diffs, "diferencias"),
+                    (frames.good, "socios en el archivo Bueno"),
+                    (frames.anomalies, "movimientos anómalos"),
+                ) if df is not None
+            ]
+            logger.info(
+                f"Dry-run {self.ctx.label}: {', '.join(produced) or 'sin resultados'}. "
+                f"No se escribió: {', '.join(str(p) for p in self.writer.skipped)}, ledger, historial ni reportes"
+            )
+        else:
+            # Los nombres nuevos de este período quedan en la tabla de nombres canónicos
+            save_name_cache()
+        return self.timings
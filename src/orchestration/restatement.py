@@ -0,0 +1,109 @@
+# src/orchestration/restatement.py
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+from src.consolidation.anomalies import generate_anomalies
+from src.consolidation.restatement import changed_ruts, propagate_changes
+from src.orchestration.pipeline import PeriodContext, Pipeline
+from src.reporting.sinks import run_sinks
+from src.storage.history_store import update_members
+from src.utils.artifacts import artifact_exists, write_csv
+from src.utils.contracts import ANOMALIES
+from src.utils.csv_io import read_diffs, read_processed
+from src.utils.dates import get_next_period
+from src.utils.exceptions import PipelineError
+from src.utils.logging import setup_logger
+from src.utils.paths import get_anomalies_csv_path, get_diff_csv_path, get_processed_csv_path
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class RestatementResult:
+    """Resultado de una re-expresión: socios modificados por período (YYYYMM)."""
+    start: Tuple[int, int]
+    changed: Dict[int, int] = field(default_factory=dict)
+    untouched: List[int] = field(default_factory=list)
+
+
+def later_periods(year: int, month: int) -> List[Tuple[int, int]]:
+    """Períodos consecutivos posteriores a (year, month) que ya tienen archivo Bueno."""
+    periods = []
+    year, month = get_next_period(year, month)
+    while artifact_exists(get_processed_csv_path(year, month)):
+        periods.append((year, month))
+        year, month = get_next_period(year, month)
+    return periods
+
+
+def _read_good(year: int, month: int):
+    path = get_processed_csv_path(year, month)
+    return read_processed(path) if artifact_exists(path) else None
+
+
+def restate_from(year: int, month: int) -> RestatementResult:
+    """
+    Re-expresa un mes cuyo XLS fue re-emitido y propaga la corrección a los meses posteriores.
+
+    1. El mes corregido se procesa completo desde su nuevo XLS.
+    2. El mes siguiente también se procesa completo (sus diferencias se calculan contra el
+       original corregido), pero sin volver a convertir su XLS.
+    3. En los meses posteriores las diferencias no cambian: solo se reconstruyen en el archivo
+       Bueno los RUTs que cambiaron en el mes anterior (ver `propagate_changes`), se
+       actualizan esos socios en el historial y los reportes del mes, y se vuelven a buscar
+       los movimientos anómalos (dependen del archivo Bueno anterior). La propagación termina
+       en el primer mes sin cambios, porque los siguientes ya no se ven afectados.
+
+    Returns:
+        RestatementResult: Socios modificados por período
+
+    Raises:
+        PipelineError: Si falla el procesamiento de algún mes
+    """
+    label = f"{year}-{month:02d}"
+    later = later_periods(year, month)
+    logger.info(f"Re-expresión desde {label}: {len(later)} meses posteriores con archivo Bueno")
+    result = RestatementResult(start=(year, month))
+
+    old_good = _read_good(year, month)
+    ctx = PeriodContext(year, month, resume=False)
+    Pipeline(ctx).run()
+    result.changed[year * 100 + month] = len(changed_ruts(old_good, ctx.frames.good))
+    if not later:
+        return result
+
+    next_year, next_month = later[0]
+    old_good = _read_good(next_year, next_month)
+    ctx = PeriodContext(next_year, next_month, convert=False, resume=False)
+    Pipeline(ctx).run()
+    ruts = changed_ruts(old_good, ctx.frames.good)
+    result.changed[next_year * 100 + next_month] = len(ruts)
+    previous_good = ctx.frames.good
+
+    for y, m in later[1:]:
+        key = y * 100 + m
+        if not ruts:
+            result.untouched.append(key)
+            continue
+        good_path = get_processed_csv_path(y, m)
+        diff_path = get_diff_csv_path(y, m)
+        if not artifact_exists(diff_path):
+            raise PipelineError(f"Re-expresión detenida en {key}: no existen sus diferencias ({diff_path})")
+
+        good, ruts = propagate_changes(read_diffs(diff_path), previous_good, read_processed(good_path), ruts)
+        result.changed[key] = len(ruts)
+        if ruts:
+            write_csv(good, good_path, index=False)
+            update_members(y, m, good, ruts)
+            run_sinks(good, y, m)
+        anomalies = ANOMALIES.enforce(
+            generate_anomalies(y, m, good, previous_good), source=f"Los movimientos anómalos de {key}"
+        )
+        write_csv(anomalies, get_anomalies_csv_path(y, m), index=False)
+        previous_good = good
+
+    logger.info(
+        f"Re-expresión desde {label} finalizada: "
+        + ", ".join(f"{key}: {count} socios" for key, count in result.changed.items())
+    )
+    return result
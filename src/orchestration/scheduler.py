@@ -0,0 +1,152 @@
+# src/orchestration/scheduler.py
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from src.utils.exceptions import PipelineError
+from src.utils.logging import current_stage, setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class Stage:
+    """
+    Etapa del pipeline.
+
+    La función de la etapa recibe como argumentos con nombre los resultados de sus
+    dependencias (por el nombre de cada dependencia).
+    """
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = field(default_factory=tuple)
+
+
+class StageScheduler:
+    """
+    Ejecuta un conjunto de etapas respetando sus dependencias.
+
+    Las etapas independientes entre sí se ejecutan en paralelo en un pool de hilos, de modo
+    que el tiempo total se acerca al de la ruta crítica. Si una etapa falla, no se inician
+    etapas nuevas, se espera a que terminen las que estaban en curso y se relanza el error
+    original de la primera etapa fallida.
+
+    `run` puede recibir resultados ya disponibles de algunas etapas (por ejemplo, leídos de un
+    checkpoint) y ejecutar solo un subconjunto de las etapas registradas.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self.stages: Dict[str, Stage] = {}
+        self.timings: Dict[str, float] = {}
+        self.results: Dict[str, Any] = {}
+        self.failed: Optional[str] = None
+
+    def add(self, name: str, func: Callable[..., Any], deps: Tuple[str, ...] = ()) -> "StageScheduler":
+        if name in self.stages:
+            raise PipelineError(f"La etapa '{name}' ya está registrada")
+        self.stages[name] = Stage(name, func, tuple(deps))
+        return self
+
+    def _validate(self) -> List[str]:
+        """Valida las dependencias y retorna un orden topológico de las etapas."""
+        for stage in self.stages.values():
+            unknown = [dep for dep in stage.deps if dep not in self.stages]
+            if unknown:
+                raise PipelineError(f"La etapa '{stage.name}' depende de etapas inexistentes: {unknown}")
+
+        order: List[str] = []
+        visiting: set = set()
+        done: set = set()
+
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise PipelineError(f"Dependencia circular en la etapa '{name}'")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def _execute(self, stage: Stage, kwargs: Dict[str, Any]) -> Any:
+        token = current_stage.set(stage.name)
+        start = time.perf_counter()
+        try:
+            logger.debug(f"Iniciando etapa {stage.name}")
+            return stage.func(**kwargs)
+        finally:
+            self.timings[stage.name] = time.perf_counter() - start
+            logger.debug(f"Etapa {stage.name} finalizada en {self.timings[stage.name]:.2f}s")
+            current_stage.reset(token)
+
+    def run(
+        self,
+        results: Optional[Dict[str, Any]] = None,
+        only: Optional[Iterable[str]] = None,
+        on_complete: Optional[Callable[[str, Any], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Ejecuta las etapas registradas.
+
+        Args:
+            results: Resultados ya disponibles, por etapa: esas etapas no se ejecutan
+            only: Etapas a ejecutar (por defecto, todas las que no están en `results`)
+            on_complete: Función que recibe el nombre y el resultado de cada etapa terminada
+
+        Returns:
+            Dict[str, Any]: Resultado de cada etapa, por nombre (incluye los recibidos)
+
+        Raises:
+            PipelineError: Si las dependencias son inválidas, a una etapa seleccionada le falta
+                el resultado de una dependencia, o una etapa lanza un PipelineError
+        """
+        order = self._validate()
+        results = dict(results or {})
+        self.results = results
+        self.failed = None
+        selected = set(order if only is None else only)
+        pending = [name for name in order if name in selected and name not in results]
+        for name in pending:
+            missing = [dep for dep in self.stages[name].deps if dep not in results and dep not in pending]
+            if missing:
+                raise PipelineError(f"La etapa '{name}' necesita el resultado de {missing}")
+        running: Dict[Future, str] = {}
+        error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="etapa") as pool:
+            while pending or running:
+                if error is None:
+                    ready = [name for name in pending if all(dep in results for dep in self.stages[name].deps)]
+                    for name in ready:
+                        pending.remove(name)
+                        stage = self.stages[name]
+                        kwargs = {dep: results[dep] for dep in stage.deps}
+                        running[pool.submit(self._execute, stage, kwargs)] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    exc = future.exception()
+                    if exc is None:
+                        results[name] = future.result()
+                        if on_complete is not None:
+                            on_complete(name, results[name])
+                    elif error is None:
+                        logger.error(f"La etapa {name} falló: {exc}")
+                        error = exc
+                        self.failed = name
+
+        if error is not None:
+            raise error
+        return results
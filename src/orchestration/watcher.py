@@ -0,0 +1,215 @@
+# src/orchestration/watcher.py
+
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from src.ingestion.reference_index import warm_reference_index
+from src.utils.artifacts import artifact_exists, resolve_artifact, write_atomic
+from src.utils.logging import setup_logger
+from src.utils.paths import (
+    get_processed_csv_path,
+    get_raw_dir,
+    get_watch_status_path,
+)
+
+logger = setup_logger(__name__)
+
+# Segundos entre revisiones de data/raw
+POLL_INTERVAL = float(os.getenv("CAPITAL_WATCH_INTERVAL", "5"))
+
+# Segundos que un archivo debe permanecer sin cambios (tamaño y fecha) antes de procesarse
+DEBOUNCE_SECONDS = float(os.getenv("CAPITAL_WATCH_DEBOUNCE", "10"))
+
+RAW_FILE_PATTERN = re.compile(r"(\d{4})(\d{2})\.xls")
+
+Signature = Tuple[int, int]
+
+
+def _run_period(run_func: Callable[[int, int], None], year: int, month: int):
+    run_func(year, month)
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class RawFolderWatcher:
+    """
+    Vigila data/raw y ejecuta el pipeline para cada YYYYMM.xls nuevo o modificado.
+
+    Un archivo se procesa cuando su tamaño y fecha de modificación no cambian durante
+    `debounce` segundos, para no leer copias a medio escribir. Las ejecuciones se hacen una a la
+    vez, en orden de período, en un único proceso trabajador que se mantiene vivo entre
+    ejecuciones: los imports y el índice de referencia quedan cargados y solo se vuelven a leer
+    si cambian. El estado se publica en un archivo JSON (data/watch_status.json).
+    """
+
+    def __init__(
+        self,
+        run_func: Callable[[int, int], None],
+        raw_dir: Optional[Path] = None,
+        status_path: Optional[Path] = None,
+        poll_interval: float = POLL_INTERVAL,
+        debounce: float = DEBOUNCE_SECONDS,
+    ):
+        self.run_func = run_func
+        self.raw_dir = raw_dir or get_raw_dir()
+        self.status_path = status_path or get_watch_status_path()
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.pool: Optional[ProcessPoolExecutor] = None
+        # Firma observada de cada archivo y desde cuándo (reloj monotónico) no cambia
+        self.observed: Dict[str, Tuple[Signature, float]] = {}
+        self.status = self._load_status()
+        self.processed: Dict[str, Signature] = {
+            name: tuple(signature) for name, signature in self.status.get("procesados", {}).items()
+        }
+
+    def _load_status(self) -> Dict:
+        if self.status_path.exists():
+            try:
+                return json.loads(self.status_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                logger.warning(f"No se pudo leer {self.status_path}; se inicia un estado nuevo")
+        return {}
+
+    def _write_status(self, estado: str, **values):
+        self.status.update(values)
+        self.status.update(
+            estado=estado,
+            actualizado=_now(),
+            pid=os.getpid(),
+            procesados={name: list(signature) for name, signature in sorted(self.processed.items())},
+        )
+        self.status_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.status_path, json.dumps(self.status, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    def _scan(self) -> Dict[str, Tuple[Signature, int, int]]:
+        found = {}
+        if not self.raw_dir.exists():
+            return found
+        for path in self.raw_dir.iterdir():
+            match = RAW_FILE_PATTERN.fullmatch(path.name)
+            if not match:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found[path.name] = ((stat.st_mtime_ns, stat.st_size), int(match.group(1)), int(match.group(2)))
+        return found
+
+    def _up_to_date(self, signature: Signature, year: int, month: int) -> bool:
+        """Indica si el archivo Bueno del período es posterior al XLS (ya fue procesado)."""
+        processed = get_processed_csv_path(year, month)
+        if not artifact_exists(processed):
+            return False
+        return resolve_artifact(processed).stat().st_mtime_ns >= signature[0]
+
+    def poll(self, now: Optional[float] = None) -> List[Tuple[int, int, str, Signature]]:
+        """
+        Revisa data/raw una vez.
+
+        Returns:
+            List[Tuple[int, int, str, Signature]]: Períodos listos para procesar (año, mes,
+            archivo, firma), ordenados por período
+        """
+        now = time.monotonic() if now is None else now
+        found = self._scan()
+        ready = []
+        pending = []
+
+        for name in list(self.observed):
+            if name not in found:
+                del self.observed[name]
+
+        for name, (signature, year, month) in found.items():
+            if self.processed.get(name) == signature:
+                continue
+            if name not in self.processed and self._up_to_date(signature, year, month):
+                self.processed[name] = signature
+                continue
+
+            previous = self.observed.get(name)
+            if previous is None or previous[0] != signature:
+                self.observed[name] = (signature, now)
+                pending.append(name)
+            elif now - previous[1] >= self.debounce:
+                ready.append((year, month, name, signature))
+            else:
+                pending.append(name)
+
+        self.status["pendientes"] = sorted(pending)
+        return sorted(ready)
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=1, initializer=warm_reference_index)
+
+    def process(self, year: int, month: int, name: str, signature: Signature) -> bool:
+        """Ejecuta el pipeline de un período en el proceso trabajador y registra el resultado."""
+        if self.pool is None:
+            self.pool = self._new_pool()
+
+        inicio = _now()
+        start = time.perf_counter()
+        self._write_status("procesando", en_curso=name)
+        logger.info(f"Modo watch: procesando {name}")
+
+        error = None
+        try:
+            self.pool.submit(_run_period, self.run_func, year, month).result()
+        except BrokenProcessPool as e:
+            error = f"El proceso trabajador terminó inesperadamente: {e}"
+            self.pool = None
+        except Exception as e:
+            error = str(e)
+
+        self.processed[name] = signature
+        self.observed.pop(name, None)
+        ultima = {
+            "periodo": f"{year}-{month:02d}",
+            "archivo": name,
+            "inicio": inicio,
+            "fin": _now(),
+            "duracion_s": round(time.perf_counter() - start, 2),
+            "resultado": "ok" if error is None else "error",
+            "error": error,
+        }
+        if error is None:
+            logger.info(f"Modo watch: {name} procesado en {ultima['duracion_s']}s")
+        else:
+            logger.error(f"Modo watch: fallo al procesar {name}: {error}")
+        self._write_status("esperando", en_curso=None, ultima_ejecucion=ultima)
+        return error is None
+
+    def run(self, max_polls: Optional[int] = None):
+        """
+        Vigila data/raw hasta recibir Ctrl+C (o hasta `max_polls` revisiones).
+        """
+        logger.info(
+            f"Modo watch: vigilando {self.raw_dir} cada {self.poll_interval}s "
+            f"(espera de {self.debounce}s sin cambios antes de procesar)"
+        )
+        self.pool = self._new_pool()
+        polls = 0
+        try:
+            while max_polls is None or polls < max_polls:
+                for year, month, name, signature in self.poll():
+                    self.process(year, month, name, signature)
+                self._write_status("esperando")
+                polls += 1
+                if max_polls is None or polls < max_polls:
+                    time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            logger.info("Modo watch detenido")
+        finally:
+            if self.pool is not None:
+                self.pool.shutdown()
+                self.pool = None
+            self._write_status("detenido", en_curso=None)
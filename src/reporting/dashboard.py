@@ -0,0 +1,218 @@
+# src/reporting/dashboard.py
+
+import json
+import os
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+from src.reporting.trend_report import MEASURES, _tramo_labels, build_trend
+from src.storage.history_store import query_summary
+from src.storage.period_view import tramo_stats_from_good, tramo_stats_from_summary
+from src.utils.artifacts import write_atomic
+from src.utils.contracts import GOOD
+from src.utils.exceptions import ReportingError
+from src.utils.logging import setup_logger
+from src.utils.paths import get_dashboard_paths, get_history_db_path
+
+logger = setup_logger(__name__)
+
+# Cantidad de períodos (hasta el del tablero) que muestra la tabla de totales mensuales
+DASHBOARD_MONTHS = int(os.getenv("CAPITAL_DASHBOARD_MONTHS", "24"))
+
+MEMBER_COLUMNS = ['Rut', 'Nombre', 'Saldo', 'Cuotas']
+
+
+def _columns(df: pd.DataFrame) -> Dict[str, list]:
+    """DataFrame como listas por columna: más compacto en JSON que una lista de filas."""
+    return {col: df[col].tolist() for col in df.columns}
+
+
+def build_dashboard_index(df: pd.DataFrame, year: int, month: int, db_path: Optional[Path] = None) -> Dict:
+    """
+    Arma el índice compacto del tablero de un período.
+
+    Los totales mensuales y la distribución por tramo se leen del resumen materializado de
+    `data/history.sqlite` (ver `query_summary`); solo si el período aún no está en el resumen
+    se calculan desde el archivo Bueno. De los socios se guarda únicamente lo que usa la
+    búsqueda (Rut, Nombre, Saldo y Cuotas), como listas por columna.
+
+    Args:
+        df: Archivo Bueno del período
+        year: Año del período
+        month: Mes del período
+        db_path: Ruta opcional al historial
+
+    Returns:
+        Dict: Claves periodo, generado, totales, tramos y socios
+    """
+    key = year * 100 + month
+    db_path = db_path or get_history_db_path()
+    summary = query_summary(end=key, db_path=db_path) if db_path.exists() else pd.DataFrame()
+
+    current = summary[summary['Periodo'] == key] if not summary.empty else summary
+    tramos = tramo_stats_from_summary(current) if not current.empty else tramo_stats_from_good(df)
+
+    totals = build_trend(summary)[['Periodo'] + MEASURES] if not summary.empty else pd.DataFrame(columns=['Periodo'] + MEASURES)
+    if current.empty:
+        row = {'Periodo': key, **tramos[MEASURES].sum().to_dict()}
+        totals = pd.concat([totals, pd.DataFrame([row])], ignore_index=True)
+    totals = totals.tail(DASHBOARD_MONTHS).astype('int64')
+
+    members = df[MEMBER_COLUMNS].sort_values('Nombre', kind='stable')
+    members = members.assign(
+        Rut=members['Rut'].astype(str),
+        Nombre=members['Nombre'].fillna('').astype(str),
+        Saldo=members['Saldo'].fillna(0).round().astype('int64'),
+        Cuotas=members['Cuotas'].fillna(0).round().astype('int64'),
+    )
+
+    return {
+        'periodo': f"{year}-{month:02d}",
+        'generado': datetime.now().isoformat(timespec="seconds"),
+        'totales': _columns(totals),
+        'tramos': _columns(tramos.assign(Rango=tramos['Tramo'].map(_tramo_labels()))),
+        'socios': _columns(members),
+    }
+
+
+def generate_dashboard(df: pd.DataFrame, year: int, month: int, output_paths: Optional[tuple] = None):
+    """
+    Genera el tablero HTML del período y su índice JSON compacto (ver `build_dashboard_index`).
+
+    El HTML es autocontenido: incluye el índice y se abre sin servidor ni conexión. Muestra los
+    totales de los últimos meses, la distribución por tramo de saldo y un buscador de socios
+    por Rut o nombre.
+
+    Args:
+        df: DataFrame con columnas: Rut, Debito, Credito, Saldo, Cuotas, Nombre
+        year: Año del período
+        month: Mes del período
+        output_paths: Rutas opcionales (html, json); por defecto las de `get_dashboard_paths`
+    """
+    html_path, index_path = output_paths or get_dashboard_paths(year, month)
+    logger.info(f"Generando tablero HTML: {html_path.name}")
+
+    try:
+        GOOD.require(df, columns=MEMBER_COLUMNS + ['Debito', 'Credito'], error=ReportingError)
+
+        index = json.dumps(build_dashboard_index(df, year, month), ensure_ascii=False, separators=(",", ":"))
+        html_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(index_path, index.encode("utf-8"))
+        # "</" dentro del JSON cerraría la etiqueta <script> que lo contiene
+        html = HTML_TEMPLATE.replace("__PERIODO__", f"{year}-{month:02d}").replace("__INDICE__", index.replace("</", "<\\/"))
+        write_atomic(html_path, html.encode("utf-8"))
+
+        logger.info(f"Tablero HTML generado exitosamente: {html_path}")
+
+    except ReportingError:
+        raise
+    except Exception as e:
+        logger.exception("Error generando tablero HTML")
+        raise ReportingError("No se pudo generar el tablero HTML") from e
+
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>Capital Pagado __PERIODO__</title>
+<style>
+  body { font-family: Calibri, Arial, sans-serif; margin: 2em; color: #222; }
+  h1 { margin-bottom: 0.2em; }
+  h2 { margin-top: 1.6em; }
+  table { border-collapse: collapse; }
+  th, td { padding: 0.25em 0.8em; border-bottom: 1px solid #ddd; }
+  td.n, th.n { text-align: right; font-variant-numeric: tabular-nums; }
+  .barra { background: #3b6ea5; height: 0.9em; }
+  #buscar { font-size: 1em; padding: 0.3em; width: 24em; }
+  .nota { color: #666; font-size: 0.9em; }
+</style>
+</head>
+<body>
+<h1>Capital Pagado __PERIODO__</h1>
+<p class="nota" id="generado"></p>
+
+<h2>Totales mensuales</h2>
+<table id="totales"></table>
+
+<h2>Distribución por tramo de saldo</h2>
+<table id="tramos"></table>
+
+<h2>Buscar socio</h2>
+<input id="buscar" type="search" placeholder="Rut o nombre">
+<p class="nota" id="resultado"></p>
+<table id="socios"></table>
+
+<script id="indice" type="application/json">__INDICE__</script>
+<script>
+(function () {
+  var indice = JSON.parse(document.getElementById("indice").textContent);
+  var fmt = new Intl.NumberFormat("es-CL");
+  var MAX_RESULTADOS = 50;
+
+  function periodo(p) { return Math.floor(p / 100) + "-" + String(p % 100).padStart(2, "0"); }
+
+  function tabla(id, encabezados, filas) {
+    var html = "<tr>" + encabezados.map(function (h) {
+      return "<th class='" + (h[1] ? "n" : "") + "'>" + h[0] + "</th>";
+    }).join("") + "</tr>";
+    filas.forEach(function (fila) {
+      html += "<tr>" + fila.map(function (celda, i) {
+        return "<td class='" + (encabezados[i][1] ? "n" : "") + "'>" + celda + "</td>";
+      }).join("") + "</tr>";
+    });
+    document.getElementById(id).innerHTML = html;
+  }
+
+  function texto(s) {
+    return String(s).replace(/[&<>]/g, function (c) { return {"&": "&amp;", "<": "&lt;", ">": "&gt;"}[c]; });
+  }
+
+  function normalizar(s) {
+    return s.normalize("NFKD").replace(/[\\u0300-\\u036f]/g, "").toUpperCase().replace(/\\s+/g, " ").trim();
+  }
+
+  document.getElementById("generado").textContent = "Generado: " + indice.generado;
+
+  var t = indice.totales;
+  tabla("totales",
+    [["Período"], ["Socios", 1], ["Débitos", 1], ["Créditos", 1], ["Saldo", 1], ["Cuotas", 1]],
+    t.Periodo.map(function (p, i) {
+      return [periodo(p), fmt.format(t.Socios[i]), fmt.format(t.Debito[i]), fmt.format(t.Credito[i]),
+              fmt.format(t.Saldo[i]), fmt.format(t.Cuotas[i])];
+    }).reverse());
+
+  var r = indice.tramos;
+  var totalSocios = r.Socios.reduce(function (a, b) { return a + b; }, 0) || 1;
+  tabla("tramos",
+    [["Tramo"], ["Rango"], ["Socios", 1], ["%", 1], [""], ["Saldo", 1]],
+    r.Tramo.map(function (tramo, i) {
+      var pct = 100 * r.Socios[i] / totalSocios;
+      return [tramo, texto(r.Rango[i]), fmt.format(r.Socios[i]), pct.toFixed(1),
+              "<div class='barra' style='width:" + (2 * pct).toFixed(0) + "px'></div>", fmt.format(r.Saldo[i])];
+    }));
+
+  var s = indice.socios;
+  var claves = s.Nombre.map(function (nombre, i) { return normalizar(s.Rut[i] + " " + nombre); });
+
+  document.getElementById("buscar").addEventListener("input", function (e) {
+    var consulta = normalizar(e.target.value);
+    var encontrados = [];
+    if (consulta.length >= 2) {
+      for (var i = 0; i < claves.length; i++) {
+        if (claves[i].indexOf(consulta) !== -1) { encontrados.push(i); }
+      }
+    }
+    document.getElementById("resultado").textContent = consulta.length < 2 ? "" :
+      encontrados.length + " socios" + (encontrados.length > MAX_RESULTADOS ? " (se muestran " + MAX_RESULTADOS + ")" : "");
+    tabla("socios", [["Rut"], ["Nombre"], ["Saldo", 1], ["Cuotas", 1]],
+      encontrados.slice(0, MAX_RESULTADOS).map(function (i) {
+        return [texto(s.Rut[i]), texto(s.Nombre[i]), fmt.format(s.Saldo[i]), fmt.format(s.Cuotas[i])];
+      }));
+  });
+})();
+</script>
+</body>
+</html>
+"""
@@ -2,6 +2,7 @@
 
 import pandas as pd
 from pathlib import Path
+from src.utils.contracts import GOOD
 from src.utils.exceptions import ReportingError
 from src.utils.logging import setup_logger
 
@@ -23,15 +24,10 @@ def generate_excel_report(df: pd.DataFrame, output_path: Path):
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Validar que el DataFrame tiene las columnas necesarias
-        required_cols = ['Nombre', 'Rut', 'Saldo', 'Cuotas']
-        missing_cols = [col for col in required_cols if col not in df.columns]
-        if missing_cols:
-            raise ReportingError(
-                f"El DataFrame no tiene las columnas requeridas: {missing_cols}"
-            )
+        GOOD.require(df, columns=['Nombre', 'Rut', 'Saldo', 'Cuotas'], error=ReportingError)
         
         # Seleccionar y reordenar columnas según el formato esperado
-        report_df = df[['Nombre', 'Rut', 'Saldo', 'Cuotas']].copy()
+        report_df = df[['Nombre', 'Rut', 'Saldo', 'Cuotas']]
         
         # Guardar a Excel sin índice
         report_df.to_excel(output_path, index=False)
@@ -0,0 +1,387 @@
+# src/reporting/member_statements.py
+
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import zipfile
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+from docx import Document
+from docx.shared import Pt
+from src.reporting.word_report import MESES, _format_number
+from src.utils.artifacts import artifact_exists, write_atomic
+from src.utils.csv_io import read_diffs, read_processed
+from src.utils.exceptions import ReportingError
+from src.utils.logging import setup_logger
+from src.utils.paths import (
+    get_diff_csv_path,
+    get_processed_csv_path,
+    get_statement_work_dir,
+    get_statements_path,
+)
+
+logger = setup_logger(__name__)
+
+# Socios por bloque: cada bloque se genera en un proceso y se guarda como una parte reanudable
+STATEMENT_CHUNK_SIZE = int(os.getenv("CAPITAL_STATEMENT_CHUNK", "500"))
+
+# Compresión del document.xml de cada cartola (el resto del .docx se comprime una sola vez)
+DOCX_COMPRESSLEVEL = 1
+
+MEMBER_FIELDS = ['NOMBRE', 'RUT', 'PERIODO', 'DEBITOS', 'CREDITOS', 'SALDO', 'CUOTAS']
+ROW_FIELDS = ['MES', 'DEBITO', 'CREDITO', 'SALDO_MES']
+
+SIGNATURE_FILE = "firma.json"
+
+# Fecha fija de las entradas de los zip, para que una misma cartola genere siempre los mismos bytes
+_ZIP_DATE = (2000, 1, 1, 0, 0, 0)
+
+
+def _placeholder(name: str) -> str:
+    return "{{" + name + "}}"
+
+
+class StatementTemplate:
+    """
+    Plantilla de cartola pre-procesada.
+
+    El documento se construye una sola vez con python-docx y se separa en sus partes: las partes
+    constantes del .docx (estilos, numeración, etc.) se comprimen una sola vez en un zip base, y
+    `word/document.xml` se divide en el encabezado, la fila de movimientos de la tabla (que se
+    repite una vez por mes) y el cierre. Generar la cartola de un socio es solo reemplazar
+    marcadores en ese XML y agregarlo comprimido a una copia del zip base, sin volver a pasar por
+    python-docx ni recomprimir los estilos.
+    """
+
+    DOCUMENT_PART = "word/document.xml"
+
+    def __init__(self, docx: bytes):
+        base = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(docx)) as source, zipfile.ZipFile(base, "w", zipfile.ZIP_DEFLATED) as out:
+            for name in source.namelist():
+                if name != self.DOCUMENT_PART:
+                    out.writestr(zipfile.ZipInfo(name, _ZIP_DATE), source.read(name), compress_type=zipfile.ZIP_DEFLATED)
+            document = source.read(self.DOCUMENT_PART).decode("utf-8")
+        self.base = base.getvalue()
+
+        marker = document.find(_placeholder(ROW_FIELDS[0]))
+        row_start = max(document.rfind("<w:tr>", 0, marker), document.rfind("<w:tr ", 0, marker))
+        row_end = document.find("</w:tr>", marker)
+        if marker < 0 or row_start < 0 or row_end < 0:
+            raise ReportingError("La plantilla de cartola no tiene la fila de movimientos")
+        row_end += len("</w:tr>")
+        self.head = document[:row_start]
+        self.row = document[row_start:row_end]
+        self.tail = document[row_end:]
+
+        missing = [
+            name for name in MEMBER_FIELDS if _placeholder(name) not in self.head + self.tail
+        ] + [name for name in ROW_FIELDS if _placeholder(name) not in self.row]
+        if missing:
+            raise ReportingError(f"La plantilla de cartola no tiene los marcadores: {missing}")
+
+    @classmethod
+    def build(cls) -> "StatementTemplate":
+        """Construye la plantilla con el formato de los reportes Word (Calibri)."""
+        document = Document()
+        style = document.styles['Normal']
+        style.font.name = 'Calibri'
+        style.font.size = Pt(12)
+
+        document.add_heading("Cartola de Capital Pagado", level=1)
+        document.add_paragraph(f"Socio: {_placeholder('NOMBRE')}")
+        document.add_paragraph(f"Rut: {_placeholder('RUT')}")
+        document.add_paragraph(f"Período: {_placeholder('PERIODO')}")
+
+        table = document.add_table(rows=3, cols=4)
+        table.style = 'Table Grid'
+        rows = [
+            ["Mes", "Débitos", "Créditos", "Saldo"],
+            [_placeholder(name) for name in ROW_FIELDS],
+            ["Total", _placeholder('DEBITOS'), _placeholder('CREDITOS'), _placeholder('SALDO')],
+        ]
+        for row, values in zip(table.rows, rows):
+            for cell, value in zip(row.cells, values):
+                cell.text = value
+
+        document.add_paragraph(f"Cuotas al cierre: {_placeholder('CUOTAS')}")
+
+        buffer = io.BytesIO()
+        document.save(buffer)
+        return cls(buffer.getvalue())
+
+    def render(self, values: Dict[str, str], rows: List[Dict[str, str]]) -> bytes:
+        """
+        Genera el .docx de un socio.
+
+        Args:
+            values: Texto de cada marcador de `MEMBER_FIELDS`
+            rows: Una fila por mes con el texto de cada marcador de `ROW_FIELDS`
+
+        Returns:
+            bytes: Contenido del archivo .docx
+        """
+        body = []
+        for row in rows:
+            text = self.row
+            for name in ROW_FIELDS:
+                text = text.replace(_placeholder(name), escape(row[name]))
+            body.append(text)
+        document = self.head + "".join(body) + self.tail
+        for name in MEMBER_FIELDS:
+            document = document.replace(_placeholder(name), escape(values[name]))
+
+        buffer = io.BytesIO(self.base)
+        with zipfile.ZipFile(buffer, "a") as out:
+            out.writestr(
+                zipfile.ZipInfo(self.DOCUMENT_PART, _ZIP_DATE),
+                document.encode("utf-8"),
+                compress_type=zipfile.ZIP_DEFLATED,
+                compresslevel=DOCX_COMPRESSLEVEL,
+            )
+        return buffer.getvalue()
+
+
+@dataclass
+class StatementData:
+    """Datos de las cartolas de un período: una fila por socio y una columna por mes del año."""
+    year: int
+    month: int
+    members: pd.DataFrame  # Rut, Nombre, Saldo, Cuotas (período de cierre)
+    debitos: np.ndarray = field(repr=False)
+    creditos: np.ndarray = field(repr=False)
+    saldos: np.ndarray = field(repr=False)
+
+    @property
+    def months(self) -> List[int]:
+        return list(range(1, self.month + 1))
+
+    def signature(self, chunk_size: int) -> Dict:
+        """Identifica los datos y el tamaño de bloque: una generación solo se reanuda si coinciden."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pd.util.hash_pandas_object(self.members, index=False).to_numpy().tobytes())
+        for values in (self.debitos, self.creditos, self.saldos):
+            digest.update(np.ascontiguousarray(values).tobytes())
+        return {
+            "periodo": f"{self.year}{self.month:02d}",
+            "socios": len(self.members),
+            "bloque": chunk_size,
+            "datos": digest.hexdigest(),
+        }
+
+    def chunk(self, start: int, stop: int) -> Tuple:
+        members = self.members.iloc[start:stop]
+        return (
+            members['Rut'].tolist(),
+            members['Nombre'].tolist(),
+            members['Saldo'].tolist(),
+            members['Cuotas'].tolist(),
+            self.debitos[start:stop],
+            self.creditos[start:stop],
+            self.saldos[start:stop],
+        )
+
+
+def _keys(df: pd.DataFrame) -> pd.Series:
+    """Rut normalizado igual que la consolidación: mayúsculas y sin espacios."""
+    return df['Rut'].astype(str).str.upper().str.strip()
+
+
+def load_statement_data(year: int, month: int) -> StatementData:
+    """
+    Reúne los datos de las cartolas del año hasta el período de cierre.
+
+    Los socios y sus saldos y cuotas al cierre salen del archivo Bueno del período; los
+    movimientos de cada mes, de las diferencias del mes (un mes sin diferencias para el socio
+    queda en 0) y el saldo de cada mes, del archivo Bueno de ese mes.
+
+    Raises:
+        ReportingError: Si no existe el archivo Bueno del período de cierre
+    """
+    closing_path = get_processed_csv_path(year, month)
+    if not artifact_exists(closing_path):
+        raise ReportingError(f"No existe el archivo Bueno del período {year}-{month:02d}: {closing_path}")
+
+    members = read_processed(closing_path, columns=['Rut', 'Nombre', 'Saldo', 'Cuotas'])
+    members = members.assign(Rut=_keys(members)).drop_duplicates('Rut').sort_values('Rut', kind='mergesort')
+    members = members.reset_index(drop=True)
+    index = pd.Index(members['Rut'])
+
+    debitos, creditos, saldos = {}, {}, {}
+    for m in range(1, month + 1):
+        diff_path = get_diff_csv_path(year, m)
+        if artifact_exists(diff_path):
+            diffs = read_diffs(diff_path, columns=['Rut', 'diff_debito', 'diff_credito'])
+            totals = diffs.groupby(_keys(diffs), sort=False)[['diff_debito', 'diff_credito']].sum()
+            debitos[m] = totals['diff_debito']
+            creditos[m] = totals['diff_credito']
+        good_path = get_processed_csv_path(year, m)
+        if artifact_exists(good_path):
+            good = read_processed(good_path, columns=['Rut', 'Saldo'])
+            saldos[m] = good.set_index(_keys(good))['Saldo'].groupby(level=0).first()
+
+    def matrix(series: Dict[int, pd.Series]) -> np.ndarray:
+        frame = pd.DataFrame(
+            {m: series[m].reindex(index) if m in series else np.nan for m in range(1, month + 1)},
+            index=index,
+        )
+        return frame.fillna(0).to_numpy(dtype=np.int64)
+
+    return StatementData(year, month, members, matrix(debitos), matrix(creditos), matrix(saldos))
+
+
+def _money(value) -> str:
+    return f"${_format_number(int(value))}"
+
+
+def _entry_name(rut: str) -> str:
+    return re.sub(r'[^0-9A-Za-z_-]', '_', rut) + ".docx"
+
+
+# Plantilla del proceso trabajador (se recibe una vez, en el inicializador del pool)
+_template: Optional[StatementTemplate] = None
+
+
+def _init_worker(template: StatementTemplate):
+    global _template
+    _template = template
+
+
+def _render_chunk(path: Path, year: int, month: int, chunk: Tuple) -> int:
+    """Genera las cartolas de un bloque y las guarda juntas en un zip (sin recomprimir los .docx)."""
+    ruts, nombres, saldos_cierre, cuotas, debitos, creditos, saldos = chunk
+    period = f"{MESES[1]} a {MESES[month]} {year}" if month > 1 else f"{MESES[1]} {year}"
+    labels = [MESES[m] for m in range(1, month + 1)]
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as out:
+        for i, rut in enumerate(ruts):
+            rows = [
+                {
+                    'MES': label,
+                    'DEBITO': _money(debitos[i, j]),
+                    'CREDITO': _money(creditos[i, j]),
+                    'SALDO_MES': _money(saldos[i, j]),
+                }
+                for j, label in enumerate(labels)
+            ]
+            values = {
+                'NOMBRE': str(nombres[i]),
+                'RUT': rut,
+                'PERIODO': period,
+                'DEBITOS': _money(debitos[i].sum()),
+                'CREDITOS': _money(creditos[i].sum()),
+                'SALDO': _money(saldos_cierre[i]),
+                'CUOTAS': _format_number(int(cuotas[i])),
+            }
+            out.writestr(zipfile.ZipInfo(_entry_name(rut), _ZIP_DATE), _template.render(values, rows))
+    write_atomic(path, buffer.getvalue())
+    return len(ruts)
+
+
+def _prepare_work_dir(work_dir: Path, signature: Dict) -> None:
+    """Conserva las partes de una generación anterior solo si corresponden a los mismos datos."""
+    signature_path = work_dir / SIGNATURE_FILE
+    if work_dir.exists():
+        try:
+            previous = json.loads(signature_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            previous = None
+        if previous == signature:
+            return
+        logger.info("Las partes de una generación anterior no corresponden a estos datos: se descartan")
+        shutil.rmtree(work_dir)
+    work_dir.mkdir(parents=True)
+    write_atomic(signature_path, json.dumps(signature, indent=2).encode("utf-8"))
+
+
+def _merge_chunks(chunk_paths: List[Path], output_path: Path) -> None:
+    """Une las partes en el zip final copiando cada .docx ya comprimido, sin cargarlas completas."""
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w", zipfile.ZIP_STORED, allowZip64=True) as out:
+            for chunk_path in chunk_paths:
+                with zipfile.ZipFile(chunk_path) as part:
+                    for info in part.infolist():
+                        with part.open(info) as src, out.open(zipfile.ZipInfo(info.filename, _ZIP_DATE), "w") as dst:
+                            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def generate_member_statements(
+    year: int,
+    month: int,
+    max_workers: Optional[int] = None,
+    chunk_size: int = STATEMENT_CHUNK_SIZE,
+) -> Path:
+    """
+    Genera la cartola de capital pagado de cada socio del período en un zip.
+
+    Las cartolas se generan por bloques en procesos trabajadores a partir de una plantilla
+    pre-procesada (`StatementTemplate`). Cada bloque terminado queda guardado como una parte en
+    el directorio de trabajo, por lo que una generación interrumpida se reanuda desde el primer
+    bloque pendiente, siempre que los datos del período no hayan cambiado. Al final las partes
+    se unen en `reports/statements/YYYYMM_cartolas.zip` (un .docx por socio, nombrado por Rut).
+
+    Args:
+        year: Año del período de cierre
+        month: Mes del período de cierre
+        max_workers: Procesos trabajadores (por defecto, los núcleos disponibles)
+        chunk_size: Socios por bloque
+
+    Returns:
+        Path: Ruta del zip generado
+
+    Raises:
+        ReportingError: Si faltan los datos del período o falla la generación de un bloque
+    """
+    start_time = time.perf_counter()
+    data = load_statement_data(year, month)
+    output_path = get_statements_path(year, month)
+    work_dir = get_statement_work_dir(year, month)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _prepare_work_dir(work_dir, data.signature(chunk_size))
+
+    total = len(data.members)
+    starts = range(0, total, chunk_size)
+    chunk_paths = [work_dir / f"bloque_{i:05d}.zip" for i in range(len(starts))]
+    pending = [(path, start) for path, start in zip(chunk_paths, starts) if not path.exists()]
+    if len(pending) < len(chunk_paths):
+        logger.info(f"Reanudando cartolas: {len(chunk_paths) - len(pending)} de {len(chunk_paths)} bloques ya generados")
+    logger.info(f"Generando {total} cartolas de {year}-{month:02d} en {len(pending)} bloques")
+
+    if pending:
+        template = StatementTemplate.build()
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(template,)) as pool:
+            futures = {
+                pool.submit(_render_chunk, path, year, month, data.chunk(start, start + chunk_size)): path
+                for path, start in pending
+            }
+            done = 0
+            for future in as_completed(futures):
+                try:
+                    done += future.result()
+                except Exception as e:
+                    for other in futures:
+                        other.cancel()
+                    raise ReportingError(f"Error al generar el bloque {futures[future].name}: {e}") from e
+                logger.debug(f"Cartolas generadas: {done}")
+
+    _merge_chunks(chunk_paths, output_path)
+    shutil.rmtree(work_dir)
+    logger.info(f"Cartolas guardadas en {output_path} ({total} socios, {time.perf_counter() - start_time:.1f}s)")
+    return output_path
@@ -0,0 +1,144 @@
+# src/reporting/perf_report.py
+
+import os
+import pandas as pd
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from src.storage.perf_history import query_runs, query_stage_timings
+from src.utils.exceptions import ReportingError
+from src.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+# Aumento sobre la línea base a partir del que una etapa se marca como regresión (0.25 = 25% más lenta)
+PERF_THRESHOLD = float(os.getenv("CAPITAL_PERF_THRESHOLD", "0.25"))
+
+# Ejecuciones correctas anteriores cuya mediana es la línea base de cada etapa
+PERF_BASELINE_RUNS = int(os.getenv("CAPITAL_PERF_BASELINE_RUNS", "5"))
+
+# Etapas más rápidas que esto no se marcan: en ellas la variación es ruido
+PERF_MIN_SECONDS = float(os.getenv("CAPITAL_PERF_MIN_SECONDS", "1"))
+
+# Ejecuciones anteriores necesarias para tener línea base
+BASELINE_MIN_RUNS = 3
+
+# Etapa con la duración total de cada ejecución
+TOTAL = "total"
+
+
+@dataclass
+class PerfReport:
+    """Ejecuciones, tiempo de cada etapa por ejecución y regresiones detectadas."""
+    runs: pd.DataFrame
+    trend: pd.DataFrame
+    regressions: pd.DataFrame
+
+    @property
+    def latest_regressed(self) -> bool:
+        """Si la ejecución más reciente tiene alguna etapa marcada."""
+        return not self.runs.empty and bool((self.regressions['Ejecucion'] == self.runs['Ejecucion'].iloc[-1]).any())
+
+
+def stage_timings(runs: pd.DataFrame, stages: pd.DataFrame) -> pd.DataFrame:
+    """
+    Une los tiempos por etapa con sus ejecuciones y agrega la duración total como etapa `total`
+    (solo de las ejecuciones correctas y completas: las demás no ejecutaron todas las etapas).
+
+    Returns:
+        pd.DataFrame: Columnas: Ejecucion, Periodo, Estado, Socios, Etapa, Segundos, ordenado por ejecución
+    """
+    info = runs[['Ejecucion', 'Periodo', 'Estado', 'Socios']]
+    totals = runs.loc[(runs['Estado'] == 'ok') & runs['Completa'], ['Ejecucion', 'Segundos']].assign(Etapa=TOTAL)
+    timings = pd.concat([stages, totals], ignore_index=True).merge(info, on='Ejecucion')
+    return timings[['Ejecucion', 'Periodo', 'Estado', 'Socios', 'Etapa', 'Segundos']].sort_values(
+        ['Ejecucion', 'Etapa'], kind='stable'
+    ).reset_index(drop=True)
+
+
+def flag_regressions(
+    timings: pd.DataFrame,
+    window: int = PERF_BASELINE_RUNS,
+    threshold: float = PERF_THRESHOLD,
+    min_seconds: float = PERF_MIN_SECONDS,
+) -> pd.DataFrame:
+    """
+    Compara cada etapa de cada ejecución con su línea base: la mediana de la misma etapa en las
+    `window` ejecuciones correctas anteriores (se necesitan al menos BASELINE_MIN_RUNS).
+
+    Args:
+        timings: Tiempos por etapa (ver `stage_timings`)
+        window: Ejecuciones de la línea base
+        threshold: Aumento relativo a partir del que se marca una regresión
+        min_seconds: Duración mínima para marcar una etapa
+
+    Returns:
+        pd.DataFrame: `timings` con las columnas Base (segundos), Variacion (relativa) y Regresion
+    """
+    ok = timings['Estado'] == 'ok'
+
+    def baseline(seconds: pd.Series) -> pd.Series:
+        # Mediana móvil de las ejecuciones correctas, tomada de la última correcta anterior a cada fila
+        rolling = seconds.dropna().rolling(window, min_periods=min(BASELINE_MIN_RUNS, window)).median()
+        return rolling.reindex(seconds.index).ffill().shift()
+
+    base = timings['Segundos'].where(ok).groupby(timings['Etapa']).transform(baseline)
+    variation = timings['Segundos'] / base - 1
+    return timings.assign(
+        Base=base.round(3),
+        Variacion=variation.round(3),
+        Regresion=(variation > threshold) & (timings['Segundos'] >= min_seconds),
+    )
+
+
+def build_stage_trend(timings: pd.DataFrame) -> pd.DataFrame:
+    """Tiempo de cada etapa (filas, con el total al final) en cada ejecución (columnas #id YYYY-MM)."""
+    labels = timings['Ejecucion'].map(str).radd('#') + ' ' + (timings['Periodo'] // 100).map(str) + '-' + (
+        timings['Periodo'] % 100
+    ).map('{:02d}'.format)
+    trend = timings.assign(Columna=labels).pivot(index='Etapa', columns='Columna', values='Segundos')
+    trend = trend[pd.unique(labels)]
+    order = sorted(stage for stage in trend.index if stage != TOTAL) + ([TOTAL] if TOTAL in trend.index else [])
+    trend = trend.loc[order]
+    trend.columns.name = None
+    return trend
+
+
+def generate_perf_report(
+    last: int = 10,
+    window: int = PERF_BASELINE_RUNS,
+    threshold: float = PERF_THRESHOLD,
+    min_seconds: float = PERF_MIN_SECONDS,
+    db_path: Optional[Path] = None,
+) -> PerfReport:
+    """
+    Arma el reporte de rendimiento de las últimas `last` ejecuciones. Las líneas base se calculan
+    con todo el historial, así la primera ejecución mostrada también se compara.
+
+    Raises:
+        ReportingError: Si no hay ejecuciones registradas
+    """
+    runs = query_runs(db_path=db_path)
+    if runs.empty:
+        raise ReportingError("No hay ejecuciones registradas en el historial de rendimiento")
+
+    flagged = flag_regressions(stage_timings(runs, query_stage_timings(db_path=db_path)), window, threshold, min_seconds)
+    shown = runs['Ejecucion'].tail(last)
+    flagged = flagged[flagged['Ejecucion'].isin(shown)]
+    regressions = flagged.loc[flagged['Regresion'], ['Ejecucion', 'Periodo', 'Etapa', 'Segundos', 'Base', 'Variacion']]
+    return PerfReport(
+        runs=runs.tail(last).reset_index(drop=True),
+        trend=build_stage_trend(flagged),
+        regressions=regressions.reset_index(drop=True),
+    )
+
+
+def check_run(run_id: int, db_path: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Regresiones de una ejecución ya registrada, con los parámetros por defecto.
+
+    Returns:
+        pd.DataFrame: Etapas marcadas (ver `generate_perf_report`); vacío si no hay
+    """
+    regressions = generate_perf_report(db_path=db_path).regressions
+    return regressions[regressions['Ejecucion'] == run_id]
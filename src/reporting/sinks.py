@@ -0,0 +1,117 @@
+# src/reporting/sinks.py
+
+import os
+import time
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from src.reporting.dashboard import generate_dashboard
+from src.reporting.excel_report import generate_excel_report
+from src.reporting.word_report import generate_word_report
+from src.utils.exceptions import ReportingError
+from src.utils.logging import setup_logger
+from src.utils.paths import get_dashboard_paths, get_report_paths
+
+logger = setup_logger(__name__)
+
+# Reportes que se generan en cada ejecución mensual, separados por comas (ver REPORT_SINKS)
+ENABLED_SINKS = os.getenv("CAPITAL_REPORT_SINKS", "excel,word,dashboard")
+
+
+@dataclass(frozen=True)
+class ReportSink:
+    """
+    Salida de reportes de un período.
+
+    `generate` recibe el archivo Bueno, el año y el mes, y escribe los archivos que indica
+    `outputs`. `deps` son las etapas del pipeline que deben terminar antes (además de la
+    consolidación, por ejemplo el historial si el reporte lee su resumen).
+    """
+    name: str
+    generate: Callable[[pd.DataFrame, int, int], object]
+    outputs: Callable[[int, int], Tuple[Path, ...]]
+    deps: Tuple[str, ...] = ("consolidate",)
+
+    @property
+    def stage(self) -> str:
+        """Nombre de la etapa del pipeline que genera el reporte."""
+        return f"{self.name}_report"
+
+
+REPORT_SINKS: Dict[str, ReportSink] = {}
+
+
+def register_sink(sink: ReportSink) -> ReportSink:
+    """Registra (o reemplaza) una salida de reportes."""
+    REPORT_SINKS[sink.name] = sink
+    return sink
+
+
+def get_report_sinks(names: Optional[Sequence[str]] = None) -> List[ReportSink]:
+    """
+    Salidas de reportes habilitadas, en orden.
+
+    Args:
+        names: Nombres de las salidas (por defecto CAPITAL_REPORT_SINKS)
+
+    Raises:
+        ReportingError: Si alguna salida no está registrada
+    """
+    if names is None:
+        names = [name.strip() for name in ENABLED_SINKS.split(",") if name.strip()]
+    unknown = [name for name in names if name not in REPORT_SINKS]
+    if unknown:
+        raise ReportingError(f"Salidas de reportes desconocidas: {unknown}. Disponibles: {', '.join(REPORT_SINKS)}")
+    return [REPORT_SINKS[name] for name in names]
+
+
+def run_sinks(
+    df: pd.DataFrame,
+    year: int,
+    month: int,
+    sinks: Optional[Sequence[ReportSink]] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    Genera en paralelo los reportes de un período fuera del pipeline (servicio HTTP, re-expresión).
+
+    Returns:
+        Dict[str, float]: Tiempo de cada reporte, por nombre de etapa, en segundos
+
+    Raises:
+        ReportingError: El primer error de los reportes que fallaron (los demás se generan igual)
+    """
+    sinks = get_report_sinks() if sinks is None else sinks
+    timings: Dict[str, float] = {}
+
+    def generate(sink: ReportSink):
+        start = time.perf_counter()
+        sink.generate(df, year, month)
+        timings[sink.stage] = time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(sinks), 1), thread_name_prefix="reporte") as pool:
+        futures = [pool.submit(generate, sink) for sink in sinks]
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    if errors:
+        raise errors[0]
+    return timings
+
+
+register_sink(ReportSink(
+    "excel",
+    lambda df, year, month: generate_excel_report(df, get_report_paths(year, month)[0]),
+    lambda year, month: get_report_paths(year, month)[:1],
+))
+register_sink(ReportSink(
+    "word",
+    lambda df, year, month: generate_word_report(df, get_report_paths(year, month)[1]),
+    lambda year, month: get_report_paths(year, month)[1:],
+))
+register_sink(ReportSink(
+    "dashboard",
+    generate_dashboard,
+    get_dashboard_paths,
+    deps=("consolidate", "history"),
+))
@@ -0,0 +1,181 @@
+# src/reporting/trend_report.py
+
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Optional
+from src.reporting.word_report import _format_number
+from src.storage.history_store import TRAMO_LIMITS, query_summary
+from src.utils.exceptions import ReportingError
+from src.utils.logging import setup_logger
+from src.utils.paths import get_annual_report_path, get_trend_report_path
+
+logger = setup_logger(__name__)
+
+MEASURES = ['Socios', 'Debito', 'Credito', 'Saldo', 'Cuotas']
+
+# Hojas de los reportes: total y desglose por cada dimensión del resumen
+DIMENSIONS = {
+    'Total': None,
+    'Por tramo': 'Tramo',
+    'Por categoría': 'Categoria',
+    'Por tipo': 'Tipo',
+}
+
+
+def _tramo_labels() -> Dict[int, str]:
+    """Rangos de saldo de cada tramo, con el formato del reporte Word."""
+    labels = {}
+    lower = 0
+    for i, limit in enumerate(TRAMO_LIMITS, start=1):
+        labels[i] = f"{_format_number(lower)} - {_format_number(limit)}"
+        lower = limit + 1
+    labels[len(TRAMO_LIMITS) + 1] = f"{_format_number(lower)} o superior"
+    return labels
+
+
+def _capital(summary: pd.DataFrame) -> pd.DataFrame:
+    """Deja solo los socios con saldo distinto de cero (tramo 0 fuera), igual que el reporte Word."""
+    capital = summary[summary['Tramo'] > 0]
+    return capital.assign(
+        Categoria=capital['Categoria'].replace('', 'Sin categoría'),
+        Tipo=capital['Tipo'].replace('', 'Sin tipo'),
+    )
+
+
+def _label_tramos(df: pd.DataFrame) -> pd.DataFrame:
+    """Reemplaza el número de tramo por su rango (después de ordenar por número)."""
+    if 'Tramo' not in df.columns:
+        return df
+    return df.assign(Tramo=df['Tramo'].map(_tramo_labels()))
+
+
+def build_trend(summary: pd.DataFrame, dimension: Optional[str] = None) -> pd.DataFrame:
+    """
+    Evolución mensual de socios, débitos, créditos, saldo y cuotas.
+
+    Args:
+        summary: Resumen materializado (ver `query_summary`)
+        dimension: Columna de desglose (Tramo, Categoria o Tipo); None para el total por período
+
+    Returns:
+        pd.DataFrame: Una fila por período (y valor de la dimensión) con las medidas y la
+                     variación del saldo respecto del período anterior
+    """
+    keys = ['Periodo'] + ([dimension] if dimension else [])
+    trend = _capital(summary).groupby(keys, as_index=False, sort=True)[MEASURES].sum()
+    if dimension:
+        trend['Var_Saldo'] = trend.groupby(dimension, sort=False)['Saldo'].diff().fillna(0).astype('int64')
+    else:
+        trend['Var_Saldo'] = trend['Saldo'].diff().fillna(0).astype('int64')
+    return _label_tramos(trend)
+
+
+def build_annual(summary: pd.DataFrame, year: int, dimension: Optional[str] = None) -> pd.DataFrame:
+    """
+    Compara el cierre del año con el cierre del año anterior.
+
+    El cierre de un año es su último período registrado (normalmente diciembre).
+
+    Args:
+        summary: Resumen materializado de ambos años
+        year: Año a reportar
+        dimension: Columna de desglose (Tramo, Categoria o Tipo); None para el total
+
+    Returns:
+        pd.DataFrame: Medidas de ambos cierres (sufijos _anterior y _actual) y sus variaciones
+
+    Raises:
+        ReportingError: Si el año no tiene períodos registrados
+    """
+    periods = summary['Periodo']
+    current = periods[periods // 100 == year]
+    if current.empty:
+        raise ReportingError(f"El resumen no tiene períodos del año {year}")
+    previous = periods[periods // 100 == year - 1]
+
+    def closing(periodo: Optional[int]) -> pd.DataFrame:
+        keys = [dimension] if dimension else []
+        selected = _capital(summary[summary['Periodo'] == periodo])
+        if not keys:
+            return selected[MEASURES].sum().to_frame().T
+        return selected.groupby(keys, sort=True)[MEASURES].sum()
+
+    before = closing(previous.max() if not previous.empty else None)
+    after = closing(current.max())
+    annual = before.join(after, how='outer', lsuffix='_anterior', rsuffix='_actual').fillna(0).astype('int64')
+    for measure in MEASURES:
+        annual[f'Var_{measure}'] = annual[f'{measure}_actual'] - annual[f'{measure}_anterior']
+    annual['Var_Saldo_%'] = (
+        annual['Var_Saldo'] / annual['Saldo_anterior'].where(annual['Saldo_anterior'] != 0) * 100
+    ).round(2)
+    return _label_tramos(annual.reset_index(drop=dimension is None))
+
+
+def _write_sheets(sheets: Dict[str, pd.DataFrame], output_path: Path) -> None:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with pd.ExcelWriter(output_path) as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+
+
+def generate_trend_report(
+    start_year: int,
+    start_month: int,
+    end_year: int,
+    end_month: int,
+    output_path: Optional[Path] = None,
+    db_path: Optional[Path] = None,
+) -> Path:
+    """
+    Genera el reporte Excel de tendencia mensual de un rango de períodos desde el resumen
+    materializado del historial (no lee datos por socio).
+
+    Returns:
+        Path: Ruta del reporte generado
+
+    Raises:
+        ReportingError: Si el rango no tiene períodos registrados o falla la escritura
+    """
+    output_path = output_path or get_trend_report_path(start_year, start_month, end_year, end_month)
+    logger.info(f"Generando reporte de tendencia: {output_path.name}")
+
+    summary = query_summary(start_year * 100 + start_month, end_year * 100 + end_month, db_path=db_path)
+    if summary.empty:
+        raise ReportingError(
+            f"El historial no tiene períodos entre {start_year}-{start_month:02d} y {end_year}-{end_month:02d}"
+        )
+    try:
+        _write_sheets({name: build_trend(summary, dimension) for name, dimension in DIMENSIONS.items()}, output_path)
+    except Exception as e:
+        logger.exception("Error generando reporte de tendencia")
+        raise ReportingError("No se pudo generar el reporte de tendencia") from e
+
+    logger.info(f"Reporte de tendencia generado: {output_path} ({summary['Periodo'].nunique()} períodos)")
+    return output_path
+
+
+def generate_annual_report(year: int, output_path: Optional[Path] = None, db_path: Optional[Path] = None) -> Path:
+    """
+    Genera el reporte Excel anual: cierre del año comparado con el del año anterior, más la
+    evolución mensual del año, desde el resumen materializado del historial.
+
+    Returns:
+        Path: Ruta del reporte generado
+
+    Raises:
+        ReportingError: Si el año no tiene períodos registrados o falla la escritura
+    """
+    output_path = output_path or get_annual_report_path(year)
+    logger.info(f"Generando reporte anual: {output_path.name}")
+
+    summary = query_summary((year - 1) * 100 + 1, year * 100 + 12, db_path=db_path)
+    sheets = {name: build_annual(summary, year, dimension) for name, dimension in DIMENSIONS.items()}
+    sheets['Evolución mensual'] = build_trend(summary[summary['Periodo'] // 100 == year])
+    try:
+        _write_sheets(sheets, output_path)
+    except Exception as e:
+        logger.exception("Error generando reporte anual")
+        raise ReportingError("No se pudo generar el reporte anual") from e
+
+    logger.info(f"Reporte anual generado: {output_path}")
+    return output_path
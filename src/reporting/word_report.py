@@ -6,6 +6,7 @@ from docx import Document
 from docx.shared import Pt
 from docx.enum.section import WD_ORIENTATION
 from pathlib import Path
+from src.utils.contracts import GOOD
 from src.utils.exceptions import ReportingError
 from src.utils.logging import setup_logger
 
@@ -41,9 +42,13 @@ def _calculate_tramo_statistics(df: pd.DataFrame):
     - cred: Créditos por tramo
     - deb: Débitos por tramo
     - sald: Saldos y cantidad de socios por tramo
+
+    Raises:
+        ReportingError: Si los tramos no suman los totales, o los totales no cuadran
+                        (créditos - débitos = saldo)
     """
     # Filtrar solo registros con saldo distinto de cero
-    capital = df[df['Saldo'] != 0].copy()
+    capital = df[df['Saldo'] != 0]
     
     # Tramo 1: Saldo <= 10,000
     tramo1 = capital[capital['Saldo'] <= 10000]
@@ -82,10 +87,18 @@ def _calculate_tramo_statistics(df: pd.DataFrame):
     }
     
     # Validar que las sumas coincidan
-    assert cred['1'] + cred['2'] + cred['3'] + cred['4'] == cred['total']
-    assert deb['1'] + deb['2'] + deb['3'] + deb['4'] == deb['total']
-    assert sald['1'][0] + sald['2'][0] + sald['3'][0] + sald['4'][0] == sald['total']
-    assert cred['total'] - deb['total'] == sald['total']
+    tramos = ('1', '2', '3', '4')
+    if sum(cred[t] for t in tramos) != cred['total']:
+        raise ReportingError("Los créditos por tramo no suman el total de créditos")
+    if sum(deb[t] for t in tramos) != deb['total']:
+        raise ReportingError("Los débitos por tramo no suman el total de débitos")
+    if sum(sald[t][0] for t in tramos) != sald['total']:
+        raise ReportingError("Los saldos por tramo no suman el saldo total")
+    if cred['total'] - deb['total'] != sald['total']:
+        raise ReportingError(
+            f"Los totales no cuadran: créditos ({cred['total']}) - débitos ({deb['total']}) "
+            f"!= saldo ({sald['total']})"
+        )
     
     return cred, deb, sald
 
@@ -116,13 +129,12 @@ def generate_word_report(df: pd.DataFrame, output_path: Path):
         # Asegurar que el directorio existe
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Validar columnas requeridas
-        required_cols = ['Rut', 'Debito', 'Credito', 'Saldo', 'Nombre']
-        missing_cols = [col for col in required_cols if col not in df.columns]
-        if missing_cols:
-            raise ReportingError(
-                f"El DataFrame no tiene las columnas requeridas: {missing_cols}"
-            )
+        # Validar columnas requeridas y que Saldo = Credito - Debito en cada socio (así los
+        # totales del documento cuadran), en todas las filas
+        GOOD.enforce(
+            df, source="El DataFrame", columns=['Rut', 'Debito', 'Credito', 'Saldo', 'Nombre'],
+            error=ReportingError,
+        )
         
         # Extraer año y mes del nombre del archivo
         year, month = _extract_year_month_from_path(output_path)
@@ -0,0 +1,405 @@
+# src/service/http_service.py
+
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from src.ingestion.reference_index import warm_reference_index
+from src.reporting.sinks import REPORT_SINKS, run_sinks
+from src.utils.artifacts import describe_artifact, write_atomic
+from src.utils.csv_io import read_processed
+from src.utils.exceptions import PipelineError
+from src.utils.logging import setup_logger
+from src.utils.paths import (
+    get_anomalies_csv_path,
+    get_dashboard_paths,
+    get_diff_csv_path,
+    get_original_csv_path,
+    get_processed_csv_path,
+    get_raw_xls_path,
+    get_renames_csv_path,
+    get_report_paths,
+    get_run_manifest_path,
+)
+
+logger = setup_logger(__name__)
+
+SERVICE_HOST = os.getenv("CAPITAL_SERVICE_HOST", "127.0.0.1")
+SERVICE_PORT = int(os.getenv("CAPITAL_SERVICE_PORT", "8765"))
+
+# Procesos trabajadores; las ejecuciones completas de un mes se hacen de a una porque
+# comparten la cadena de archivos Bueno, el ledger y el historial
+SERVICE_WORKERS = int(os.getenv("CAPITAL_SERVICE_WORKERS", "2"))
+
+# Tamaño máximo aceptado para un XLS subido
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+
+# Cantidad de trabajos terminados que se conservan para consulta
+MAX_FINISHED_JOBS = 100
+
+CHUNK_SIZE = 64 * 1024
+
+JOB_TYPES = ("mes", "reportes")
+
+REPORT_CONTENT_TYPES = {
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "word": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "dashboard": "text/html; charset=utf-8",
+}
+
+PERIOD_PATTERN = re.compile(r"(\d{4})-(\d{2})")
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def build_run_manifest(year: int, month: int, tipo: str, timings: Optional[Dict[str, float]]) -> Dict:
+    """
+    Arma el manifiesto de una ejecución: tiempos por etapa y artefactos con su checksum.
+    """
+    excel_path, word_path = get_report_paths(year, month)
+    dashboard_path, dashboard_index_path = get_dashboard_paths(year, month)
+    paths = {
+        "original": get_original_csv_path(year, month),
+        "diferencias": get_diff_csv_path(year, month),
+        "renombres": get_renames_csv_path(year, month),
+        "anomalias": get_anomalies_csv_path(year, month),
+        "bueno": get_processed_csv_path(year, month),
+        "excel": excel_path,
+        "word": word_path,
+        "tablero": dashboard_path,
+        "indice_tablero": dashboard_index_path,
+    }
+    return {
+        "periodo": f"{year}-{month:02d}",
+        "tipo": tipo,
+        "generado": _now(),
+        "etapas": {name: round(seconds, 3) for name, seconds in (timings or {}).items()},
+        "artefactos": {name: describe_artifact(path) for name, path in paths.items()},
+    }
+
+
+def _generate_reports(year: int, month: int) -> Dict[str, float]:
+    """Regenera los reportes de un período ya consolidado (se ejecuta en un proceso trabajador)."""
+    timings = {}
+    start = time.perf_counter()
+    df_good = read_processed(get_processed_csv_path(year, month))
+    timings["load_good"] = time.perf_counter() - start
+
+    timings.update(run_sinks(df_good, year, month))
+    return timings
+
+
+def _run_job(run_func: Callable[[int, int], Optional[Dict[str, float]]], year: int, month: int, tipo: str) -> Dict:
+    """Ejecuta un trabajo y escribe su manifiesto (se ejecuta en un proceso trabajador)."""
+    timings = run_func(year, month) if tipo == "mes" else _generate_reports(year, month)
+    manifest = build_run_manifest(year, month, tipo, timings)
+    path = get_run_manifest_path(year, month)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8"))
+    return manifest
+
+
+@dataclass
+class Job:
+    """Trabajo encolado en el servicio."""
+    id: str
+    year: int
+    month: int
+    tipo: str
+    estado: str = "en_cola"
+    creado: str = field(default_factory=_now)
+    inicio: Optional[str] = None
+    fin: Optional[str] = None
+    error: Optional[str] = None
+    manifest: Optional[Dict] = None
+
+    @property
+    def activo(self) -> bool:
+        return self.estado in ("en_cola", "procesando")
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "periodo": f"{self.year}-{self.month:02d}",
+            "tipo": self.tipo,
+            "estado": self.estado,
+            "creado": self.creado,
+            "inicio": self.inicio,
+            "fin": self.fin,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """
+    Cola de trabajos del servicio.
+
+    Los trabajos se ejecutan en un pool acotado de procesos trabajadores que se mantienen vivos,
+    con el índice de referencia cargado. Las solicitudes concurrentes para un período y tipo que
+    ya tienen un trabajo en cola o en curso reciben ese mismo trabajo. Los trabajos de un mismo
+    período se serializan (escriben los mismos reportes, y la regeneración lee el archivo Bueno
+    que produce la ejecución del mes); además, las ejecuciones completas de un mes se serializan
+    entre sí. La regeneración de reportes de distintos períodos puede correr en paralelo.
+    """
+
+    def __init__(self, run_func: Callable[[int, int], Optional[Dict[str, float]]], max_workers: int = SERVICE_WORKERS):
+        self.run_func = run_func
+        self.max_workers = max_workers
+        self.jobs: Dict[str, Job] = {}
+        self.lock = threading.Lock()
+        self.chain_lock = threading.Lock()
+        self.period_locks: Dict[Tuple[int, int], threading.Lock] = {}
+        self.pool_lock = threading.Lock()
+        self.pool = self._new_pool()
+        # Los hilos solo esperan a los procesos trabajadores: hay más hilos que procesos para que los
+        # trabajos en espera de la cadena no bloqueen la regeneración de reportes
+        self.dispatcher = ThreadPoolExecutor(max_workers=max_workers * 4, thread_name_prefix="trabajo")
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=warm_reference_index)
+
+    def submit(self, year: int, month: int, tipo: str = "mes", upload: Optional[bytes] = None) -> Tuple[Job, bool]:
+        """
+        Encola un trabajo para el período, o retorna el del mismo tipo que ya está activo (un
+        "mes" se encola detrás de una regeneración de reportes del período en curso, y viceversa).
+
+        Returns:
+            Tuple[Job, bool]: El trabajo y si fue creado (False si se reutilizó uno activo)
+
+        Raises:
+            PipelineError: Si se sube un XLS para un período que ya se está procesando
+        """
+        with self.lock:
+            for job in self.jobs.values():
+                if job.activo and (job.year, job.month) == (year, month):
+                    if upload is not None:
+                        raise PipelineError(
+                            f"El período {year}-{month:02d} ya se está procesando (trabajo {job.id})"
+                        )
+                    if job.tipo == tipo:
+                        return job, False
+
+            if upload is not None:
+                raw_path = get_raw_xls_path(year, month)
+                raw_path.parent.mkdir(parents=True, exist_ok=True)
+                write_atomic(raw_path, upload)
+                logger.info(f"XLS recibido para {year}-{month:02d} ({len(upload)} bytes)")
+
+            job = Job(id=uuid.uuid4().hex[:12], year=year, month=month, tipo=tipo)
+            self.jobs[job.id] = job
+            self._prune()
+
+        self.dispatcher.submit(self._execute, job)
+        logger.info(f"Trabajo {job.id} encolado: {tipo} {year}-{month:02d}")
+        return job, True
+
+    def _prune(self):
+        finished = [job for job in self.jobs.values() if not job.activo]
+        for job in finished[:max(len(finished) - MAX_FINISHED_JOBS, 0)]:
+            del self.jobs[job.id]
+
+    def _period_lock(self, year: int, month: int) -> threading.Lock:
+        with self.lock:
+            return self.period_locks.setdefault((year, month), threading.Lock())
+
+    def _execute(self, job: Job):
+        # Primero la cadena y después el período: una regeneración de reportes no espera detrás
+        # de una ejecución del mes que todavía aguarda su turno en la cadena
+        locks = [self.chain_lock] if job.tipo == "mes" else []
+        locks.append(self._period_lock(job.year, job.month))
+        for lock in locks:
+            lock.acquire()
+        try:
+            job.estado = "procesando"
+            job.inicio = _now()
+            pool = self.pool
+            try:
+                job.manifest = pool.submit(_run_job, self.run_func, job.year, job.month, job.tipo).result()
+                job.estado = "ok"
+            except BrokenProcessPool as e:
+                job.error = f"El proceso trabajador terminó inesperadamente: {e}"
+                job.estado = "error"
+                self._replace_pool(pool)
+            except Exception as e:
+                job.error = str(e)
+                job.estado = "error"
+            job.fin = _now()
+            if job.error:
+                logger.error(f"Trabajo {job.id} falló: {job.error}")
+            else:
+                logger.info(f"Trabajo {job.id} finalizado")
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _replace_pool(self, broken: ProcessPoolExecutor):
+        """Reemplaza el pool roto, una sola vez aunque fallen varios trabajos suyos a la vez."""
+        with self.pool_lock:
+            if self.pool is broken:
+                self.pool = self._new_pool()
+                broken.shutdown(wait=False, cancel_futures=True)
+                logger.warning("Pool de procesos trabajadores reemplazado")
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self.lock:
+            return list(self.jobs.values())
+
+    def shutdown(self):
+        self.dispatcher.shutdown(wait=True)
+        with self.pool_lock:
+            self.pool.shutdown()
+
+
+def parse_period_param(text: Optional[str]) -> Tuple[int, int]:
+    """Convierte un período YYYY-MM de la URL a (año, mes)."""
+    match = PERIOD_PATTERN.fullmatch(text or "")
+    if not match or not (1 <= int(match.group(2)) <= 12):
+        raise ValueError(f"Período inválido: {text}. Use el formato YYYY-MM")
+    return int(match.group(1)), int(match.group(2))
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """
+    Rutas:
+        GET  /health
+        GET  /jobs
+        POST /jobs?periodo=YYYY-MM[&tipo=mes|reportes]  (cuerpo opcional: XLS del período)
+        GET  /jobs/<id>
+        GET  /jobs/<id>/manifest
+        GET  /jobs/<id>/excel
+        GET  /jobs/<id>/word
+        GET  /jobs/<id>/dashboard
+    """
+
+    server_version = "CapitalPagado/1.0"
+
+    @property
+    def manager(self) -> JobManager:
+        return self.server.manager
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send_json(self, status: HTTPStatus, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str):
+        self._send_json(status, {"error": message})
+
+    def _send_file(self, path: Path, content_type: str):
+        size = path.stat().st_size
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(size))
+        self.send_header("Content-Disposition", f'attachment; filename="{path.name}"')
+        self.end_headers()
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+
+    def do_GET(self):
+        parts = [part for part in urlparse(self.path).path.split("/") if part]
+        if parts == ["health"]:
+            return self._send_json(HTTPStatus.OK, {"estado": "ok"})
+        if parts == ["jobs"]:
+            return self._send_json(HTTPStatus.OK, [job.to_dict() for job in self.manager.list()])
+        if len(parts) in (2, 3) and parts[0] == "jobs":
+            job = self.manager.get(parts[1])
+            if job is None:
+                return self._send_error(HTTPStatus.NOT_FOUND, f"Trabajo no encontrado: {parts[1]}")
+            if len(parts) == 2:
+                return self._send_json(HTTPStatus.OK, job.to_dict())
+            return self._send_job_output(job, parts[2])
+        self._send_error(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {self.path}")
+
+    def _send_job_output(self, job: Job, output: str):
+        if output not in ("manifest", *REPORT_CONTENT_TYPES):
+            return self._send_error(HTTPStatus.NOT_FOUND, f"Salida desconocida: {output}")
+        if job.activo:
+            return self._send_error(HTTPStatus.CONFLICT, f"El trabajo {job.id} todavía está {job.estado}")
+        if job.estado != "ok":
+            return self._send_error(HTTPStatus.CONFLICT, f"El trabajo {job.id} terminó con error: {job.error}")
+        if output == "manifest":
+            return self._send_json(HTTPStatus.OK, job.manifest)
+
+        path = REPORT_SINKS[output].outputs(job.year, job.month)[0]
+        if not path.exists():
+            return self._send_error(HTTPStatus.NOT_FOUND, f"Reporte no encontrado: {path.name}")
+        self._send_file(path, REPORT_CONTENT_TYPES[output])
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/jobs":
+            return self._send_error(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {self.path}")
+
+        params = parse_qs(url.query)
+        try:
+            year, month = parse_period_param(params.get("periodo", [None])[0])
+        except ValueError as e:
+            return self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+        tipo = params.get("tipo", ["mes"])[0]
+        if tipo not in JOB_TYPES:
+            return self._send_error(HTTPStatus.BAD_REQUEST, f"Tipo de trabajo desconocido: {tipo}")
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_UPLOAD_BYTES:
+            return self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "El archivo supera el tamaño máximo")
+        upload = self.rfile.read(length) if length else None
+        if upload is not None and tipo != "mes":
+            return self._send_error(HTTPStatus.BAD_REQUEST, "Solo se puede subir un XLS para un trabajo de tipo mes")
+
+        try:
+            job, created = self.manager.submit(year, month, tipo=tipo, upload=upload)
+        except PipelineError as e:
+            return self._send_error(HTTPStatus.CONFLICT, str(e))
+        self._send_json(HTTPStatus.ACCEPTED if created else HTTPStatus.OK, job.to_dict())
+
+
+class ReportService(ThreadingHTTPServer):
+    """Servidor HTTP local con su cola de trabajos."""
+
+    daemon_threads = True
+
+    def __init__(self, manager: JobManager, host: str = SERVICE_HOST, port: int = SERVICE_PORT):
+        super().__init__((host, port), ServiceHandler)
+        self.manager = manager
+
+
+def serve(run_func: Callable[[int, int], Optional[Dict[str, float]]], host: str = SERVICE_HOST,
+          port: int = SERVICE_PORT, max_workers: int = SERVICE_WORKERS):
+    """Levanta el servicio HTTP local hasta recibir Ctrl+C."""
+    manager = JobManager(run_func, max_workers=max_workers)
+    server = ReportService(manager, host=host, port=port)
+    logger.info(f"Servicio escuchando en http://{host}:{server.server_address[1]} ({max_workers} trabajadores)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Servicio detenido")
+    finally:
+        server.server_close()
+        manager.shutdown()
@@ -0,0 +1,396 @@
+# src/storage/history_store.py
+
+import re
+import sqlite3
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+from src.utils.artifacts import list_artifacts
+from src.utils.contracts import GOOD
+from src.utils.csv_io import read_processed
+from src.utils.exceptions import StorageError
+from src.utils.logging import setup_logger
+from src.utils.paths import get_history_db_path, get_processed_dir
+
+logger = setup_logger(__name__)
+
+# Cantidad de filas enviadas en cada executemany
+BATCH_SIZE = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS socios_mensual (
+    periodo INTEGER NOT NULL,
+    rut     TEXT    NOT NULL,
+    nombre  TEXT,
+    debito  INTEGER NOT NULL,
+    credito INTEGER NOT NULL,
+    saldo   INTEGER NOT NULL,
+    cuotas  INTEGER NOT NULL,
+    tipo      TEXT,
+    categoria TEXT,
+    PRIMARY KEY (rut, periodo)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_socios_mensual_periodo ON socios_mensual (periodo);
+"""
+
+# Resumen materializado por período: se recalcula en la misma transacción que cada escritura del
+# historial, así los reportes de tendencia y anuales no leen datos por socio
+SUMMARY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resumen_mensual (
+    periodo   INTEGER NOT NULL,
+    tramo     INTEGER NOT NULL,
+    categoria TEXT    NOT NULL,
+    tipo      TEXT    NOT NULL,
+    socios    INTEGER NOT NULL,
+    debito    INTEGER NOT NULL,
+    credito   INTEGER NOT NULL,
+    saldo     INTEGER NOT NULL,
+    cuotas    INTEGER NOT NULL,
+    PRIMARY KEY (periodo, tramo, categoria, tipo)
+) WITHOUT ROWID;
+"""
+
+# Límites superiores de los tramos de saldo 1 a 3 (igual que el reporte Word); el tramo 4 es el
+# resto y el tramo 0 agrupa a los socios con saldo cero
+TRAMO_LIMITS = [10000, 50000, 100000]
+
+TRAMO_SQL = (
+    "CASE WHEN saldo = 0 THEN 0 "
+    + " ".join(f"WHEN saldo <= {limit} THEN {i}" for i, limit in enumerate(TRAMO_LIMITS, start=1))
+    + f" ELSE {len(TRAMO_LIMITS) + 1} END"
+)
+
+REFRESH_SUMMARY_SQL = f"""
+INSERT INTO resumen_mensual (periodo, tramo, categoria, tipo, socios, debito, credito, saldo, cuotas)
+SELECT periodo, {TRAMO_SQL} AS tramo, COALESCE(categoria, '') AS cat, COALESCE(tipo, '') AS tip,
+       COUNT(*), SUM(debito), SUM(credito), SUM(saldo), SUM(cuotas)
+FROM socios_mensual
+WHERE {{where}}
+GROUP BY periodo, tramo, cat, tip
+"""
+
+INSERT_SQL = (
+    "INSERT OR REPLACE INTO socios_mensual "
+    "(periodo, rut, nombre, debito, credito, saldo, cuotas, tipo, categoria) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """
+    Abre la base de datos del historial y crea el esquema si no existe.
+
+    Args:
+        db_path: Ruta opcional a la base de datos (por defecto data/history.sqlite)
+
+    Returns:
+        sqlite3.Connection: Conexión abierta
+    """
+    db_path = db_path or get_history_db_path()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    _migrate(conn)
+    return conn
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Agrega a una base anterior las columnas de clasificación y el resumen materializado."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(socios_mensual)")}
+    with conn:
+        for column in ('tipo', 'categoria'):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE socios_mensual ADD COLUMN {column} TEXT")
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'resumen_mensual'"
+        ).fetchone()
+        if not exists:
+            conn.executescript(SUMMARY_SCHEMA)
+            conn.execute(REFRESH_SUMMARY_SQL.format(where="1"))
+
+
+def _refresh_summary(conn: sqlite3.Connection, periodo: int) -> None:
+    """Recalcula el resumen materializado de un período desde el historial por socio."""
+    conn.execute("DELETE FROM resumen_mensual WHERE periodo = ?", (periodo,))
+    conn.execute(REFRESH_SUMMARY_SQL.format(where="periodo = ?"), (periodo,))
+
+
+def normalize_rut(rut: str) -> str:
+    """Normaliza un Rut igual que la consolidación: mayúsculas y sin espacios."""
+    return str(rut).upper().strip()
+
+
+def _existing_classification(conn: sqlite3.Connection, periodo: int) -> Dict[str, Tuple]:
+    """Tipo y categoría ya registrados de los socios de un período."""
+    return {
+        rut: (tipo, categoria)
+        for rut, tipo, categoria in conn.execute(
+            "SELECT rut, tipo, categoria FROM socios_mensual WHERE periodo = ?", (periodo,)
+        )
+    }
+
+
+def _classify(
+    ruts: pd.Series,
+    classification: Optional[pd.DataFrame],
+    existing: Dict[str, Tuple],
+) -> Tuple[pd.Series, pd.Series]:
+    """
+    Tipo y categoría de cada socio: los del original del período si se entregan (columnas rut,
+    tipo y categoria de `process_csv`) y, si no, los que ya estaban registrados.
+    """
+    tipo = pd.Series(None, index=ruts.index, dtype=object)
+    categoria = pd.Series(None, index=ruts.index, dtype=object)
+    if classification is not None:
+        reference = classification.set_axis(
+            classification['rut'].astype(str).str.upper().str.strip(), axis=0
+        )
+        reference = reference[~reference.index.duplicated(keep='first')]
+        tipo = ruts.map(reference['tipo']).astype(object)
+        categoria = ruts.map(reference['categoria']).astype(object)
+    if existing:
+        tipo = tipo.where(tipo.notna(), ruts.map({rut: values[0] for rut, values in existing.items()}))
+        categoria = categoria.where(categoria.notna(), ruts.map({rut: values[1] for rut, values in existing.items()}))
+    return tipo.where(tipo.notna(), None), categoria.where(categoria.notna(), None)
+
+
+def _rows(
+    periodo: int,
+    df: pd.DataFrame,
+    classification: Optional[pd.DataFrame] = None,
+    existing: Optional[Dict[str, Tuple]] = None,
+) -> Iterable[Tuple]:
+    """Convierte un archivo Bueno en tuplas listas para insertar."""
+    GOOD.require(df, error=StorageError)
+
+    numeric = df[['Debito', 'Credito', 'Saldo', 'Cuotas']].apply(pd.to_numeric, errors='coerce').fillna(0)
+    numeric = numeric.round().astype('int64')
+    ruts = df['Rut'].astype(str).str.upper().str.strip()
+    nombres = df['Nombre'].astype(object).where(df['Nombre'].notna(), None)
+    tipos, categorias = _classify(ruts, classification, existing or {})
+    return zip(
+        [periodo] * len(df),
+        ruts,
+        nombres,
+        numeric['Debito'].tolist(),
+        numeric['Credito'].tolist(),
+        numeric['Saldo'].tolist(),
+        numeric['Cuotas'].tolist(),
+        tipos.tolist(),
+        categorias.tolist(),
+    )
+
+
+def _insert_period(
+    conn: sqlite3.Connection,
+    periodo: int,
+    df: pd.DataFrame,
+    classification: Optional[pd.DataFrame] = None,
+) -> int:
+    existing = _existing_classification(conn, periodo)
+    conn.execute("DELETE FROM socios_mensual WHERE periodo = ?", (periodo,))
+    rows = list(_rows(periodo, df, classification, existing))
+    for start in range(0, len(rows), BATCH_SIZE):
+        conn.executemany(INSERT_SQL, rows[start:start + BATCH_SIZE])
+    _refresh_summary(conn, periodo)
+    return len(rows)
+
+
+def upsert_period(
+    year: int,
+    month: int,
+    df: pd.DataFrame,
+    db_path: Optional[Path] = None,
+    classification: Optional[pd.DataFrame] = None,
+) -> int:
+    """
+    Reemplaza en el historial el archivo Bueno de un período y recalcula su resumen.
+
+    Args:
+        year: Año del período
+        month: Mes del período
+        df: DataFrame con columnas: Rut, Debito, Credito, Saldo, Cuotas, Nombre
+        db_path: Ruta opcional a la base de datos
+        classification: Original procesado del período (columnas rut, tipo, categoria). Sin él
+                        se conserva la clasificación ya registrada de cada socio
+
+    Returns:
+        int: Cantidad de socios registrados
+
+    Raises:
+        StorageError: Si el DataFrame no tiene el formato esperado o falla la escritura
+    """
+    try:
+        conn = connect(db_path)
+        try:
+            with conn:
+                count = _insert_period(conn, year * 100 + month, df, classification)
+        finally:
+            conn.close()
+    except StorageError:
+        raise
+    except Exception as e:
+        logger.exception("Error actualizando el historial de socios")
+        raise StorageError("No se pudo actualizar el historial de socios") from e
+
+    logger.info(f"Historial actualizado: período {year}{month:02d} con {count} socios")
+    return count
+
+
+def update_members(
+    year: int,
+    month: int,
+    df: pd.DataFrame,
+    ruts: Iterable[str],
+    db_path: Optional[Path] = None,
+) -> int:
+    """
+    Reemplaza en el historial solo los socios indicados de un período y recalcula su resumen.
+
+    Los RUTs indicados que no están en `df` se eliminan del período (por ejemplo, socios que
+    quedaron con saldo cero tras una re-expresión). Los socios reemplazados conservan su tipo y
+    categoría.
+
+    Args:
+        year: Año del período
+        month: Mes del período
+        df: Archivo Bueno del período (basta con las filas de los RUTs indicados)
+        ruts: RUTs a reemplazar
+        db_path: Ruta opcional a la base de datos
+
+    Returns:
+        int: Cantidad de socios escritos
+
+    Raises:
+        StorageError: Si el DataFrame no tiene el formato esperado o falla la escritura
+    """
+    periodo = year * 100 + month
+    keys = sorted({normalize_rut(rut) for rut in ruts})
+    try:
+        selected = df[df['Rut'].astype(str).str.upper().str.strip().isin(keys)]
+        conn = connect(db_path)
+        try:
+            with conn:
+                rows = list(_rows(periodo, selected, existing=_existing_classification(conn, periodo)))
+                conn.executemany(
+                    "DELETE FROM socios_mensual WHERE periodo = ? AND rut = ?", [(periodo, key) for key in keys]
+                )
+                for start in range(0, len(rows), BATCH_SIZE):
+                    conn.executemany(INSERT_SQL, rows[start:start + BATCH_SIZE])
+                _refresh_summary(conn, periodo)
+        finally:
+            conn.close()
+    except StorageError:
+        raise
+    except Exception as e:
+        logger.exception("Error actualizando el historial de socios")
+        raise StorageError("No se pudo actualizar el historial de socios") from e
+
+    logger.info(f"Historial actualizado: período {periodo} con {len(rows)} socios modificados")
+    return len(rows)
+
+
+def load_processed_history(processed_dir: Optional[Path] = None, db_path: Optional[Path] = None) -> int:
+    """
+    Carga todos los archivos Bueno de data/processed en el historial.
+
+    La carga completa ocurre dentro de una única transacción con inserciones por lotes, de modo
+    que un error deja la base de datos en su estado anterior. Los archivos Bueno no traen el tipo
+    ni la categoría de los socios: se conserva la clasificación ya registrada.
+
+    Args:
+        processed_dir: Directorio opcional con los archivos YYYYMM.csv consolidados
+        db_path: Ruta opcional a la base de datos
+
+    Returns:
+        int: Cantidad total de filas cargadas
+
+    Raises:
+        StorageError: Si falla la lectura de algún archivo o la escritura en la base de datos
+    """
+    processed_dir = processed_dir or get_processed_dir()
+    files = [p for p in list_artifacts(processed_dir) if re.fullmatch(r"\d{6}", p.stem)]
+    logger.info(f"Cargando {len(files)} períodos consolidados en el historial")
+
+    total = 0
+    try:
+        conn = connect(db_path)
+        try:
+            with conn:
+                for path in files:
+                    df = read_processed(path)
+                    total += _insert_period(conn, int(path.stem), df)
+        finally:
+            conn.close()
+    except StorageError:
+        raise
+    except Exception as e:
+        logger.exception("Error cargando el historial de socios")
+        raise StorageError("No se pudo cargar el historial de socios") from e
+
+    logger.info(f"Historial cargado: {total} filas")
+    return total
+
+
+def query_member_history(rut: str, months: Optional[int] = None, db_path: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Consulta el historial mensual de un socio.
+
+    Args:
+        rut: Rut del socio (se normaliza a mayúsculas y sin espacios)
+        months: Cantidad opcional de períodos más recientes a devolver
+        db_path: Ruta opcional a la base de datos
+
+    Returns:
+        pd.DataFrame: DataFrame con columnas: Periodo, Rut, Nombre, Debito, Credito, Saldo, Cuotas,
+                     ordenado por período
+    """
+    query = (
+        "SELECT periodo AS Periodo, rut AS Rut, nombre AS Nombre, debito AS Debito, "
+        "credito AS Credito, saldo AS Saldo, cuotas AS Cuotas "
+        "FROM socios_mensual WHERE rut = ? ORDER BY periodo DESC"
+    )
+    params: Tuple = (normalize_rut(rut),)
+    if months is not None:
+        query += " LIMIT ?"
+        params += (months,)
+
+    conn = connect(db_path)
+    try:
+        history = pd.read_sql_query(query, conn, params=params)
+    finally:
+        conn.close()
+    return history.iloc[::-1].reset_index(drop=True)
+
+
+SUMMARY_COLUMNS = ['Periodo', 'Tramo', 'Categoria', 'Tipo', 'Socios', 'Debito', 'Credito', 'Saldo', 'Cuotas']
+
+
+def query_summary(
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    db_path: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    Consulta el resumen materializado por período, tramo, categoría y tipo.
+
+    Args:
+        start: Período inicial opcional (YYYYMM, inclusive)
+        end: Período final opcional (YYYYMM, inclusive)
+        db_path: Ruta opcional a la base de datos
+
+    Returns:
+        pd.DataFrame: DataFrame con columnas: Periodo, Tramo, Categoria, Tipo, Socios, Debito,
+                     Credito, Saldo, Cuotas, ordenado por período
+    """
+    query = (
+        "SELECT periodo, tramo, categoria, tipo, socios, debito, credito, saldo, cuotas "
+        "FROM resumen_mensual WHERE periodo BETWEEN ? AND ? ORDER BY periodo, tramo, categoria, tipo"
+    )
+    params = (start if start is not None else 0, end if end is not None else 999999)
+
+    conn = connect(db_path)
+    try:
+        summary = pd.DataFrame(conn.execute(query, params).fetchall(), columns=SUMMARY_COLUMNS)
+    finally:
+        conn.close()
+    return summary.astype({col: 'int64' for col in SUMMARY_COLUMNS if col not in ('Categoria', 'Tipo')})
@@ -0,0 +1,160 @@
+# src/storage/perf_history.py
+
+import sqlite3
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+from src.utils.exceptions import StorageError
+from src.utils.logging import setup_logger
+from src.utils.paths import get_perf_db_path
+
+logger = setup_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ejecuciones (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    inicio        TEXT    NOT NULL,
+    periodo       INTEGER NOT NULL,
+    estado        TEXT    NOT NULL,
+    completa      INTEGER NOT NULL,
+    segundos      REAL    NOT NULL,
+    pico_mb       REAL,
+    socios        INTEGER,
+    bytes_entrada INTEGER
+);
+CREATE TABLE IF NOT EXISTS etapas_ejecucion (
+    ejecucion INTEGER NOT NULL REFERENCES ejecuciones (id),
+    etapa     TEXT    NOT NULL,
+    segundos  REAL    NOT NULL,
+    PRIMARY KEY (ejecucion, etapa)
+) WITHOUT ROWID;
+"""
+
+RUN_COLUMNS = ['Ejecucion', 'Inicio', 'Periodo', 'Estado', 'Completa', 'Segundos', 'Pico_mb', 'Socios', 'Bytes_entrada']
+STAGE_COLUMNS = ['Ejecucion', 'Etapa', 'Segundos']
+
+
+def connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """
+    Abre la base de datos de rendimiento y crea el esquema si no existe.
+
+    Args:
+        db_path: Ruta opcional a la base de datos (por defecto data/perf_history.sqlite)
+
+    Returns:
+        sqlite3.Connection: Conexión abierta
+    """
+    db_path = db_path or get_perf_db_path()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def record_run(
+    year: int,
+    month: int,
+    timings: Dict[str, float],
+    seconds: float,
+    status: str = "ok",
+    complete: bool = True,
+    peak_mb: Optional[float] = None,
+    members: Optional[int] = None,
+    input_bytes: Optional[int] = None,
+    started: Optional[datetime] = None,
+    db_path: Optional[Path] = None,
+) -> int:
+    """
+    Registra una ejecución mensual: tiempo de cada etapa, tiempo total, pico de memoria y tamaño
+    de las entradas.
+
+    Args:
+        year: Año del período procesado
+        month: Mes del período procesado
+        timings: Segundos de cada etapa ejecutada
+        seconds: Duración total de la ejecución (las etapas corren en paralelo: no es la suma)
+        status: "ok" o "error"
+        complete: Si se ejecutaron todas las etapas (no solo algunas, ni retomando checkpoints)
+        peak_mb: Pico de memoria del proceso, en MB
+        members: Socios del archivo Bueno producido
+        input_bytes: Tamaño total de las entradas del período
+        started: Inicio de la ejecución (por defecto, ahora)
+        db_path: Ruta opcional a la base de datos
+
+    Returns:
+        int: Identificador de la ejecución registrada
+
+    Raises:
+        StorageError: Si falla la escritura
+    """
+    started = started or datetime.now()
+    try:
+        conn = connect(db_path)
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "INSERT INTO ejecuciones (inicio, periodo, estado, completa, segundos, pico_mb, socios, bytes_entrada) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (started.isoformat(timespec="seconds"), year * 100 + month, status, int(complete),
+                     round(seconds, 3), peak_mb, members, input_bytes),
+                )
+                run_id = cursor.lastrowid
+                conn.executemany(
+                    "INSERT INTO etapas_ejecucion (ejecucion, etapa, segundos) VALUES (?, ?, ?)",
+                    [(run_id, stage, round(value, 3)) for stage, value in timings.items()],
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        raise StorageError("No se pudo registrar el rendimiento de la ejecución") from e
+    logger.debug(f"Rendimiento registrado: ejecución {run_id} de {year}-{month:02d}")
+    return run_id
+
+
+def query_runs(last: Optional[int] = None, db_path: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Consulta las ejecuciones registradas, de la más antigua a la más reciente.
+
+    Args:
+        last: Cantidad opcional de ejecuciones más recientes
+        db_path: Ruta opcional a la base de datos
+
+    Returns:
+        pd.DataFrame: Columnas: Ejecucion, Inicio, Periodo, Estado, Completa, Segundos, Pico_mb,
+                     Socios, Bytes_entrada
+    """
+    query = (
+        "SELECT id, inicio, periodo, estado, completa, segundos, pico_mb, socios, bytes_entrada "
+        "FROM ejecuciones ORDER BY id DESC"
+    )
+    params = ()
+    if last is not None:
+        query += " LIMIT ?"
+        params = (last,)
+
+    conn = connect(db_path)
+    try:
+        runs = pd.DataFrame(conn.execute(query, params).fetchall(), columns=RUN_COLUMNS)
+    finally:
+        conn.close()
+    runs = runs.astype({'Completa': bool, 'Socios': 'Int64', 'Bytes_entrada': 'Int64'})
+    return runs.iloc[::-1].reset_index(drop=True)
+
+
+def query_stage_timings(db_path: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Consulta los tiempos por etapa de todas las ejecuciones registradas.
+
+    Returns:
+        pd.DataFrame: Columnas: Ejecucion, Etapa, Segundos, ordenado por ejecución y etapa
+    """
+    conn = connect(db_path)
+    try:
+        stages = pd.DataFrame(
+            conn.execute("SELECT ejecucion, etapa, segundos FROM etapas_ejecucion ORDER BY ejecucion, etapa").fetchall(),
+            columns=STAGE_COLUMNS,
+        )
+    finally:
+        conn.close()
+    return stages
@@ -0,0 +1,234 @@
+# src/storage/period_view.py
+
+import os
+import threading
+import pandas as pd
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Hashable, Iterator, Optional, Tuple
+from src.consolidation.ledger import DIFF_COLUMNS, list_snapshots, read_ledger, reconstruct_period
+from src.ingestion.csv_processor import process_csv
+from src.ingestion.csv_scanner import read_member_rows
+from src.storage.history_store import TRAMO_LIMITS, query_summary
+from src.utils.artifacts import artifact_exists, resolve_artifact
+from src.utils.csv_io import read_diffs, read_processed
+from src.utils.dates import get_next_period, get_previous_period
+from src.utils.logging import setup_logger
+from src.utils.paths import (
+    get_base_path,
+    get_dictionary_path,
+    get_diff_csv_path,
+    get_history_db_path,
+    get_ledger_path,
+    get_original_csv_path,
+    get_processed_csv_path,
+)
+
+logger = setup_logger(__name__)
+
+# Memoria máxima (MB) de los DataFrames que conserva el caché compartido de PeriodView
+VIEW_CACHE_MB = int(os.getenv("CAPITAL_VIEW_CACHE_MB", "512"))
+
+TRAMO_COLUMNS = ['Tramo', 'Socios', 'Debito', 'Credito', 'Saldo', 'Cuotas']
+
+
+class FrameCache:
+    """
+    Caché LRU de DataFrames acotado por memoria.
+
+    Cada entrada se mide con `memory_usage(deep=True)`; al superar `max_bytes` se descartan las
+    usadas hace más tiempo. Un DataFrame más grande que el caché completo no se guarda. Es
+    seguro para usarlo desde varios hilos.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+        """
+        Retorna el DataFrame de `key`, cargándolo con `load` si no está en el caché.
+
+        Se entrega una copia superficial: con copy-on-write, modificarla no altera el caché.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0].copy(deep=False)
+            self.misses += 1
+
+        df = load()
+        if df is None:
+            return None
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.max_bytes:
+            logger.debug(f"{key[0] if isinstance(key, tuple) else key}: {nbytes / 1e6:.0f} MB, no cabe en el caché")
+        else:
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = (df, nbytes)
+                    self.size += nbytes
+                while self.size > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self.size -= evicted
+        return df.copy(deep=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+_cache = FrameCache(VIEW_CACHE_MB * 1024 * 1024)
+
+
+def get_view_cache() -> FrameCache:
+    """Caché compartido por todas las instancias de PeriodView del proceso."""
+    return _cache
+
+
+def _signature(path: Path) -> Tuple:
+    """Identifica la versión de un archivo: un archivo reescrito no se sirve desde el caché."""
+    stored = resolve_artifact(path)
+    if not stored.exists():
+        return (str(stored), None, None)
+    stat = stored.stat()
+    return (str(stored), stat.st_mtime_ns, stat.st_size)
+
+
+def tramo_stats_from_good(df: pd.DataFrame) -> pd.DataFrame:
+    """Socios, débitos, créditos, saldo y cuotas por tramo de saldo (sin los socios con saldo cero)."""
+    capital = df[df['Saldo'] != 0]
+    tramo = pd.Series(len(TRAMO_LIMITS) + 1, index=capital.index)
+    for i, limit in reversed(list(enumerate(TRAMO_LIMITS, start=1))):
+        tramo = tramo.mask(capital['Saldo'] <= limit, i)
+    stats = capital.groupby(tramo.rename('Tramo'))[['Debito', 'Credito', 'Saldo', 'Cuotas']].sum()
+    stats.insert(0, 'Socios', capital.groupby(tramo.rename('Tramo')).size())
+    stats = stats.reindex(range(1, len(TRAMO_LIMITS) + 2), fill_value=0).rename_axis('Tramo').reset_index()
+    return stats[TRAMO_COLUMNS].astype('int64')
+
+
+def tramo_stats_from_summary(summary: pd.DataFrame) -> pd.DataFrame:
+    """Lo mismo que `tramo_stats_from_good`, a partir del resumen materializado de un período."""
+    stats = summary[summary['Tramo'] > 0].groupby('Tramo')[TRAMO_COLUMNS[1:]].sum()
+    stats = stats.reindex(range(1, len(TRAMO_LIMITS) + 2), fill_value=0)
+    return stats.rename_axis('Tramo').reset_index()[TRAMO_COLUMNS].astype('int64')
+
+
+class PeriodView:
+    """
+    Vista de solo lectura de los datos de un período, para análisis.
+
+    Cada propiedad se carga la primera vez que se usa, desde la fuente más rápida disponible, y
+    queda en un caché LRU acotado por memoria compartido por todas las vistas del proceso
+    (ver `FrameCache` y CAPITAL_VIEW_CACHE_MB). Recorrer muchos períodos no acumula memoria:
+    los menos usados salen del caché. Las propiedades retornan None si el período no tiene
+    esos datos.
+
+    Ejemplo:
+        >>> for view in iter_periods((2024, 1), (2025, 12)):
+        ...     print(view.label, view.processed['Saldo'].sum())
+    """
+
+    def __init__(self, year: int, month: int, cache: Optional[FrameCache] = None):
+        self.year = year
+        self.month = month
+        self.cache = cache if cache is not None else get_view_cache()
+
+    def __repr__(self) -> str:
+        return f"PeriodView({self.year}, {self.month})"
+
+    @property
+    def key(self) -> int:
+        return self.year * 100 + self.month
+
+    @property
+    def label(self) -> str:
+        return f"{self.year}-{self.month:02d}"
+
+    @property
+    def previous(self) -> "PeriodView":
+        return PeriodView(*get_previous_period(self.year, self.month), cache=self.cache)
+
+    def _load(self, kind: str, sources: Tuple[Path, ...], load: Callable[[], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+        key = (kind, self.key) + tuple(_signature(source) for source in sources)
+        return self.cache.get_or_load(key, load)
+
+    @property
+    def original(self) -> Optional[pd.DataFrame]:
+        """Filas de socios del CSV original (texto, sin procesar; ver `read_member_rows`)."""
+        path = get_original_csv_path(self.year, self.month)
+        return self._load('original', (path,), lambda: read_member_rows(path) if artifact_exists(path) else None)
+
+    @property
+    def parsed(self) -> Optional[pd.DataFrame]:
+        """CSV original procesado (ver `process_csv`)."""
+        path = get_original_csv_path(self.year, self.month)
+
+        def load():
+            if not artifact_exists(path):
+                return None
+            return process_csv(path, base_path=get_base_path(), diccionario_path=get_dictionary_path())
+        return self._load('parsed', (path, get_base_path(), get_dictionary_path()), load)
+
+    @property
+    def diffs(self) -> Optional[pd.DataFrame]:
+        """Diferencias del período: el CSV de data/diffs o, si no existe, sus filas del ledger."""
+        path = get_diff_csv_path(self.year, self.month)
+        if artifact_exists(path):
+            return self._load('diffs', (path,), lambda: read_diffs(path))
+
+        def from_ledger():
+            ledger = read_ledger()
+            rows = ledger[ledger['Periodo'] == self.key]
+            return rows[DIFF_COLUMNS].reset_index(drop=True) if not rows.empty else None
+        return self._load('diffs', (get_ledger_path(),), from_ledger)
+
+    @property
+    def processed(self) -> Optional[pd.DataFrame]:
+        """Archivo Bueno: el CSV de data/processed o, si no existe, reconstruido desde el ledger."""
+        path = get_processed_csv_path(self.year, self.month)
+        if artifact_exists(path):
+            return self._load('processed', (path,), lambda: read_processed(path))
+
+        def from_ledger():
+            if not any(key <= self.key for key in list_snapshots()):
+                return None
+            return reconstruct_period(self.year, self.month)
+        return self._load('processed', (get_ledger_path(),), from_ledger)
+
+    @property
+    def tramo_stats(self) -> Optional[pd.DataFrame]:
+        """
+        Socios, débitos, créditos, saldo y cuotas por tramo de saldo (columnas Tramo, Socios,
+        Debito, Credito, Saldo, Cuotas; tramos 1 a 4). Se leen del resumen materializado del
+        historial y, si el período no está en él, se calculan desde el archivo Bueno.
+        """
+        db_path = get_history_db_path()
+
+        def load():
+            if db_path.exists():
+                summary = query_summary(self.key, self.key, db_path=db_path)
+                if not summary.empty:
+                    return tramo_stats_from_summary(summary)
+            processed = self.processed
+            return tramo_stats_from_good(processed) if processed is not None else None
+        sources = (db_path, get_processed_csv_path(self.year, self.month), get_ledger_path())
+        return self._load('tramo_stats', sources, load)
+
+
+def iter_periods(start: Tuple[int, int], end: Tuple[int, int], cache: Optional[FrameCache] = None) -> Iterator[PeriodView]:
+    """Vistas de los períodos entre start y end (año, mes), ambos incluidos."""
+    year, month = start
+    while (year, month) <= end:
+        yield PeriodView(year, month, cache=cache)
+        year, month = get_next_period(year, month)
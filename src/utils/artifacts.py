@@ -0,0 +1,393 @@
+# src/utils/artifacts.py
+
+import gzip
+import hashlib
+import io
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import pandas as pd
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+from src.utils.exceptions import StorageError
+from src.utils.logging import setup_logger
+
+try:
+    import zstandard
+except ImportError:  # zstandard es opcional: sin él solo hay compresión gzip
+    zstandard = None
+
+logger = setup_logger(__name__)
+
+# Compresión de los artefactos escritos: "none", "gzip" o "zstd"
+ARTIFACT_COMPRESSION = os.getenv("CAPITAL_ARTIFACT_COMPRESSION", "none")
+
+# Nivel de compresión (bajo: prioriza velocidad)
+GZIP_LEVEL = 1
+ZSTD_LEVEL = 3
+
+SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def _compression(compression: Optional[str]) -> str:
+    compression = (compression or ARTIFACT_COMPRESSION).lower()
+    if compression not in ("none", "gzip", "zstd"):
+        raise StorageError(f"Compresión de artefactos desconocida: {compression}")
+    if compression == "zstd" and zstandard is None:
+        logger.warning("Compresión zstd solicitada pero zstandard no está instalado; se usa gzip")
+        return "gzip"
+    return compression
+
+
+def _variants(path: Path) -> List[Path]:
+    """Rutas físicas posibles de un artefacto: sin comprimir y con cada compresión."""
+    return [path] + [path.with_name(path.name + suffix) for suffix in SUFFIXES.values()]
+
+
+def manifest_path(stored_path: Path) -> Path:
+    """Ruta del manifiesto (checksum) de un archivo almacenado."""
+    return stored_path.with_name(stored_path.name + MANIFEST_SUFFIX)
+
+
+def resolve_artifact(path: Path) -> Path:
+    """
+    Retorna la ruta física de un artefacto (con o sin compresión).
+
+    Si no existe ninguna variante, retorna la ruta sin comprimir.
+    """
+    for variant in _variants(path):
+        if variant.exists():
+            return variant
+    return path
+
+
+def artifact_exists(path: Path) -> bool:
+    """Indica si existe el artefacto, en cualquiera de sus variantes."""
+    return any(variant.exists() for variant in _variants(path))
+
+
+def list_artifacts(directory: Path, pattern: str = "*.csv") -> List[Path]:
+    """Lista las rutas lógicas (sin sufijo de compresión) de los artefactos de un directorio."""
+    if not directory.exists():
+        return []
+    found = set(directory.glob(pattern))
+    for suffix in SUFFIXES.values():
+        found.update(p.with_name(p.name[:-len(suffix)]) for p in directory.glob(pattern + suffix))
+    return sorted(found)
+
+
+def remove_artifact(path: Path) -> None:
+    """Elimina todas las variantes de un artefacto y sus manifiestos."""
+    for variant in _variants(path):
+        for stale in (variant, manifest_path(variant)):
+            if stale.exists():
+                stale.unlink()
+
+
+def _checksum(data) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def write_atomic(path: Path, data: bytes):
+    """Escribe en un archivo temporal del mismo directorio y lo renombra sobre el destino."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def append_atomic(path: Path, data: bytes):
+    """
+    Agrega `data` al final del archivo sin dejarlo nunca a medio escribir: el contenido actual
+    se copia a un archivo temporal del mismo directorio, se le agregan los bytes nuevos y se
+    renombra sobre el destino (que se crea si no existe).
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if path.exists():
+                with open(path, "rb") as current:
+                    shutil.copyfileobj(current, f)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def describe_artifact(path: Path) -> Optional[Dict]:
+    """
+    Describe un artefacto para un manifiesto de ejecución: archivo, tamaño y checksum.
+
+    Usa el manifiesto del artefacto si existe; si no, calcula el checksum.
+
+    Returns:
+        Optional[Dict]: Claves archivo, bytes, blake2b y compresion, o None si no existe
+    """
+    stored_path = resolve_artifact(path)
+    if not stored_path.exists():
+        return None
+    manifest_file = manifest_path(stored_path)
+    if manifest_file.exists():
+        manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+        size, checksum, compression = manifest["size"], manifest["blake2b"], manifest["compression"]
+    else:
+        data = stored_path.read_bytes()
+        size, checksum, compression = len(data), _checksum(data), "none"
+    return {"archivo": str(stored_path), "bytes": size, "blake2b": checksum, "compresion": compression}
+
+
+def write_bytes(path: Path, data: bytes, compression: Optional[str] = None) -> Path:
+    """
+    Escribe un artefacto de forma atómica, con compresión opcional y manifiesto de checksum.
+
+    El contenido se escribe en un archivo temporal y se renombra sobre el destino, de modo que
+    un corte a mitad de la escritura nunca deja un archivo truncado con el nombre final. Junto
+    al archivo se guarda `<archivo>.manifest.json` con el tamaño y el checksum blake2b de los
+    bytes almacenados. Las variantes con otra compresión del mismo artefacto se eliminan.
+
+    Args:
+        path: Ruta lógica del artefacto (sin sufijo de compresión)
+        data: Contenido sin comprimir
+        compression: "none", "gzip" o "zstd" (por defecto CAPITAL_ARTIFACT_COMPRESSION)
+
+    Returns:
+        Path: Ruta física del archivo escrito
+
+    Raises:
+        StorageError: Si la compresión es desconocida o la escritura falla
+    """
+    compression = _compression(compression)
+    if compression == "gzip":
+        stored = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    elif compression == "zstd":
+        stored = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    else:
+        stored = data
+
+    target = _target(path, compression)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        _drop_manifest(target)
+        write_atomic(target, stored)
+        _finish(path, target, compression, len(stored), len(data), _checksum(stored))
+    except OSError as e:
+        raise StorageError(f"No se pudo escribir el artefacto {target}: {e}") from e
+
+    logger.debug(f"Artefacto escrito: {target.name} ({len(stored)} bytes, {compression})")
+    return target
+
+
+def _target(path: Path, compression: str) -> Path:
+    return path if compression == "none" else path.with_name(path.name + SUFFIXES[compression])
+
+
+def _drop_manifest(target: Path) -> None:
+    """
+    Elimina el manifiesto del artefacto antes de reemplazar sus datos: si la escritura se corta
+    entre el renombrado y el manifiesto nuevo, el archivo queda sin manifiesto (se acepta sin
+    verificar) y no junto al manifiesto de los datos anteriores, que lo haría fallar.
+    """
+    manifest_file = manifest_path(target)
+    if manifest_file.exists():
+        manifest_file.unlink()
+
+
+def _finish(path: Path, target: Path, compression: str, size: int, raw_size: int, checksum: str) -> None:
+    """Guarda el manifiesto del artefacto escrito y elimina sus variantes con otra compresión."""
+    manifest = {
+        "file": target.name,
+        "compression": compression,
+        "size": size,
+        "raw_size": raw_size,
+        "blake2b": checksum,
+    }
+    write_atomic(manifest_path(target), json.dumps(manifest, indent=2).encode("utf-8"))
+    for variant in _variants(path):
+        if variant != target:
+            for stale in (variant, manifest_path(variant)):
+                if stale.exists():
+                    stale.unlink()
+
+
+class _HashingWriter:
+    """Archivo de salida que acumula el tamaño y el checksum de los bytes escritos."""
+
+    def __init__(self, f):
+        self.f = f
+        self.size = 0
+        self.digest = hashlib.blake2b(digest_size=16)
+
+    def write(self, data) -> int:
+        self.f.write(data)
+        self.digest.update(data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        self.f.flush()
+
+
+def write_stream(path: Path, chunks: Iterable[bytes], compression: Optional[str] = None) -> Path:
+    """
+    Escribe un artefacto por partes, sin armar su contenido completo en memoria.
+
+    Igual que `write_bytes`: se escribe en un archivo temporal que se renombra sobre el destino
+    al terminar, con compresión opcional y manifiesto de checksum.
+
+    Args:
+        path: Ruta lógica del artefacto (sin sufijo de compresión)
+        chunks: Partes del contenido sin comprimir, en orden
+        compression: "none", "gzip" o "zstd" (por defecto CAPITAL_ARTIFACT_COMPRESSION)
+
+    Returns:
+        Path: Ruta física del archivo escrito
+
+    Raises:
+        StorageError: Si la compresión es desconocida o la escritura falla
+    """
+    compression = _compression(compression)
+    target = _target(path, compression)
+    raw_size = 0
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                out = _HashingWriter(f)
+                if compression == "gzip":
+                    sink = gzip.GzipFile(fileobj=out, mode="wb", compresslevel=GZIP_LEVEL, mtime=0)
+                elif compression == "zstd":
+                    sink = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(out, closefd=False)
+                else:
+                    sink = out
+                for chunk in chunks:
+                    sink.write(chunk)
+                    raw_size += len(chunk)
+                if sink is not out:
+                    sink.close()
+                f.flush()
+                os.fsync(f.fileno())
+            _drop_manifest(target)
+            os.replace(tmp_name, target)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        _finish(path, target, compression, out.size, raw_size, out.digest.hexdigest())
+    except OSError as e:
+        raise StorageError(f"No se pudo escribir el artefacto {target}: {e}") from e
+
+    logger.debug(f"Artefacto escrito por partes: {target.name} ({out.size} bytes, {compression})")
+    return target
+
+
+def write_csv(df: pd.DataFrame, path: Path, compression: Optional[str] = None, **kwargs) -> Path:
+    """Escribe un DataFrame como CSV con `write_bytes`. Los kwargs se pasan a DataFrame.to_csv."""
+    return write_bytes(path, df.to_csv(**kwargs).encode("utf-8"), compression=compression)
+
+
+def write_csv_chunks(chunks: Iterable[pd.DataFrame], path: Path, compression: Optional[str] = None, **kwargs) -> Path:
+    """
+    Escribe DataFrames consecutivos como un solo CSV con `write_stream` (encabezado una vez).
+    Los kwargs se pasan a DataFrame.to_csv.
+    """
+    def encoded():
+        header = kwargs.pop("header", True)
+        for df in chunks:
+            yield df.to_csv(header=header, **kwargs).encode("utf-8")
+            header = False
+
+    return write_stream(path, encoded(), compression=compression)
+
+
+def verify(stored_path: Path, data) -> None:
+    """
+    Verifica los bytes almacenados de un artefacto contra su manifiesto.
+
+    Los artefactos sin manifiesto (anteriores a este formato) se aceptan sin verificar.
+
+    Raises:
+        StorageError: Si el tamaño o el checksum no coinciden
+    """
+    manifest_file = manifest_path(stored_path)
+    if not manifest_file.exists():
+        return
+    manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+    if len(data) != manifest["size"] or _checksum(data) != manifest["blake2b"]:
+        raise StorageError(
+            f"El artefacto {stored_path} no coincide con su manifiesto (archivo truncado o modificado)"
+        )
+
+
+def _decompress(stored_path: Path, data) -> bytes:
+    if stored_path.name.endswith(SUFFIXES["gzip"]):
+        return gzip.decompress(data)
+    if stored_path.name.endswith(SUFFIXES["zstd"]):
+        if zstandard is None:
+            raise StorageError(f"Se necesita zstandard para leer {stored_path}")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return bytes(data)
+
+
+def read_bytes(path: Path) -> bytes:
+    """
+    Lee el contenido sin comprimir de un artefacto, verificando su checksum.
+
+    Raises:
+        StorageError: Si el artefacto no existe o no coincide con su manifiesto
+    """
+    stored_path = resolve_artifact(path)
+    if not stored_path.exists():
+        raise StorageError(f"Artefacto no encontrado: {path}")
+    data = stored_path.read_bytes()
+    verify(stored_path, data)
+    return _decompress(stored_path, data)
+
+
+def open_artifact(path: Path) -> io.BytesIO:
+    """Abre un artefacto como flujo binario en memoria (ver `read_bytes`)."""
+    return io.BytesIO(read_bytes(path))
+
+
+@contextmanager
+def artifact_buffer(path: Path) -> Iterator:
+    """
+    Entrega el contenido sin comprimir de un artefacto como buffer de bytes.
+
+    Los archivos sin comprimir se mapean en memoria en lugar de leerse completos; los
+    comprimidos se descomprimen en memoria. En ambos casos se verifica el checksum. Un archivo
+    vacío no se puede mapear: se entrega un buffer vacío.
+
+    Raises:
+        StorageError: Si el artefacto no existe o no coincide con su manifiesto
+    """
+    stored_path = resolve_artifact(path)
+    if stored_path != path:
+        yield read_bytes(path)
+        return
+    if not stored_path.exists():
+        raise StorageError(f"Artefacto no encontrado: {path}")
+    with open(stored_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            verify(stored_path, b"")
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            verify(stored_path, mm)
+            yield mm
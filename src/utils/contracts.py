@@ -0,0 +1,268 @@
+# src/utils/contracts.py
+
+import os
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type
+from src.utils.exceptions import (
+    ConsolidationError,
+    DiffGenerationError,
+    IngestionError,
+    PipelineError,
+)
+from src.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+# Nivel de validación de los DataFrames entre etapas:
+#   "full": todas las reglas sobre todas las filas, también en entradas ya validadas
+#   "fast": todas las reglas sobre lo que se produce en la ejecución; las entradas ya validadas
+#           (archivos Bueno anteriores, artefactos existentes) se revisan sobre una muestra y
+#           las leídas de checkpoints no se revisan
+#   "off":  solo columnas requeridas
+VALIDATION_MODE = os.getenv("CAPITAL_VALIDATION", "fast")
+
+# Filas revisadas de una entrada ya validada en modo "fast"
+VALIDATION_SAMPLE_ROWS = int(os.getenv("CAPITAL_VALIDATION_SAMPLE", "10000"))
+
+# Diferencia máxima aceptada en las igualdades entre montos (los montos son pesos enteros
+# guardados como float)
+AMOUNT_TOLERANCE = 0.5
+
+# Ejemplos de filas que se muestran por cada regla incumplida
+MAX_EXAMPLES = 5
+
+TEXT = "texto"
+NUMBER = "numero"
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    Regla de negocio sobre columnas completas.
+
+    `violations` recibe el DataFrame y retorna una máscara booleana con las filas que la
+    incumplen. La regla se omite si al DataFrame le falta alguna de sus `columns`.
+    """
+    name: str
+    description: str
+    columns: Tuple[str, ...]
+    violations: Callable[[pd.DataFrame], "pd.Series | np.ndarray"]
+
+
+@dataclass
+class Violation:
+    """Regla (o requisito de columna) incumplida, con la cantidad de filas y algunos ejemplos."""
+    rule: str
+    description: str
+    rows: int = 0
+    examples: List = field(default_factory=list)
+
+    def __str__(self) -> str:
+        text = f"{self.rule}: {self.description}"
+        if self.rows:
+            text += f" ({self.rows} filas; p. ej. {', '.join(str(e) for e in self.examples)})"
+        return text
+
+
+@dataclass(frozen=True)
+class Contract:
+    """
+    Esquema de un DataFrame que pasa entre etapas: columnas con su tipo y reglas de negocio.
+
+    `validate` revisa todo en una pasada y retorna todas las infracciones; `enforce` además
+    lanza `error` con la lista completa. `key` es la columna que identifica las filas en los
+    ejemplos de las infracciones.
+    """
+    name: str
+    columns: Dict[str, str]
+    rules: Tuple[Rule, ...] = ()
+    key: Optional[str] = None
+    not_null: Tuple[str, ...] = ()
+    error: Type[PipelineError] = PipelineError
+
+    def require(
+        self,
+        df: pd.DataFrame,
+        columns: Optional[Sequence[str]] = None,
+        error: Optional[Type[PipelineError]] = None,
+        source: Optional[str] = None,
+    ):
+        """
+        Verifica solo que estén las columnas requeridas (por defecto, todas las del contrato).
+
+        Raises:
+            PipelineError: `error` (por defecto el del contrato) con las columnas faltantes
+        """
+        missing_cols = [col for col in (columns or self.columns) if col not in df.columns]
+        if missing_cols:
+            raise (error or self.error)(
+                f"{source or 'El DataFrame'} no tiene las columnas requeridas: {missing_cols}"
+            )
+
+    def _sample(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Filas repartidas de forma pareja por todo el DataFrame, sin azar: ejecuciones
+        # repetidas revisan las mismas filas
+        step = -(-len(df) // VALIDATION_SAMPLE_ROWS)
+        return df.iloc[::step]
+
+    def validate(
+        self,
+        df: pd.DataFrame,
+        columns: Optional[Sequence[str]] = None,
+        mode: Optional[str] = None,
+        trusted: bool = False,
+    ) -> List[Violation]:
+        """
+        Revisa el DataFrame contra el contrato.
+
+        Args:
+            df: DataFrame a revisar
+            columns: Columnas requeridas (por defecto todas las del contrato). Las reglas sobre
+                columnas ausentes se omiten
+            mode: Nivel de validación (por defecto CAPITAL_VALIDATION)
+            trusted: Si el DataFrame ya se validó antes (por ejemplo, un artefacto existente):
+                en modo "fast" se revisa una muestra
+
+        Returns:
+            List[Violation]: Todas las infracciones encontradas (vacía si el DataFrame cumple)
+        """
+        mode = mode or VALIDATION_MODE
+        violations = [
+            Violation("columna_faltante", f"falta la columna {col}")
+            for col in (columns or self.columns) if col not in df.columns
+        ]
+        if mode == "off" or df.empty:
+            return violations
+        if mode == "fast" and trusted and len(df) > VALIDATION_SAMPLE_ROWS:
+            df = self._sample(df)
+
+        for col, kind in self.columns.items():
+            if col not in df.columns:
+                continue
+            if kind == NUMBER and not pd.api.types.is_numeric_dtype(df[col]):
+                violations.append(Violation("tipo", f"la columna {col} no es numérica ({df[col].dtype})"))
+                continue
+            if kind == NUMBER or col in self.not_null:
+                self._add(violations, df, df[col].isna(), "nulos", f"la columna {col} tiene valores vacíos")
+
+        for rule in self.rules:
+            if all(col in df.columns for col in rule.columns) and not any(v.rule == "tipo" for v in violations):
+                self._add(violations, df, rule.violations(df), rule.name, rule.description)
+        return violations
+
+    def _add(self, violations: List[Violation], df: pd.DataFrame, mask, rule: str, description: str):
+        mask = np.asarray(mask, dtype=bool)
+        rows = int(mask.sum())
+        if not rows:
+            return
+        examples = df[self.key] if self.key in df.columns else df.index.to_series()
+        violations.append(Violation(rule, description, rows, examples[mask].head(MAX_EXAMPLES).tolist()))
+
+    def enforce(
+        self,
+        df: pd.DataFrame,
+        source: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        error: Optional[Type[PipelineError]] = None,
+        mode: Optional[str] = None,
+        trusted: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Igual que `validate`, pero lanza un error con todas las infracciones.
+
+        Returns:
+            pd.DataFrame: El mismo DataFrame, si cumple el contrato
+
+        Raises:
+            PipelineError: `error` (por defecto el del contrato) con la lista de infracciones
+        """
+        violations = self.validate(df, columns=columns, mode=mode, trusted=trusted)
+        if violations:
+            details = "\n".join(f"  - {violation}" for violation in violations)
+            message = f"{source or 'El DataFrame'} no cumple el contrato {self.name}:\n{details}"
+            logger.error(message)
+            raise (error or self.error)(message)
+        return df
+
+
+def _differs(left: pd.Series, right: pd.Series) -> pd.Series:
+    return (left - right).abs() > AMOUNT_TOLERANCE
+
+
+def _negative(*columns: str) -> Callable[[pd.DataFrame], pd.Series]:
+    def violations(df: pd.DataFrame) -> pd.Series:
+        mask = np.zeros(len(df), dtype=bool)
+        for col in columns:
+            mask |= (df[col] < 0).to_numpy()
+        return mask
+    return violations
+
+
+PARSED = Contract(
+    name="CSV procesado",
+    columns={'rut': TEXT, 'nombre': TEXT, 'debitos': NUMBER, 'creditos': NUMBER, 'saldo': NUMBER},
+    key='rut',
+    not_null=('rut', 'nombre'),
+    rules=(
+        Rule("saldo_distinto_de_movimientos", "saldo distinto de créditos - débitos",
+             ('debitos', 'creditos', 'saldo'), lambda df: _differs(df['creditos'] - df['debitos'], df['saldo'])),
+    ),
+    error=IngestionError,
+)
+
+RENAMES = Contract(
+    name="renombres",
+    columns={'nombre_anterior': TEXT, 'nombre_actual': TEXT, 'rut_anterior': TEXT, 'rut_actual': TEXT,
+             'similitud': NUMBER, 'criterio': TEXT, 'aplicado': TEXT},
+    key='nombre_actual',
+    rules=(
+        Rule("similitud_fuera_de_rango", "similitud fuera del rango 0 a 1",
+             ('similitud',), lambda df: ~df['similitud'].between(0, 1)),
+    ),
+    error=DiffGenerationError,
+)
+
+DIFFS = Contract(
+    name="diferencias",
+    columns={'Nombre': TEXT, 'Rut': TEXT, 'diff_debito': NUMBER, 'diff_credito': NUMBER, 'diff_saldo': NUMBER},
+    key='Rut',
+    not_null=('Rut',),
+    rules=(
+        Rule("saldo_distinto_de_movimientos", "diff_saldo distinto de diff_credito - diff_debito",
+             ('diff_debito', 'diff_credito', 'diff_saldo'),
+             lambda df: _differs(df['diff_credito'] - df['diff_debito'], df['diff_saldo'])),
+    ),
+    error=DiffGenerationError,
+)
+
+GOOD = Contract(
+    name="archivo Bueno",
+    columns={'Rut': TEXT, 'Debito': NUMBER, 'Credito': NUMBER, 'Saldo': NUMBER, 'Cuotas': NUMBER, 'Nombre': TEXT},
+    key='Rut',
+    not_null=('Rut',),
+    rules=(
+        Rule("rut_duplicado", "Rut repetido después de la consolidación",
+             ('Rut',), lambda df: df['Rut'].duplicated(keep=False)),
+        Rule("saldo_distinto_de_movimientos", "Saldo distinto de Credito - Debito",
+             ('Debito', 'Credito', 'Saldo'), lambda df: _differs(df['Credito'] - df['Debito'], df['Saldo'])),
+        # Igual que la consolidación: la parte entera de Saldo / 1000
+        Rule("cuotas_distintas_de_saldo", "Cuotas distinto de la parte entera de Saldo / 1000",
+             ('Saldo', 'Cuotas'), lambda df: _differs(np.trunc(df['Saldo'] / 1000), df['Cuotas'])),
+    ),
+    error=ConsolidationError,
+)
+
+ANOMALIES = Contract(
+    name="movimientos anómalos",
+    columns={'Periodo': NUMBER, 'Rut': TEXT, 'Nombre': TEXT, 'Saldo_anterior': NUMBER, 'Saldo': NUMBER,
+             'Diferencia': NUMBER, 'Meses_historial': NUMBER, 'Motivo': TEXT},
+    key='Rut',
+    # Los montos (y las cuotas) pueden ser negativos, p. ej. un saldo deudor o una reversa: solo
+    # los conteos se exigen no negativos
+    rules=(
+        Rule("conteos_negativos", "Meses_historial negativo", ('Meses_historial',), _negative('Meses_historial')),
+    ),
+    error=ConsolidationError,
+)
@@ -0,0 +1,110 @@
+# src/utils/csv_io.py
+
+import csv
+import io
+import os
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional
+from src.utils.artifacts import open_artifact
+from src.utils.logging import setup_logger
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:  # pyarrow es opcional: sin él se usa el parser C de pandas
+    HAS_PYARROW = False
+
+logger = setup_logger(__name__)
+
+# Motor de lectura CSV: "auto" (pyarrow si está instalado), "pyarrow" o "c" (parser de pandas)
+CSV_ENGINE = os.getenv("CAPITAL_CSV_ENGINE", "auto")
+
+# Columnas y tipos de cada artefacto, para leer solo lo que cada etapa necesita
+PROCESSED_COLUMNS = ['Rut', 'Debito', 'Credito', 'Saldo', 'Cuotas', 'Nombre']
+PROCESSED_DTYPES = {
+    'Rut': str, 'Nombre': str,
+    'Debito': 'float64', 'Credito': 'float64', 'Saldo': 'float64', 'Cuotas': 'float64',
+}
+
+DIFF_COLUMNS = ['Nombre', 'Rut', 'diff_debito', 'diff_credito', 'diff_saldo']
+DIFF_DTYPES = {
+    'Nombre': str, 'Rut': str,
+    'diff_debito': 'float64', 'diff_credito': 'float64', 'diff_saldo': 'float64',
+}
+
+DICTIONARY_COLUMNS = ['Rut', 'Nombre']
+DICTIONARY_DTYPES = {'Rut': str, 'Nombre': str}
+
+
+def get_engine() -> str:
+    """
+    Resuelve el motor de lectura configurado en CAPITAL_CSV_ENGINE.
+
+    Returns:
+        str: "pyarrow" o "c"
+    """
+    engine = CSV_ENGINE.lower()
+    if engine == "auto":
+        return "pyarrow" if HAS_PYARROW else "c"
+    if engine == "pyarrow" and not HAS_PYARROW:
+        logger.warning("CAPITAL_CSV_ENGINE=pyarrow pero pyarrow no está instalado; se usa el parser de pandas")
+        return "c"
+    return engine
+
+
+def _read_header(source: io.BytesIO) -> List[str]:
+    """Lee la línea de encabezado de un CSV y deja el flujo al inicio."""
+    line = source.readline().decode("utf-8")
+    source.seek(0)
+    return next(csv.reader([line]), [])
+
+
+def read_csv(
+    path: Path,
+    columns: Optional[List[str]] = None,
+    dtype: Optional[Dict] = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Lee un CSV con el motor configurado, leyendo solo las columnas indicadas.
+
+    El archivo se resuelve como artefacto (ver src/utils/artifacts.py): se descomprime si está
+    comprimido y se verifica contra su manifiesto antes de parsearlo.
+
+    Args:
+        path: Ruta lógica al archivo CSV (sin sufijo de compresión)
+        columns: Columnas a leer (por defecto todas). Las que no existan en el archivo se omiten
+            y la validación queda a cargo de quien consume el DataFrame
+        dtype: Tipos explícitos por columna; se aplican solo a las columnas leídas
+        **kwargs: Argumentos adicionales para pandas.read_csv
+
+    Returns:
+        pd.DataFrame: Contenido del archivo, con las columnas en el orden pedido
+    """
+    source = open_artifact(path)
+    if columns is not None:
+        header = set(_read_header(source))
+        columns = [col for col in columns if col in header]
+    if dtype is not None and columns is not None:
+        dtype = {col: kind for col, kind in dtype.items() if col in columns}
+
+    df = pd.read_csv(source, usecols=columns, dtype=dtype, engine=get_engine(), **kwargs)
+    if columns is not None:
+        df = df[columns]
+    return df
+
+
+def read_processed(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Lee un archivo Bueno (data/processed) con sus tipos explícitos."""
+    return read_csv(path, columns=columns or PROCESSED_COLUMNS, dtype=PROCESSED_DTYPES)
+
+
+def read_diffs(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Lee un archivo de diferencias (data/diffs) con sus tipos explícitos."""
+    return read_csv(path, columns=columns or DIFF_COLUMNS, dtype=DIFF_DTYPES)
+
+
+def read_dictionary(path: Path) -> pd.DataFrame:
+    """Lee un archivo de referencia de nombres (base o diccionario de RUTs faltantes)."""
+    return read_csv(path, columns=DICTIONARY_COLUMNS, dtype=DICTIONARY_DTYPES)
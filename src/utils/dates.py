@@ -4,3 +4,9 @@ def get_previous_period(year: int, month: int):
     if month == 1:
         return year - 1, 12
     return year, month - 1
+
+
+def get_next_period(year: int, month: int):
+    if month == 12:
+        return year + 1, 1
+    return year, month + 1
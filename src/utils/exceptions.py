@@ -18,3 +18,7 @@ class ConsolidationError(PipelineError):
 
 class ReportingError(PipelineError):
     pass
+
+
+class StorageError(PipelineError):
+    pass
@@ -1,7 +1,19 @@
 import logging
+from contextvars import ContextVar
 from pathlib import Path
 from datetime import datetime
 
+# Etapa del pipeline en ejecución en el contexto actual (hilo o tarea)
+current_stage: ContextVar[str] = ContextVar("current_stage", default="-")
+
+
+class StageFilter(logging.Filter):
+    """Agrega a cada registro la etapa del pipeline que lo emitió."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.stage = current_stage.get()
+        return True
+
 
 def setup_logger(name: str) -> logging.Logger:
     log_dir = Path("logs")
@@ -17,18 +29,21 @@ def setup_logger(name: str) -> logging.Logger:
         return logger  # evita handlers duplicados
 
     formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+        "%(asctime)s | %(levelname)s | %(stage)s | %(name)s | %(message)s"
     )
+    stage_filter = StageFilter()
 
     # Consola
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
+    console_handler.addFilter(stage_filter)
 
     # Archivo
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
+    file_handler.addFilter(stage_filter)
 
     logger.addHandler(console_handler)
     logger.addHandler(file_handler)
@@ -0,0 +1,171 @@
+# src/utils/names.py
+
+import os
+import pickle
+import threading
+import unicodedata
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+from src.utils.artifacts import write_atomic
+from src.utils.logging import setup_logger
+from src.utils.paths import get_name_cache_path
+
+logger = setup_logger(__name__)
+
+# Cantidad máxima de nombres en la tabla de nombres canónicos (se descartan los usados hace más tiempo)
+NAME_CACHE_SIZE = int(os.getenv("CAPITAL_NAME_CACHE_SIZE", "200000"))
+
+# Versión de las reglas de `canonical_name`: si cambian, la tabla guardada se descarta
+CANONICAL_VERSION = 1
+
+
+def canonical_name(name) -> str:
+    """
+    Forma canónica de un nombre: sin tildes, en mayúsculas y con espacios simples.
+
+    Es la forma con que se agrupan los socios en `process_csv` y se cruzan los meses en
+    `generate_diffs`, así que dos escrituras del mismo nombre que solo difieren en tildes,
+    mayúsculas o espacios son el mismo socio.
+    """
+    if name is None or (isinstance(name, float) and pd.isna(name)):
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(name))
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(without_accents.upper().split())
+
+
+class NameCanonicalizer:
+    """
+    Tabla acotada nombre original → nombre canónico, persistente entre ejecuciones.
+
+    Los mismos nombres se repiten todos los meses: con la tabla, cada nombre ya visto cuesta una
+    búsqueda en un diccionario en lugar de volver a normalizarlo. La tabla conserva los
+    `max_entries` nombres usados más recientemente y se guarda con `save` (ver
+    `save_name_cache`). Es segura para usarla desde varios hilos.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = NAME_CACHE_SIZE):
+        self.path = path
+        self.max_entries = max_entries
+        self.names: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None, max_entries: int = NAME_CACHE_SIZE) -> "NameCanonicalizer":
+        """Carga la tabla guardada en `path`; si no existe, es de otra versión o está dañada, parte vacía."""
+        canonicalizer = cls(path, max_entries)
+        if path is None or not path.exists():
+            return canonicalizer
+        try:
+            with open(path, "rb") as f:
+                stored = pickle.load(f)
+            if stored.get("version") == CANONICAL_VERSION:
+                canonicalizer.names = OrderedDict(stored["names"])
+                canonicalizer._evict()
+                logger.debug(f"Tabla de nombres canónicos cargada: {len(canonicalizer.names)} nombres")
+        except Exception as e:
+            logger.warning(f"No se pudo leer la tabla de nombres canónicos {path}: {e}")
+        return canonicalizer
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _lookup(self, name: str) -> str:
+        # Se llama con el lock tomado
+        canonical = self.names.get(name)
+        if canonical is None:
+            canonical = canonical_name(name)
+            self.names[name] = canonical
+            self.misses += 1
+            self._dirty = True
+        else:
+            self.names.move_to_end(name)
+            self.hits += 1
+        return canonical
+
+    def canonical(self, name) -> str:
+        """Nombre canónico de un nombre (ver `canonical_name`)."""
+        if not isinstance(name, str):
+            return canonical_name(name)
+        with self._lock:
+            canonical = self._lookup(name)
+            self._evict()
+        return canonical
+
+    def canonicalize(self, names: pd.Series) -> pd.Series:
+        """
+        Nombres canónicos de una columna: cada nombre distinto se busca una sola vez en la tabla.
+        Los valores nulos se mantienen nulos.
+        """
+        codes, distinct = pd.factorize(names)
+        distinct = distinct.tolist()
+        with self._lock:
+            canonical = [
+                self._lookup(name) if isinstance(name, str) else canonical_name(name) for name in distinct
+            ]
+            self._evict()
+        values = np.array(canonical + [None], dtype=object)
+        return pd.Series(values[codes], index=names.index, name=names.name)
+
+    def _evict(self):
+        while len(self.names) > self.max_entries:
+            self.names.popitem(last=False)
+
+    def save(self) -> bool:
+        """
+        Guarda la tabla si cambió desde que se cargó o se guardó.
+
+        Returns:
+            bool: True si se escribió el archivo
+        """
+        if self.path is None:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            data = pickle.dumps(
+                {"version": CANONICAL_VERSION, "names": list(self.names.items())},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.path, data)
+        logger.debug(f"Tabla de nombres canónicos guardada: {len(self.names)} nombres")
+        return True
+
+
+_canonicalizer: Optional[NameCanonicalizer] = None
+_canonicalizer_lock = threading.Lock()
+
+
+def get_canonicalizer() -> NameCanonicalizer:
+    """
+    Retorna la tabla de nombres canónicos del proceso, cargándola de data/cache la primera vez.
+
+    La comparten la ingesta y la comparación, y en un proceso de larga duración (modo watch o
+    servicio HTTP) se mantiene en memoria entre ejecuciones.
+    """
+    global _canonicalizer
+    path = get_name_cache_path().resolve()
+    with _canonicalizer_lock:
+        if _canonicalizer is None or _canonicalizer.path != path:
+            _canonicalizer = NameCanonicalizer.load(path)
+        return _canonicalizer
+
+
+def canonicalize_names(names: pd.Series) -> pd.Series:
+    """Nombres canónicos de una columna usando la tabla compartida del proceso."""
+    return get_canonicalizer().canonicalize(names)
+
+
+def save_name_cache() -> bool:
+    """Guarda la tabla compartida de nombres canónicos si se cargó y cambió."""
+    with _canonicalizer_lock:
+        canonicalizer = _canonicalizer
+    return canonicalizer.save() if canonicalizer is not None else False
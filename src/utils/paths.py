@@ -6,7 +6,7 @@ BASE_DATA = Path("data")
 BASE_REPORTS = Path("reports")
 
 def get_raw_xls_path(year, month):
-    return BASE_DATA / "raw" / f"{year}{month:02d}.xls"
+    return get_raw_dir() / f"{year}{month:02d}.xls"
 
 def get_original_csv_path(year, month):
     return BASE_DATA / "original" / f"{year}{month:02d}.csv"
@@ -14,8 +14,23 @@ def get_original_csv_path(year, month):
 def get_diff_csv_path(year, month):
     return BASE_DATA / "diffs" / f"{year}{month:02d}.csv"
 
+def get_renames_csv_path(year, month):
+    """
+    Obtiene la ruta al archivo auxiliar con los posibles cambios de nombre del mes, para revisión.
+    """
+    return BASE_DATA / "diffs" / f"{year}{month:02d}_renombres.csv"
+
+def get_anomalies_csv_path(year, month):
+    """
+    Obtiene la ruta al archivo con los movimientos de saldo anómalos del mes, para revisión.
+    """
+    return BASE_DATA / "diffs" / f"{year}{month:02d}_anomalias.csv"
+
+def get_processed_dir():
+    return BASE_DATA / "processed"
+
 def get_processed_csv_path(year, month):
-    return BASE_DATA / "processed" / f"{year}{month:02d}.csv"
+    return get_processed_dir() / f"{year}{month:02d}.csv"
 
 def get_report_paths(year, month):
     base = f"{year}{month:02d}"
@@ -24,6 +39,16 @@ def get_report_paths(year, month):
         BASE_REPORTS / "word" / f"{base}reporte.docx",
     )
 
+def get_dashboard_paths(year, month):
+    """
+    Obtiene las rutas al tablero HTML del período y a su índice JSON compacto.
+    """
+    directory = BASE_REPORTS / "dashboard"
+    return (
+        directory / f"{year}{month:02d}_tablero.html",
+        directory / f"{year}{month:02d}_indice.json",
+    )
+
 def get_base_path():
     """
     Obtiene la ruta al archivo base para regularización de nombres.
@@ -35,4 +60,95 @@ def get_dictionary_path():
     """
     Obtiene la ruta al archivo diccionario de RUTs faltantes para regularización de nombres.
     """
-    return BASE_DATA / "dictionary" / "ruts_faltantes.csv"
\ No newline at end of file
+    return BASE_DATA / "dictionary" / "ruts_faltantes.csv"
+
+def get_ledger_path():
+    """
+    Obtiene la ruta al ledger append-only de diferencias mensuales por socio.
+    """
+    return BASE_DATA / "ledger" / "deltas.csv"
+
+def get_snapshot_dir():
+    """
+    Obtiene el directorio de snapshots (checkpoints completos del archivo Bueno) del ledger.
+    """
+    return BASE_DATA / "ledger" / "snapshots"
+
+def get_history_db_path():
+    """
+    Obtiene la ruta a la base de datos local con el historial mensual de cada socio.
+    """
+    return BASE_DATA / "history.sqlite"
+
+def get_perf_db_path():
+    """
+    Obtiene la ruta a la base de datos local con los tiempos de cada ejecución mensual.
+    """
+    return BASE_DATA / "perf_history.sqlite"
+
+def get_audit_paths(start_year, start_month, end_year, end_month):
+    """
+    Obtiene las rutas de los reportes de auditoría (detalle por socio y resumen por mes).
+    """
+    base = f"{start_year}{start_month:02d}_{end_year}{end_month:02d}"
+    return (
+        BASE_DATA / "audit" / f"{base}_socios.csv",
+        BASE_DATA / "audit" / f"{base}_resumen.csv",
+    )
+
+def get_raw_dir():
+    return BASE_DATA / "raw"
+
+def get_watch_status_path():
+    """
+    Obtiene la ruta al archivo de estado del modo watch (último período procesado, errores).
+    """
+    return BASE_DATA / "watch_status.json"
+
+def get_run_manifest_path(year, month):
+    """
+    Obtiene la ruta al manifiesto de la última ejecución del período (etapas, tiempos y artefactos).
+    """
+    return BASE_DATA / "runs" / f"{year}{month:02d}.json"
+
+def get_checkpoint_dir(year, month):
+    """
+    Obtiene el directorio de checkpoints de etapas de una ejecución fallida del período.
+    """
+    return BASE_DATA / "checkpoints" / f"{year}{month:02d}"
+
+def get_statements_path(year, month):
+    """
+    Obtiene la ruta al zip con las cartolas por socio del período.
+    """
+    return BASE_REPORTS / "statements" / f"{year}{month:02d}_cartolas.zip"
+
+def get_statement_work_dir(year, month):
+    """
+    Obtiene el directorio de trabajo con los bloques de cartolas ya generados (para reanudar).
+    """
+    return BASE_REPORTS / "statements" / f".{year}{month:02d}_partes"
+
+def get_trend_report_path(start_year, start_month, end_year, end_month):
+    """
+    Obtiene la ruta al reporte de tendencia mensual de un rango de períodos.
+    """
+    return BASE_REPORTS / "trends" / f"{start_year}{start_month:02d}_{end_year}{end_month:02d}_tendencia.xlsx"
+
+def get_annual_report_path(year):
+    """
+    Obtiene la ruta al reporte anual (cierre del año comparado con el cierre del año anterior).
+    """
+    return BASE_REPORTS / "annual" / f"{year}_anual.xlsx"
+
+def get_name_cache_path():
+    """
+    Obtiene la ruta a la tabla persistente de nombres canónicos (nombre original → canónico).
+    """
+    return BASE_DATA / "cache" / "nombres_canonicos.pkl"
+
+def get_spill_dir():
+    """
+    Obtiene el directorio de archivos temporales de partición del modo fuera de memoria.
+    """
+    return BASE_DATA / "spill"
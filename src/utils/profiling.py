@@ -0,0 +1,142 @@
+# src/utils/profiling.py
+
+import ctypes
+import sys
+import time
+import tracemalloc
+import pandas as pd
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+MB = 1024 * 1024
+
+
+def fingerprint(df: pd.DataFrame) -> Tuple:
+    """Huella de un DataFrame (columnas, tipos, índice y contenido) para detectar modificaciones."""
+    return (
+        tuple(df.columns),
+        tuple(str(dtype) for dtype in df.dtypes),
+        len(df),
+        int(pd.util.hash_pandas_object(df, index=True).sum()) if len(df.columns) else 0,
+    )
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Pico de memoria residente del proceso desde que inició, en MB (None si el sistema no lo informa).
+
+    A diferencia de `AllocationTracker` no agrega costo: lo lleva el sistema operativo, así que se
+    puede medir en cada ejecución mensual.
+    """
+    try:
+        import resource
+    except ImportError:  # Windows: no tiene el módulo resource
+        return _windows_peak_rss_mb()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss viene en KB en Linux y en bytes en macOS
+    return round(peak / (MB if sys.platform == "darwin" else 1024), 1)
+
+
+def _windows_peak_rss_mb() -> Optional[float]:
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    try:
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        get_current_process = ctypes.windll.kernel32.GetCurrentProcess
+        get_current_process.restype = wintypes.HANDLE
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(get_current_process(), ctypes.byref(counters), counters.cb):
+            return None
+    except (AttributeError, OSError):
+        return None
+    return round(counters.PeakWorkingSetSize / MB, 1)
+
+
+@dataclass
+class StageAllocation:
+    """Memoria asignada por una etapa, medida con tracemalloc."""
+    stage: str
+    peak_bytes: int
+    retained_bytes: int
+    seconds: float
+    mutated_inputs: List[int] = field(default_factory=list)
+
+
+class AllocationTracker:
+    """
+    Mide la memoria asignada por etapa con tracemalloc (pico y memoria retenida al terminar).
+
+    Las etapas se miden de a una: tracemalloc es global al proceso, por lo que con etapas en
+    paralelo los picos se mezclarían. Con `check_inputs` se verifica además que la etapa no
+    modifique los DataFrames que recibe como argumentos posicionales (ver `fingerprint`).
+    Pensado para benchmarks y tests, no para la ejecución mensual.
+    """
+
+    def __init__(self):
+        self.stages: List[StageAllocation] = []
+
+    @contextmanager
+    def track(self, stage: str) -> Iterator[StageAllocation]:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        allocation = StageAllocation(stage, 0, 0, 0.0)
+        start = time.perf_counter()
+        try:
+            yield allocation
+        finally:
+            allocation.seconds = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            allocation.peak_bytes = peak - before
+            allocation.retained_bytes = current - before
+            self.stages.append(allocation)
+            if started:
+                tracemalloc.stop()
+
+    def run(self, stage: str, func: Callable[..., Any], *args, check_inputs: bool = True, **kwargs) -> Any:
+        """
+        Ejecuta `func(*args, **kwargs)` midiendo su memoria.
+
+        Returns:
+            Any: El resultado de la función. La medición queda en `self.stages`
+        """
+        frames = [(i, arg) for i, arg in enumerate(args) if isinstance(arg, pd.DataFrame)] if check_inputs else []
+        before = [fingerprint(df) for _, df in frames]
+        with self.track(stage) as allocation:
+            result = func(*args, **kwargs)
+        allocation.mutated_inputs = [i for (i, df), fp in zip(frames, before) if fingerprint(df) != fp]
+        return result
+
+    def peak(self, stage: str) -> int:
+        """Pico de memoria (bytes) de la última medición de la etapa."""
+        return next(s.peak_bytes for s in reversed(self.stages) if s.stage == stage)
+
+    def summary(self) -> pd.DataFrame:
+        """Tabla con una fila por etapa: etapa, pico_mb, retenido_mb, segundos, modifica_entradas."""
+        return pd.DataFrame([
+            {
+                "etapa": s.stage,
+                "pico_mb": round(s.peak_bytes / MB, 2),
+                "retenido_mb": round(s.retained_bytes / MB, 2),
+                "segundos": round(s.seconds, 3),
+                "modifica_entradas": bool(s.mutated_inputs),
+            }
+            for s in self.stages
+        ])
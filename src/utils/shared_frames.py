@@ -0,0 +1,255 @@
+# src/utils/shared_frames.py
+
+import os
+import pickle
+import sys
+import uuid
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+from src.utils.logging import setup_logger
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow es opcional: sin él las columnas de texto se serializan con pickle
+    pa = None
+
+logger = setup_logger(__name__)
+
+# DataFrames más chicos que este tamaño (bytes) se envían por pickle en lugar de memoria compartida
+SHARED_MIN_BYTES = int(os.getenv("CAPITAL_SHARED_MIN_BYTES", str(1024 * 1024)))
+
+# En Windows un segmento con nombre desaparece al cerrarse su último handle: el que lo crea (a
+# menudo un proceso trabajador) lo cierra antes de que otro proceso se conecte. Ahí los
+# DataFrames se envían siempre por pickle
+SHARED_MEMORY_SUPPORTED = sys.platform != "win32"
+
+# Alineación de cada buffer dentro del segmento
+ALIGNMENT = 64
+
+SEGMENT_PREFIX = "capital_"
+
+# Segmentos abiertos por este proceso (se reutilizan entre llamadas a `attach`)
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+
+@dataclass
+class ColumnLayout:
+    """Ubicación de una columna dentro del segmento compartido."""
+    kind: str  # "numpy", "arrow_string" o "pickle"
+    dtype: Any
+    buffers: List[Tuple[int, int]]  # (offset, bytes); None en la validez si no hay nulos
+    null_count: int = 0
+
+
+@dataclass
+class SharedFrame:
+    """
+    Referencia serializable a un DataFrame publicado en memoria compartida.
+
+    Solo viaja entre procesos esta descripción (nombre del segmento y ubicación de cada
+    columna): el proceso que la recibe se conecta al segmento con `attach` y obtiene un
+    DataFrame cuyas columnas numéricas y de texto (con pyarrow) apuntan directamente al
+    segmento, sin copiarlas. Los DataFrames chicos viajan completos en `frame` (pickle).
+    """
+    segment: Optional[str]
+    nrows: int
+    columns: pd.Index
+    layouts: List[ColumnLayout] = field(default_factory=list)
+    index: Optional[pd.Index] = None
+    index_names: List[Any] = field(default_factory=list)
+    frame: Optional[pd.DataFrame] = None
+
+    @property
+    def shared(self) -> bool:
+        return self.segment is not None
+
+    def attach(self) -> pd.DataFrame:
+        """
+        Retorna el DataFrame, conectándose al segmento compartido si corresponde.
+
+        Las columnas conectadas son de solo lectura, para que un proceso no altere los datos que
+        leen los demás: las etapas no modifican sus entradas, y una asignación en el lugar sobre
+        el DataFrame conectado falla con ValueError (hay que trabajar sobre una copia).
+        """
+        if not self.shared:
+            return self.frame
+
+        shm = _attached.get(self.segment)
+        if shm is None:
+            shm = shared_memory.SharedMemory(name=self.segment)
+            _attached[self.segment] = shm
+
+        data = {}
+        for i, layout in enumerate(self.layouts):
+            data[i] = pd.Series(_read_column(shm.buf, layout, self.nrows), index=self.index, copy=False)
+        df = pd.DataFrame(data, copy=False)
+        df.columns = self.columns
+        if self.index_names:
+            df = df.set_index(self.index_names)
+        return df
+
+
+def _read_column(buf: memoryview, layout: ColumnLayout, nrows: int):
+    if layout.kind == "numpy":
+        offset, _ = layout.buffers[0]
+        values = np.frombuffer(buf, dtype=layout.dtype, count=nrows, offset=offset)
+        values.flags.writeable = False
+        return values
+    if layout.kind == "arrow_string":
+        validity, offsets, values = (
+            None if b is None else pa.py_buffer(buf[b[0]:b[0] + b[1]]) for b in layout.buffers
+        )
+        array = pa.LargeStringArray.from_buffers(nrows, offsets, values, validity, layout.null_count)
+        return pd.array(array, dtype=layout.dtype)
+    offset, nbytes = layout.buffers[0]
+    return pickle.loads(buf[offset:offset + nbytes]).array
+
+
+def _column_buffers(series: pd.Series) -> Tuple[str, List[Any], int]:
+    """Buffers contiguos de una columna, según su tipo."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+        return "numpy", [np.ascontiguousarray(series.to_numpy()).view(np.uint8)], 0
+    if (
+        pa is not None
+        and isinstance(dtype, pd.StringDtype)
+        and dtype.storage == "pyarrow"
+    ):
+        array = series.array._pa_array.combine_chunks().cast(pa.large_string())
+        if array.offset:
+            array = pa.concat_arrays([array, pa.array([], type=pa.large_string())])
+        validity, offsets, values = array.buffers()
+        return "arrow_string", [validity if array.null_count else None, offsets, values], array.null_count
+    return "pickle", [pickle.dumps(series, protocol=pickle.HIGHEST_PROTOCOL)], 0
+
+
+def _aligned(n: int) -> int:
+    return (n + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def share_frame(df: pd.DataFrame, min_bytes: int = SHARED_MIN_BYTES) -> SharedFrame:
+    """
+    Publica un DataFrame en un segmento de memoria compartida nuevo.
+
+    El segmento queda a cargo de quien recibe la referencia: debe liberarse con `unlink_frame`
+    (o adoptándolo en un `SharedFrameStore`). Si el DataFrame ocupa menos de `min_bytes`, o la
+    plataforma no admite segmentos (ver SHARED_MEMORY_SUPPORTED), no se crea segmento y la
+    referencia lleva el DataFrame completo (se envía por pickle).
+
+    Returns:
+        SharedFrame: Referencia serializable al DataFrame
+    """
+    if not SHARED_MEMORY_SUPPORTED or df.memory_usage(index=False).sum() < min_bytes:
+        return SharedFrame(segment=None, nrows=len(df), columns=df.columns, frame=df)
+
+    index_names: List[Any] = []
+    if not isinstance(df.index, pd.RangeIndex):
+        index_names = [name if name is not None else f"level_{i}" for i, name in enumerate(df.index.names)]
+        df = df.reset_index(names=index_names)
+
+    column_buffers = []
+    layouts = []
+    size = 0
+    for i in range(df.shape[1]):
+        series = df.iloc[:, i]
+        kind, buffers, null_count = _column_buffers(series)
+        placed = []
+        for buffer in buffers:
+            if buffer is None:
+                placed.append(None)
+                continue
+            nbytes = len(memoryview(buffer).cast("B"))
+            placed.append((size, nbytes))
+            size = _aligned(size + nbytes)
+        column_buffers.append(buffers)
+        layouts.append(ColumnLayout(kind, series.dtype, placed, null_count))
+
+    name = f"{SEGMENT_PREFIX}{os.getpid()}_{uuid.uuid4().hex[:12]}"
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+    try:
+        for buffers, layout in zip(column_buffers, layouts):
+            for buffer, place in zip(buffers, layout.buffers):
+                if place is not None:
+                    offset, nbytes = place
+                    shm.buf[offset:offset + nbytes] = memoryview(buffer).cast("B")
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+
+    logger.debug(f"DataFrame de {len(df)} filas publicado en memoria compartida ({size} bytes, {name})")
+    return SharedFrame(
+        segment=name,
+        nrows=len(df),
+        columns=df.columns,
+        layouts=layouts,
+        index=df.index,
+        index_names=index_names,
+    )
+
+
+def detach_frame(frame: SharedFrame) -> None:
+    """
+    Cierra la conexión de este proceso al segmento, si ya no hay DataFrames que lo usen.
+
+    Si todavía existen columnas que apuntan al segmento, la conexión se mantiene y se cierra al
+    terminar el proceso.
+    """
+    shm = _attached.pop(frame.segment, None) if frame.shared else None
+    if shm is None:
+        return
+    try:
+        shm.close()
+    except BufferError:
+        _attached[frame.segment] = shm
+
+
+def unlink_frame(frame: SharedFrame) -> None:
+    """Libera el segmento compartido de la referencia (las conexiones abiertas siguen siendo válidas)."""
+    if not frame.shared:
+        return
+    detach_frame(frame)
+    try:
+        shm = shared_memory.SharedMemory(name=frame.segment)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+class SharedFrameStore:
+    """
+    Dueño de los segmentos compartidos de una ejecución en paralelo.
+
+    Debe crearse en el proceso principal antes de levantar los procesos trabajadores: así todos
+    comparten el mismo resource tracker, que libera los segmentos pendientes si el proceso
+    principal termina de forma inesperada. Al cerrarse libera todos los segmentos adoptados,
+    incluidos los creados por los trabajadores con `share_frame`.
+    """
+
+    def __init__(self):
+        resource_tracker.ensure_running()
+        self.frames: List[SharedFrame] = []
+
+    def share(self, df: pd.DataFrame, min_bytes: int = SHARED_MIN_BYTES) -> SharedFrame:
+        return self.adopt(share_frame(df, min_bytes=min_bytes))
+
+    def adopt(self, frame: SharedFrame) -> SharedFrame:
+        if frame.shared:
+            self.frames.append(frame)
+        return frame
+
+    def close(self):
+        for frame in self.frames:
+            unlink_frame(frame)
+        self.frames = []
+
+    def __enter__(self) -> "SharedFrameStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -120,3 +120,41 @@ class TestDiffGenerator:
         assert sum_diff_saldo == 717805, \
             f"La suma de diff_saldo es {sum_diff_saldo}, se esperaba 717805"
 
+
+    def test_generate_diffs_does_not_mutate_inputs(self):
+        """
+        Test que valida que generate_diffs no modifica los DataFrames recibidos.
+
+        Los montos llegan como texto: la conversión a número debe hacerse sobre un DataFrame nuevo.
+        """
+        current = pd.DataFrame({
+            'rut': ['1-1', '2-2'], 'nombre': ['PEREZ JUAN', 'SOTO ANA'],
+            'debitos': ['0', 'x'], 'creditos': ['6000', '2000'], 'saldo': ['6000', '2000'],
+        })
+        previous = current.iloc[:1].copy()
+        expected_current, expected_previous = current.copy(), previous.copy()
+
+        diffs = generate_diffs(current, previous)
+
+        pd.testing.assert_frame_equal(current, expected_current)
+        pd.testing.assert_frame_equal(previous, expected_previous)
+        assert diffs['diff_saldo'].tolist() == [0, 2000]
+
+    def test_generate_diffs_joins_on_canonical_names(self):
+        """
+        Test que un nombre escrito con otras tildes, mayúsculas o espacios no genera una baja y un alta.
+        """
+        current = pd.DataFrame({
+            'rut': ['1-1', '2-2'], 'nombre': ['José  Pérez ', 'SOTO ANA'],
+            'debitos': [0, 0], 'creditos': [7000, 2000], 'saldo': [7000, 2000],
+        })
+        previous = pd.DataFrame({
+            'rut': ['1-1', '2-2'], 'nombre': ['JOSE PEREZ', 'Soto Ana'],
+            'debitos': [0, 0], 'creditos': [6000, 2000], 'saldo': [6000, 2000],
+        })
+
+        diffs = generate_diffs(current, previous)
+
+        # Se cruzan por la forma canónica, pero se muestra el nombre del mes actual tal como viene
+        assert diffs['Nombre'].tolist() == ['José  Pérez ', 'SOTO ANA']
+        assert diffs['diff_saldo'].tolist() == [1000, 0]
@@ -0,0 +1,58 @@
+# tests/comparison/test_name_matching.py
+
+import pandas as pd
+
+from src.comparison.diff_generator import generate_diffs
+from src.comparison.name_matching import find_renames, match_renamed_members, normalize_name
+
+
+def _month(rows):
+    return pd.DataFrame(rows, columns=['rut', 'nombre', 'debitos', 'creditos', 'saldo'])
+
+
+class TestNameMatching:
+    """Tests para el emparejamiento de nombres entre meses."""
+
+    def test_normalize_name_removes_accents_case_and_spaces(self):
+        """
+        Test que valida la normalización de tildes, mayúsculas y espacios.
+        """
+        assert normalize_name("  José  Núñez\tpérez ") == "JOSE NUNEZ PEREZ"
+        assert normalize_name(None) == ""
+
+    def test_find_renames_blocks_by_rut_and_by_name(self):
+        """
+        Test que valida el emparejamiento por Rut y por similitud de nombre.
+        """
+        removed = pd.DataFrame({
+            'nombre': ['PEREZ SOTO JUAN', 'GONZALEZ ROJAS MARIA ISABEL', 'MUÑOZ DIAZ PEDRO'],
+            'rut': ['1-1', '2-2', '3-3'],
+        })
+        added = pd.DataFrame({
+            'nombre': ['PÉREZ SOTO JUAN ANDRÉS', 'GONZALEZ ROJAS MARIA YSABEL', 'TAPIA VERA ANA'],
+            'rut': ['1-1', '9-9', '4-4'],
+        })
+
+        renames = find_renames(removed, added).set_index('nombre_anterior')
+
+        assert len(renames) == 2
+        assert renames.loc['PEREZ SOTO JUAN', 'criterio'] == 'rut'
+        assert bool(renames.loc['PEREZ SOTO JUAN', 'aplicado'])
+        assert renames.loc['GONZALEZ ROJAS MARIA ISABEL', 'nombre_actual'] == 'GONZALEZ ROJAS MARIA YSABEL'
+        assert renames.loc['GONZALEZ ROJAS MARIA ISABEL', 'criterio'] == 'nombre'
+        assert not bool(renames.loc['GONZALEZ ROJAS MARIA ISABEL', 'aplicado'])
+
+    def test_applied_renames_join_member_in_diffs(self):
+        """
+        Test que valida que un socio renombrado con el mismo Rut genera una sola fila de diferencias.
+        """
+        previous = _month([['1-1', 'PEREZ JUAN', 0, 5000, 5000], ['2-2', 'SOTO ANA', 0, 1000, 1000]])
+        current = _month([['1-1', 'PEREZ JUAN ANDRES', 0, 7000, 7000], ['2-2', 'SOTO ANA', 0, 1000, 1000]])
+
+        renames = match_renamed_members(current, previous)
+        diffs = generate_diffs(current, previous, renames=renames)
+
+        assert len(diffs) == 2
+        row = diffs[diffs['Rut'] == '1-1'].iloc[0]
+        assert row['Nombre'] == 'PEREZ JUAN ANDRES'
+        assert row['diff_saldo'] == 2000
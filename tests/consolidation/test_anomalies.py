@@ -0,0 +1,101 @@
+# tests/consolidation/test_anomalies.py
+
+import pandas as pd
+
+from src.consolidation.anomalies import AnomalyThresholds, detect_anomalies, generate_anomalies
+from src.utils.artifacts import write_csv
+from src.utils.paths import get_processed_csv_path
+
+PERIODS = [202501, 202502, 202503, 202504, 202505, 202506]
+
+
+def _panel(balances):
+    """Panel a partir de {rut: [saldo por período]} (None = socio ausente ese mes)."""
+    rows = [
+        {'Periodo': periodo, 'Rut': rut, 'Saldo': saldo, 'Nombre': f"SOCIO {rut}"}
+        for rut, saldos in balances.items()
+        for periodo, saldo in zip(PERIODS, saldos)
+        if saldo is not None
+    ]
+    return pd.DataFrame(rows)
+
+
+def _good(balances, index):
+    return pd.DataFrame([
+        {'Rut': rut, 'Debito': 0, 'Credito': saldos[index], 'Saldo': saldos[index],
+         'Cuotas': saldos[index] // 1000, 'Nombre': f"SOCIO {rut}"}
+        for rut, saldos in balances.items()
+        if saldos[index] is not None
+    ])
+
+
+BALANCES = {
+    # Aportes regulares: nada que marcar
+    '1-1': [100000, 105000, 110000, 115000, 120000, 125000],
+    # Aportes regulares y un mes con un aporte muy superior a su historial
+    '2-2': [200000, 210000, 220000, 230000, 240000, 940000],
+    # El saldo se multiplica por 20 en un mes
+    '3-3': [50000, 50000, 50000, 50000, 50000, 1000000],
+    # Retiro grande
+    '4-4': [5000000, 5000000, 5000000, 5000000, 5000000, 3500000],
+    # Socio nuevo en el último mes: sin historial no se marca
+    '5-5': [None, None, None, None, None, 9000000],
+}
+
+
+class TestAnomalies:
+    """Tests para la detección de movimientos de saldo anómalos."""
+
+    def test_flags_each_rule(self):
+        """Test que cada regla marca al socio esperado y solo a él."""
+        anomalies = detect_anomalies(_panel(BALANCES)).set_index('Rut')
+
+        assert sorted(anomalies.index) == ['2-2', '3-3', '4-4']
+        assert anomalies.loc['2-2', 'Motivo'] == 'variacion_atipica'
+        assert anomalies.loc['3-3', 'Motivo'] == 'variacion_atipica, salto_de_magnitud'
+        assert anomalies.loc['4-4', 'Motivo'] == 'variacion_atipica, diferencia_negativa'
+        assert anomalies.loc['2-2', 'Diferencia'] == 700000
+        assert anomalies.loc['2-2', 'Media_diferencias'] == 10000
+        assert anomalies.loc['2-2', 'Meses_historial'] == 4
+        assert anomalies.loc['4-4', 'Nombre'] == 'SOCIO 4-4'
+        assert (anomalies['Periodo'] == 202506).all()
+
+    def test_thresholds_and_window(self):
+        """Test que los umbrales son configurables y que la ventana limita el historial usado."""
+        panel = _panel(BALANCES)
+
+        strict = detect_anomalies(panel, thresholds=AnomalyThresholds(min_amount=800000, negative_limit=2000000))
+        assert strict.set_index('Rut')['Motivo'].to_dict() == {
+            '3-3': 'variacion_atipica, salto_de_magnitud',
+            '4-4': 'variacion_atipica',
+        }
+
+        short = detect_anomalies(panel, thresholds=AnomalyThresholds(window=2, min_months=2))
+        assert short.set_index('Rut').loc['2-2', 'Meses_historial'] == 2
+
+    def test_rolling_statistics_for_every_period(self):
+        """Test que las estadísticas se calculan para todos los períodos sin mirar hacia adelante."""
+        anomalies = detect_anomalies(_panel(BALANCES), periods=PERIODS)
+
+        # El último mes de cada socio es el único anómalo: los meses anteriores son regulares
+        assert set(anomalies['Periodo']) == {202506}
+
+    def test_member_leaving_is_compared_to_zero(self):
+        """Test que un socio ausente en un período registrado tiene saldo cero ese mes."""
+        balances = dict(BALANCES, **{'6-6': [3000000, 3000000, 3000000, 3000000, 3000000, None]})
+
+        anomalies = detect_anomalies(_panel(balances)).set_index('Rut')
+
+        assert anomalies.loc['6-6', 'Saldo'] == 0
+        assert anomalies.loc['6-6', 'Diferencia'] == -3000000
+        assert 'diferencia_negativa' in anomalies.loc['6-6', 'Motivo']
+
+    def test_generate_anomalies_reads_previous_good_files(self, tmp_path, monkeypatch):
+        """Test que el período se evalúa contra los archivos Bueno anteriores de data/processed."""
+        monkeypatch.chdir(tmp_path)
+        for i, periodo in enumerate(PERIODS[:-2]):
+            write_csv(_good(BALANCES, i), get_processed_csv_path(periodo // 100, periodo % 100), index=False)
+
+        anomalies = generate_anomalies(2025, 6, _good(BALANCES, 5), _good(BALANCES, 4))
+
+        pd.testing.assert_frame_equal(anomalies, detect_anomalies(_panel(BALANCES)))
@@ -0,0 +1,39 @@
+# tests/consolidation/test_audit.py
+
+import pandas as pd
+
+from src.consolidation.audit import compare_good_files
+
+
+class TestAudit:
+    """Tests para la auditoría de la cadena de archivos Bueno."""
+
+    def _good(self, rows):
+        return pd.DataFrame(rows, columns=['Rut', 'Debito', 'Credito', 'Saldo', 'Cuotas', 'Nombre'])
+
+    def test_identical_files_have_no_drift(self):
+        """
+        Test que valida que archivos iguales (salvo formato del Rut) no reportan diferencias.
+        """
+        expected = self._good([['1-K', 0, 5000, 5000, 5, 'Uno'], ['2-2', 0, 9000, 9000, 9, 'Dos']])
+        stored = self._good([['2-2', 0.0, 9000.0, 9000.0, 9, 'Dos'], [' 1-k', 0, 5000, 5000, 5, 'Uno']])
+
+        drift = compare_good_files(202509, expected, stored)
+
+        assert drift.empty
+
+    def test_drift_is_reported_per_member(self):
+        """
+        Test que valida que se reportan socios faltantes, sobrantes y con valores distintos.
+        """
+        expected = self._good([['1-1', 0, 5000, 5000, 5, 'Uno'], ['2-2', 0, 9000, 9000, 9, 'Dos']])
+        stored = self._good([['1-1', 0, 6000, 6000, 6, 'Uno'], ['3-3', 0, 1000, 1000, 1, 'Tres']])
+
+        drift = compare_good_files(202509, expected, stored).set_index('Rut')
+
+        assert drift.loc['1-1', 'Tipo'] == 'diferencia'
+        assert drift.loc['1-1', 'Saldo_diff'] == 1000
+        assert drift.loc['2-2', 'Tipo'] == 'faltante'
+        assert drift.loc['2-2', 'Saldo_diff'] == -9000
+        assert drift.loc['3-3', 'Tipo'] == 'sobrante'
+        assert (drift['Periodo'] == 202509).all()
@@ -0,0 +1,145 @@
+# tests/consolidation/test_ledger.py
+
+from datetime import date
+import os
+import pytest
+import pandas as pd
+
+from src.consolidation.monthly_builder import build_monthly_file
+from src.consolidation.ledger import (
+    append_period,
+    get_member_balances,
+    list_snapshots,
+    read_ledger,
+    reconstruct_period,
+)
+from src.utils.exceptions import ConsolidationError
+
+
+def _diffs(values):
+    return pd.DataFrame(
+        [[f"Socio {rut}", rut, deb, cred, cred - deb] for rut, deb, cred in values],
+        columns=['Nombre', 'Rut', 'diff_debito', 'diff_credito', 'diff_saldo'],
+    )
+
+
+class TestLedger:
+    """Tests para el ledger append-only de diferencias con snapshots."""
+
+    @pytest.fixture
+    def ledger_path(self, tmp_path):
+        return tmp_path / "ledger" / "deltas.csv"
+
+    @pytest.fixture
+    def snapshot_dir(self, tmp_path):
+        return tmp_path / "ledger" / "snapshots"
+
+    @pytest.fixture
+    def initial_good(self):
+        """Archivo bueno inicial (diciembre 2024)."""
+        return pd.DataFrame({
+            'Rut': ['1-1', '2-2', '3-K'],
+            'Debito': [0, 1000, 0],
+            'Credito': [5000, 21000, 150000],
+            'Saldo': [5000, 20000, 150000],
+            'Cuotas': [5, 20, 150],
+            'Nombre': ['Socio 1-1', 'Socio 2-2', 'Socio 3-K'],
+        })
+
+    @pytest.fixture
+    def monthly_diffs(self):
+        """Diferencias de enero a abril 2025."""
+        return [
+            _diffs([('1-1', 0, 2000), ('4-4', 0, 30000)]),
+            _diffs([('2-2', 20000, 0), ('3-K', 0, 1000)]),
+            _diffs([('1-1', 1000, 0), ('5-5', 0, 12000)]),
+            _diffs([('4-4', 0, 5000), ('3-k ', 50000, 0)]),
+        ]
+
+    @pytest.fixture
+    def chain(self, initial_good, monthly_diffs, ledger_path, snapshot_dir):
+        """Registra los cuatro meses en el ledger con un snapshot cada dos períodos."""
+        goods = {}
+        previous = initial_good
+        for month, diffs in enumerate(monthly_diffs, start=1):
+            good = build_monthly_file(diffs, previous)
+            append_period(
+                2025, month, diffs, previous, good,
+                ledger_path=ledger_path, snapshot_dir=snapshot_dir, snapshot_interval=2,
+            )
+            goods[month] = good
+            previous = good
+        return goods
+
+    def test_snapshots_are_written_periodically(self, chain, snapshot_dir):
+        """
+        Test que valida que se guarda el snapshot inicial y luego uno cada dos períodos.
+        """
+        assert list_snapshots(snapshot_dir) == [202412, 202502, 202504]
+
+    def test_reconstruct_matches_sequential_chain(self, chain, ledger_path, snapshot_dir):
+        """
+        Test que valida que la reconstrucción de cada período coincide con la cadena mensual.
+        """
+        for month, expected in chain.items():
+            result = reconstruct_period(2025, month, ledger_path=ledger_path, snapshot_dir=snapshot_dir)
+            pd.testing.assert_frame_equal(
+                result.sort_values('Rut').reset_index(drop=True),
+                expected.sort_values('Rut').reset_index(drop=True),
+                check_dtype=False,
+            )
+
+    def test_member_balances_at_date(self, chain, ledger_path, snapshot_dir):
+        """
+        Test que valida la consulta puntual de saldos de un socio en una fecha.
+        """
+        result = get_member_balances(
+            date(2025, 3, 15), ruts=['4-4'], ledger_path=ledger_path, snapshot_dir=snapshot_dir
+        )
+        assert result['Rut'].tolist() == ['4-4']
+        assert result['Saldo'].tolist() == [30000]
+
+    def test_revision_supersedes_previous_entries(self, chain, monthly_diffs, ledger_path, snapshot_dir):
+        """
+        Test que valida que una nueva revisión de un período reemplaza a la anterior
+        y descarta los snapshots posteriores.
+        """
+        corrected = _diffs([('1-1', 0, 7000)])
+        good = build_monthly_file(corrected, chain[2])
+        revision = append_period(
+            2025, 3, corrected, chain[2], good,
+            ledger_path=ledger_path, snapshot_dir=snapshot_dir, snapshot_interval=2,
+        )
+
+        assert revision == 1
+        assert list_snapshots(snapshot_dir) == [202412, 202502, 202503]
+        assert len(read_ledger(ledger_path, keep_revisions=True)) == 9
+        result = reconstruct_period(2025, 3, ruts=['1-1'], ledger_path=ledger_path, snapshot_dir=snapshot_dir)
+        assert result['Saldo'].tolist() == [14000]
+
+    def test_failed_append_keeps_ledger_readable(self, chain, ledger_path, snapshot_dir, monkeypatch):
+        """
+        Test que valida que una escritura interrumpida no altera el ledger ni deja temporales.
+        """
+        before = ledger_path.read_bytes()
+
+        def interrupted(src, dst):
+            raise OSError("corte de energía")
+
+        monkeypatch.setattr(os, "replace", interrupted)
+        with pytest.raises(OSError):
+            append_period(
+                2025, 5, _diffs([('1-1', 0, 1000)]), chain[4], chain[4],
+                ledger_path=ledger_path, snapshot_dir=snapshot_dir, snapshot_interval=2,
+            )
+
+        assert ledger_path.read_bytes() == before
+        assert [p.name for p in ledger_path.parent.iterdir() if p.is_file()] == [ledger_path.name]
+        assert len(read_ledger(ledger_path, keep_revisions=True)) == 8
+
+    def test_missing_periods_raise_error(self, chain, ledger_path, snapshot_dir):
+        """
+        Test que valida que se informa un error si faltan períodos en el ledger.
+        """
+        with pytest.raises(ConsolidationError):
+            reconstruct_period(2025, 6, ledger_path=ledger_path, snapshot_dir=snapshot_dir)
@@ -94,3 +94,23 @@ class TestMonthlyBuilder:
         assert sum_saldo == 177169221, \
             f"La suma de Saldo es {sum_saldo}, se esperaba 177169221"
 
+
+    def test_build_monthly_file_does_not_mutate_inputs(self):
+        """
+        Test que valida que build_monthly_file no modifica los DataFrames recibidos.
+        """
+        diffs = pd.DataFrame({
+            'Nombre': ['PEREZ JUAN', 'SOTO ANA'], 'Rut': ['1-1 ', '2-2'],
+            'diff_debito': [0, 0], 'diff_credito': [1000, 2000], 'diff_saldo': [1000, 2000],
+        })
+        previous_good = pd.DataFrame({
+            'Rut': ['1-1'], 'Debito': [0], 'Credito': [5000], 'Saldo': [5000], 'Cuotas': [5],
+            'Nombre': ['PEREZ JUAN'],
+        })
+        expected_diffs, expected_previous = diffs.copy(), previous_good.copy()
+
+        result = build_monthly_file(diffs, previous_good)
+
+        pd.testing.assert_frame_equal(diffs, expected_diffs)
+        pd.testing.assert_frame_equal(previous_good, expected_previous)
+        assert result['Saldo'].tolist() == [6000, 2000]
@@ -0,0 +1,79 @@
+# tests/consolidation/test_partitioned.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.comparison.diff_generator import generate_diffs
+from src.consolidation.monthly_builder import build_monthly_file
+from src.consolidation.partitioned import (
+    build_monthly_file_partitioned,
+    generate_diffs_partitioned,
+    plan_partitions,
+)
+
+
+def _month(seed, n=400):
+    rng = np.random.default_rng(seed)
+    ids = rng.integers(0, n // 2, n)
+    debitos = rng.integers(0, 50, n) * 10
+    creditos = rng.integers(0, 150, n) * 10
+    return pd.DataFrame({
+        'rut': [f"{i}-{'k' if i % 7 == 0 else i % 10}" + (" " if i % 11 == 0 else "") for i in ids],
+        'nombre': [f"SOCIO {i % (n // 3)}" for i in ids],
+        'debitos': debitos,
+        'creditos': creditos,
+        'saldo': creditos - debitos,
+    })
+
+
+RENAMES = pd.DataFrame({
+    'nombre_anterior': ['SOCIO 1', 'SOCIO 2', 'SOCIO 3'],
+    'nombre_actual': ['SOCIO 10', 'SOCIO NUEVO', 'SOCIO 4'],
+    'aplicado': [True, True, False],
+})
+
+
+class TestPartitioned:
+    """Tests para la comparación y consolidación por particiones en disco."""
+
+    @pytest.mark.parametrize("partitions", [2, 7])
+    def test_partitioned_diffs_match_generate_diffs(self, tmp_path, partitions):
+        """Test que las diferencias por particiones son iguales (y en el mismo orden) a las en memoria."""
+        current, previous = _month(1), _month(2)
+
+        expected = generate_diffs(current, previous, renames=RENAMES)
+        result = generate_diffs_partitioned(current, previous, renames=RENAMES, partitions=partitions, spill_dir=tmp_path)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize("partitions", [2, 7])
+    def test_partitioned_consolidation_matches_build_monthly_file(self, tmp_path, partitions):
+        """Test que el archivo Bueno por particiones es igual al construido en memoria."""
+        diffs = generate_diffs(_month(1), _month(2))
+        previous_good = build_monthly_file(generate_diffs(_month(3), _month(3).iloc[:0]), pd.DataFrame(
+            columns=['Rut', 'Debito', 'Credito', 'Saldo', 'Cuotas', 'Nombre']
+        ))
+
+        expected = build_monthly_file(diffs, previous_good)
+        result = build_monthly_file_partitioned(diffs, previous_good, partitions=partitions, spill_dir=tmp_path)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_empty_inputs_keep_columns(self, tmp_path):
+        """Test que sin filas se obtiene un resultado vacío con las columnas esperadas."""
+        empty = _month(1).iloc[:0]
+        diffs = generate_diffs_partitioned(empty, empty, partitions=3, spill_dir=tmp_path)
+
+        assert diffs.empty
+        assert list(diffs.columns) == ['Nombre', 'Rut', 'diff_debito', 'diff_credito', 'diff_saldo']
+
+    def test_plan_partitions_follows_budget(self):
+        """Test que se particiona solo si la memoria estimada supera el presupuesto."""
+        df = _month(1, n=20000)
+
+        assert plan_partitions(df, budget_mb=0, partitions=0) == 1
+        assert plan_partitions(df, budget_mb=10_000, partitions=0) == 1
+        assert plan_partitions(df, budget_mb=1, partitions=0) > 1
+        assert plan_partitions(df, budget_mb=0, partitions=5) == 5
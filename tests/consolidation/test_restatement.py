@@ -0,0 +1,60 @@
+# tests/consolidation/test_restatement.py
+
+import pandas as pd
+
+from src.consolidation.monthly_builder import build_monthly_file
+from src.consolidation.restatement import changed_ruts, propagate_changes
+
+
+def _good(rows):
+    return pd.DataFrame(rows, columns=['Rut', 'Debito', 'Credito', 'Saldo', 'Cuotas', 'Nombre'])
+
+
+def _diffs(rows):
+    return pd.DataFrame(rows, columns=['Nombre', 'Rut', 'diff_debito', 'diff_credito', 'diff_saldo'])
+
+
+class TestRestatement:
+    """Tests para la propagación de un mes re-expresado a los meses posteriores."""
+
+    def test_changed_ruts_detects_changes_additions_and_removals(self):
+        """Test que se detectan RUTs con valores distintos, nuevos y eliminados."""
+        old = _good([['1-1', 0, 5000, 5000, 5, 'UNO'], ['2-2', 0, 2000, 2000, 2, 'DOS'], ['3-3', 0, 1000, 1000, 1, 'TRES']])
+        new = _good([['1-1', 0.0, 5000.0, 5000.0, 5, 'UNO'], ['2-2', 0, 3000, 3000, 3, 'DOS'], ['4-4 ', 0, 1000, 1000, 1, 'CUATRO']])
+
+        assert changed_ruts(old, new) == {'2-2', '3-3', '4-4'}
+        assert changed_ruts(None, new) == {'1-1', '2-2', '4-4'}
+
+    def test_propagation_matches_full_rebuild(self):
+        """Test que reconstruir solo los RUTs cambiados da el mismo Bueno que reconstruir el mes."""
+        diffs = _diffs([
+            ['UNO', '1-1', 0, 1000, 1000],
+            ['DOS', '2-2', 0, 500, 500],
+            ['TRES', '3-3', 0, 4000, 4000],
+            ['CINCO', '5-5', 0, 900, 900],
+        ])
+        old_previous = _good([
+            ['1-1', 0, 5000, 5000, 5, 'UNO'], ['2-2', 1000, 3000, 2000, 2, 'DOS'], ['3-3', 0, 1000, 1000, 1, 'TRES'],
+        ])
+        # Corrección: 2-2 queda en cero (se elimina del Bueno y pierde sus acumulados) y aparece 4-4
+        new_previous = _good([
+            ['1-1', 0, 5000, 5000, 5, 'UNO'], ['3-3', 0, 1000, 1000, 1, 'TRES'], ['4-4', 0, 700, 700, 0, 'CUATRO'],
+        ])
+        good = build_monthly_file(diffs, old_previous)
+        ruts = changed_ruts(old_previous, new_previous)
+
+        propagated, changed = propagate_changes(diffs, new_previous, good, ruts)
+
+        pd.testing.assert_frame_equal(propagated, build_monthly_file(diffs, new_previous), check_dtype=False)
+        assert changed == {'2-2', '4-4'}
+
+    def test_propagation_stops_when_nothing_changes(self):
+        """Test que un cambio que no afecta al Bueno del mes no lo reescribe."""
+        diffs = _diffs([['UNO', '1-1', 0, 1000, 1000]])
+        previous = _good([['1-1', 0, 5000, 5000, 5, 'UNO']])
+        good = build_monthly_file(diffs, previous)
+
+        propagated, changed = propagate_changes(diffs, previous, good, {'1-1'})
+
+        assert changed == set()
+        assert propagated is good
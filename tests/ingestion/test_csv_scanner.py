@@ -0,0 +1,75 @@
+# tests/ingestion/test_csv_scanner.py
+
+import pytest
+import pandas as pd
+
+import src.ingestion.csv_scanner as csv_scanner
+from src.ingestion.csv_scanner import read_member_rows, scan_layout
+from src.utils.exceptions import IngestionError
+
+
+HEADER = "TP,Vencto.,Detalle,Nro,Fecha,Glosa,TP,Débitos,,Créditos,Saldo,"
+
+
+def _write_csv(path, preamble_lines=12):
+    lines = [f"Cabecera {i},,,,,,,,,,," for i in range(preamble_lines)]
+    lines.insert(3, "")  # las líneas vacías no cuentan para ubicar el encabezado
+    lines += [
+        HEADER,
+        "1-1,PEREZ JUAN,SOC,,,,,,,,,",
+        "VO,05/09/2025,mov,1,,x,,,,,,",
+        ',Total,,,,,PEREZ JUAN,,"1.000","6.000","-5.000",A',
+        "2-2,,SOC,,,,,,,,,",
+        ",Total,,,,,SOTO ANA,,,2.000,-2.000,B",
+        ",TOTAL,,,,,,,1.000,8.000,-7.000,",
+        "",
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+class TestCsvScanner:
+    """Tests para el escáner de la región de datos del CSV convertido."""
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        return _write_csv(tmp_path / "202509.csv")
+
+    def test_scan_layout_finds_header_and_trailer(self, csv_path):
+        """
+        Test que valida que se ubican el encabezado y el trailer y se nombran las columnas como pandas.
+        """
+        content = csv_path.read_bytes()
+        layout = scan_layout(content)
+
+        assert content[layout.header_start:].startswith(b"TP,Vencto.")
+        assert content[layout.trailer_start:layout.end] == b",TOTAL,,,,,,,1.000,8.000,-7.000,"
+        assert layout.columns[6] == "TP.1"
+        assert layout.columns[8] == "Unnamed: 8"
+        assert layout.columns[11] == "Unnamed: 11"
+
+    @pytest.mark.parametrize("use_arrow", [True, False])
+    def test_read_member_rows_matches_pandas_read(self, csv_path, monkeypatch, use_arrow):
+        """
+        Test que valida que las filas leídas coinciden con la lectura completa de pandas filtrada.
+        """
+        if not use_arrow or csv_scanner.pa is None:
+            monkeypatch.setattr(csv_scanner, "pa", None)
+
+        rows = read_member_rows(csv_path)
+
+        df = pd.read_csv(csv_path, header=12, dtype=str).iloc[:-1]
+        expected = df[~df["Vencto."].str.contains("/").fillna(False)].reset_index(drop=True)
+        expected = expected[csv_scanner.MEMBER_COLUMNS]
+        pd.testing.assert_frame_equal(rows, expected, check_dtype=False)
+        assert rows["TP.1"].tolist()[1] == "PEREZ JUAN"
+        assert pd.isna(rows.loc[2, "Vencto."])
+
+    def test_short_file_raises_error(self, tmp_path):
+        """
+        Test que valida que un archivo sin encabezado produce un IngestionError.
+        """
+        path = tmp_path / "corto.csv"
+        path.write_text("a,b\n1,2\n", encoding="utf-8")
+        with pytest.raises(IngestionError):
+            read_member_rows(path)
@@ -0,0 +1,82 @@
+# tests/ingestion/test_preflight.py
+
+import pytest
+
+from src.ingestion.preflight import preflight_original, run_preflight
+from src.ingestion.reference_index import ReferenceIndex
+from src.utils.exceptions import IngestionError
+
+
+HEADER = "TP,Vencto.,Detalle,Nro,Fecha,Glosa,TP,Débitos,,Créditos,Saldo,"
+
+
+def _write_csv(path, trailer=",TOTAL,,,,,,,1.000,8.000,-7.000,", second_name="SOTO ANA"):
+    lines = [f"Cabecera {i},,,,,,,,,,," for i in range(12)]
+    lines += [
+        HEADER,
+        "1-1,PEREZ JUAN,SOC,,,,,,,,,",
+        "VO,05/09/2025,mov,1,,x,,,,,,",
+        ',Total,,,,,PEREZ JUAN,,"1.000","6.000","-5.000",A',
+        "2-2,,SOC,,,,,,,,,",
+        f",Total,,,,,{second_name},,,2.000,-2.000,B",
+        trailer,
+        "",
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+class TestPreflight:
+    """Tests para la validación previa de los CSV originales."""
+
+    def test_valid_file_has_no_problems(self, tmp_path):
+        """Test que un archivo cuadrado y con nombres no reporta problemas."""
+        report = preflight_original(_write_csv(tmp_path / "202509.csv"), ReferenceIndex({}))
+
+        assert report.ok
+        assert report.members == 2
+
+    def test_missing_name_not_in_reference(self, tmp_path):
+        """Test que un socio sin nombre y sin referencia se reporta con su Rut."""
+        path = _write_csv(tmp_path / "202509.csv", second_name="")
+
+        report = preflight_original(path, ReferenceIndex({}))
+        assert len(report.problems) == 1
+        assert "2-2" in report.problems[0]
+
+        assert preflight_original(path, ReferenceIndex({"2-2": "SOTO ANA"})).ok
+
+    def test_totals_mismatch(self, tmp_path):
+        """Test que una línea TOTAL que no cuadra se reporta por cada monto."""
+        path = _write_csv(tmp_path / "202509.csv", trailer=",TOTAL,,,,,,,1.000,9.000,-7.000,")
+
+        report = preflight_original(path, ReferenceIndex({}))
+
+        assert len(report.problems) == 1
+        assert "creditos" in report.problems[0]
+        assert "9000" in report.problems[0]
+
+    def test_reference_index_loads_base_before_dictionary(self, tmp_path):
+        """Test que la base tiene prioridad sobre el diccionario, como en regularizar_nombre."""
+        base = tmp_path / "base.csv"
+        base.write_text(",Rut,Nombre\n0, 2-2 ,SOTO ANA\n", encoding="utf-8")
+        diccionario = tmp_path / "ruts_faltantes.csv"
+        diccionario.write_text("Rut,Nombre\n2-2,OTRO NOMBRE\n3-3,ROJAS LUIS\n", encoding="utf-8")
+
+        index = ReferenceIndex.load(base, diccionario)
+
+        assert index.lookup("2-2") == "SOTO ANA"
+        assert "3-3" in index
+        assert index.missing(["3-3", "4-4", "4-4"]) == ["4-4"]
+
+    def test_run_preflight_reports_all_files_at_once(self, tmp_path):
+        """Test que los problemas de todos los archivos se informan en un solo error."""
+        current = _write_csv(tmp_path / "202509.csv", second_name="")
+        previous = tmp_path / "202508.csv"
+
+        with pytest.raises(IngestionError) as exc_info:
+            run_preflight([current, previous])
+
+        message = str(exc_info.value)
+        assert "202509.csv" in message and "2-2" in message
+        assert "202508.csv" in message and "no encontrado" in message
@@ -0,0 +1 @@
+# tests/orchestration/__init__.py
@@ -0,0 +1,175 @@
+# tests/orchestration/test_pipeline.py
+
+import pandas as pd
+import pytest
+from pathlib import Path
+
+import src.orchestration.pipeline as pipeline_module
+import src.reporting.sinks as sinks_module
+from src.orchestration.pipeline import ArtifactWriter, PeriodContext, Pipeline
+from src.utils.exceptions import ConsolidationError, PipelineError, ReportingError, StorageError
+
+
+HEADER = "TP,Vencto.,Detalle,Nro,Fecha,Glosa,TP,Débitos,,Créditos,Saldo,"
+
+
+def _write_original(path, creditos):
+    lines = [f"Cabecera {i},,,,,,,,,,," for i in range(12)]
+    lines += [
+        HEADER,
+        "1-1,PEREZ JUAN,SOC,,,,,,,,,",
+        f',Total,,,,,PEREZ JUAN,,,"{creditos}","-{creditos}",A',
+        f",TOTAL,,,,,,,,{creditos},-{creditos},",
+        "",
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+class TestPipeline:
+    """Tests para el pipeline en memoria y la escritura de artefactos en segundo plano."""
+
+    @pytest.fixture
+    def workspace(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        _write_original(Path("data/original/202508.csv"), "5.000")
+        _write_original(Path("data/original/202509.csv"), "6.000")
+        processed = Path("data/processed")
+        processed.mkdir(parents=True)
+        pd.DataFrame(
+            {"Rut": ["1-1"], "Debito": [0], "Credito": [5000], "Saldo": [5000], "Cuotas": [5], "Nombre": ["PEREZ JUAN"]}
+        ).to_csv(processed / "202508.csv", index=False)
+        return tmp_path
+
+    def _files(self, root):
+        return sorted(p.relative_to(root) for p in root.rglob("*") if p.is_file())
+
+    def test_dry_run_writes_nothing(self, workspace):
+        """Test que el dry-run produce los DataFrames en memoria sin escribir archivos."""
+        before = self._files(workspace)
+        ctx = PeriodContext(2025, 9, dry_run=True)
+        pipeline = Pipeline(ctx)
+
+        timings = pipeline.run()
+
+        assert self._files(workspace) == before
+        assert not (workspace / "reports").exists()
+        assert ctx.frames.good.loc[0, "Saldo"] == 6000
+        assert len(ctx.frames.diffs) == 1
+        assert Path("data/processed/202509.csv") in pipeline.writer.skipped
+        assert "ledger" not in timings
+        assert "consolidate" in timings
+
+    def test_partitioned_run_matches_in_memory_run(self, workspace):
+        """Test que comparar y consolidar por particiones produce los mismos DataFrames."""
+        in_memory = PeriodContext(2025, 9, dry_run=True)
+        partitioned = PeriodContext(2025, 9, dry_run=True, partitions=4)
+        Pipeline(in_memory).run()
+        Pipeline(partitioned).run()
+
+        pd.testing.assert_frame_equal(partitioned.frames.diffs, in_memory.frames.diffs)
+        pd.testing.assert_frame_equal(partitioned.frames.good, in_memory.frames.good)
+        assert not (workspace / "data" / "spill").exists()
+
+    @pytest.fixture
+    def reports(self, monkeypatch):
+        """Reemplaza los reportes por funciones que registran el archivo Bueno recibido."""
+        received = {}
+        monkeypatch.setattr(sinks_module, "generate_excel_report", lambda df, path: received.update(excel=df))
+        monkeypatch.setattr(sinks_module, "generate_word_report", lambda df, path: received.update(word=df))
+        return received
+
+    def test_failed_run_resumes_from_failed_stage(self, workspace, reports, monkeypatch):
+        """Test que una ejecución fallida se retoma desde la etapa que falló, con sus entradas guardadas."""
+        def failing(df, path):
+            raise ReportingError("tramos inconsistentes")
+
+        monkeypatch.setattr(sinks_module, "generate_word_report", failing)
+        with pytest.raises(ReportingError):
+            Pipeline(PeriodContext(2025, 9, convert=False)).run()
+        assert (workspace / "data" / "checkpoints" / "202509" / "estado.json").exists()
+
+        monkeypatch.setattr(sinks_module, "generate_word_report", lambda df, path: reports.update(word=df))
+        parsed = []
+        process_csv = pipeline_module.process_csv
+        monkeypatch.setattr(pipeline_module, "process_csv", lambda *a, **k: parsed.append(a) or process_csv(*a, **k))
+        timings = Pipeline(PeriodContext(2025, 9, convert=False)).run()
+
+        # El tablero no alcanza a iniciarse si el reporte Word falla antes
+        assert {"word_report", "write_artifacts"} <= set(timings) <= {"word_report", "dashboard_report", "write_artifacts"}
+        assert parsed == []
+        assert reports["word"].loc[0, "Saldo"] == 6000
+        assert not (workspace / "data" / "checkpoints" / "202509").exists()
+
+    def test_changed_inputs_discard_checkpoints(self, workspace, reports, monkeypatch):
+        """Test que los checkpoints no se usan si cambiaron las entradas del período."""
+        def failing(df, path):
+            raise ReportingError("tramos inconsistentes")
+
+        monkeypatch.setattr(sinks_module, "generate_word_report", failing)
+        with pytest.raises(ReportingError):
+            Pipeline(PeriodContext(2025, 9, convert=False)).run()
+
+        _write_original(Path("data/original/202509.csv"), "7.000")
+        monkeypatch.setattr(sinks_module, "generate_word_report", lambda df, path: reports.update(word=df))
+        timings = Pipeline(PeriodContext(2025, 9, convert=False)).run()
+
+        assert "parse_current" in timings
+        assert reports["word"].loc[0, "Saldo"] == 7000
+
+    def test_single_stage_runs_against_existing_artifacts(self, workspace, reports):
+        """Test que una etapa sola se ejecuta con las entradas leídas de los artefactos existentes."""
+        Pipeline(PeriodContext(2025, 9, convert=False)).run()
+        reports.clear()
+
+        timings = Pipeline(PeriodContext(2025, 9, convert=False, stages=("word_report",))).run()
+
+        assert set(timings) == {"word_report", "write_artifacts"}
+        assert set(reports) == {"word"}
+        assert reports["word"].loc[0, "Saldo"] == 6000
+
+        timings = Pipeline(PeriodContext(2025, 9, convert=False, from_stage="consolidate")).run()
+        assert {"consolidate", "anomalies", "excel_report", "word_report"} <= set(timings)
+        # history necesita la clasificación del original, que no se guarda como artefacto
+        assert "parse_current" in timings and "parse_previous" not in timings and "diffs" not in timings
+
+        with pytest.raises(PipelineError, match="Etapa desconocida"):
+            Pipeline(PeriodContext(2025, 9, convert=False, stages=("informe",))).run()
+
+    def test_invalid_stage_output_stops_before_writing(self, workspace, reports, monkeypatch):
+        """Test que un archivo Bueno que no cumple su contrato detiene el pipeline sin escribirse."""
+        build_monthly_file = pipeline_module.build_monthly_file
+        monkeypatch.setattr(
+            pipeline_module, "build_monthly_file",
+            lambda *a: build_monthly_file(*a).assign(Cuotas=lambda df: df["Cuotas"] + 1),
+        )
+
+        with pytest.raises(ConsolidationError, match="cuotas_distintas_de_saldo"):
+            Pipeline(PeriodContext(2025, 9, convert=False)).run()
+        assert not (workspace / "data" / "processed" / "202509.csv").exists()
+        assert reports == {}
+
+    def test_writer_saves_artifacts_before_close_returns(self, tmp_path):
+        """Test que `close` espera a que terminen las escrituras encoladas."""
+        writer = ArtifactWriter()
+        df = pd.DataFrame({"Rut": ["1-1"], "Saldo": [100]})
+        writer.submit_csv(df, tmp_path / "a.csv")
+        writer.submit_csv(df, tmp_path / "b.csv")
+
+        writer.close()
+
+        assert writer.written == [tmp_path / "a.csv", tmp_path / "b.csv"]
+        assert pd.read_csv(tmp_path / "b.csv")["Saldo"].tolist() == [100]
+
+    def test_writer_reraises_first_error(self, tmp_path):
+        """Test que un error de escritura en segundo plano se relanza al cerrar."""
+        def failing():
+            raise StorageError("disco lleno")
+
+        writer = ArtifactWriter()
+        writer.submit(tmp_path / "a.csv", failing)
+        writer.submit_csv(pd.DataFrame({"Rut": ["1-1"]}), tmp_path / "b.csv")
+
+        with pytest.raises(PipelineError, match="disco lleno"):
+            writer.close()
+        assert (tmp_path / "b.csv").exists()
@@ -0,0 +1,110 @@
+# tests/orchestration/test_scheduler.py
+
+import threading
+import pytest
+
+from src.orchestration.scheduler import StageScheduler
+from src.utils.exceptions import IngestionError, PipelineError
+from src.utils.logging import current_stage
+
+
+class TestStageScheduler:
+    """Tests para el planificador de etapas del pipeline."""
+
+    def test_results_are_passed_to_dependents(self):
+        """
+        Test que valida que cada etapa recibe los resultados de sus dependencias.
+        """
+        scheduler = StageScheduler()
+        scheduler.add("a", lambda: 2)
+        scheduler.add("b", lambda: 3)
+        scheduler.add("c", lambda a, b: a * b, deps=("a", "b"))
+
+        results = scheduler.run()
+
+        assert results == {"a": 2, "b": 3, "c": 6}
+        assert set(scheduler.timings) == {"a", "b", "c"}
+
+    def test_independent_stages_run_concurrently(self):
+        """
+        Test que valida que las etapas independientes se ejecutan al mismo tiempo.
+        """
+        barrier = threading.Barrier(2, timeout=5)
+        scheduler = StageScheduler()
+        scheduler.add("current", lambda: barrier.wait())
+        scheduler.add("previous", lambda: barrier.wait())
+
+        # Si las etapas corrieran en serie, la barrera expiraría
+        scheduler.run()
+
+    def test_stage_name_is_available_to_logging(self):
+        """
+        Test que valida que cada etapa se ejecuta con su nombre como contexto de logging.
+        """
+        scheduler = StageScheduler()
+        scheduler.add("parse_current", lambda: current_stage.get())
+        scheduler.add("parse_previous", lambda: current_stage.get())
+
+        results = scheduler.run()
+
+        assert results == {"parse_current": "parse_current", "parse_previous": "parse_previous"}
+        assert current_stage.get() == "-"
+
+    def test_pipeline_error_is_propagated_and_dependents_skipped(self):
+        """
+        Test que valida que se relanza el error original y no se ejecutan etapas dependientes.
+        """
+        executed = []
+
+        def failing():
+            raise IngestionError("archivo inválido")
+
+        scheduler = StageScheduler()
+        scheduler.add("parse", failing)
+        scheduler.add("report", lambda parse: executed.append("report"), deps=("parse",))
+
+        with pytest.raises(IngestionError, match="archivo inválido"):
+            scheduler.run()
+        assert executed == []
+
+    def test_invalid_dependencies_raise_error(self):
+        """
+        Test que valida que se detectan dependencias inexistentes o circulares.
+        """
+        missing = StageScheduler().add("a", lambda x: x, deps=("x",))
+        with pytest.raises(PipelineError):
+            missing.run()
+
+        circular = StageScheduler()
+        circular.add("a", lambda b: b, deps=("b",))
+        circular.add("b", lambda a: a, deps=("a",))
+        with pytest.raises(PipelineError):
+            circular.run()
+
+    def test_preloaded_results_and_stage_subset(self):
+        """
+        Test que valida que las etapas con resultado recibido no se ejecutan y que solo se
+        ejecutan las etapas seleccionadas.
+        """
+        executed = []
+        completed = []
+
+        def stage(name, value):
+            def run(**deps):
+                executed.append(name)
+                return value + sum(deps.values())
+            return run
+
+        scheduler = StageScheduler()
+        scheduler.add("a", stage("a", 1))
+        scheduler.add("b", stage("b", 10), deps=("a",))
+        scheduler.add("c", stage("c", 100), deps=("b",))
+
+        results = scheduler.run(results={"a": 5}, only=("b",), on_complete=lambda name, result: completed.append(name))
+
+        assert executed == ["b"]
+        assert completed == ["b"]
+        assert results == {"a": 5, "b": 15}
+
+        with pytest.raises(PipelineError, match="necesita"):
+            StageScheduler().add("a", lambda: 1).add("b", lambda a: a, deps=("a",)).run(only=("b",))
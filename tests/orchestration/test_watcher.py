@@ -0,0 +1,104 @@
+# tests/orchestration/test_watcher.py
+
+import json
+import os
+import pytest
+
+from src.orchestration.watcher import RawFolderWatcher
+
+
+def _record_run(year, month):
+    """Función de pipeline de prueba: deja registro de la ejecución (en el proceso trabajador)."""
+    with open(os.environ["WATCH_TEST_LOG"], "a", encoding="utf-8") as f:
+        f.write(f"{year}-{month:02d}\n")
+
+
+def _failing_run(year, month):
+    raise ValueError(f"falló {year}-{month:02d}")
+
+
+class TestRawFolderWatcher:
+    """Tests para el modo watch sobre data/raw."""
+
+    @pytest.fixture
+    def workspace(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        raw = tmp_path / "data" / "raw"
+        raw.mkdir(parents=True)
+        monkeypatch.setenv("WATCH_TEST_LOG", str(tmp_path / "runs.log"))
+        return tmp_path
+
+    def _watcher(self, workspace, run_func=_record_run):
+        return RawFolderWatcher(
+            run_func,
+            raw_dir=workspace / "data" / "raw",
+            status_path=workspace / "data" / "watch_status.json",
+            debounce=10,
+        )
+
+    def test_file_is_ready_only_after_debounce(self, workspace):
+        """Test que un archivo se procesa solo después de no cambiar durante el debounce."""
+        watcher = self._watcher(workspace)
+        xls = workspace / "data" / "raw" / "202509.xls"
+        xls.write_bytes(b"parcial")
+
+        assert watcher.poll(now=0) == []
+        assert watcher.poll(now=5) == []
+
+        xls.write_bytes(b"parcial + resto")
+        assert watcher.poll(now=12) == []
+        assert watcher.status["pendientes"] == ["202509.xls"]
+
+        ready = watcher.poll(now=23)
+        assert [(year, month, name) for year, month, name, _ in ready] == [(2025, 9, "202509.xls")]
+
+    def test_ignores_other_files_and_up_to_date_periods(self, workspace):
+        """Test que se ignoran archivos con otro nombre y períodos ya consolidados."""
+        raw = workspace / "data" / "raw"
+        (raw / "notas.xls").write_bytes(b"x")
+        (raw / "202508.xls").write_bytes(b"x")
+        processed = workspace / "data" / "processed"
+        processed.mkdir(parents=True)
+        (processed / "202508.csv").write_text("Rut\n", encoding="utf-8")
+
+        watcher = self._watcher(workspace)
+        watcher.poll(now=0)
+
+        assert watcher.poll(now=100) == []
+        assert "202508.xls" in watcher.processed
+
+    def test_process_runs_in_worker_and_writes_status(self, workspace):
+        """Test que el período se ejecuta en el proceso trabajador y el estado queda publicado."""
+        (workspace / "data" / "raw" / "202509.xls").write_bytes(b"x")
+        watcher = self._watcher(workspace)
+        watcher.poll(now=0)
+        (ready,) = watcher.poll(now=20)
+
+        try:
+            assert watcher.process(*ready)
+        finally:
+            watcher.pool.shutdown()
+
+        assert (workspace / "runs.log").read_text(encoding="utf-8") == "2025-09\n"
+        status = json.loads((workspace / "data" / "watch_status.json").read_text(encoding="utf-8"))
+        assert status["ultima_ejecucion"]["resultado"] == "ok"
+        assert "202509.xls" in status["procesados"]
+        assert watcher.poll(now=40) == []
+
+    def test_failed_run_is_recorded_and_not_retried_until_file_changes(self, workspace):
+        """Test que un período fallido queda registrado y no se reintenta en cada revisión."""
+        (workspace / "data" / "raw" / "202509.xls").write_bytes(b"x")
+        watcher = self._watcher(workspace, run_func=_failing_run)
+        watcher.poll(now=0)
+        (ready,) = watcher.poll(now=20)
+
+        try:
+            assert not watcher.process(*ready)
+        finally:
+            watcher.pool.shutdown()
+
+        assert watcher.status["ultima_ejecucion"]["error"] == "falló 2025-09"
+        assert watcher.poll(now=40) == []
+
+        restarted = self._watcher(workspace)
+        assert restarted.poll(now=0) == []
@@ -0,0 +1 @@
+# tests/reporting/__init__.py
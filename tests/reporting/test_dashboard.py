@@ -0,0 +1,89 @@
+# tests/reporting/test_dashboard.py
+
+import json
+import pandas as pd
+import pytest
+
+import src.reporting.dashboard as dashboard_module
+from src.reporting.dashboard import build_dashboard_index, generate_dashboard
+from src.reporting.sinks import ReportSink, get_report_sinks, run_sinks
+from src.storage.history_store import upsert_period
+from src.utils.exceptions import ReportingError
+from src.utils.paths import get_dashboard_paths
+
+
+def _good(saldos, nombres=('UNO', 'DOS', 'TRES</script>', 'CUATRO')):
+    return pd.DataFrame({
+        'Rut': ['1-1', '2-2', '3-3', '4-4'],
+        'Debito': [0, 1000, 0, 0],
+        'Credito': [s + d for s, d in zip(saldos, [0, 1000, 0, 0])],
+        'Saldo': saldos,
+        'Cuotas': [s // 1000 for s in saldos],
+        'Nombre': list(nombres),
+    })
+
+
+class TestDashboard:
+    """Tests para el tablero HTML y el registro de salidas de reportes."""
+
+    @pytest.fixture
+    def workdir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_index_reads_totals_from_summary(self, workdir):
+        """Test que los totales y los tramos salen del resumen del historial, sin el tramo de saldo cero."""
+        upsert_period(2025, 8, _good([5000, 20000, 0, 80000]))
+        upsert_period(2025, 9, _good([6000, 25000, 0, 90000]))
+
+        index = build_dashboard_index(_good([6000, 25000, 0, 90000]), 2025, 9)
+
+        assert index['totales']['Periodo'] == [202508, 202509]
+        assert index['totales']['Socios'] == [3, 3]
+        assert index['totales']['Saldo'] == [105000, 121000]
+        assert index['tramos']['Socios'] == [1, 1, 1, 0]
+        assert index['socios']['Rut'] == ['4-4', '2-2', '3-3', '1-1']
+
+    def test_index_without_history_uses_good_file(self, workdir):
+        """Test que un período que aún no está en el resumen se calcula desde el archivo Bueno."""
+        upsert_period(2025, 8, _good([5000, 20000, 0, 80000]))
+
+        index = build_dashboard_index(_good([6000, 25000, 0, 90000]), 2025, 9)
+
+        assert index['totales']['Periodo'] == [202508, 202509]
+        assert index['totales']['Saldo'] == [105000, 121000]
+        assert index['tramos']['Saldo'] == [6000, 25000, 90000, 0]
+
+    def test_generate_dashboard_is_self_contained(self, workdir, monkeypatch):
+        """Test que el HTML incluye el índice (escapado) y que no vuelve a recorrer los socios para los totales."""
+        monkeypatch.setattr(dashboard_module, "DASHBOARD_MONTHS", 1)
+        generate_dashboard(_good([6000, 25000, 0, 90000]), 2025, 9)
+
+        html_path, index_path = get_dashboard_paths(2025, 9)
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        html = html_path.read_text(encoding="utf-8")
+        assert index['periodo'] == '2025-09'
+        assert index['socios']['Nombre'][2] == 'TRES</script>'
+        assert 'TRES<\\/script>' in html and html.count('</script>') == 2
+
+        with pytest.raises(ReportingError):
+            generate_dashboard(_good([1, 2, 3, 4]).drop(columns=['Cuotas']), 2025, 9)
+
+    def test_sinks_run_concurrently_and_report_errors(self, workdir):
+        """Test que las salidas se generan en paralelo y se relanza el error de la que falla."""
+        generated = []
+
+        def failing(df, year, month):
+            raise ReportingError("sin plantilla")
+
+        ok = ReportSink("ok", lambda df, year, month: generated.append((year, month)), lambda year, month: ())
+        timings = run_sinks(_good([1, 2, 3, 4]), 2025, 9, sinks=[ok])
+        assert generated == [(2025, 9)] and set(timings) == {"ok_report"}
+
+        with pytest.raises(ReportingError, match="sin plantilla"):
+            run_sinks(_good([1, 2, 3, 4]), 2025, 9, sinks=[ReportSink("malo", failing, lambda year, month: ()), ok])
+        assert len(generated) == 2
+
+        assert [sink.stage for sink in get_report_sinks(["word", "dashboard"])] == ["word_report", "dashboard_report"]
+        with pytest.raises(ReportingError):
+            get_report_sinks(["pdf"])
@@ -0,0 +1,126 @@
+# tests/reporting/test_member_statements.py
+
+import io
+import zipfile
+import pandas as pd
+import pytest
+from pathlib import Path
+from docx import Document
+
+from src.reporting import member_statements
+from src.reporting.member_statements import StatementTemplate, generate_member_statements
+from src.utils.paths import get_statement_work_dir, get_statements_path
+
+
+def _write_month(month, rows, diffs):
+    processed = Path("data/processed")
+    diff_dir = Path("data/diffs")
+    processed.mkdir(parents=True, exist_ok=True)
+    diff_dir.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(rows, columns=['Rut', 'Debito', 'Credito', 'Saldo', 'Cuotas', 'Nombre']).to_csv(
+        processed / f"2025{month:02d}.csv", index=False
+    )
+    pd.DataFrame(diffs, columns=['Nombre', 'Rut', 'diff_debito', 'diff_credito', 'diff_saldo']).to_csv(
+        diff_dir / f"2025{month:02d}.csv", index=False
+    )
+
+
+def _document_text(data):
+    document = Document(io.BytesIO(data))
+    cells = [cell.text for table in document.tables for row in table.rows for cell in row.cells]
+    return "\n".join([p.text for p in document.paragraphs] + cells)
+
+
+class TestMemberStatements:
+    """Tests para la generación de cartolas por socio."""
+
+    @pytest.fixture
+    def workspace(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        _write_month(1, [
+            ['1-1', 0, 5000, 5000, 5, 'PEREZ JUAN'],
+            ['2-K', 0, 2000, 2000, 2, 'SOTO & ANA'],
+        ], [
+            ['PEREZ JUAN', '1-1', 0, 5000, 5000],
+            ['SOTO & ANA', '2-k', 0, 2000, 2000],
+        ])
+        _write_month(2, [
+            ['1-1', 1000, 8000, 7000, 7, 'PEREZ JUAN'],
+            ['2-K', 0, 2000, 2000, 2, 'SOTO & ANA'],
+            ['3-3', 0, 4000, 4000, 4, 'ROJAS LUIS'],
+        ], [
+            ['PEREZ JUAN', '1-1', 1000, 3000, 2000],
+            ['ROJAS LUIS', '3-3', 0, 4000, 4000],
+        ])
+        return tmp_path
+
+    def test_template_renders_valid_docx(self):
+        """Test que la plantilla genera un .docx válido con una fila por mes y el texto escapado."""
+        template = StatementTemplate.build()
+        values = {
+            'NOMBRE': 'SOTO & ANA', 'RUT': '2-K', 'PERIODO': 'Enero 2025', 'DEBITOS': '$0',
+            'CREDITOS': '$2.000', 'SALDO': '$2.000', 'CUOTAS': '2',
+        }
+        rows = [{'MES': mes, 'DEBITO': '$0', 'CREDITO': '$1.000', 'SALDO_MES': '$1.000'} for mes in ('Enero', 'Febrero')]
+
+        document = Document(io.BytesIO(template.render(values, rows)))
+
+        assert "Socio: SOTO & ANA" in [p.text for p in document.paragraphs]
+        assert [row.cells[0].text for row in document.tables[0].rows] == ['Mes', 'Enero', 'Febrero', 'Total']
+
+    def test_generates_one_statement_per_member(self, workspace):
+        """Test que el zip tiene una cartola por socio con los movimientos de cada mes."""
+        output_path = generate_member_statements(2025, 2, max_workers=1, chunk_size=2)
+
+        with zipfile.ZipFile(output_path) as archive:
+            assert sorted(archive.namelist()) == ['1-1.docx', '2-K.docx', '3-3.docx']
+            text = _document_text(archive.read('1-1.docx'))
+            soto = _document_text(archive.read('2-K.docx'))
+
+        assert "Período: Enero a Febrero 2025" in text
+        assert "Febrero\n$1.000\n$3.000\n$7.000" in text
+        assert "Total\n$1.000\n$8.000\n$7.000" in text
+        assert "Febrero\n$0\n$0\n$2.000" in soto
+        assert not get_statement_work_dir(2025, 2).exists()
+
+    def test_resumes_from_pending_chunks(self, workspace, monkeypatch):
+        """Test que una generación interrumpida reutiliza los bloques ya guardados."""
+        merge_chunks = member_statements._merge_chunks
+
+        def interrupted(chunk_paths, output_path):
+            raise RuntimeError("interrumpido")
+
+        monkeypatch.setattr(member_statements, "_merge_chunks", interrupted)
+        with pytest.raises(RuntimeError):
+            generate_member_statements(2025, 2, max_workers=1, chunk_size=2)
+
+        work_dir = get_statement_work_dir(2025, 2)
+        (work_dir / "bloque_00000.zip").unlink()
+        kept = work_dir / "bloque_00001.zip"
+        kept_mtime = kept.stat().st_mtime_ns
+        merged = []
+
+        def check_and_merge(chunk_paths, output_path):
+            merged.append(kept.stat().st_mtime_ns)
+            merge_chunks(chunk_paths, output_path)
+
+        monkeypatch.setattr(member_statements, "_merge_chunks", check_and_merge)
+        generate_member_statements(2025, 2, max_workers=1, chunk_size=2)
+
+        assert merged == [kept_mtime]
+        with zipfile.ZipFile(get_statements_path(2025, 2)) as archive:
+            assert sorted(archive.namelist()) == ['1-1.docx', '2-K.docx', '3-3.docx']
+        assert not work_dir.exists()
+
+    def test_discards_chunks_of_other_data(self, workspace):
+        """Test que los bloques de una generación con otros datos no se reutilizan."""
+        work_dir = get_statement_work_dir(2025, 2)
+        work_dir.mkdir(parents=True)
+        (work_dir / "firma.json").write_text('{"periodo": "202502"}', encoding="utf-8")
+        with zipfile.ZipFile(work_dir / "bloque_00000.zip", "w") as stale:
+            stale.writestr("9-9.docx", b"")
+
+        generate_member_statements(2025, 2, max_workers=1, chunk_size=2)
+
+        with zipfile.ZipFile(get_statements_path(2025, 2)) as archive:
+            assert "9-9.docx" not in archive.namelist()
@@ -0,0 +1,63 @@
+# tests/reporting/test_perf_report.py
+
+import pytest
+
+from src.reporting.perf_report import TOTAL, check_run, generate_perf_report
+from src.storage.perf_history import query_runs, record_run
+from src.utils.exceptions import ReportingError
+
+
+class TestPerfReport:
+    """Tests para el historial de rendimiento y la detección de regresiones."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return tmp_path / "perf_history.sqlite"
+
+    def _record(self, db_path, diffs, total=None, **kwargs):
+        timings = {"parse_current": 2.0, "diffs": diffs}
+        return record_run(2025, 9, timings, total or diffs + 3, db_path=db_path, **kwargs)
+
+    def test_runs_are_recorded_with_sizes(self, db_path):
+        """Test que cada ejecución guarda sus tiempos, memoria y tamaño de entradas."""
+        self._record(db_path, 4.0, peak_mb=512.5, members=1200, input_bytes=10_000)
+        self._record(db_path, 4.1, status="error")
+
+        runs = query_runs(db_path=db_path)
+        assert runs['Ejecucion'].tolist() == [1, 2]
+        assert runs.loc[0, 'Pico_mb'] == 512.5 and runs.loc[0, 'Socios'] == 1200
+        assert runs['Estado'].tolist() == ['ok', 'error']
+        assert query_runs(last=1, db_path=db_path)['Ejecucion'].tolist() == [2]
+
+    def test_regression_against_rolling_median(self, db_path):
+        """Test que se marca la etapa que supera la mediana de las ejecuciones correctas anteriores."""
+        for diffs in (4.0, 4.2, 3.9, 4.1):
+            self._record(db_path, diffs)
+        # Una ejecución fallida no entra en la línea base, y una parcial no aporta total
+        self._record(db_path, 9.0, status="error")
+        self._record(db_path, 4.0, total=1.0, complete=False)
+        slow = self._record(db_path, 6.0)
+
+        report = generate_perf_report(window=5, threshold=0.25, min_seconds=1, db_path=db_path)
+
+        regressions = report.regressions
+        assert regressions['Etapa'].tolist() == ['diffs', 'diffs', TOTAL]
+        assert regressions['Ejecucion'].tolist() == [5, slow, slow]
+        assert regressions['Base'].tolist()[1:] == [4.0, 7.05]
+        assert report.latest_regressed
+        assert report.trend.index[-1] == TOTAL and report.trend.columns[-1] == f"#{slow} 2025-09"
+        assert check_run(slow, db_path=db_path)['Etapa'].tolist() == ['diffs', TOTAL]
+
+    def test_fast_stages_and_short_history_are_not_flagged(self, db_path):
+        """Test que no se marca sin línea base suficiente ni en etapas por debajo del mínimo."""
+        self._record(db_path, 0.1)
+        self._record(db_path, 0.1)
+        self._record(db_path, 5.0)
+        assert generate_perf_report(db_path=db_path).regressions.empty
+
+        self._record(db_path, 0.4)
+        report = generate_perf_report(min_seconds=1, db_path=db_path)
+        assert report.regressions.empty and not report.latest_regressed
+
+        with pytest.raises(ReportingError):
+            generate_perf_report(db_path=db_path.with_name("vacia.sqlite"))
@@ -0,0 +1,59 @@
+# tests/reporting/test_trend_report.py
+
+import pandas as pd
+import pytest
+
+from src.reporting.trend_report import build_annual, build_trend
+from src.utils.exceptions import ReportingError
+
+
+def _summary():
+    """Resumen materializado de tres períodos (diciembre 2024, enero y febrero 2025)."""
+    return pd.DataFrame(
+        [
+            [202412, 0, 'A', 'SOC', 3, 900, 900, 0, 0],
+            [202412, 1, 'A', 'SOC', 2, 0, 15000, 15000, 15],
+            [202412, 4, 'B', 'EMP', 1, 0, 200000, 200000, 200],
+            [202501, 1, 'A', 'SOC', 2, 0, 16000, 16000, 16],
+            [202501, 4, 'B', 'EMP', 1, 0, 210000, 210000, 210],
+            [202502, 1, 'A', 'SOC', 1, 0, 9000, 9000, 9],
+            [202502, 3, '', 'SOC', 1, 0, 60000, 60000, 60],
+            [202502, 4, 'B', 'EMP', 1, 0, 210000, 210000, 210],
+        ],
+        columns=['Periodo', 'Tramo', 'Categoria', 'Tipo', 'Socios', 'Debito', 'Credito', 'Saldo', 'Cuotas'],
+    )
+
+
+class TestTrendReport:
+    """Tests para los reportes de tendencia y anual desde el resumen materializado."""
+
+    def test_trend_totals_exclude_zero_balance(self):
+        """Test que la tendencia total omite el tramo de saldo cero y calcula la variación."""
+        trend = build_trend(_summary())
+
+        assert trend['Socios'].tolist() == [3, 3, 3]
+        assert trend['Saldo'].tolist() == [215000, 226000, 279000]
+        assert trend['Var_Saldo'].tolist() == [0, 11000, 53000]
+
+    def test_trend_by_tramo_is_ordered_by_tramo(self):
+        """Test que el desglose por tramo se ordena por tramo y muestra su rango."""
+        trend = build_trend(_summary(), 'Tramo')
+        february = trend[trend['Periodo'] == 202502]
+
+        assert february['Tramo'].tolist() == ['0 - 10.000', '50.001 - 100.000', '100.001 o superior']
+        assert trend.loc[trend['Tramo'] == '0 - 10.000', 'Var_Saldo'].tolist() == [0, 1000, -7000]
+
+    def test_annual_compares_closings(self):
+        """Test que el reporte anual compara el último período de cada año."""
+        annual = build_annual(_summary(), 2025, 'Categoria').set_index('Categoria')
+
+        assert annual.loc['Sin categoría', 'Saldo_anterior'] == 0
+        assert annual.loc['Sin categoría', 'Saldo_actual'] == 60000
+        assert annual.loc['A', 'Var_Socios'] == -1
+        assert annual.loc['B', 'Var_Saldo_%'] == 5.0
+        assert build_annual(_summary(), 2025)['Var_Saldo'].tolist() == [64000]
+
+    def test_annual_requires_periods_of_the_year(self):
+        """Test que el reporte anual falla si el año no tiene períodos."""
+        with pytest.raises(ReportingError):
+            build_annual(_summary(), 2026)
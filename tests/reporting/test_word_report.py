@@ -0,0 +1,42 @@
+# tests/reporting/test_word_report.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.reporting.word_report import generate_word_report
+from src.utils import contracts
+from src.utils.exceptions import ReportingError
+
+
+def _good(n=50):
+    saldo = np.arange(1, n + 1) * 3000.0
+    return pd.DataFrame({
+        'Rut': [f"{i}-K" for i in range(n)],
+        'Debito': 0.0,
+        'Credito': saldo,
+        'Saldo': saldo,
+        'Cuotas': np.trunc(saldo / 1000),
+        'Nombre': 'SOCIO',
+    })
+
+
+class TestWordReport:
+    """Tests para el reporte Word de capital pagado."""
+
+    def test_report_is_written(self, tmp_path):
+        """Test que un archivo Bueno consistente genera el documento."""
+        output_path = tmp_path / "202509reporte.docx"
+        generate_word_report(_good(), output_path)
+        assert output_path.stat().st_size > 0
+
+    def test_every_row_is_validated(self, tmp_path, monkeypatch):
+        """Test que un socio inconsistente fuera de la muestra del modo "fast" detiene el reporte."""
+        monkeypatch.setattr(contracts, "VALIDATION_MODE", "fast")
+        monkeypatch.setattr(contracts, "VALIDATION_SAMPLE_ROWS", 5)
+        df = _good()
+        df.loc[1, 'Saldo'] += 1000
+
+        with pytest.raises(ReportingError, match="saldo_distinto_de_movimientos"):
+            generate_word_report(df, tmp_path / "202509reporte.docx")
+        assert not (tmp_path / "202509reporte.docx").exists()
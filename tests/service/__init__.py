@@ -0,0 +1 @@
+# tests/service/__init__.py
@@ -0,0 +1,136 @@
+# tests/service/test_http_service.py
+
+import json
+import threading
+import time
+import pytest
+import urllib.error
+import urllib.request
+
+from src.service.http_service import Job, JobManager, ReportService
+from src.utils.paths import get_report_paths
+
+
+def _fake_run_month(year, month):
+    """Pipeline de prueba: genera reportes vacíos y demora lo suficiente para deduplicar."""
+    time.sleep(0.5)
+    for path in get_report_paths(year, month):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(f"reporte {year}-{month:02d} {path.suffix}".encode("utf-8"))
+    return {"convert": 0.1, "consolidate": 0.2}
+
+
+class TestHttpService:
+    """Tests para el servicio HTTP local."""
+
+    @pytest.fixture
+    def base_url(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = JobManager(_fake_run_month, max_workers=1)
+        server = ReportService(manager, host="127.0.0.1", port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+        manager.shutdown()
+
+    def _request(self, url, method="GET", data=None):
+        request = urllib.request.Request(url, method=method, data=data)
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, response.read()
+
+    def _wait(self, base_url, job_id):
+        for _ in range(100):
+            _, body = self._request(f"{base_url}/jobs/{job_id}")
+            job = json.loads(body)
+            if job["estado"] not in ("en_cola", "procesando"):
+                return job
+            time.sleep(0.1)
+        raise AssertionError("El trabajo no terminó")
+
+    def test_same_period_is_deduplicated(self, base_url):
+        """Test que dos solicitudes para el mismo período comparten el trabajo."""
+        status_1, body_1 = self._request(f"{base_url}/jobs?periodo=2025-09", method="POST")
+        status_2, body_2 = self._request(f"{base_url}/jobs?periodo=2025-09", method="POST")
+
+        assert status_1 == 202
+        assert status_2 == 200
+        assert json.loads(body_1)["id"] == json.loads(body_2)["id"]
+
+    def test_month_run_is_not_deduplicated_into_report_job(self, tmp_path, monkeypatch):
+        """Test que una ejecución del mes no se confunde con una regeneración de reportes en curso."""
+        monkeypatch.chdir(tmp_path)
+        manager = JobManager(_fake_run_month, max_workers=1)
+        try:
+            reports = Job(id="reportes", year=2025, month=9, tipo="reportes", estado="procesando")
+            manager.jobs[reports.id] = reports
+
+            job, created = manager.submit(2025, 9, tipo="mes")
+            assert created and job.id != reports.id
+            assert manager.submit(2025, 9, tipo="reportes") == (reports, False)
+            assert manager.submit(2025, 9, tipo="mes") == (job, False)
+        finally:
+            reports.estado = "ok"
+            manager.shutdown()
+
+    def test_jobs_of_a_period_wait_for_each_other(self, tmp_path, monkeypatch):
+        """Test que una regeneración de reportes espera al trabajo en curso de su período."""
+        monkeypatch.chdir(tmp_path)
+        manager = JobManager(_fake_run_month, max_workers=1)
+        try:
+            with manager._period_lock(2025, 9):
+                job, _ = manager.submit(2025, 9, tipo="reportes")
+                other, _ = manager.submit(2025, 10, tipo="reportes")
+                for _ in range(100):
+                    if not other.activo:
+                        break
+                    time.sleep(0.05)
+                assert not other.activo
+                assert job.estado == "en_cola"
+            for _ in range(100):
+                if not job.activo:
+                    break
+                time.sleep(0.05)
+            assert not job.activo
+        finally:
+            manager.shutdown()
+
+    def test_broken_pool_is_replaced_once(self):
+        """Test que varios trabajos de un pool roto lo reemplazan una sola vez y lo cierran."""
+        manager = JobManager(_fake_run_month, max_workers=1)
+        broken = manager.pool
+        try:
+            manager._replace_pool(broken)
+            replacement = manager.pool
+            manager._replace_pool(broken)
+
+            assert replacement is not broken and manager.pool is replacement
+            with pytest.raises(RuntimeError):
+                broken.submit(time.sleep, 0)
+        finally:
+            manager.shutdown()
+
+    def test_job_streams_reports_and_manifest(self, base_url, tmp_path):
+        """Test que al terminar se descargan los reportes y el manifiesto de la ejecución."""
+        _, body = self._request(f"{base_url}/jobs?periodo=2025-09", method="POST", data=b"contenido xls")
+        job = self._wait(base_url, json.loads(body)["id"])
+
+        assert job["estado"] == "ok"
+        assert (tmp_path / "data" / "raw" / "202509.xls").read_bytes() == b"contenido xls"
+
+        _, excel = self._request(f"{base_url}/jobs/{job['id']}/excel")
+        assert excel == b"reporte 2025-09 .xlsx"
+
+        _, manifest = self._request(f"{base_url}/jobs/{job['id']}/manifest")
+        manifest = json.loads(manifest)
+        assert manifest["etapas"] == {"convert": 0.1, "consolidate": 0.2}
+        assert manifest["artefactos"]["word"]["bytes"] == len(b"reporte 2025-09 .docx")
+        assert manifest["artefactos"]["bueno"] is None
+        assert (tmp_path / "data" / "runs" / "202509.json").exists()
+
+    def test_invalid_period_is_rejected(self, base_url):
+        """Test que un período mal formado responde 400."""
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            self._request(f"{base_url}/jobs?periodo=2025-13", method="POST")
+        assert exc_info.value.code == 400
@@ -0,0 +1 @@
+# tests/storage/__init__.py
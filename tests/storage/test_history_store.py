@@ -0,0 +1,149 @@
+# tests/storage/test_history_store.py
+
+import sqlite3
+import pytest
+import pandas as pd
+
+from src.reporting.word_report import _calculate_tramo_statistics
+from src.storage.history_store import (
+    connect,
+    load_processed_history,
+    query_member_history,
+    query_summary,
+    update_members,
+    upsert_period,
+)
+
+
+class TestHistoryStore:
+    """Tests para el historial local de socios."""
+
+    @pytest.fixture
+    def processed_dir(self, tmp_path):
+        """Directorio con tres archivos Bueno consecutivos."""
+        processed = tmp_path / "processed"
+        processed.mkdir()
+        for month, saldo in [(7, 10000), (8, 12000), (9, 15000)]:
+            pd.DataFrame({
+                'Rut': ['11111111-K', '22222222-2'],
+                'Debito': [0, 1000],
+                'Credito': [saldo, 51000],
+                'Saldo': [saldo, 50000],
+                'Cuotas': [saldo // 1000, 50],
+                'Nombre': ['Socio Uno', 'Socio Dos'],
+            }).to_csv(processed / f"2025{month:02d}.csv", index=False)
+        return processed
+
+    @pytest.fixture
+    def db_path(self, tmp_path, processed_dir):
+        db_path = tmp_path / "history.sqlite"
+        load_processed_history(processed_dir, db_path=db_path)
+        return db_path
+
+    def test_load_processed_history_loads_all_periods(self, db_path):
+        """
+        Test que valida que se cargan todos los períodos consolidados.
+        """
+        conn = sqlite3.connect(db_path)
+        count = conn.execute("SELECT COUNT(*) FROM socios_mensual").fetchone()[0]
+        conn.close()
+        assert count == 6
+
+    def test_query_member_history_normalizes_rut(self, db_path):
+        """
+        Test que valida que la consulta normaliza el Rut y devuelve el historial ordenado.
+        """
+        history = query_member_history(" 11111111-k ", db_path=db_path)
+        assert history['Periodo'].tolist() == [202507, 202508, 202509]
+        assert history['Saldo'].tolist() == [10000, 12000, 15000]
+        assert list(history.columns) == ['Periodo', 'Rut', 'Nombre', 'Debito', 'Credito', 'Saldo', 'Cuotas']
+
+    def test_query_member_history_limits_months(self, db_path):
+        """
+        Test que valida que se pueden pedir solo los períodos más recientes.
+        """
+        history = query_member_history("11111111-K", months=2, db_path=db_path)
+        assert history['Periodo'].tolist() == [202508, 202509]
+
+    def test_upsert_period_replaces_existing_rows(self, db_path):
+        """
+        Test que valida que volver a registrar un período reemplaza sus filas.
+        """
+        df = pd.DataFrame({
+            'Rut': ['11111111-K'], 'Debito': [0.0], 'Credito': [20000.0],
+            'Saldo': [20000.0], 'Cuotas': [20], 'Nombre': ['Socio Uno'],
+        })
+        upsert_period(2025, 9, df, db_path=db_path)
+
+        assert query_member_history("22222222-2", db_path=db_path)['Periodo'].tolist() == [202507, 202508]
+        assert query_member_history("11111111-K", db_path=db_path)['Saldo'].tolist() == [10000, 12000, 20000]
+
+    def test_update_members_replaces_only_given_ruts(self, db_path):
+        """
+        Test que valida que update_members reemplaza solo los socios indicados del período.
+        """
+        corrected = pd.DataFrame({
+            'Rut': ['11111111-k '], 'Debito': [0], 'Credito': [16000], 'Saldo': [16000],
+            'Cuotas': [16], 'Nombre': ['Socio Uno'],
+        })
+
+        update_members(2025, 9, corrected, ['11111111-K', '33333333-3'], db_path=db_path)
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("SELECT rut, saldo FROM socios_mensual WHERE periodo = 202509 ORDER BY rut").fetchall()
+        conn.close()
+        assert rows == [('11111111-K', 16000), ('22222222-2', 50000)]
+
+    def test_summary_matches_tramo_statistics(self, db_path):
+        """
+        Test que valida que el resumen materializado cuadra con los tramos del reporte Word y
+        conserva la clasificación al actualizar socios.
+        """
+        good = pd.DataFrame({
+            'Rut': ['1-1', '2-2', '3-3', '4-4', '5-5'], 'Debito': [0, 0, 500, 100, 0],
+            'Credito': [8000, 30000, 500, 80100, 150000], 'Saldo': [8000, 30000, 0, 80000, 150000],
+            'Cuotas': [8, 30, 0, 80, 150], 'Nombre': ['A', 'B', 'C', 'D', 'E'],
+        })
+        classification = pd.DataFrame({
+            'rut': ['1-1', '2-2', '3-3', '4-4', '5-5'],
+            'tipo': ['SOC', 'SOC', 'SOC', 'EMP', 'SOC'],
+            'categoria': ['A', 'B', 'A', 'A', 'B'],
+        })
+        upsert_period(2025, 10, good, db_path=db_path, classification=classification)
+
+        summary = query_summary(202510, 202510, db_path=db_path)
+        cred, deb, sald = _calculate_tramo_statistics(good)
+        by_tramo = summary.groupby('Tramo')[['Socios', 'Debito', 'Credito', 'Saldo']].sum()
+        for tramo in ('1', '2', '3', '4'):
+            row = by_tramo.loc[int(tramo)]
+            assert [row['Credito'], row['Debito'], row['Saldo'], row['Socios']] == [cred[tramo], deb[tramo], *sald[tramo]]
+        assert by_tramo.loc[0, 'Socios'] == 1
+        assert summary.groupby('Tipo')['Socios'].sum().to_dict() == {'EMP': 1, 'SOC': 4}
+
+        update_members(2025, 10, good.assign(Saldo=[8000, 30000, 0, 80000, 5000]), ['5-5'], db_path=db_path)
+
+        summary = query_summary(202510, 202510, db_path=db_path)
+        moved = summary[summary['Tramo'] == 1]
+        assert moved.set_index('Categoria')['Socios'].to_dict() == {'A': 1, 'B': 1}
+        assert summary['Tramo'].max() == 3
+
+    def test_connect_migrates_previous_schema(self, tmp_path):
+        """
+        Test que valida que una base anterior recibe las columnas de clasificación y el resumen
+        de los períodos ya cargados.
+        """
+        db_path = tmp_path / "old.sqlite"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE socios_mensual (periodo INTEGER NOT NULL, rut TEXT NOT NULL, nombre TEXT, "
+            "debito INTEGER NOT NULL, credito INTEGER NOT NULL, saldo INTEGER NOT NULL, "
+            "cuotas INTEGER NOT NULL, PRIMARY KEY (rut, periodo)) WITHOUT ROWID"
+        )
+        conn.execute("INSERT INTO socios_mensual VALUES (202509, '1-1', 'A', 0, 7000, 7000, 7)")
+        conn.commit()
+        conn.close()
+
+        connect(db_path).close()
+
+        summary = query_summary(db_path=db_path)
+        assert summary[['Periodo', 'Tramo', 'Categoria', 'Tipo', 'Saldo']].values.tolist() == [[202509, 1, '', '', 7000]]
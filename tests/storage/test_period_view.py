@@ -0,0 +1,93 @@
+# tests/storage/test_period_view.py
+
+import os
+import pytest
+import pandas as pd
+
+from src.reporting.word_report import _calculate_tramo_statistics
+from src.storage.history_store import upsert_period
+from src.storage.period_view import FrameCache, PeriodView, iter_periods
+from src.utils.artifacts import write_csv
+from src.utils.paths import get_diff_csv_path, get_history_db_path, get_processed_csv_path
+
+
+def _good(saldos):
+    return pd.DataFrame({
+        'Rut': ['1-1', '2-2', '3-3', '4-4', '5-5'],
+        'Debito': [0, 1000, 0, 2000, 0],
+        'Credito': [s + d for s, d in zip(saldos, [0, 1000, 0, 2000, 0])],
+        'Saldo': saldos,
+        'Cuotas': [s // 1000 for s in saldos],
+        'Nombre': ['UNO', 'DOS', 'TRES', 'CUATRO', 'CINCO'],
+    })
+
+
+class TestPeriodView:
+    """Tests para la vista perezosa de períodos y su caché compartido."""
+
+    @pytest.fixture
+    def workdir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        for month, saldos in [(7, [5000, 20000, 0, 80000, 500000]), (8, [6000, 25000, 0, 90000, 510000])]:
+            write_csv(_good(saldos), get_processed_csv_path(2025, month), index=False)
+        write_csv(pd.DataFrame({
+            'Nombre': ['UNO'], 'Rut': ['1-1'], 'diff_debito': [0], 'diff_credito': [1000], 'diff_saldo': [1000],
+        }), get_diff_csv_path(2025, 8), index=False)
+        return tmp_path
+
+    def test_properties_load_lazily_and_are_cached(self, workdir):
+        """Test que cada propiedad se lee una vez y las demás vistas la sirven desde el caché."""
+        cache = FrameCache(10 * 1024 * 1024)
+        view = PeriodView(2025, 8, cache=cache)
+        assert len(cache) == 0
+
+        processed = view.processed
+        assert processed['Saldo'].tolist() == [6000, 25000, 0, 90000, 510000]
+        assert view.diffs['diff_saldo'].tolist() == [1000]
+        assert view.original is None
+        assert PeriodView(2025, 9, cache=cache).processed is None
+
+        processed['Saldo'] = 0
+        again = PeriodView(2025, 8, cache=cache).processed
+        assert again['Saldo'].tolist() == [6000, 25000, 0, 90000, 510000]
+        assert cache.hits == 1
+
+    def test_rewritten_file_is_reloaded(self, workdir):
+        """Test que un archivo reescrito no se sirve desde el caché."""
+        cache = FrameCache(10 * 1024 * 1024)
+        assert PeriodView(2025, 8, cache=cache).processed['Saldo'].iloc[0] == 6000
+
+        path = get_processed_csv_path(2025, 8)
+        write_csv(_good([7000, 25000, 0, 90000, 510000]), path, index=False)
+        os.utime(path, ns=(0, 0))
+
+        assert PeriodView(2025, 8, cache=cache).processed['Saldo'].iloc[0] == 7000
+
+    def test_cache_is_bounded_by_memory(self, workdir):
+        """Test que el caché descarta los períodos usados hace más tiempo al superar su tamaño."""
+        size = int(PeriodView(2025, 7, cache=FrameCache(1 << 20)).processed.memory_usage(deep=True).sum())
+        cache = FrameCache(size + size // 2)
+
+        for view in iter_periods((2025, 7), (2025, 8), cache=cache):
+            view.processed
+        assert len(cache) == 1
+        assert cache.size <= cache.max_bytes
+
+        PeriodView(2025, 8, cache=cache).processed
+        assert cache.hits == 1
+        assert FrameCache(size // 2).get_or_load('grande', lambda: _good([1, 2, 3, 4, 5])) is not None
+
+    def test_tramo_stats_match_word_report(self, workdir):
+        """Test que las estadísticas por tramo coinciden con el informe Word, con y sin historial."""
+        cred, deb, sald = _calculate_tramo_statistics(_good([6000, 25000, 0, 90000, 510000]))
+
+        computed = PeriodView(2025, 8, cache=FrameCache(1 << 20)).tramo_stats
+        upsert_period(2025, 8, _good([6000, 25000, 0, 90000, 510000]))
+        assert get_history_db_path().exists()
+        from_summary = PeriodView(2025, 8, cache=FrameCache(1 << 20)).tramo_stats
+
+        pd.testing.assert_frame_equal(computed, from_summary)
+        stats = computed.set_index('Tramo')
+        for tramo in ('1', '2', '3', '4'):
+            row = stats.loc[int(tramo)]
+            assert [row['Credito'], row['Debito'], row['Saldo'], row['Socios']] == [cred[tramo], deb[tramo], *sald[tramo]]
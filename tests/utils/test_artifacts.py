@@ -0,0 +1,133 @@
+# tests/utils/test_artifacts.py
+
+import pytest
+import pandas as pd
+
+from src.utils import artifacts
+from src.utils.artifacts import (
+    artifact_buffer,
+    artifact_exists,
+    list_artifacts,
+    manifest_path,
+    read_bytes,
+    resolve_artifact,
+    write_bytes,
+    write_csv,
+    write_csv_chunks,
+)
+from src.utils.csv_io import read_processed
+from src.utils.exceptions import StorageError
+
+
+COMPRESSIONS = ["none", "gzip"] + (["zstd"] if artifacts.zstandard is not None else [])
+
+
+class TestArtifacts:
+    """Tests para la escritura atómica y verificada de artefactos."""
+
+    @pytest.mark.parametrize("compression", COMPRESSIONS)
+    def test_round_trip(self, tmp_path, compression):
+        """Test que el contenido se recupera igual con cada compresión."""
+        path = tmp_path / "diffs" / "202509.csv"
+        stored = write_bytes(path, b"a,b\n1,2\n", compression=compression)
+
+        assert artifact_exists(path)
+        assert resolve_artifact(path) == stored
+        assert manifest_path(stored).exists()
+        assert read_bytes(path) == b"a,b\n1,2\n"
+        with artifact_buffer(path) as buffer:
+            assert bytes(buffer) == b"a,b\n1,2\n"
+
+    def test_empty_file_gives_empty_buffer(self, tmp_path):
+        """Test que un artefacto vacío (que no se puede mapear en memoria) entrega un buffer vacío."""
+        path = tmp_path / "202509.csv"
+        write_bytes(path, b"", compression="none")
+        with artifact_buffer(path) as buffer:
+            assert bytes(buffer) == b""
+
+        legacy = tmp_path / "202510.csv"
+        legacy.touch()
+        with artifact_buffer(legacy) as buffer:
+            assert bytes(buffer) == b""
+
+    def test_rewrite_removes_other_variants(self, tmp_path):
+        """Test que reescribir con otra compresión elimina la versión anterior."""
+        path = tmp_path / "202509.csv"
+        write_bytes(path, b"viejo\n", compression="none")
+        write_bytes(path, b"nuevo\n", compression="gzip")
+
+        assert not path.exists()
+        assert not manifest_path(path).exists()
+        assert list_artifacts(tmp_path) == [path]
+        assert read_bytes(path) == b"nuevo\n"
+
+    def test_truncated_artifact_is_rejected(self, tmp_path):
+        """Test que un archivo truncado después de escrito no se consume."""
+        path = tmp_path / "202509.csv"
+        write_bytes(path, b"Rut,Saldo\n1-9,1000\n2-7,2000\n")
+        path.write_bytes(b"Rut,Saldo\n1-9,1000\n")
+
+        with pytest.raises(StorageError):
+            read_bytes(path)
+        with pytest.raises(StorageError):
+            read_processed(path)
+
+    def test_files_without_manifest_are_accepted(self, tmp_path):
+        """Test que los archivos anteriores al manifiesto se leen sin verificar."""
+        path = tmp_path / "202508.csv"
+        path.write_bytes(b"x\n")
+
+        assert read_bytes(path) == b"x\n"
+
+    def test_failed_write_keeps_previous_file(self, tmp_path, monkeypatch):
+        """Test que una escritura interrumpida no deja un archivo truncado con el nombre final."""
+        path = tmp_path / "202509.csv"
+        write_bytes(path, b"completo\n")
+
+        def failing_replace(src, dst):
+            raise OSError("disco lleno")
+
+        monkeypatch.setattr(artifacts.os, "replace", failing_replace)
+        with pytest.raises(StorageError):
+            write_bytes(path, b"parcial\n")
+
+        assert read_bytes(path) == b"completo\n"
+        assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+    @pytest.mark.parametrize("writer", [write_bytes, lambda path, data: artifacts.write_stream(path, [data])])
+    def test_interrupted_manifest_does_not_reject_new_data(self, tmp_path, monkeypatch, writer):
+        """Test que un corte entre el renombrado y el manifiesto nuevo no deja el manifiesto anterior."""
+        path = tmp_path / "202509.csv"
+        write_bytes(path, b"anterior\n", compression="none")
+
+        def interrupted(*args):
+            raise OSError("corte de energía")
+
+        monkeypatch.setattr(artifacts, "_finish", interrupted)
+        with pytest.raises(StorageError):
+            writer(path, b"nuevo\n")
+
+        assert not manifest_path(path).exists()
+        assert read_bytes(path) == b"nuevo\n"
+
+    def test_write_csv_is_read_back_by_csv_layer(self, tmp_path):
+        """Test que un DataFrame escrito comprimido se lee con la capa CSV."""
+        path = tmp_path / "202509.csv"
+        df = pd.DataFrame({'Rut': ['1-9'], 'Debito': [0], 'Credito': [1000], 'Saldo': [1000],
+                           'Cuotas': [1], 'Nombre': ['Uno']})
+        write_csv(df, path, compression="gzip", index=False)
+
+        result = read_processed(path)
+
+        assert result['Saldo'].tolist() == [1000.0]
+        assert result['Rut'].tolist() == ['1-9']
+
+    @pytest.mark.parametrize("compression", COMPRESSIONS)
+    def test_write_csv_chunks_matches_write_csv(self, tmp_path, compression):
+        """Test que el CSV escrito por bloques tiene el mismo contenido que el escrito de una vez."""
+        df = pd.DataFrame({"Rut": ["1-1", "2-2", "3-3"], "Saldo": [100.0, 250.5, 0.0]})
+        write_csv(df, tmp_path / "una.csv", compression=compression, index=False)
+        stored = write_csv_chunks([df.iloc[:2], df.iloc[2:]], tmp_path / "bloques.csv", compression=compression, index=False)
+
+        assert manifest_path(stored).exists()
+        assert read_bytes(tmp_path / "bloques.csv") == read_bytes(tmp_path / "una.csv")
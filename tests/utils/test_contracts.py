@@ -0,0 +1,81 @@
+# tests/utils/test_contracts.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils import contracts
+from src.utils.contracts import DIFFS, GOOD, PARSED
+from src.utils.exceptions import ConsolidationError, ReportingError
+
+
+def _good(n=4):
+    saldo = np.arange(1, n + 1) * 10500.0
+    return pd.DataFrame({
+        'Rut': [f"{i}-K" for i in range(n)],
+        'Debito': 500.0,
+        'Credito': saldo + 500,
+        'Saldo': saldo,
+        'Cuotas': np.trunc(saldo / 1000),
+        'Nombre': 'SOCIO',
+    })
+
+
+class TestContracts:
+    """Tests para los contratos de los DataFrames entre etapas."""
+
+    def test_valid_frames_pass(self):
+        """Test que los DataFrames correctos no tienen infracciones."""
+        assert GOOD.validate(_good(), mode="full") == []
+        parsed = pd.DataFrame({'rut': ['1-1'], 'nombre': ['UNO'], 'debitos': [0], 'creditos': [5000], 'saldo': [5000]})
+        assert PARSED.validate(parsed, mode="full") == []
+        assert DIFFS.validate(pd.DataFrame(columns=DIFFS.columns), mode="full") == []
+
+    def test_all_violations_reported_in_one_pass(self):
+        """Test que `enforce` informa todas las reglas incumplidas juntas, con ejemplos de Rut."""
+        df = _good()
+        df.loc[1, 'Rut'] = '0-K'
+        df.loc[2, 'Saldo'] += 3000
+        df.loc[3, 'Debito'] = -1.0
+
+        violations = GOOD.validate(df, mode="full")
+        by_rule = {violation.rule: violation for violation in violations}
+        assert set(by_rule) == {"rut_duplicado", "saldo_distinto_de_movimientos", "cuotas_distintas_de_saldo"}
+        assert by_rule["rut_duplicado"].rows == 2 and by_rule["rut_duplicado"].examples == ['0-K', '0-K']
+        assert by_rule["saldo_distinto_de_movimientos"].examples == ['2-K', '3-K']
+
+        with pytest.raises(ConsolidationError, match="rut_duplicado(.|\n)*cuotas_distintas_de_saldo"):
+            GOOD.enforce(df, mode="full")
+        with pytest.raises(ReportingError):
+            GOOD.enforce(df, mode="full", error=ReportingError)
+
+    def test_negative_balances_are_valid(self):
+        """Test que un saldo deudor es válido, con cuotas truncadas hacia cero igual que la consolidación."""
+        df = _good(1).assign(Debito=1500.0, Credito=0.0, Saldo=-1500.0, Cuotas=-1.0)
+        assert GOOD.validate(df, mode="full") == []
+        reversal = _good(1).assign(Debito=-200.0, Credito=-700.0, Saldo=-500.0, Cuotas=0.0)
+        assert GOOD.validate(reversal, mode="full") == []
+
+    def test_missing_columns_and_types(self):
+        """Test que se informan columnas faltantes y no numéricas, y que las reglas sobre ellas se omiten."""
+        df = _good().drop(columns=['Cuotas']).assign(Debito='0')
+        rules = [violation.rule for violation in GOOD.validate(df, mode="full")]
+        assert rules == ["columna_faltante", "tipo"]
+
+        assert GOOD.validate(df.drop(columns=['Debito']), columns=['Rut', 'Saldo'], mode="full") == []
+        with pytest.raises(ReportingError, match=r"El DataFrame no tiene las columnas requeridas: \['Cuotas'\]"):
+            GOOD.require(df, error=ReportingError)
+
+    def test_fast_mode_samples_trusted_inputs(self, monkeypatch):
+        """Test que en modo "fast" una entrada ya validada se revisa sobre una muestra pareja."""
+        monkeypatch.setattr(contracts, "VALIDATION_SAMPLE_ROWS", 10)
+        df = _good(100)
+        df.loc[1, 'Saldo'] += 3000
+
+        assert GOOD.validate(df, mode="fast", trusted=True) == []
+        assert GOOD.validate(df, mode="fast") != []
+        assert GOOD.validate(df, mode="full", trusted=True) != []
+        df.loc[90, 'Saldo'] += 3000
+        assert GOOD.validate(df, mode="fast", trusted=True) != []
+        assert GOOD.validate(df.drop(columns=['Rut']), mode="off") != []
+        assert GOOD.validate(df, mode="off") == []
@@ -0,0 +1,73 @@
+# tests/utils/test_csv_io.py
+
+import pytest
+import pandas as pd
+
+from src.utils import csv_io
+from src.utils.csv_io import read_csv, read_dictionary, read_processed
+
+
+class TestCsvIo:
+    """Tests para la capa de lectura CSV."""
+
+    @pytest.fixture(params=["c", "pyarrow"])
+    def engine(self, request, monkeypatch):
+        """Ejecuta cada test con ambos motores de lectura."""
+        if request.param == "pyarrow" and not csv_io.HAS_PYARROW:
+            pytest.skip("pyarrow no está instalado")
+        monkeypatch.setattr(csv_io, "CSV_ENGINE", request.param)
+        return request.param
+
+    @pytest.fixture
+    def processed_path(self, tmp_path):
+        path = tmp_path / "202509.csv"
+        pd.DataFrame({
+            'Rut': ['01111111-K', '22222222-2'],
+            'Debito': [0, 1000],
+            'Credito': [10000, 51000],
+            'Saldo': [10000, 50000],
+            'Cuotas': [10, 50],
+            'Nombre': ['Socio Uno', 'Socio Dos'],
+        }).to_csv(path, index=False)
+        return path
+
+    def test_read_processed_types(self, engine, processed_path):
+        """Test que el Rut se lee como texto y los montos como float64."""
+        df = read_processed(processed_path)
+
+        assert list(df.columns) == ['Rut', 'Debito', 'Credito', 'Saldo', 'Cuotas', 'Nombre']
+        assert df['Rut'].tolist() == ['01111111-K', '22222222-2']
+        assert str(df['Saldo'].dtype) == 'float64'
+        assert df['Saldo'].sum() == 60000
+
+    def test_projection_keeps_requested_order(self, engine, processed_path):
+        """Test que solo se leen las columnas pedidas, en el orden pedido."""
+        df = read_processed(processed_path, columns=['Saldo', 'Rut'])
+
+        assert list(df.columns) == ['Saldo', 'Rut']
+
+    def test_missing_columns_are_skipped(self, engine, tmp_path):
+        """Test que las columnas ausentes en el archivo se omiten sin error."""
+        path = tmp_path / "sin_cuotas.csv"
+        pd.DataFrame({'Rut': ['1-9'], 'Saldo': [1000]}).to_csv(path, index=False)
+
+        df = read_csv(path, columns=['Rut', 'Saldo', 'Cuotas'], dtype={'Rut': str, 'Cuotas': 'float64'})
+
+        assert list(df.columns) == ['Rut', 'Saldo']
+
+    def test_read_dictionary_ignores_index_column(self, engine, tmp_path):
+        """Test que el archivo base, guardado con índice, se lee solo con Rut y Nombre."""
+        path = tmp_path / "base.csv"
+        pd.DataFrame({'Rut': ['1-9', '2-7'], 'Nombre': ['Uno', 'Dos']}).to_csv(path)
+
+        df = read_dictionary(path)
+
+        assert list(df.columns) == ['Rut', 'Nombre']
+        assert df['Nombre'].tolist() == ['Uno', 'Dos']
+
+    def test_pyarrow_falls_back_when_missing(self, monkeypatch):
+        """Test que sin pyarrow instalado se usa el parser de pandas."""
+        monkeypatch.setattr(csv_io, "HAS_PYARROW", False)
+        monkeypatch.setattr(csv_io, "CSV_ENGINE", "pyarrow")
+
+        assert csv_io.get_engine() == "c"
@@ -0,0 +1,68 @@
+# tests/utils/test_names.py
+
+import pickle
+import pandas as pd
+
+from src.utils import names
+from src.utils.names import CANONICAL_VERSION, NameCanonicalizer, canonical_name
+
+
+def _fail_if_normalized(name):
+    raise AssertionError(f"Se normalizó {name!r} en lugar de tomarlo de la tabla")
+
+
+class TestNames:
+    """Tests para la tabla persistente de nombres canónicos."""
+
+    def test_canonical_name(self):
+        """Test que la forma canónica ignora tildes, mayúsculas y espacios."""
+        assert canonical_name("  José  Núñez\tpérez ") == "JOSE NUNEZ PEREZ"
+        assert canonical_name(None) == ""
+
+    def test_canonicalize_looks_up_each_distinct_name_once(self, tmp_path):
+        """Test que cada nombre distinto se normaliza una sola vez y los nulos se mantienen."""
+        canonicalizer = NameCanonicalizer(tmp_path / "nombres.pkl")
+        series = pd.Series(['Ana Soto', 'ana  soto', None, 'Ana Soto'])
+
+        result = canonicalizer.canonicalize(series)
+
+        assert result.iloc[[0, 1, 3]].tolist() == ['ANA SOTO'] * 3
+        assert pd.isna(result.iloc[2])
+        assert (canonicalizer.misses, canonicalizer.hits) == (2, 0)
+        canonicalizer.canonicalize(series)
+        assert (canonicalizer.misses, canonicalizer.hits) == (2, 2)
+
+    def test_table_persists_across_runs(self, tmp_path, monkeypatch):
+        """Test que los nombres guardados se reutilizan en la siguiente ejecución sin normalizarlos."""
+        path = tmp_path / "nombres.pkl"
+        first = NameCanonicalizer(path)
+        first.canonicalize(pd.Series(['José Pérez', 'Ana Soto']))
+        assert first.save()
+        assert not first.save()  # sin cambios no se vuelve a escribir
+
+        monkeypatch.setattr(names, "canonical_name", _fail_if_normalized)
+        second = NameCanonicalizer.load(path)
+        assert second.canonicalize(pd.Series(['José Pérez'])).tolist() == ['JOSE PEREZ']
+        assert second.hits == 1
+
+    def test_table_is_bounded_and_keeps_recently_used(self, tmp_path):
+        """Test que la tabla descarta los nombres usados hace más tiempo al superar su tamaño."""
+        canonicalizer = NameCanonicalizer(tmp_path / "nombres.pkl", max_entries=2)
+        canonicalizer.canonical('a')
+        canonicalizer.canonical('b')
+        canonicalizer.canonical('a')
+        canonicalizer.canonical('c')
+
+        assert list(canonicalizer.names) == ['a', 'c']
+
+    def test_table_from_other_version_is_discarded(self, tmp_path):
+        """Test que una tabla guardada con otras reglas de normalización no se usa."""
+        path = tmp_path / "nombres.pkl"
+        canonicalizer = NameCanonicalizer(path)
+        canonicalizer.canonical('Ana')
+        canonicalizer.save()
+        stored = pickle.loads(path.read_bytes())
+        stored["version"] = CANONICAL_VERSION + 1
+        path.write_bytes(pickle.dumps(stored))
+
+        assert len(NameCanonicalizer.load(path)) == 0
@@ -0,0 +1,47 @@
+# tests/utils/test_profiling.py
+
+import numpy as np
+import pandas as pd
+
+from src.utils.profiling import AllocationTracker, fingerprint
+
+
+def _mutating_stage(df):
+    df['Saldo'] = df['Saldo'] * 2
+    return df
+
+
+def _pure_stage(df):
+    return df.assign(Saldo=df['Saldo'] * 2)
+
+
+class TestAllocationTracker:
+    """Tests para la medición de memoria por etapa."""
+
+    def test_records_peak_per_stage(self):
+        """Test que el pico de cada etapa refleja lo que asigna."""
+        tracker = AllocationTracker()
+        tracker.run("chica", np.ones, 1_000)
+        tracker.run("grande", np.ones, 1_000_000)
+
+        assert tracker.peak("grande") >= 8_000_000
+        assert tracker.peak("chica") < 1_000_000
+        assert list(tracker.summary()["etapa"]) == ["chica", "grande"]
+
+    def test_detects_mutated_inputs(self):
+        """Test que se detecta una etapa que modifica el DataFrame recibido."""
+        tracker = AllocationTracker()
+        df = pd.DataFrame({"Rut": ["1-1", "2-2"], "Saldo": [100, 200]})
+
+        tracker.run("pura", _pure_stage, df)
+        tracker.run("mutante", _mutating_stage, df)
+
+        assert tracker.stages[0].mutated_inputs == []
+        assert tracker.stages[1].mutated_inputs == [0]
+        assert tracker.summary()["modifica_entradas"].tolist() == [False, True]
+
+    def test_fingerprint_ignores_copies(self):
+        """Test que una copia sin cambios tiene la misma huella."""
+        df = pd.DataFrame({"Rut": ["1-1"], "Saldo": [100]})
+        assert fingerprint(df) == fingerprint(df.copy())
+        assert fingerprint(df) != fingerprint(df.rename(columns={"Saldo": "Credito"}))
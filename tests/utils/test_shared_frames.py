@@ -0,0 +1,81 @@
+# tests/utils/test_shared_frames.py
+
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import src.utils.shared_frames as shared_frames_module
+from src.utils.shared_frames import SharedFrameStore, share_frame, unlink_frame
+
+
+def _members():
+    return pd.DataFrame({
+        'rut': ['1-1', None, '3-3'],
+        'nombre': ['PEREZ JUAN', 'SOTO ANA', 'ROJAS LUIS'],
+        'saldo': [5000, 2000, 7000],
+        'tasa': [0.5, np.nan, 1.0],
+        'activo': [True, False, True],
+        'extra': [{'a': 1}, 2, 'x'],
+    })
+
+
+def _saldo_total(frame):
+    """Función de prueba: se ejecuta en otro proceso sobre el DataFrame compartido."""
+    return int(frame.attach()['saldo'].sum())
+
+
+class TestSharedFrames:
+    """Tests para el traspaso de DataFrames entre procesos por memoria compartida."""
+
+    def test_round_trip_preserves_frame(self):
+        """Test que el DataFrame conectado es igual al original (tipos, nulos e índice)."""
+        df = _members()
+        with SharedFrameStore() as store:
+            frame = pickle.loads(pickle.dumps(store.share(df, min_bytes=0)))
+
+            assert frame.shared
+            pd.testing.assert_frame_equal(frame.attach(), df)
+            indexed = df.set_index('nombre')
+            pd.testing.assert_frame_equal(store.share(indexed, min_bytes=0).attach(), indexed)
+
+    def test_attached_columns_are_read_only(self):
+        """Test que las columnas conectadas no se pueden modificar en el lugar (sí una copia)."""
+        with SharedFrameStore() as store:
+            attached = store.share(_members(), min_bytes=0).attach()
+            values = attached['saldo'].to_numpy()
+
+            assert not values.flags.writeable
+            with pytest.raises(ValueError):
+                attached.loc[0, 'saldo'] = 1
+            copy = attached.copy()
+            copy.loc[0, 'saldo'] = 1
+            assert attached.loc[0, 'saldo'] == 5000
+
+    def test_small_frames_fall_back_to_pickle(self):
+        """Test que un DataFrame chico no crea segmento compartido."""
+        frame = share_frame(_members())
+
+        assert not frame.shared
+        pd.testing.assert_frame_equal(frame.attach(), _members())
+
+    def test_unsupported_platform_falls_back_to_pickle(self, monkeypatch):
+        """Test que sin soporte de segmentos (Windows) los DataFrames se envían completos."""
+        monkeypatch.setattr(shared_frames_module, "SHARED_MEMORY_SUPPORTED", False)
+        with SharedFrameStore() as store:
+            frame = store.share(_members(), min_bytes=0)
+
+            assert not frame.shared and store.frames == []
+            pd.testing.assert_frame_equal(pickle.loads(pickle.dumps(frame)).attach(), _members())
+
+    def test_worker_attaches_and_store_releases_segment(self):
+        """Test que otro proceso lee el segmento y que el store lo libera al cerrarse."""
+        with SharedFrameStore() as store, ProcessPoolExecutor(max_workers=1) as pool:
+            frame = store.share(_members(), min_bytes=0)
+            assert pool.submit(_saldo_total, frame).result() == 14000
+
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=frame.segment)
+        unlink_frame(frame)